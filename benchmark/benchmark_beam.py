@@ -3,6 +3,8 @@ This benchmark documents a performance problem with data transfers that needs to
 """
 import unittest
 
+import numpy as np
+
 import openmdao.api as om
 from openmdao.test_suite.test_examples.beam_optimization.multipoint_beam_group import MultipointBeamGroup
 
@@ -55,6 +57,58 @@ class BenchBeamNP2(unittest.TestCase):
         prob.run_model()
 
 
+class BenchBeamKrylovRecycle(unittest.TestCase):
+    """
+    Compare Krylov iteration counts with and without recycling over a sequence of small design
+    changes, as seen by compute_totals during an optimization.
+
+    Recycling also applies the operator to recompute the products of the kept solutions when the
+    operator changes, so the total number of operator applications is reported as well.
+    """
+
+    N_PROCS = 1
+
+    def _run_sequence(self, recycle):
+
+        E = 1.
+        L = 1.
+        b = 0.1
+        volume = 0.01
+
+        num_elements = 50
+        num_cp = 4
+        num_load_cases = 4
+
+        prob = om.Problem(model=MultipointBeamGroup(E=E, L=L, b=b, volume=volume,
+                                                    num_elements=num_elements, num_cp=num_cp,
+                                                    num_load_cases=num_load_cases))
+
+        ln = prob.model.linear_solver = om.ScipyKrylov(recycle=recycle, atol=1e-6)
+        ln.precon = om.LinearRunOnce()
+
+        prob.setup(mode='fwd')
+
+        prob.run_model()
+
+        ln._total_iter_count = 0
+        ln._total_matvec_count = 0
+        for i in range(10):
+            prob.set_val('interp.h_cp', prob.get_val('interp.h_cp') * (1. + 1e-4 * np.cos(i)))
+            prob.run_model()
+            prob.compute_totals()
+
+        return ln._total_iter_count, ln._total_matvec_count
+
+    def benchmark_beam_krylov_recycle(self):
+        niter, nmatvec = self._run_sequence(recycle=False)
+        niter_recycled, nmatvec_recycled = self._run_sequence(recycle=True)
+
+        print(f"Krylov iterations: {niter} without recycling, {niter_recycled} with recycling "
+              f"({100. * (niter - niter_recycled) / niter:.1f}% reduction)")
+        print(f"Operator applications: {nmatvec} without recycling, {nmatvec_recycled} with "
+              f"recycling ({100. * (nmatvec - nmatvec_recycled) / nmatvec:.1f}% reduction)")
+
+
 @unittest.skip("for debugging, not for routine benchmarking")
 class BenchBeamNP4(unittest.TestCase):
 
@@ -0,0 +1,78 @@
+"""
+Benchmarks for the coloring algorithms over a range of random sparsity sizes and densities.
+
+Running this file directly prints the time taken by each algorithm for each case, which is
+what _SPARSE_COLORING_MIN_NNZ in openmdao/utils/coloring.py is based on.
+"""
+import time
+import unittest
+
+import numpy as np
+
+from openmdao.utils.array_utils import rand_sparsity
+from openmdao.utils.coloring import _compute_coloring
+
+
+# (shape, density) of each case
+CASES = [
+    ((10, 10), .3),
+    ((100, 100), .05),
+    ((100, 100), .5),
+    ((1000, 1000), .005),
+    ((3000, 3000), .01),
+    ((20000, 20000), .0005),
+]
+
+
+def _get_sparsity(shape, density, seed=11):
+    np.random.seed(seed)
+    return rand_sparsity(shape, density)
+
+
+def _run_case(shape, density, mode, algorithm):
+    J = _get_sparsity(shape, density)
+    start = time.perf_counter()
+    coloring = _compute_coloring(J, mode, algorithm)
+    return J.nnz, time.perf_counter() - start, coloring.total_solves()
+
+
+class BenchColoringSmall(unittest.TestCase):
+
+    def benchmark_small_sparse_auto(self):
+        _run_case((100, 100), .05, 'auto', 'sparse')
+
+    def benchmark_small_adjacency_auto(self):
+        _run_case((100, 100), .05, 'auto', 'adjacency')
+
+    def benchmark_small_dense_sparse_fwd(self):
+        _run_case((100, 100), .5, 'fwd', 'sparse')
+
+    def benchmark_small_dense_adjacency_fwd(self):
+        _run_case((100, 100), .5, 'fwd', 'adjacency')
+
+
+class BenchColoringLarge(unittest.TestCase):
+
+    def benchmark_large_sparse_auto(self):
+        _run_case((3000, 3000), .01, 'auto', 'sparse')
+
+    def benchmark_large_adjacency_auto(self):
+        _run_case((3000, 3000), .01, 'auto', 'adjacency')
+
+    def benchmark_huge_sparse_auto(self):
+        _run_case((20000, 20000), .0005, 'auto', 'sparse')
+
+    def benchmark_1M_nonzeros_sparse_fwd(self):
+        _run_case((100000, 100000), .0001, 'fwd', 'sparse')
+
+
+if __name__ == '__main__':
+    print(f"{'shape':>16} {'density':>8} {'nnz':>8} {'mode':>5} {'adjacency (s)':>14} "
+          f"{'sparse (s)':>11} {'solves':>7}")
+    for shape, density in CASES:
+        for mode in ('fwd', 'auto'):
+            nnz, t_adj, n_adj = _run_case(shape, density, mode, 'adjacency')
+            nnz, t_sparse, n_sparse = _run_case(shape, density, mode, 'sparse')
+            assert n_adj == n_sparse
+            print(f"{str(shape):>16} {density:8.4f} {nnz:8d} {mode:>5} {t_adj:14.4f} "
+                  f"{t_sparse:11.4f} {n_sparse:7d}")
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+import unittest
+
+
+def _run(code):
+    # a fresh interpreter is needed so that no modules have been imported already
+    subprocess.check_call([sys.executable, '-c', code],  # nosec: trusted input
+                          stdout=subprocess.DEVNULL)
+
+
+class BM(unittest.TestCase):
+    """Startup time of processes that use OpenMDAO, such as command line tools and workers"""
+
+    def benchmark_import_api(self):
+        _run('import openmdao.api')
+
+    def benchmark_import_problem(self):
+        _run('import openmdao.api as om; om.Problem')
+
+    def benchmark_cmd_help(self):
+        _run('import sys; sys.argv = ["openmdao", "-h"]\n'
+             'from openmdao.utils.om import openmdao_cmd\n'
+             'try:\n'
+             '    openmdao_cmd()\n'
+             'except SystemExit:\n'
+             '    pass')
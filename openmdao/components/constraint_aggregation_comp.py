@@ -0,0 +1,368 @@
+"""
+Definition of the Constraint Aggregation Component.
+"""
+import numpy as np
+
+from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.components.ks_comp import check_option, CITATIONS as KS_CITATIONS
+
+
+CITATIONS = KS_CITATIONS + """
+@article{Kennedy:2015:ICA,
+        title = {Improved constraint-aggregation methods},
+        journal = {Computer Methods in Applied Mechanics and Engineering},
+        volume = {289},
+        pages = {332-354},
+        year = {2015},
+        author = {Graeme J. Kennedy and Jason E. Hicken}
+}
+"""
+
+_METHODS = ('ks', 'ie', 'pnorm')
+
+
+def _iter_chunks(width, chunk_size):
+    """
+    Yield the column slices used to stream over the constraints in each row.
+
+    Parameters
+    ----------
+    width : int
+        Number of constraints in each row.
+    chunk_size : int or None
+        Number of columns in each chunk. If None, all columns are handled at once.
+
+    Yields
+    ------
+    slice
+        Slice of columns in the current chunk.
+    """
+    if chunk_size is None or chunk_size >= width:
+        yield slice(None)
+    else:
+        for start in range(0, width, chunk_size):
+            yield slice(start, start + chunk_size)
+
+
+def _rescale(shift, new_shift):
+    """
+    Return the factor that rescales a running sum of exponentials when its shift increases.
+
+    Parameters
+    ----------
+    shift : ndarray
+        Current shift of each row, -inf if nothing has been summed yet.
+    new_shift : ndarray
+        New shift of each row.
+
+    Returns
+    -------
+    ndarray
+        Factor by which the running sums must be multiplied.
+    """
+    scale = np.zeros(shift.size)
+    summed = ~np.isneginf(shift)
+    scale[summed] = np.exp(shift[summed] - new_shift[summed])
+    return scale
+
+
+class ConstraintAggregationComp(ExplicitComponent):
+    """
+    Aggregate rows of constraint values into a single value per row.
+
+    Use the add_aggregate method to define any number of aggregates. Each aggregate has an input
+    of shape (vec_size, width) and an output of shape (vec_size, 1), where every row is
+    aggregated independently with one of the following methods:
+
+    - 'ks': Kreisselmeier-Steinhauser function, a smooth upper bound of the maximum.
+    - 'ie': Induced exponential function, a smooth lower bound of the maximum.
+    - 'pnorm': p-norm of the constraint values, which approximates the maximum magnitude.
+
+    For 'ks' and 'ie', the aggregate of g - upper is computed, so the resulting constraint is
+    satisfied when it is less than or equal to zero. For 'pnorm', upper is subtracted from the
+    p-norm of g.
+
+    Values are computed with a streaming, numerically stable reduction over chunks of
+    'chunk_size' columns, so no temporary arrays larger than a chunk are allocated. The partials
+    of each output only have one nonzero per input entry and are declared sparse.
+
+    Parameters
+    ----------
+    output_name : str or None
+        Name of the output of the first aggregate to add. If None, aggregates are only added
+        with add_aggregate.
+    input_name : str
+        Name of the input of the first aggregate.
+    chunk_size : int or None
+        Number of constraint columns handled at once when computing the aggregates.
+    **kwargs : dict
+        Other arguments of add_aggregate for the first aggregate.
+
+    Attributes
+    ----------
+    cite : str
+        Listing of relevant citations that should be referenced when publishing
+        work that uses this class.
+    _aggregates : dict
+        Metadata of each aggregate, keyed by output name.
+    """
+
+    def __init__(self, output_name=None, input_name=None, chunk_size=None, **kwargs):
+        """
+        Initialize the aggregation component.
+        """
+        super().__init__(chunk_size=chunk_size)
+
+        self.cite = CITATIONS
+
+        self._aggregates = {}
+
+        if output_name is not None:
+            self.add_aggregate(output_name, input_name, **kwargs)
+
+        self._no_check_partials = True
+
+    def initialize(self):
+        """
+        Declare options.
+        """
+        self.options.declare('chunk_size', types=int, default=None, allow_none=True, lower=1,
+                             desc='Number of constraint columns handled at once when computing '
+                                  'the aggregates. Default is None, which handles all columns '
+                                  'at once.')
+
+    def add_aggregate(self, output_name, input_name, width=1, vec_size=1, method='ks', rho=50.0,
+                      upper=0.0, lower_flag=False, units=None, add_constraint=False, ref=None,
+                      ref0=None, scaler=None, adder=None, parallel_deriv_color=None):
+        """
+        Add an aggregate of an input of constraint values.
+
+        Parameters
+        ----------
+        output_name : str
+            Name of the aggregated output, of shape (vec_size, 1).
+        input_name : str
+            Name of the input of constraint values, of shape (vec_size, width).
+        width : int
+            Number of constraints aggregated in each row.
+        vec_size : int
+            Number of rows to aggregate independently.
+        method : str
+            Aggregation method, one of 'ks', 'ie' or 'pnorm'.
+        rho : float
+            Aggregation factor. For 'pnorm' this is the order of the norm.
+        upper : float
+            Upper bound for the constraint values.
+        lower_flag : bool
+            Set to True to reverse the sign of the constraint values. Not valid for 'pnorm'.
+        units : str or None
+            Units of the input and output.
+        add_constraint : bool
+            If True, add an upper bound constraint of zero on the output.
+        ref : float or None
+            Unit reference for the constraint, if added.
+        ref0 : float or None
+            Zero-reference for the constraint, if added.
+        scaler : float or None
+            Scaler for the constraint, if added.
+        adder : float or None
+            Adder for the constraint, if added.
+        parallel_deriv_color : str or None
+            If specified, the constraint will be grouped for parallel derivative calculations
+            with other variables sharing the same parallel_deriv_color.
+        """
+        if method not in _METHODS:
+            raise ValueError(f"{self.msginfo}: Method '{method}' for aggregate '{output_name}' "
+                             f"is not one of {list(_METHODS)}.")
+        if method == 'pnorm' and lower_flag:
+            raise ValueError(f"{self.msginfo}: Option 'lower_flag' is not valid for 'pnorm' "
+                             f"aggregate '{output_name}'.")
+        if output_name in self._aggregates:
+            raise ValueError(f"{self.msginfo}: Aggregate '{output_name}' already exists.")
+        if any(meta['input_name'] == input_name for meta in self._aggregates.values()):
+            raise ValueError(f"{self.msginfo}: Input '{input_name}' is already aggregated.")
+        check_option('units', units)
+
+        self._aggregates[output_name] = {
+            'input_name': input_name,
+            'width': width,
+            'vec_size': vec_size,
+            'method': method,
+            'rho': rho,
+            'upper': upper,
+            'lower_flag': lower_flag,
+            'units': units,
+            'add_constraint': add_constraint,
+            'ref': ref,
+            'ref0': ref0,
+            'scaler': scaler,
+            'adder': adder,
+            'parallel_deriv_color': parallel_deriv_color,
+        }
+
+    def setup(self):
+        """
+        Declare inputs, outputs, and derivatives for the aggregates.
+        """
+        for output_name, meta in self._aggregates.items():
+            input_name = meta['input_name']
+            width = meta['width']
+            vec_size = meta['vec_size']
+
+            self.add_input(input_name, shape=(vec_size, width), units=meta['units'],
+                           desc="Array of function values to be aggregated")
+            self.add_output(output_name, shape=(vec_size, 1), units=meta['units'],
+                            desc=f"Value of the aggregate {meta['method'].upper()} function")
+
+            if meta['add_constraint']:
+                self.add_constraint(name=output_name, upper=0.0, scaler=meta['scaler'],
+                                    adder=meta['adder'], ref0=meta['ref0'], ref=meta['ref'],
+                                    parallel_deriv_color=meta['parallel_deriv_color'])
+
+            rows = np.repeat(np.arange(vec_size), width)
+            cols = np.arange(vec_size * width)
+            self.declare_partials(of=output_name, wrt=input_name, rows=rows, cols=cols)
+
+    def _constraint_chunk(self, g, sl, meta):
+        """
+        Return the shifted and signed constraint values in a chunk of columns.
+
+        Parameters
+        ----------
+        g : ndarray
+            Input constraint values.
+        sl : slice
+            Slice of columns in the chunk.
+        meta : dict
+            Metadata of the aggregate.
+
+        Returns
+        -------
+        ndarray
+            Constraint values to be aggregated.
+        """
+        if meta['method'] == 'pnorm':
+            return g[:, sl]
+        if meta['lower_flag']:
+            return meta['upper'] - g[:, sl]
+        return g[:, sl] - meta['upper']
+
+    def _reduce(self, g, meta):
+        """
+        Compute the streaming reduction of each row needed by the aggregate.
+
+        Parameters
+        ----------
+        g : ndarray
+            Input constraint values.
+        meta : dict
+            Metadata of the aggregate.
+
+        Returns
+        -------
+        ndarray
+            Aggregated value of each row.
+        ndarray
+            Shift of each row.
+        ndarray
+            Shifted sum of each row.
+        """
+        method = meta['method']
+        rho = meta['rho']
+        vec_size = g.shape[0]
+
+        # running maximum, in the same scale as the exponents for 'ks' and 'ie'
+        shift = np.zeros(vec_size) if method == 'pnorm' else np.full(vec_size, -np.inf)
+        total = np.zeros(vec_size, dtype=g.dtype)
+        weighted = np.zeros(vec_size, dtype=g.dtype)
+
+        for sl in _iter_chunks(meta['width'], self.options['chunk_size']):
+            con = self._constraint_chunk(g, sl, meta)
+
+            if method == 'pnorm':
+                # analytic absolute value so complex step still works
+                mag = con * np.sign(con.real)
+                new_shift = np.maximum(shift, np.max(mag.real, axis=-1))
+                nonzero = new_shift > 0.0
+                scale = np.zeros(vec_size)
+                scale[nonzero] = (shift[nonzero] / new_shift[nonzero]) ** rho
+                terms = np.zeros(mag.shape, dtype=mag.dtype)
+                terms[nonzero] = (mag[nonzero] / new_shift[nonzero, np.newaxis]) ** rho
+                total = total * scale + np.sum(terms, axis=-1)
+            else:
+                new_shift = np.maximum(shift, rho * np.max(con.real, axis=-1))
+                scale = _rescale(shift, new_shift)
+                terms = np.exp(rho * con - new_shift[:, np.newaxis])
+                total = total * scale + np.sum(terms, axis=-1)
+                if method == 'ie':
+                    weighted = weighted * scale + np.sum(con * terms, axis=-1)
+
+            shift = new_shift
+
+        if method == 'ks':
+            value = (shift + np.log(total)) / rho
+        elif method == 'ie':
+            value = weighted / total
+        else:
+            value = shift * total ** (1.0 / rho)
+
+        return value, shift, total
+
+    def compute(self, inputs, outputs):
+        """
+        Compute the aggregated outputs.
+
+        Parameters
+        ----------
+        inputs : `Vector`
+            `Vector` containing inputs.
+        outputs : `Vector`
+            `Vector` containing outputs.
+        """
+        for output_name, meta in self._aggregates.items():
+            value = self._reduce(inputs[meta['input_name']], meta)[0]
+            if meta['method'] == 'pnorm':
+                value = value - meta['upper']
+            outputs[output_name] = value[:, np.newaxis]
+
+    def compute_partials(self, inputs, partials):
+        """
+        Compute sub-jacobian parts. The model is assumed to be in an unscaled state.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        partials : Jacobian
+            Sub-jac components written to partials[output_name, input_name].
+        """
+        chunk_size = self.options['chunk_size']
+
+        for output_name, meta in self._aggregates.items():
+            input_name = meta['input_name']
+            method = meta['method']
+            rho = meta['rho']
+            g = inputs[input_name]
+
+            value, shift, total = self._reduce(g, meta)
+            value = value[:, np.newaxis]
+
+            # write each chunk of the derivatives directly into the sparse subjac values
+            jac = partials[output_name, input_name].reshape(g.shape)
+
+            for sl in _iter_chunks(meta['width'], chunk_size):
+                con = self._constraint_chunk(g, sl, meta)
+
+                if method == 'ks':
+                    jac[:, sl] = np.exp(rho * (con - value))
+                elif method == 'ie':
+                    weights = np.exp(rho * con - shift[:, np.newaxis]) / total[:, np.newaxis]
+                    jac[:, sl] = weights * (1.0 + rho * (con - value))
+                else:
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        jac[:, sl] = np.sign(con.real) * (con * np.sign(con.real) /
+                                                          value) ** (rho - 1.0)
+                    jac[np.ravel(value.real == 0.0), sl] = 0.0
+
+                if meta['lower_flag']:
+                    jac[:, sl] *= -1.0
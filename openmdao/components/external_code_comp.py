@@ -8,6 +8,7 @@ from shutil import which
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.implicitcomponent import ImplicitComponent
+from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.utils.shell_proc import STDOUT, DEV_NULL, ShellProc
 
 
@@ -306,6 +307,25 @@ class ExternalCodeComp(ExplicitComponent):
         """
         self._external_code_runner.run_component()
 
+    def _concurrent_solve_nonlinear(self):
+        """
+        Split _solve_nonlinear so compute can run at the same time as other external codes.
+
+        The owning Group runs the yielded function in a separate thread, then resumes this
+        generator to record the iteration.
+
+        Yields
+        ------
+        function
+            Function that calls compute.
+        """
+        with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
+            self._residuals.set_val(0.0)
+            yield self._compute_wrapper
+
+        with Recording(self.pathname + '._solve_nonlinear', self.iter_count, self):
+            pass
+
 
 class ExternalCodeImplicitComp(ImplicitComponent):
     """
@@ -407,3 +427,29 @@ class ExternalCodeImplicitComp(ImplicitComponent):
         command = self.options['command_solve']
         if command:
             self._external_code_runner.run_component(command=command)
+
+    def _concurrent_solve_nonlinear(self):
+        """
+        Split _solve_nonlinear so solve_nonlinear can run at the same time as other external codes.
+
+        The owning Group runs the yielded function in a separate thread, then resumes this
+        generator to record the iteration.
+
+        Yields
+        ------
+        function
+            Function that calls solve_nonlinear.
+        """
+        def _solve():
+            with self._call_user_function('solve_nonlinear'):
+                if self._discrete_inputs or self._discrete_outputs:
+                    self.solve_nonlinear(self._inputs, self._outputs,
+                                         self._discrete_inputs, self._discrete_outputs)
+                else:
+                    self.solve_nonlinear(self._inputs, self._outputs)
+
+        with self._unscaled_context(outputs=[self._outputs]):
+            yield _solve
+
+            with Recording(self.pathname + '._solve_nonlinear', self.iter_count, self):
+                pass
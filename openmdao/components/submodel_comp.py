@@ -1,5 +1,7 @@
 """Define the SubmodelComp class for evaluating OpenMDAO systems within components."""
 
+import numpy as np
+
 from openmdao.core.constants import _SetupStatus, INF_BOUND
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.utils.general_utils import find_matches
@@ -49,6 +51,22 @@ class SubmodelComp(ExplicitComponent):
         Outputs passed into __init__ to be used as outputs in the subproblem's system. These
         must be bookkept separately from submodel outputs added at setup time because setup
         can be called multiple times and the submodel outputs dict is reset each time.
+    _boundary_slices : tuple or None
+        Slices that copy the boundary variables directly between our vectors and the output
+        vector of the subproblem, along with the variables that can't be copied directly.
+        Computed on the first run after setup.
+    _cache_key : bytes or None
+        Input values of the point whose outputs and totals are cached.
+    _cache_outputs : ndarray or None
+        Cached output values at the point given by _cache_key.
+    _cache_totals : dict or None
+        Cached total derivatives of the subproblem at the point given by _cache_key.
+    _subprob_key : bytes or None
+        Input values of the point where the subproblem was last run.
+    _subprob_node : int
+        Index of the node where the subproblem was last run.
+    _cache_stats : dict
+        Number of cache hits and misses of compute and compute_partials.
     """
 
     def __init__(self, problem, inputs=None, outputs=None, reports=False, **kwargs):
@@ -66,6 +84,17 @@ class SubmodelComp(ExplicitComponent):
         self._static_submodel_inputs = {}
         self._static_submodel_outputs = {}
 
+        self._boundary_slices = None
+        self._cache_key = None
+        self._cache_outputs = None
+        self._cache_totals = None
+        self._subprob_key = None
+        self._subprob_node = 0
+        self._cache_stats = {
+            'compute': {'hits': 0, 'misses': 0},
+            'compute_partials': {'hits': 0, 'misses': 0},
+        }
+
         if inputs is not None:
             for inp in inputs:
                 if isinstance(inp, str):
@@ -84,6 +113,51 @@ class SubmodelComp(ExplicitComponent):
                 else:
                     raise Exception(f'Expected output of type str or tuple, got {type(out)}.')
 
+    def initialize(self):
+        """
+        Declare options.
+        """
+        self.options.declare('use_cache', types=bool, default=True,
+                             desc='If True, the outputs and total derivatives of the last point '
+                                  'are reused when the inputs repeat, without running the '
+                                  'subproblem again.')
+        self.options.declare('num_nodes', types=int, default=None, allow_none=True, lower=1,
+                             desc='If not None, all inputs and outputs get a leading axis of '
+                                  'this size and the subproblem is evaluated at each node in '
+                                  'turn, giving block diagonal partials.')
+
+    def _vectorize_meta(self, meta):
+        """
+        Return the metadata of a boundary variable with the leading num_nodes axis added.
+
+        Parameters
+        ----------
+        meta : dict
+            Metadata of the variable in the subproblem.
+
+        Returns
+        -------
+        dict
+            Metadata of the variable of this component.
+        """
+        num_nodes = self.options['num_nodes']
+        if num_nodes is None:
+            return meta
+
+        meta = meta.copy()
+        val = np.asarray(meta.get('val', 1.0))
+        shape = meta.get('shape')
+        if shape is None:
+            shape = val.shape
+        elif isinstance(shape, int):
+            shape = (shape,)
+        shape = (num_nodes,) + tuple(shape)
+
+        meta['val'] = np.broadcast_to(val, shape[1:])[np.newaxis].repeat(num_nodes, axis=0)
+        meta['shape'] = shape
+
+        return meta
+
     def _add_static_input(self, path, name=None, **kwargs):
         if name is None:
             name = path.replace('.', ':')
@@ -132,7 +206,7 @@ class SubmodelComp(ExplicitComponent):
             meta[key] = val
 
         meta.pop('prom_name')
-        super().add_input(name, **meta)
+        super().add_input(name, **self._vectorize_meta(meta))
         meta['prom_name'] = path
 
     def add_output(self, path, name=None, **kwargs):
@@ -172,7 +246,7 @@ class SubmodelComp(ExplicitComponent):
             meta[key] = val
 
         meta.pop('prom_name')
-        super().add_output(name, **meta)
+        super().add_output(name, **self._vectorize_meta(meta))
         meta['prom_name'] = path
 
     def _reset_driver_vars(self):
@@ -280,7 +354,7 @@ class SubmodelComp(ExplicitComponent):
                     continue
                 meta[key] = val
 
-            super().add_input(iface_name, **meta)
+            super().add_input(iface_name, **self._vectorize_meta(meta))
             meta['prom_name'] = prom_name
 
         for var, data in sorted(self.submodel_outputs.items(), key=lambda x: x[0]):
@@ -299,7 +373,7 @@ class SubmodelComp(ExplicitComponent):
                     continue
                 meta[key] = val
 
-            super().add_output(iface_name, **meta)
+            super().add_output(iface_name, **self._vectorize_meta(meta))
             meta['prom_name'] = prom_name
 
         # NOTE to be looked at later. Trying to get variables from subsystems has been causing
@@ -434,19 +508,207 @@ class SubmodelComp(ExplicitComponent):
 
         # self._reset_driver_vars()
 
-        if self.coloring is None:
+        self._boundary_slices = None
+        self._clear_cache()
+
+        num_nodes = self.options['num_nodes']
+
+        if self.coloring is not None:
+            for of, wrt, _, _, nzrows, nzcols, osize, isize in self._coloring_subjac_iter():
+                if num_nodes is None:
+                    self.declare_partials(of=of, wrt=wrt, rows=nzrows, cols=nzcols)
+                else:
+                    rows, cols = _block_diag_pattern(nzrows, nzcols, osize, isize, num_nodes)
+                    self.declare_partials(of=of, wrt=wrt, rows=rows, cols=cols)
+        elif num_nodes is None:
             self.declare_partials(of='*', wrt='*')
         else:
-            for of, wrt, nzrows, nzcols, _, _, _, _ in self.coloring._subjac_sparsity_iter():
-                self.declare_partials(of=of, wrt=wrt, rows=nzrows, cols=nzcols)
+            meta = self._var_rel2meta
+            for out_data in self.submodel_outputs.values():
+                of = out_data['iface_name']
+                osize = meta[of]['size'] // num_nodes
+                for in_data in self.submodel_inputs.values():
+                    wrt = in_data['iface_name']
+                    isize = meta[wrt]['size'] // num_nodes
+                    rows, cols = _block_diag_pattern(np.repeat(np.arange(osize), isize),
+                                                     np.tile(np.arange(isize), osize),
+                                                     osize, isize, num_nodes)
+                    self.declare_partials(of=of, wrt=wrt, rows=rows, cols=cols)
+
+    def _coloring_subjac_iter(self):
+        """
+        Iterate over the nonzero subjacs of the total coloring of the subproblem.
+
+        Yields
+        ------
+        str
+            Name of our output.
+        str
+            Name of our input.
+        str
+            Promoted name of the output in the subproblem.
+        str
+            Promoted name of the input in the subproblem.
+        list
+            Row indices of the nonzero entries.
+        list
+            Column indices of the nonzero entries.
+        int
+            Size of the output.
+        int
+            Size of the input.
+        """
+        abs2prom = self._subprob.model._var_allprocs_abs2prom['output']
+        for of, wrt, nzrows, nzcols, ostart, oend, istart, iend in \
+                self.coloring._subjac_sparsity_iter():
+            # responses are keyed by the absolute name of their source
+            of = abs2prom.get(of, of)
+            wrt = abs2prom.get(wrt, wrt)
+            yield (self.submodel_outputs[of]['iface_name'],
+                   self.submodel_inputs[wrt]['iface_name'],
+                   of, wrt, nzrows, nzcols, oend - ostart, iend - istart)
 
     def _set_complex_step_mode(self, active):
         super()._set_complex_step_mode(active)
         self._subprob.set_complex_step_mode(active)
 
-    def compute(self, inputs, outputs):
+    def _clear_cache(self):
         """
-        Perform the subproblem system computation at run time.
+        Discard the cached point.
+        """
+        self._cache_key = None
+        self._cache_outputs = None
+        self._cache_totals = None
+        self._subprob_key = None
+        self._subprob_node = 0
+
+    def _get_boundary_src(self, prom_name):
+        """
+        Return the source of a boundary variable if its value can be copied directly.
+
+        Parameters
+        ----------
+        prom_name : str
+            Promoted name of the variable in the subproblem.
+
+        Returns
+        -------
+        str or None
+            Absolute name of the source, or None if the value must be set using set_val, e.g.
+            because of a unit conversion or because the source is not local.
+        """
+        model = self._subprob.model
+        prom2abs = model._var_allprocs_prom2abs_list
+        all_meta = model._var_allprocs_abs2meta
+
+        if prom_name in prom2abs['output']:
+            src = prom2abs['output'][prom_name][0]
+        elif prom_name in prom2abs['input']:
+            abs_ins = prom2abs['input'][prom_name]
+            src = model._conn_global_abs_in2out[abs_ins[0]]
+            sunits = all_meta['output'][src]['units']
+            if sunits is not None:
+                ginputs = model._group_inputs.get(prom_name)
+                gunits = ginputs[0].get('units') if ginputs else None
+                tunits = {gunits if gunits is not None else all_meta['input'][n]['units']
+                          for n in abs_ins}
+                if tunits != {sunits}:
+                    return
+        else:
+            return
+
+        if src in model._var_allprocs_discrete['output'] or \
+                all_meta['output'][src]['distributed'] or \
+                src not in model._outputs.get_slice_dict():
+            return
+
+        return src
+
+    def _get_boundary_slices(self):
+        """
+        Return the slices used to copy the boundary variables to and from the subproblem.
+
+        Returns
+        -------
+        tuple
+            Lists of (start, size per node, subproblem slice) entries for the inputs and outputs
+            that can be copied directly, and lists of (promoted name, iface name) pairs for the
+            others.
+        """
+        if self._boundary_slices is None:
+            num_nodes = self.options['num_nodes'] or 1
+            sub_slices = self._subprob.model._outputs.get_slice_dict()
+            plan = []
+            for io, vec, submodel_vars in (('input', self._inputs, self.submodel_inputs),
+                                           ('output', self._outputs, self.submodel_outputs)):
+                slices = vec.get_slice_dict()
+                prom2abs = self._var_allprocs_prom2abs_list[io]
+                direct = []
+                indirect = []
+                for prom_name, meta in submodel_vars.items():
+                    iface_name = meta['iface_name']
+                    src = self._get_boundary_src(prom_name)
+                    if src is None:
+                        indirect.append((prom_name, iface_name))
+                    else:
+                        slc = slices[prom2abs[iface_name][0]]
+                        direct.append((slc.start, (slc.stop - slc.start) // num_nodes,
+                                       sub_slices[src]))
+                plan.append(direct)
+                plan.append(indirect)
+
+            self._boundary_slices = tuple(plan)
+
+        return self._boundary_slices
+
+    def _set_subprob_inputs(self, inputs, node=0):
+        """
+        Copy our inputs at the given node into the subproblem.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        node : int
+            Index of the node along the leading num_nodes axis.
+        """
+        p = self._subprob
+        direct, indirect, _, _ = self._get_boundary_slices()
+
+        arr = inputs.asarray()
+        sub_arr = p.model._outputs.asarray()
+        for start, size, sub_slc in direct:
+            start += node * size
+            sub_arr[sub_slc] = arr[start:start + size]
+
+        for prom_name, iface_name in indirect:
+            p.set_val(prom_name, self._node_val(inputs, iface_name, node))
+
+    def _node_val(self, vec, name, node):
+        """
+        Return the value of a variable at the given node.
+
+        Parameters
+        ----------
+        vec : Vector
+            Vector containing the variable.
+        name : str
+            Name of the variable.
+        node : int
+            Index of the node along the leading num_nodes axis.
+
+        Returns
+        -------
+        ndarray
+            Value of the variable at the node.
+        """
+        if self.options['num_nodes'] is None:
+            return vec[name]
+        return vec[name][node]
+
+    def _run_subprob(self, inputs, outputs, node=0):
+        """
+        Run the subproblem at the inputs of the given node and copy its results into outputs.
 
         Parameters
         ----------
@@ -454,20 +716,91 @@ class SubmodelComp(ExplicitComponent):
             Unscaled, dimensional input variables read via inputs[key].
         outputs : Vector
             Unscaled, dimensional output variables read via outputs[key].
+        node : int
+            Index of the node along the leading num_nodes axis.
         """
         p = self._subprob
+        _, _, direct, indirect = self._get_boundary_slices()
 
-        for prom_name, meta in self.submodel_inputs.items():
-            p.set_val(prom_name, inputs[meta['iface_name']])
+        self._set_subprob_inputs(inputs, node)
 
         # set initial output vals
-        for prom_name, meta in self.submodel_outputs.items():
-            p.set_val(prom_name, outputs[meta['iface_name']])
+        arr = outputs.asarray()
+        sub_arr = p.model._outputs.asarray()
+        for start, size, sub_slc in direct:
+            start += node * size
+            sub_arr[sub_slc] = arr[start:start + size]
+        for prom_name, iface_name in indirect:
+            p.set_val(prom_name, self._node_val(outputs, iface_name, node))
 
         p.driver.run()
 
-        for prom_name, meta in self.submodel_outputs.items():
-            outputs[meta['iface_name']] = p.get_val(prom_name)
+        sub_arr = p.model._outputs.asarray()
+        for start, size, sub_slc in direct:
+            start += node * size
+            arr[start:start + size] = sub_arr[sub_slc]
+        for prom_name, iface_name in indirect:
+            if self.options['num_nodes'] is None:
+                outputs[iface_name] = p.get_val(prom_name)
+            else:
+                outputs[iface_name][node] = p.get_val(prom_name)
+
+    def compute(self, inputs, outputs):
+        """
+        Perform the subproblem system computation at run time.
+
+        If caching is active and the inputs are the same as those of the cached point, the
+        cached outputs are used instead of running the subproblem. With num_nodes set, the
+        subproblem is run once per node.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        outputs : Vector
+            Unscaled, dimensional output variables read via outputs[key].
+        """
+        num_nodes = self.options['num_nodes'] or 1
+        use_cache = self.options['use_cache'] and not self.under_complex_step
+        key = inputs.asarray().tobytes()
+
+        if use_cache:
+            stats = self._cache_stats['compute']
+            if key == self._cache_key and self._cache_outputs is not None:
+                stats['hits'] += 1
+                outputs.set_val(self._cache_outputs)
+                return
+            stats['misses'] += 1
+
+        for node in range(num_nodes):
+            self._run_subprob(inputs, outputs, node)
+
+        if self.under_complex_step:
+            # the subproblem is no longer at a known real point
+            self._subprob_key = None
+            return
+
+        self._subprob_key = key
+        self._subprob_node = num_nodes - 1
+
+        if use_cache:
+            self._cache_key = key
+            self._cache_outputs = outputs.asarray(copy=True)
+            self._cache_totals = None
+
+    def _compute_subprob_totals(self):
+        """
+        Compute the total derivatives of the subproblem outputs with respect to its inputs.
+
+        Returns
+        -------
+        dict
+            Total derivatives keyed by (of, wrt) promoted name pairs.
+        """
+        tots = self._subprob.driver._compute_totals(wrt=list(self.submodel_inputs),
+                                                    of=list(self.submodel_outputs),
+                                                    use_abs_names=False, driver_scaling=False)
+        return {k: v.copy() for k, v in tots.items()}
 
     def compute_partials(self, inputs, partials):
         """
@@ -475,7 +808,8 @@ class SubmodelComp(ExplicitComponent):
 
         Checks if the needed derivatives are cached already based on the
         inputs vector. Refreshes the cache by re-computing the current point
-        if necessary.
+        if necessary. With num_nodes set, the totals of each node form one block of
+        the block diagonal partials.
 
         Parameters
         ----------
@@ -484,23 +818,74 @@ class SubmodelComp(ExplicitComponent):
         partials : Jacobian
             Sub-jac components written to partials[output_name, input_name].
         """
-        p = self._subprob
+        num_nodes = self.options['num_nodes'] or 1
+        use_cache = self.options['use_cache'] and not self.under_complex_step
+        key = inputs.asarray().tobytes()
 
-        for prom_name, meta in self.submodel_inputs.items():
-            p.set_val(prom_name, inputs[meta['iface_name']])
-
-        wrt = list(self.submodel_inputs.keys())
-        of = list(self.submodel_outputs.keys())
-
-        tots = p.driver._compute_totals(wrt=wrt,
-                                        of=of,
-                                        use_abs_names=False, driver_scaling=False)
+        if use_cache and key == self._cache_key and self._cache_totals is not None:
+            self._cache_stats['compute_partials']['hits'] += 1
+            node_tots = self._cache_totals
+        else:
+            if use_cache:
+                self._cache_stats['compute_partials']['misses'] += 1
+
+            node_tots = []
+            for node in range(num_nodes):
+                if key != self._subprob_key or node != self._subprob_node:
+                    # the subproblem was last run at a different point
+                    self._set_subprob_inputs(inputs, node)
+                    self._subprob.driver.run()
+                    self._subprob_key = None if self.under_complex_step else key
+                    self._subprob_node = node
+                node_tots.append(self._compute_subprob_totals())
+
+            if use_cache:
+                if key != self._cache_key:
+                    self._cache_key = key
+                    self._cache_outputs = None
+                self._cache_totals = node_tots
 
         if self.coloring is None:
-            for (tot_output, tot_input), tot in tots.items():
+            for tot_output, tot_input in node_tots[0]:
                 input_iface_name = self.submodel_inputs[tot_input]['iface_name']
                 output_iface_name = self.submodel_outputs[tot_output]['iface_name']
+                if len(node_tots) == 1:
+                    tot = node_tots[0][tot_output, tot_input]
+                else:
+                    tot = np.concatenate([tots[tot_output, tot_input].ravel()
+                                          for tots in node_tots])
                 partials[output_iface_name, input_iface_name] = tot
         else:
-            for of, wrt, nzrows, nzcols, _, _, _, _ in self.coloring._subjac_sparsity_iter():
-                partials[of, wrt] = tots[of, wrt][nzrows, nzcols].ravel()
+            for of, wrt, tot_output, tot_input, nzrows, nzcols, _, _ in \
+                    self._coloring_subjac_iter():
+                partials[of, wrt] = np.concatenate([tots[tot_output, tot_input][nzrows, nzcols]
+                                                    for tots in node_tots])
+
+
+def _block_diag_pattern(rows, cols, nrows, ncols, num_nodes):
+    """
+    Return the sparsity pattern of a block diagonal jacobian with one block per node.
+
+    Parameters
+    ----------
+    rows : array_like
+        Row indices of the nonzero entries of each block.
+    cols : array_like
+        Column indices of the nonzero entries of each block.
+    nrows : int
+        Number of rows in each block.
+    ncols : int
+        Number of columns in each block.
+    num_nodes : int
+        Number of blocks.
+
+    Returns
+    -------
+    ndarray
+        Row indices of all nonzero entries.
+    ndarray
+        Column indices of all nonzero entries.
+    """
+    nodes = np.arange(num_nodes)[:, np.newaxis]
+    return (nodes * nrows + np.asarray(rows, dtype=int)).ravel(), \
+        (nodes * ncols + np.asarray(cols, dtype=int)).ravel()
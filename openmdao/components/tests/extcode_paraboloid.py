@@ -1,11 +1,11 @@
 #!/usr/bin/env python
 #
-# usage: extcode_paraboloid.py input_filename output_filename
+# usage: extcode_paraboloid.py input_filename output_filename [delay]
 #
 # Evaluates the equation f(x,y) = (x-3)^2 + xy + (y+4)^2 - 3.
 #
 # Read the values of `x` and `y` from input file
-# and write the value of `f_xy` to output file.
+# and write the value of `f_xy` to output file, after an optional delay in seconds.
 
 if __name__ == '__main__':
     import sys
@@ -13,6 +13,10 @@ if __name__ == '__main__':
     input_filename = sys.argv[1]
     output_filename = sys.argv[2]
 
+    if len(sys.argv) > 3:
+        import time
+        time.sleep(float(sys.argv[3]))
+
     with open(input_filename, 'r') as input_file:
         file_contents = input_file.readlines()
 
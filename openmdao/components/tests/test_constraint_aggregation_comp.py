@@ -0,0 +1,155 @@
+""" Test the ConstraintAggregationComp component. """
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.components.ks_comp import KSfunction
+from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials
+from openmdao.utils.testing_utils import force_check_partials
+
+
+def _build(g, chunk_size=None, **kwargs):
+    vec_size, width = g.shape
+
+    prob = om.Problem()
+    comp = prob.model.add_subsystem('agg', om.ConstraintAggregationComp(chunk_size=chunk_size))
+    comp.add_aggregate('ks', 'g_ks', width=width, vec_size=vec_size, method='ks', **kwargs)
+    comp.add_aggregate('ie', 'g_ie', width=width, vec_size=vec_size, method='ie', **kwargs)
+    if not kwargs.get('lower_flag'):
+        comp.add_aggregate('pnorm', 'g_pnorm', width=width, vec_size=vec_size, method='pnorm',
+                           **kwargs)
+
+    prob.setup(force_alloc_complex=True)
+
+    for name in comp._aggregates.values():
+        prob.set_val(f"agg.{name['input_name']}", g)
+
+    prob.run_model()
+
+    return prob
+
+
+class TestConstraintAggregationComp(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.g = rng.random((4, 23)) * 2. - 1.
+
+    def test_values(self):
+        g = self.g
+        prob = _build(g, rho=20.)
+
+        assert_near_equal(prob.get_val('agg.ks'), KSfunction.compute(g, 20.), 1e-12)
+
+        weights = np.exp(20. * g)
+        expected = np.sum(g * weights, axis=-1) / np.sum(weights, axis=-1)
+        assert_near_equal(prob.get_val('agg.ie').ravel(), expected, 1e-12)
+
+        expected = np.sum(np.abs(g) ** 20., axis=-1) ** (1. / 20.)
+        assert_near_equal(prob.get_val('agg.pnorm').ravel(), expected, 1e-12)
+
+        # ie is a lower bound and ks an upper bound of the maximum
+        gmax = np.max(g, axis=-1)
+        self.assertTrue(np.all(prob.get_val('agg.ie').ravel() <= gmax))
+        self.assertTrue(np.all(prob.get_val('agg.ks').ravel() >= gmax))
+
+    def test_upper_lower_flag(self):
+        g = self.g
+        prob = _build(g, upper=0.3, lower_flag=True)
+
+        assert_near_equal(prob.get_val('agg.ks'), KSfunction.compute(0.3 - g), 1e-12)
+
+        weights = np.exp(50. * (0.3 - g))
+        expected = np.sum((0.3 - g) * weights, axis=-1) / np.sum(weights, axis=-1)
+        assert_near_equal(prob.get_val('agg.ie').ravel(), expected, 1e-12)
+
+    def test_chunked(self):
+        g = self.g
+        prob = _build(g, rho=30., upper=0.1)
+
+        for chunk_size in (1, 5, 23, 100):
+            chunked = _build(g, chunk_size=chunk_size, rho=30., upper=0.1)
+            for name in ('ks', 'ie', 'pnorm'):
+                assert_near_equal(chunked.get_val(f'agg.{name}'), prob.get_val(f'agg.{name}'),
+                                  1e-12)
+
+    def test_partials(self):
+        for chunk_size in (None, 6):
+            prob = _build(self.g, chunk_size=chunk_size, rho=10., upper=0.2)
+            data = force_check_partials(prob, method='cs', out_stream=None)
+            assert_check_partials(data, atol=1e-10, rtol=1e-10)
+
+            prob = _build(self.g, chunk_size=chunk_size, rho=10., lower_flag=True)
+            data = force_check_partials(prob, method='cs', out_stream=None)
+            assert_check_partials(data, atol=1e-10, rtol=1e-10)
+
+    def test_sparse_partials(self):
+        prob = _build(self.g)
+        subjacs = prob.model.agg._subjacs_info
+
+        for name in ('ks', 'ie', 'pnorm'):
+            meta = subjacs[f'agg.{name}', f'agg.g_{name}']
+            self.assertEqual(meta['rows'].size, self.g.size)
+            self.assertEqual(meta['cols'].size, self.g.size)
+
+    def test_stable_large_values(self):
+        g = np.array([[1e3, 2e3, -5., 1e4, 9.99e3]])
+        prob = _build(g, chunk_size=2, rho=100.)
+
+        assert_near_equal(prob.get_val('agg.ks'), [[1e4]], 1e-12)
+        assert_near_equal(prob.get_val('agg.ie'), [[1e4]], 1e-12)
+        expected = 1e4 * np.sum((np.abs(g) / 1e4) ** 100.) ** 0.01
+        assert_near_equal(prob.get_val('agg.pnorm'), [[expected]], 1e-12)
+
+        g = np.array([[1e300, 2e300, 0., 1.]])
+        prob = _build(g, chunk_size=3, rho=50.)
+        assert_near_equal(prob.get_val('agg.pnorm'), [[2e300]], 1e-12)
+
+    def test_pnorm_zeros(self):
+        g = np.zeros((2, 5))
+        prob = _build(g)
+
+        assert_near_equal(prob.get_val('agg.pnorm'), np.zeros((2, 1)), 1e-12)
+        J = prob.compute_totals('agg.pnorm', 'agg.g_pnorm')
+        assert_near_equal(J['agg.pnorm', 'agg.g_pnorm'], np.zeros((2, 10)), 1e-12)
+
+    def test_add_constraint(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('agg', om.ConstraintAggregationComp('KS', 'g', width=3,
+                                                                     add_constraint=True,
+                                                                     ref=2.))
+        prob.setup()
+
+        cons = prob.model.get_constraints()
+        self.assertIn('agg.KS', cons)
+        self.assertEqual(cons['agg.KS']['upper'], 0.)
+
+    def test_errors(self):
+        comp = om.ConstraintAggregationComp()
+
+        with self.assertRaises(ValueError) as cm:
+            comp.add_aggregate('x', 'g', method='max')
+        self.assertEqual(str(cm.exception),
+                         "<class ConstraintAggregationComp>: Method 'max' for aggregate 'x' is "
+                         "not one of ['ks', 'ie', 'pnorm'].")
+
+        with self.assertRaises(ValueError) as cm:
+            comp.add_aggregate('x', 'g', method='pnorm', lower_flag=True)
+        self.assertEqual(str(cm.exception),
+                         "<class ConstraintAggregationComp>: Option 'lower_flag' is not valid "
+                         "for 'pnorm' aggregate 'x'.")
+
+        comp.add_aggregate('x', 'g')
+        with self.assertRaises(ValueError) as cm:
+            comp.add_aggregate('y', 'g')
+        self.assertEqual(str(cm.exception),
+                         "<class ConstraintAggregationComp>: Input 'g' is already aggregated.")
+
+        with self.assertRaises(ValueError) as cm:
+            comp.add_aggregate('z', 'h', units='wtfu')
+        self.assertEqual(str(cm.exception), "The units 'wtfu' are invalid.")
+
+
+if __name__ == '__main__':
+    unittest.main()
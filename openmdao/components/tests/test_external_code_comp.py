@@ -3,6 +3,7 @@ import os
 import sys
 import shutil
 import tempfile
+import time
 import unittest
 
 from scipy.optimize import fsolve
@@ -11,6 +12,7 @@ import openmdao.api as om
 from openmdao.components.external_code_comp import STDOUT
 
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
+from openmdao.utils.testing_utils import use_tempdirs
 
 DIRECTORY = os.path.dirname((os.path.abspath(__file__)))
 
@@ -617,5 +619,208 @@ class TestExternalCodeImplicitCompFeature(unittest.TestCase):
         prob.run_model()
         assert_near_equal(prob.get_val('mach'), mach_solve(area_ratio, super_sonic=super_sonic), 1e-8)
 
+
+class DelayedParaboloidComp(om.ExternalCodeComp):
+    def initialize(self):
+        self.options.declare('delay', 0.0)
+
+    def setup(self):
+        self.add_input('x', val=0.0)
+        self.add_input('y', val=0.0)
+
+        self.add_output('f_xy', val=0.0)
+
+        # each component running concurrently needs its own files
+        self.input_file = f'{self.name}_input.dat'
+        self.output_file = f'{self.name}_output.dat'
+        self.stderr = f'{self.name}_error.out'
+
+        self.options['command'] = [
+            sys.executable, 'extcode_paraboloid.py', self.input_file, self.output_file,
+            str(self.options['delay'])
+        ]
+
+    def compute(self, inputs, outputs):
+        with open(self.input_file, 'w') as input_file:
+            input_file.write('%.16f\n%.16f\n' % (inputs['x'].item(), inputs['y'].item()))
+
+        super().compute(inputs, outputs)
+
+        with open(self.output_file, 'r') as output_file:
+            outputs['f_xy'] = float(output_file.read())
+
+
+def paraboloid(x, y):
+    return (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0
+
+
+@use_tempdirs
+class TestConcurrentExternalCodes(unittest.TestCase):
+
+    def setUp(self):
+        shutil.copy(os.path.join(DIRECTORY, 'extcode_paraboloid.py'), 'extcode_paraboloid.py')
+
+    def build_model(self, concurrent, delay=0.0):
+        prob = om.Problem()
+        model = prob.model
+        model.options['concurrent_external_codes'] = concurrent
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', 1.0)
+        ivc.add_output('y', 2.0)
+
+        for name in ('p1', 'p2', 'p3'):
+            model.add_subsystem(name, DelayedParaboloidComp(delay=delay))
+            model.connect('ivc.x', f'{name}.x')
+            model.connect('ivc.y', f'{name}.y')
+
+        model.add_subsystem('total', om.ExecComp('f = f1 + f2 + f3'))
+        model.connect('p1.f_xy', 'total.f1')
+        model.connect('p2.f_xy', 'total.f2')
+        model.connect('p3.f_xy', 'total.f3')
+
+        model.add_subsystem('p4', DelayedParaboloidComp())
+        model.connect('total.f', 'p4.x')
+        model.connect('ivc.y', 'p4.y')
+
+        prob.setup()
+        return prob
+
+    def test_batches(self):
+        prob = self.build_model(concurrent=True)
+        prob.final_setup()
+
+        batches = [[s.name for s in batch] for batch in prob.model._get_concurrent_batches()]
+        self.assertEqual(batches, [['ivc'], ['p1', 'p2', 'p3'], ['total'], ['p4']])
+
+    def test_batches_skipped_systems(self):
+        prob = om.Problem()
+        model = prob.model
+        model.options['concurrent_external_codes'] = True
+
+        model.add_subsystem('p1', DelayedParaboloidComp())
+        model.add_subsystem('c1', om.ExecComp('y = 2 * x'))
+        model.add_subsystem('p2', DelayedParaboloidComp())
+        model.add_subsystem('p3', DelayedParaboloidComp())
+        model.add_subsystem('c2', om.ExecComp('y = 2 * x'))
+        model.add_subsystem('p4', DelayedParaboloidComp())
+        model.connect('p1.f_xy', 'c1.x')
+        model.connect('c1.y', 'p3.x')
+        model.connect('p2.f_xy', 'c2.x')
+        model.connect('c2.y', 'p4.x')
+
+        prob.setup()
+        prob.final_setup()
+
+        # p3 depends on c1, so it runs after it, and p4 depends on c2, which runs after p2
+        batches = [[s.name for s in batch] for batch in model._get_concurrent_batches()]
+        self.assertEqual(batches, [['_auto_ivc'], ['p1', 'p2'], ['c1'], ['p3'], ['c2'], ['p4']])
+
+    def test_concurrent_run(self):
+        prob = self.build_model(concurrent=True, delay=1.0)
+
+        start = time.perf_counter()
+        prob.run_model()
+        elapsed = time.perf_counter() - start
+
+        f_xy = paraboloid(1.0, 2.0)
+        for name in ('p1', 'p2', 'p3'):
+            assert_near_equal(prob.get_val(f'{name}.f_xy'), f_xy, 1e-12)
+        assert_near_equal(prob.get_val('p4.f_xy'), paraboloid(3 * f_xy, 2.0), 1e-12)
+
+        # the three delayed external codes take at least 3 seconds when run in order
+        self.assertLess(elapsed, 2.5)
+
+        self.assertEqual([prob.model._get_subsystem(name).iter_count for name in ('p1', 'p2')],
+                         [1, 1])
+
+    def test_same_as_serial(self):
+        results = []
+        for concurrent in (False, True):
+            prob = self.build_model(concurrent=concurrent)
+            prob.model.nonlinear_solver = om.NonlinearBlockGS(maxiter=3, iprint=-1)
+            prob.run_model()
+            results.append([prob.get_val(f'p{i}.f_xy') for i in range(1, 5)])
+
+        assert_near_equal(results[1], results[0], 1e-12)
+
+    def test_first_iteration(self):
+        prob = self.build_model(concurrent=True)
+        prob.model.nonlinear_solver = om.NonlinearBlockGS(maxiter=10, iprint=-1)
+        prob.final_setup()
+
+        batches = []
+        solve_concurrently = prob.model._solve_subsystems_concurrently
+
+        def solve(subsystems):
+            batches.append([s.name for s in subsystems])
+            solve_concurrently(subsystems)
+
+        prob.model._solve_subsystems_concurrently = solve
+        prob.run_model()
+
+        # the batch also runs concurrently in the first iteration, which runs the subsystems
+        # instead of applying them
+        self.assertEqual(prob.model.nonlinear_solver._iter_count, 2)
+        self.assertEqual(batches, [['p1', 'p2', 'p3'], ['p1', 'p2', 'p3']])
+
+    def test_block_jacobi(self):
+        results = []
+        for concurrent in (False, True):
+            prob = self.build_model(concurrent=concurrent)
+            prob.model.nonlinear_solver = om.NonlinearBlockJac(maxiter=4, iprint=-1)
+            prob.final_setup()
+
+            batches = []
+            solve_concurrently = prob.model._solve_subsystems_concurrently
+
+            def solve(subsystems):
+                batches.append([s.name for s in subsystems])
+                solve_concurrently(subsystems)
+
+            prob.model._solve_subsystems_concurrently = solve
+            prob.run_model()
+            results.append([prob.get_val(f'p{i}.f_xy') for i in range(1, 5)])
+
+        # the subsystems don't see each other's new outputs during an iteration, so all of the
+        # external codes run at the same time
+        niter = prob.model.nonlinear_solver._iter_count
+        self.assertEqual(batches, [['p1', 'p2', 'p3', 'p4']] * niter)
+        assert_near_equal(results[1], results[0], 1e-12)
+
+    def test_unsupported_solver(self):
+        prob = self.build_model(concurrent=True)
+        prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        prob.model.linear_solver = om.DirectSolver()
+
+        msg = ("NewtonSolver in <model> <class Group>: Option 'concurrent_external_codes' of "
+               "<model> <class Group> does nothing, because this solver doesn't run the "
+               "subsystems of the group.")
+
+        with assert_warning(om.SolverWarning, msg):
+            prob.final_setup()
+
+    def test_error(self):
+        prob = self.build_model(concurrent=True)
+        prob.model.p2.options['command'] = ['no-such-command']
+        prob.model.p2.add_recorder(om.SqliteRecorder('p2_cases.sql'))
+        prob.model.p3.add_recorder(om.SqliteRecorder('p3_cases.sql'))
+
+        with self.assertRaises(ValueError) as cm:
+            prob.run_model()
+        prob.cleanup()
+
+        self.assertEqual(str(cm.exception),
+                         "'p2' <class DelayedParaboloidComp>: Error calling compute(), The command "
+                         "to be executed, 'no-such-command', cannot be found")
+
+        # the other external codes in the batch still ran
+        assert_near_equal(prob.get_val('p3.f_xy'), paraboloid(1.0, 2.0), 1e-12)
+
+        # and only their iterations were recorded
+        self.assertEqual(len(om.CaseReader('p2_cases.sql').list_cases(out_stream=None)), 0)
+        self.assertEqual(len(om.CaseReader('p3_cases.sql').list_cases(out_stream=None)), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,17 @@
 import unittest
+import pickle
+from io import StringIO
+import numpy as np
 from numpy import pi
 
 import openmdao.api as om
 from openmdao.utils.mpi import MPI
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, \
      assert_check_totals
+from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.test_suite.groups.parallel_groups import FanIn, FanOut
+from openmdao.visualization.timing_viewer.timer import TimingManager
+from openmdao.visualization.timing_viewer.timing_viewer import view_cache_stats
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -488,6 +494,180 @@ class TestSubmodelComp(unittest.TestCase):
         assert_check_totals(totals, atol=1e-11, rtol=1e-11)
 
 
+def _cached_submodel_prob(use_cache=True):
+    p = om.Problem()
+    subprob = om.Problem()
+    subprob.model.add_subsystem('comp', om.ExecComp('x = r*cos(theta)', r={'units': 'm'},
+                                                    x={'units': 'm'}),
+                                promotes=['*'])
+    subprob.model.add_subsystem('comp2', om.ExecComp('y = 3.*r*x', r={'units': 'ft'},
+                                                     x={'units': 'ft'}, y={'units': 'ft**2'}),
+                                promotes=['*'])
+    subprob.model.set_input_defaults('r', val=1., units='ft')
+    submodel = om.SubmodelComp(problem=subprob, inputs=['r', 'theta'], outputs=['x', 'y'],
+                               use_cache=use_cache)
+
+    p.model.add_subsystem('submodel', submodel, promotes=['*'])
+    p.setup(force_alloc_complex=True)
+    p.set_val('r', 2.)
+    p.set_val('theta', .5)
+
+    return p
+
+
+@use_tempdirs
+class TestSubmodelCompCache(unittest.TestCase):
+    def test_cache_hits(self):
+        p = _cached_submodel_prob()
+        submodel = p.model.submodel
+
+        p.run_model()
+        p.run_model()
+        J1 = p.compute_totals(of=['x', 'y'], wrt=['r', 'theta'])
+        J2 = p.compute_totals(of=['x', 'y'], wrt=['r', 'theta'])
+
+        self.assertEqual(submodel._cache_stats['compute'], {'hits': 1, 'misses': 1})
+        self.assertEqual(submodel._cache_stats['compute_partials'], {'hits': 1, 'misses': 1})
+
+        assert_near_equal(p.get_val('x'), 2. * .3048 * np.cos(.5), 1e-12)
+        assert_near_equal(p.get_val('y'), 12. * np.cos(.5), 1e-12)
+        for key, J in J1.items():
+            assert_near_equal(J2[key], J, 1e-15)
+
+        p.set_val('r', 3.)
+        p.run_model()
+        self.assertEqual(submodel._cache_stats['compute'], {'hits': 1, 'misses': 2})
+        assert_near_equal(p.get_val('x'), 3. * .3048 * np.cos(.5), 1e-12)
+
+    def test_same_as_uncached(self):
+        p = _cached_submodel_prob()
+        ref = _cached_submodel_prob(use_cache=False)
+
+        for prob in (p, ref):
+            prob.run_model()
+            prob.set_val('theta', 1.5)
+            prob.run_model()
+            prob.set_val('theta', .5)
+            prob.run_model()
+            prob.run_model()
+
+        self.assertEqual(p.model.submodel._cache_stats['compute'], {'hits': 1, 'misses': 3})
+        self.assertEqual(ref.model.submodel._cache_stats['compute'], {'hits': 0, 'misses': 0})
+
+        # complex step runs the subproblem at other points without using the cache
+        cpd = p.check_partials(method='cs', out_stream=None)
+        assert_check_partials(cpd)
+
+        J = p.compute_totals(of=['x', 'y'], wrt=['r', 'theta'])
+        Jref = ref.compute_totals(of=['x', 'y'], wrt=['r', 'theta'])
+
+        for key, val in Jref.items():
+            assert_near_equal(J[key], val, 1e-12)
+
+        assert_near_equal(J['x', 'theta'][0, 0], -2. * .3048 * np.sin(.5), 1e-12)
+        assert_near_equal(p.get_val('x'), ref.get_val('x'), 1e-15)
+
+    def test_direct_boundary_slices(self):
+        p = _cached_submodel_prob()
+        p.run_model()
+
+        in_direct, in_indirect, out_direct, out_indirect = \
+            p.model.submodel._get_boundary_slices()
+
+        # r has the units of the auto_ivc output, so it doesn't need a unit conversion
+        self.assertEqual(len(in_direct), 2)
+        self.assertEqual(in_indirect, [])
+        self.assertEqual(len(out_direct), 2)
+        self.assertEqual(out_indirect, [])
+
+    def test_timing_cache_stats(self):
+        p = _cached_submodel_prob()
+
+        tmanager = TimingManager()
+        tmanager.add_timings([('submodel', p.model.submodel, 1)], ['compute'])
+
+        p.run_model()
+        p.run_model()
+
+        with open('timings.pkl', 'wb') as f:
+            pickle.dump([({'prob': tmanager}, 1.)], f)
+
+        stream = StringIO()
+        stats = view_cache_stats('timings.pkl', out_stream=stream)
+
+        self.assertEqual(stats, [(0, 'prob', 'SubmodelComp', 'submodel', 'compute', 1, 1)])
+        self.assertIn('Cache hit rates', stream.getvalue())
+        self.assertIn('50.00%', stream.getvalue())
+
+
+class TestVectorizedSubmodelComp(unittest.TestCase):
+    def _build(self, num_nodes, coloring=False, use_cache=True):
+        subprob = om.Problem()
+        subprob.model.add_subsystem('comp', om.ExecComp(['x = r*cos(theta)', 'y = r*sin(theta)**2'],
+                                                        r=np.ones(3), theta=np.ones(3),
+                                                        x=np.ones(3), y=np.ones(3),
+                                                        has_diag_partials=True),
+                                    promotes=['*'])
+        if coloring:
+            subprob.driver.declare_coloring()
+
+        p = om.Problem()
+        p.model.add_subsystem('sub', om.SubmodelComp(problem=subprob, inputs=['r', 'theta'],
+                                                     outputs=['x', 'y'], num_nodes=num_nodes,
+                                                     use_cache=use_cache),
+                              promotes=['*'])
+        p.setup(force_alloc_complex=True)
+
+        rng = np.random.default_rng(11)
+        p.set_val('r', rng.random((num_nodes, 3)) + 1.)
+        p.set_val('theta', rng.random((num_nodes, 3)))
+
+        return p
+
+    def test_outputs(self):
+        p = self._build(4)
+        p.run_model()
+
+        r = p.get_val('r')
+        theta = p.get_val('theta')
+        x = p.get_val('x')
+
+        self.assertEqual(x.shape, (4, 3))
+        assert_near_equal(x, r * np.cos(theta), 1e-12)
+        assert_near_equal(p.get_val('y'), r * np.sin(theta)**2, 1e-12)
+
+    def test_block_diag_partials(self):
+        for coloring in (False, True):
+            for use_cache in (False, True):
+                with self.subTest(coloring=coloring, use_cache=use_cache):
+                    p = self._build(4, coloring=coloring, use_cache=use_cache)
+                    p.run_model()
+
+                    subjacs = p.model.sub._subjacs_info
+                    nnz = 4 * (3 if coloring else 9)
+                    self.assertEqual(len(subjacs['sub.x', 'sub.r']['rows']), nnz)
+
+                    cpd = p.check_partials(method='cs', out_stream=None)
+                    assert_check_partials(cpd, atol=1e-10, rtol=1e-10)
+
+                    J = p.compute_totals(of=['x'], wrt=['theta'])
+                    assert_near_equal(J['x', 'theta'],
+                                      np.diag((-p.get_val('r') * np.sin(p.get_val('theta'))).ravel()),
+                                      1e-12)
+
+    def test_single_subproblem(self):
+        p = self._build(5)
+        subprob = p.model.sub._subprob
+        p.run_model()
+
+        self.assertIs(p.model.sub._subprob, subprob)
+        self.assertEqual(subprob.model.comp.iter_count, 5)
+
+        # a repeated point is taken from the cache
+        p.run_model()
+        self.assertEqual(subprob.model.comp.iter_count, 5)
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestSubmodelCompMPI(unittest.TestCase):
     N_PROCS = 2
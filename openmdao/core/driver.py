@@ -1,4 +1,5 @@
 """Define a base class for all Drivers in OpenMDAO."""
+from collections import OrderedDict
 from itertools import chain
 import pprint
 import sys
@@ -93,6 +94,24 @@ class Driver(object):
         Dictionary containing information for use in the optimization report.
     _has_scaling : bool
         If True, scaling has been set for this driver.
+    _voi_plans : dict
+        Compiled plans used to get the values of each type of VOI and to set design vars,
+        built on first use after setup. False if the values of a type of VOI can't be gathered
+        with a plan.
+    _design_cache : OrderedDict
+        Cached responses and total derivatives of the most recently used design points, keyed
+        by the bytes of the design vector.
+    _design_cache_hits : dict
+        Number of times cached responses and total derivatives were reused in the current run.
+    _model_design_key : bytes or None
+        Key of the design point that the model was last run at, if known.
+    _hotstart_cases : list
+        Driver scaled design vectors, responses and total derivatives of the cases loaded from a
+        hot start file, in the order they were recorded.
+    _hotstart_index : int
+        Index of the next case of the hot start file to be replayed.
+    _hotstart_hits : int
+        Number of times a case from the hot start file was used in the current run.
     """
 
     def __init__(self, **kwargs):
@@ -126,6 +145,12 @@ class Driver(object):
                                   'variable to one of the valid options.',
                              default=default_desvar_behavior)
 
+        self.options.declare('memoize', types=int, default=0, lower=0,
+                             desc='Number of design points whose responses and total derivatives '
+                                  'are cached, so that the model is not run again when the '
+                                  'optimizer returns to one of them. The cache is only used by '
+                                  'drivers that support it. Set to 0 to disable the cache.')
+
         # Case recording options
         self.recording_options = OptionsDictionary(parent_name=type(self).__name__)
 
@@ -194,10 +219,20 @@ class Driver(object):
             'iter_count': 0,
             'obj_calls': 0,
             'deriv_calls': 0,
+            'cache_hits': {'responses': 0, 'totals': 0},
             'exit_status': 'NOT_RUN'
         }
 
         self._has_scaling = False
+        self._voi_plans = {}
+
+        self._design_cache = OrderedDict()
+        self._design_cache_hits = {'responses': 0, 'totals': 0}
+        self._model_design_key = None
+
+        self._hotstart_cases = []
+        self._hotstart_index = 0
+        self._hotstart_hits = 0
 
         # Want to allow the setting of hooks on Drivers
         _setup_hooks(self)
@@ -286,6 +321,7 @@ class Driver(object):
         model = problem.model
 
         self._total_jac = None
+        self._voi_plans = {}
 
         # Determine if any design variables are discrete.
         self._designvars_discrete = [name for name, meta in self._designvars.items()
@@ -689,6 +725,191 @@ class Driver(object):
 
         return val
 
+    def _build_voi_plan(self, vois, remote_vois):
+        """
+        Compile the plan used to gather the values of all of the given VOIs at once.
+
+        Local values are pulled out of the output vector with one index array, and the
+        values of remote and distributed VOIs are all exchanged with a single Allgatherv.
+
+        Parameters
+        ----------
+        vois : dict
+            Metadata of the VOIs, keyed by name.
+        remote_vois : dict
+            Dict containing (owning_rank, size) for all remote vois of a particular
+            type (design var, constraint, or objective).
+
+        Returns
+        -------
+        dict or None
+            The plan, or None if the values can't be gathered this way.
+        """
+        model = self._problem().model
+        comm = model.comm
+        rank = comm.rank
+        slices = model._outputs.get_slice_dict()
+        discrete_outs = model._var_allprocs_discrete['output']
+
+        def local_idxs(src_name, idxs):
+            # indices of the given entries of a local source in the flat output array
+            slc = slices[src_name]
+            rng = np.arange(slc.start, slc.stop)
+            return rng if idxs is _full_slice else rng[idxs]
+
+        val_slices = {}
+        discrete = []
+        src_idxs = []
+        dst_idxs = []
+        pieces = [[] for _ in range(comm.size)]
+        scalers = []
+        adders = []
+        has_scaler = has_adder = False
+        size = 0
+
+        for name, meta in vois.items():
+            src_name = meta['source']
+            drv_name = _src_or_alias_name(meta)
+            indices = meta['indices']
+
+            if src_name in discrete_outs:
+                discrete.append(name)
+                continue
+
+            if drv_name in remote_vois:
+                owner, vsize = remote_vois[drv_name]
+                if owner is None:
+                    return
+                if indices is not None:
+                    vsize = indices.indexed_src_size
+                idxs = None
+                if owner == rank:
+                    idxs = local_idxs(src_name,
+                                      _full_slice if indices is None else indices.as_array())
+                pieces[owner].append((idxs, size, vsize))
+
+            elif MPI and drv_name in self._dist_driver_vars:
+                loc_indices, sizes, _ = self._dist_driver_vars[drv_name]
+                vsize = np.sum(sizes)
+                offsets = sizes2offsets(sizes)
+                for irank, rsize in enumerate(sizes):
+                    idxs = None
+                    if irank == rank:
+                        idxs = local_idxs(src_name, _full_slice if loc_indices is _full_slice
+                                          else loc_indices.flat())
+                    pieces[irank].append((idxs, size + offsets[irank], rsize))
+
+            elif src_name in slices:
+                idxs = local_idxs(src_name,
+                                  _full_slice if indices is None else indices.as_array())
+                vsize = idxs.size
+                src_idxs.append(idxs)
+                dst_idxs.append(np.arange(size, size + vsize))
+
+            else:
+                return
+
+            val_slices[name] = slice(size, size + vsize)
+            size += vsize
+
+            scaler = meta['total_scaler']
+            has_scaler |= scaler is not None
+            scalers.append(np.broadcast_to(1.0 if scaler is None else scaler, vsize))
+
+            adder = meta['total_adder']
+            has_adder |= adder is not None
+            adders.append(np.broadcast_to(0.0 if adder is None else adder, vsize))
+
+        def concat(arrs, dtype=float):
+            return np.concatenate(arrs) if arrs else np.zeros(0, dtype=dtype)
+
+        recv_sizes = np.array([sum(p[2] for p in rpieces) for rpieces in pieces], dtype=INT_DTYPE)
+
+        return {
+            'names': list(vois),
+            'size': size,
+            'val_slices': val_slices,
+            'discrete': discrete,
+            'src_idxs': concat(src_idxs, INT_DTYPE),
+            'dst_idxs': concat(dst_idxs, INT_DTYPE),
+            'send_idxs': concat([p[0] for p in pieces[rank]], INT_DTYPE),
+            'recv_sizes': recv_sizes,
+            'recv_offsets': sizes2offsets(recv_sizes),
+            'recv_dst_idxs': concat([np.arange(start, start + psize) for rpieces in pieces
+                                     for _, start, psize in rpieces], INT_DTYPE),
+            'scaler': concat(scalers) if has_scaler else None,
+            'adder': concat(adders) if has_adder else None,
+        }
+
+    def _get_voi_vals(self, kind, vois, remote_vois, driver_scaling=True, get_remote=True):
+        """
+        Return the values of all of the given VOIs.
+
+        Parameters
+        ----------
+        kind : str
+            Type of the VOIs, used to look up their compiled plan.
+        vois : dict
+            Metadata of the VOIs, keyed by name.
+        remote_vois : dict
+            Dict containing (owning_rank, size) for all remote vois of a particular
+            type (design var, constraint, or objective).
+        driver_scaling : bool
+            When True, return values that are scaled according to either the adder and scaler or
+            the ref and ref0 values that were specified when add_design_var, add_objective, and
+            add_constraint were called on the model. Default is True.
+        get_remote : bool or None
+            If True, retrieve the value even if it is on a remote process.  Note that if the
+            variable is remote on ANY process, this function must be called on EVERY process
+            in the Problem's MPI communicator.
+            If False, only retrieve the value if it is on the current process, or only the part
+            of the value that's on the current process for a distributed variable.
+
+        Returns
+        -------
+        dict
+            Values of the VOIs, keyed by name.
+        """
+        model = self._problem().model
+        comm = model.comm
+
+        plan = False
+        if get_remote or comm.size == 1:
+            plan = self._voi_plans.get(kind)
+            # some drivers add VOIs after setup, e.g. bounds as constraints for COBYLA. False
+            # means that the values can't be gathered with a plan, which doesn't change when
+            # VOIs are added.
+            if plan is None or (plan is not False and plan['names'] != list(vois)):
+                plan = self._build_voi_plan(vois, remote_vois)
+                self._voi_plans[kind] = plan = False if plan is None else plan
+
+        if plan is False:
+            return {n: self._get_voi_val(n, meta, remote_vois, get_remote=get_remote,
+                                         driver_scaling=driver_scaling)
+                    for n, meta in vois.items()}
+
+        arr = model._outputs.asarray()
+        flat = np.empty(plan['size'], dtype=arr.dtype)
+        flat[plan['dst_idxs']] = arr[plan['src_idxs']]
+
+        recv_sizes = plan['recv_sizes']
+        if recv_sizes.size > 1 and np.any(recv_sizes):
+            send = np.ascontiguousarray(arr[plan['send_idxs']].real)
+            recv = np.zeros(np.sum(recv_sizes))
+            comm.Allgatherv(send, [recv, recv_sizes, plan['recv_offsets'], MPI.DOUBLE])
+            flat[plan['recv_dst_idxs']] = recv
+
+        if self._has_scaling and driver_scaling:
+            if plan['adder'] is not None:
+                flat += plan['adder']
+            if plan['scaler'] is not None:
+                flat *= plan['scaler']
+
+        val_slices = plan['val_slices']
+        discrete = plan['discrete']
+        return {n: self._get_voi_val(n, meta, remote_vois, driver_scaling=driver_scaling)
+                if n in discrete else flat[val_slices[n]] for n, meta in vois.items()}
+
     def get_driver_objective_calls(self):
         """
         Return number of objective evaluations made during a driver run.
@@ -711,6 +932,236 @@ class Driver(object):
         """
         return 0
 
+    def get_driver_cache_hits(self):
+        """
+        Return the number of times cached values were reused during a driver run.
+
+        Returns
+        -------
+        dict
+            Number of evaluations of the responses ('responses') and of the total derivatives
+            ('totals') that were taken from the design point cache instead of the model.
+        """
+        return self._design_cache_hits.copy()
+
+    def _reset_design_cache(self):
+        """
+        Clear the design point cache at the start of a run.
+        """
+        self._design_cache.clear()
+        self._design_cache_hits = {'responses': 0, 'totals': 0}
+        self._model_design_key = None
+
+    def _get_design_key(self, x):
+        """
+        Return the key of a design point in the design point cache.
+
+        Parameters
+        ----------
+        x : ndarray
+            The flat design vector.
+
+        Returns
+        -------
+        bytes or None
+            The key of the design point, or None if neither the cache nor a hot start is used.
+        """
+        if self.options['memoize'] > 0 or self._hotstart_cases:
+            return np.ascontiguousarray(x, dtype=float).tobytes()
+
+    def _get_cached(self, key, kind):
+        """
+        Return cached values for a design point.
+
+        Parameters
+        ----------
+        key : bytes or None
+            The key of the design point.
+        kind : str
+            Kind of the cached values, either 'responses' or 'totals'.
+
+        Returns
+        -------
+        object or None
+            The cached values, or None if they aren't cached.
+        """
+        if key is None:
+            return None
+
+        entry = self._design_cache.get(key)
+        if entry is None or kind not in entry:
+            return None
+
+        self._design_cache.move_to_end(key)
+        self._design_cache_hits[kind] += 1
+        return entry[kind]
+
+    def _set_cached(self, key, kind, value):
+        """
+        Cache values for a design point, discarding the least recently used point if needed.
+
+        Parameters
+        ----------
+        key : bytes or None
+            The key of the design point.
+        kind : str
+            Kind of the cached values, either 'responses' or 'totals'.
+        value : object
+            The values to cache. They must not be modified afterwards.
+        """
+        if key is None or self.options['memoize'] < 1:
+            return
+
+        cache = self._design_cache
+        try:
+            entry = cache[key]
+        except KeyError:
+            entry = cache[key] = {}
+            while len(cache) > self.options['memoize']:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        entry[kind] = value
+
+    def get_driver_hotstart_hits(self):
+        """
+        Return the number of evaluations taken from the hot start file during a driver run.
+
+        Returns
+        -------
+        int
+            Number of design points whose responses were taken from the hot start file instead
+            of the model.
+        """
+        return self._hotstart_hits
+
+    def _load_hotstart_cases(self, filename):
+        """
+        Load the responses, total derivatives and data of the cases recorded in a previous run.
+
+        The driver cases are kept in the order they were recorded, because they are replayed in
+        that order. Loading stops at the first case that misses one of the design variables,
+        objectives or constraints of this driver. The recorded data is kept so that replayed cases
+        can be recorded again.
+
+        Parameters
+        ----------
+        filename : str or None
+            Path of the case recorder database, or None to disable the hot start.
+        """
+        self._hotstart_cases = []
+        self._hotstart_index = 0
+        self._hotstart_hits = 0
+        if filename is None:
+            return
+
+        from openmdao.recorders.case_reader import CaseReader
+
+        cr = CaseReader(filename)
+        totals = cr._driver_cases.get_derivatives_by_counter()
+
+        def _recorded_val(case, meta):
+            val = np.asarray(case[meta['source']]).ravel()
+            if meta['indices'] is not None:
+                val = val[meta['indices'].flat()]
+            val = val.astype(float)
+
+            # values are compared and returned the way the driver sees them
+            if meta['total_adder'] is not None:
+                val += meta['total_adder']
+            if meta['total_scaler'] is not None:
+                val *= meta['total_scaler']
+            return val
+
+        def _recorded_data(vals):
+            # the values the way they were passed to the recorder
+            return {} if vals is None else {name: vals._values[name] for name in vals._keys}
+
+        for case in cr.get_cases('driver', recurse=False):
+            try:
+                x = np.concatenate([_recorded_val(case, meta)
+                                    for meta in self._designvars.values()])
+                vals = {name: _recorded_val(case, meta)
+                        for name, meta in chain(self._objs.items(), self._cons.items())}
+            except (KeyError, TypeError, ValueError):
+                break
+
+            self._hotstart_cases.append({'x': x, 'success': case.success, 'msg': case.msg,
+                                         'responses': vals, 'totals': totals.get(case.counter),
+                                         'data': {'input': _recorded_data(case.inputs),
+                                                  'output': _recorded_data(case.outputs),
+                                                  'residual': _recorded_data(case.residuals)}})
+
+    def _get_hotstart_case(self):
+        """
+        Return the next hot start case if it was recorded at the current design point.
+
+        As in the hot start of pyOptSparse, the cases are replayed in the order they were
+        recorded, and the first design point that doesn't match the next case ends the replay.
+        Design points are compared on the driver scaled design vector, within a tolerance.
+
+        Returns
+        -------
+        dict or None
+            The driver scaled 'responses' and 'totals' of the case, or None if the design point
+            doesn't match the next case or that case failed.
+        """
+        if self._hotstart_index >= len(self._hotstart_cases):
+            return None
+
+        entry = self._hotstart_cases[self._hotstart_index]
+        try:
+            x = np.concatenate([np.asarray(val, dtype=float).ravel()
+                                for val in self.get_design_var_values().values()])
+            match = x.shape == entry['x'].shape and np.allclose(x, entry['x'],
+                                                                rtol=1e-12, atol=1e-12)
+        except (TypeError, ValueError):
+            match = False
+
+        if not match:
+            self._hotstart_index = len(self._hotstart_cases)
+            return None
+
+        self._hotstart_index += 1
+        if not entry['success']:
+            return None
+
+        self._hotstart_hits += 1
+        return entry
+
+    def _record_hotstart_case(self, entry):
+        """
+        Record a case replayed from the hot start file with the values recorded for it.
+
+        The case is recorded with a hotstart flag in its metadata, so that the new case recording
+        is complete and can be used to hot start a later run.
+
+        Parameters
+        ----------
+        entry : dict
+            The hot start case returned by _get_hotstart_case.
+        """
+        if not self._rec_mgr._recorders:
+            return
+
+        name = self._get_name()
+        self._recording_iter.push((name, self.iter_count))
+        try:
+            metadata = create_local_meta(name)
+            metadata.update(success=entry['success'], msg=entry['msg'], hotstart=True)
+            self._rec_mgr.record_iteration(self, entry['data'], metadata)
+
+            totals = entry['totals']
+            if totals is not None and self.recording_options['record_derivatives']:
+                metadata = create_local_meta(name)
+                metadata['hotstart'] = True
+                self._rec_mgr.record_derivatives(self, {'!'.join(key): val
+                                                        for key, val in totals.items()},
+                                                 metadata)
+        finally:
+            self._recording_iter.pop()
+
     def get_design_var_values(self, get_remote=True, driver_scaling=True):
         """
         Return the design variable values.
@@ -733,9 +1184,8 @@ class Driver(object):
         dict
            Dictionary containing values of each design variable.
         """
-        return {n: self._get_voi_val(n, dv, self._remote_dvs, get_remote=get_remote,
-                                     driver_scaling=driver_scaling)
-                for n, dv in self._designvars.items()}
+        return self._get_voi_vals('desvars', self._designvars, self._remote_dvs,
+                                  driver_scaling=driver_scaling, get_remote=get_remote)
 
     def set_design_var(self, name, value, set_remote=True):
         """
@@ -783,34 +1233,72 @@ class Driver(object):
             problem.model._discrete_outputs[src_name] = value
 
         elif problem.model._outputs._contains_abs(src_name):
-            desvar = problem.model._outputs._abs_get_val(src_name)
-            if drv_name in self._dist_driver_vars:
-                loc_idxs, _, dist_idxs = self._dist_driver_vars[drv_name]
-                loc_idxs = loc_idxs()  # don't use indexer here
-            else:
-                loc_idxs = meta['indices']
-                if loc_idxs is None:
-                    loc_idxs = _full_slice
-                else:
-                    loc_idxs = loc_idxs()
-                dist_idxs = _full_slice
+            set_plans = self._voi_plans.setdefault('set_desvars', {})
+            try:
+                idxs, shape, dist_idxs, inv_scaler, adder = set_plans[name]
+            except KeyError:
+                idxs, shape, dist_idxs, inv_scaler, adder = set_plans[name] = \
+                    self._build_set_desvar_plan(meta)
 
+            val = np.empty(shape, dtype=problem.model._outputs.asarray().dtype)
             if set_remote:
                 # provided value is the global value, use indices for this proc
-                desvar[loc_idxs] = np.atleast_1d(value)[dist_idxs]
+                val[...] = np.atleast_1d(value)[dist_idxs]
             else:
                 # provided value is the local value
-                desvar[loc_idxs] = np.atleast_1d(value)
+                val[...] = np.atleast_1d(value)
 
             # Undo driver scaling when setting design var values into model.
-            if self._has_scaling:
-                scaler = meta['total_scaler']
-                if scaler is not None:
-                    desvar[loc_idxs] *= 1.0 / scaler
+            if inv_scaler is not None:
+                val *= inv_scaler
+            if adder is not None:
+                val -= adder
 
-                adder = meta['total_adder']
-                if adder is not None:
-                    desvar[loc_idxs] -= adder
+            problem.model._outputs.asarray()[idxs] = val.ravel()
+
+    def _build_set_desvar_plan(self, meta):
+        """
+        Compile the indices and scaling used to set a local design variable.
+
+        Parameters
+        ----------
+        meta : dict
+            Metadata of the design variable.
+
+        Returns
+        -------
+        tuple
+            Indices of the entries set in the flat output array, shape of the value being set,
+            indices of the local part of a global value, and the inverse scaler and adder to
+            apply, or None.
+        """
+        model = self._problem().model
+        src_name = meta['source']
+        drv_name = _src_or_alias_name(meta)
+
+        desvar = model._outputs._abs_get_val(src_name)
+        if drv_name in self._dist_driver_vars:
+            loc_idxs, _, dist_idxs = self._dist_driver_vars[drv_name]
+            loc_idxs = loc_idxs()  # don't use indexer here
+        else:
+            loc_idxs = meta['indices']
+            if loc_idxs is None:
+                loc_idxs = _full_slice
+            else:
+                loc_idxs = loc_idxs()
+            dist_idxs = _full_slice
+
+        # positions of the indexed entries in the flat output array, in the order they are set
+        start = model._outputs.get_slice_dict()[src_name].start
+        pos = np.arange(start, start + desvar.size)[loc_idxs]
+
+        inv_scaler = adder = None
+        if self._has_scaling:
+            if meta['total_scaler'] is not None:
+                inv_scaler = 1.0 / meta['total_scaler']
+            adder = meta['total_adder']
+
+        return np.ravel(pos), np.shape(pos), dist_idxs, inv_scaler, adder
 
     def get_objective_values(self, driver_scaling=True):
         """
@@ -828,9 +1316,8 @@ class Driver(object):
         dict
            Dictionary containing values of each objective.
         """
-        return {n: self._get_voi_val(n, obj, self._remote_objs,
-                                     driver_scaling=driver_scaling)
-                for n, obj in self._objs.items()}
+        return self._get_voi_vals('objs', self._objs, self._remote_objs,
+                                  driver_scaling=driver_scaling)
 
     def get_constraint_values(self, ctype='all', lintype='all', driver_scaling=True):
         """
@@ -854,7 +1341,7 @@ class Driver(object):
         dict
            Dictionary containing values of each constraint.
         """
-        con_dict = {}
+        cons = {}
         for name, meta in self._cons.items():
             if lintype == 'linear' and not meta['linear']:
                 continue
@@ -868,10 +1355,11 @@ class Driver(object):
             if ctype == 'ineq' and meta['equals'] is not None:
                 continue
 
-            con_dict[name] = self._get_voi_val(name, meta, self._remote_cons,
-                                               driver_scaling=driver_scaling)
+            cons[name] = meta
 
-        return con_dict
+        # each filter gets its own plan so that only the requested constraints are gathered
+        return self._get_voi_vals(f'cons_{ctype}_{lintype}', cons, self._remote_cons,
+                                  driver_scaling=driver_scaling)
 
     def _get_ordered_nl_responses(self):
         """
@@ -1132,7 +1620,8 @@ class Driver(object):
                          perturb_size=coloring_mod._DEF_COMP_SPARSITY_ARGS['perturb_size'],
                          min_improve_pct=coloring_mod._DEF_COMP_SPARSITY_ARGS['min_improve_pct'],
                          show_summary=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_summary'],
-                         show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity']):
+                         show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity'],
+                         sparsity_method='numeric'):
         """
         Set options for total deriv coloring.
 
@@ -1153,7 +1642,15 @@ class Driver(object):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        sparsity_method : str
+            How to determine the total jacobian sparsity. 'numeric' computes 'num_full_jacs'
+            total jacobians. 'symbolic' propagates the sparsity of the declared partials through
+            the model without any linear solves, falling back to 'numeric' if that isn't possible.
         """
+        if sparsity_method not in ('numeric', 'symbolic'):
+            raise ValueError(f"{self.msginfo}: sparsity_method must be 'numeric' or 'symbolic', "
+                             f"but '{sparsity_method}' was given.")
+
         self._coloring_info['num_full_jacs'] = num_full_jacs
         self._coloring_info['tol'] = tol
         self._coloring_info['orders'] = orders
@@ -1166,6 +1663,7 @@ class Driver(object):
         self._coloring_info['coloring'] = None
         self._coloring_info['show_summary'] = show_summary
         self._coloring_info['show_sparsity'] = show_sparsity
+        self._coloring_info['sparsity_method'] = sparsity_method
 
     def use_fixed_coloring(self, coloring=coloring_mod._STD_COLORING_FNAME):
         """
@@ -1477,6 +1975,7 @@ class SaveOptResult(object):
             'iter_count': driver.iter_count,
             'obj_calls': driver.get_driver_objective_calls(),
             'deriv_calls': driver.get_driver_derivative_calls(),
+            'cache_hits': driver.get_driver_cache_hits(),
             'exit_status': driver.get_exit_status()
         }
 
@@ -1521,7 +2020,7 @@ class RecordingDebugging(Recording):
             Solver recording requires extra args.
         """
         self.recording_requester()._post_run_model_debug_print()
-        super().__exit__()
+        super().__exit__(*args)
 
 
 def record_iteration(requester, prob, case_name):
@@ -1,6 +1,7 @@
 """Define the Group class."""
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from collections.abc import Iterable
 
 from itertools import product, chain
@@ -192,6 +193,9 @@ class Group(System):
         Set of absolute response names.
     _relevance_graph : nx.DiGraph
         Graph of relevance connections.  Always None except in the top level Group.
+    _concurrent_batches : dict
+        Batches of subsystems iterated over by solvers when the 'concurrent_external_codes'
+        option is True, keyed by optimization status.
     """
 
     def __init__(self, **kwargs):
@@ -222,6 +226,7 @@ class Group(System):
         self._abs_desvars = None
         self._abs_responses = None
         self._relevance_graph = None
+        self._concurrent_batches = {}
 
         # TODO: we cannot set the solvers with property setters at the moment
         # because our lint check thinks that we are defining new attributes
@@ -235,6 +240,14 @@ class Group(System):
                              desc='If True the order of subsystems is determined automatically '
                              'based on the dependency graph.  It will not break or reorder '
                              'cycles.')
+        self.options.declare('concurrent_external_codes', types=bool, default=False,
+                             desc='If True, independent ExternalCodeComps and '
+                             'ExternalCodeImplicitComps that are subsystems of this group run '
+                             'their external codes at the same time, and the systems that '
+                             'depend on them run once they have all finished. Each of them must '
+                             'use its own input, output and stream files. This only applies '
+                             'when the group runs on a single process, with a nonlinear solver '
+                             'that runs its subsystems.')
 
     def setup(self):
         """
@@ -565,6 +578,7 @@ class Group(System):
                 issue_warning(msg, prefix=self.msginfo, category=MPIWarning)
 
         self.comm = comm
+        self._concurrent_batches = {}
 
         self._subsystems_allprocs = self._static_subsystems_allprocs.copy()
         self._manual_connections = self._static_manual_connections.copy()
@@ -4864,6 +4878,152 @@ class Group(System):
                     if s._run_on_opt[opt_status]:
                         yield s
 
+    def _solver_subsystem_batch_iter(self):
+        """
+        Iterate over batches of the subsystems that are being optimized, in execution order.
+
+        Each batch contains a single subsystem, unless the 'concurrent_external_codes' option is
+        True. In that case, the batch of an external code component also contains the later
+        external code components that don't depend on it or on any system in between, so they
+        can all run at the same time.
+
+        Yields
+        ------
+        list of System
+            A batch of subsystems.
+        """
+        if not self.options['concurrent_external_codes'] or self.comm.size > 1:
+            for subsys in self._solver_subsystem_iter(local_only=False):
+                yield [subsys]
+            return
+
+        opt_status = self._problem_meta['opt_status']
+        if opt_status not in self._concurrent_batches:
+            self._concurrent_batches[opt_status] = self._get_concurrent_batches()
+
+        yield from self._concurrent_batches[opt_status]
+
+    def _solver_subsystem_jacobi_batch_iter(self):
+        """
+        Iterate over batches of the local subsystems being optimized, for a block Jacobi solve.
+
+        The subsystems don't see each other's new outputs during a block Jacobi iteration, so if
+        the 'concurrent_external_codes' option is True, all of the subsystems that can run at the
+        same time form a single batch. It runs in place of the first of them.
+
+        Yields
+        ------
+        list of System
+            A batch of subsystems.
+        """
+        subsystems = list(self._solver_subsystem_iter(local_only=True))
+        concurrent = []
+        if self.options['concurrent_external_codes'] and self.comm.size == 1:
+            concurrent = [s for s in subsystems if _runs_concurrently(s)]
+
+        for subsys in subsystems:
+            if len(concurrent) < 2 or subsys not in concurrent:
+                yield [subsys]
+            elif subsys is concurrent[0]:
+                yield concurrent
+
+    def _get_concurrent_batches(self):
+        """
+        Group the subsystems being optimized into batches that can run at the same time.
+
+        An external code component can run in the batch of an earlier one if it isn't connected
+        to any of the systems from the start of that batch up to itself. Systems that are skipped
+        over keep their order and run after the batch, so each system sees the same input values
+        as it would when running in order.
+
+        Returns
+        -------
+        list of list of System
+            The batches of subsystems, in execution order.
+        """
+        graph = self.compute_sys_graph()
+        remaining = list(self._solver_subsystem_iter(local_only=False))
+        batches = []
+
+        while remaining:
+            first = remaining[0]
+            batch = [first]
+            rest = []
+
+            if _runs_concurrently(first):
+                skipped = {first.name}
+                for subsys in remaining[1:]:
+                    name = subsys.name
+                    if _runs_concurrently(subsys) and \
+                            skipped.isdisjoint(graph.pred[name]) and \
+                            skipped.isdisjoint(graph.succ[name]):
+                        batch.append(subsys)
+                    else:
+                        rest.append(subsys)
+                    skipped.add(name)
+            else:
+                rest = remaining[1:]
+
+            batches.append(batch)
+            remaining = rest
+
+        return batches
+
+    def _solve_subsystem_batch(self, batch):
+        """
+        Transfer the inputs of a batch of subsystems and run their nonlinear solves.
+
+        Parameters
+        ----------
+        batch : list of System
+            A batch of subsystems from _solver_subsystem_batch_iter.
+        """
+        for subsys in batch:
+            self._transfer('nonlinear', 'fwd', subsys.name)
+
+        if len(batch) > 1:
+            self._solve_subsystems_concurrently(batch)
+        elif batch[0]._is_local:
+            batch[0]._solve_nonlinear()
+
+    def _solve_subsystems_concurrently(self, subsystems):
+        """
+        Run the nonlinear solves of independent subsystems, like external codes, at the same time.
+
+        The user functions that run the external codes are called in a separate thread for each
+        component. The iterations that succeeded are recorded in this thread once all of them
+        have finished, and the first error, if any, is raised after that.
+
+        Parameters
+        ----------
+        subsystems : list of System
+            The subsystems to run, which define _concurrent_solve_nonlinear.
+        """
+        steps = []
+        try:
+            funcs = []
+            for subsys in subsystems:
+                step = subsys._concurrent_solve_nonlinear()
+                funcs.append(next(step))
+                steps.append(step)
+
+            with ThreadPoolExecutor(max_workers=len(funcs)) as executor:
+                futures = [executor.submit(func) for func in funcs]
+        except BaseException:
+            for step in steps:
+                step.close()
+            raise
+
+        # a failed iteration is not recorded
+        for step, future in zip(steps, futures):
+            if future.exception() is None:
+                next(step, None)
+            else:
+                step.close()
+
+        for future in futures:
+            future.result()
+
     def _setup_iteration_lists(self):
         """
         Set up the lists containing the pre, iterated, and post subsets of systems.
@@ -5099,3 +5259,22 @@ class Group(System):
                     self._subsystems_myproc[0]._full_comm.rank == 0
 
         return False
+
+
+def _runs_concurrently(system):
+    """
+    Return True if the given system can run its nonlinear solve concurrently with others.
+
+    Such systems, like the external code components, define _concurrent_solve_nonlinear.
+
+    Parameters
+    ----------
+    system : System
+        The system to check.
+
+    Returns
+    -------
+    bool
+        True if the system can run at the same time as other such systems.
+    """
+    return hasattr(system, '_concurrent_solve_nonlinear') and system._nonlinear_solver is None
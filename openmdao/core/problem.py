@@ -4,6 +4,7 @@ import __main__
 
 import sys
 import pprint
+import time
 import os
 import weakref
 import pathlib
@@ -46,6 +47,7 @@ from openmdao.utils.hooks import _setup_hooks, _reset_all_hooks
 from openmdao.utils.record_util import create_local_meta
 from openmdao.utils.array_utils import scatter_dist_to_local
 from openmdao.utils.class_util import overrides_method
+from openmdao.utils.concurrent import concurrent_eval_async
 from openmdao.utils.reports_system import get_reports_to_activate, activate_reports, \
     clear_reports, get_reports_dir, _load_report_plugins
 from openmdao.utils.general_utils import ContainsAll, pad_name, LocalRangeIterable, \
@@ -289,6 +291,14 @@ class Problem(object):
         self.options.declare('coloring_dir', types=str,
                              default=os.path.join(os.getcwd(), 'coloring_files'),
                              desc='Directory containing coloring files (if any) for this Problem.')
+        self.options.declare('coloring_cache_dir', types=str, allow_none=True,
+                             default=os.environ.get('OPENMDAO_COLORING_CACHE_DIR'),
+                             desc='Directory where dynamically computed total and partial '
+                                  'colorings are cached, keyed by a hash of the structure of '
+                                  'the model. Cached colorings are reused in later runs of a '
+                                  'model with the same structure. Defaults to the value of the '
+                                  'OPENMDAO_COLORING_CACHE_DIR environment variable. If None, '
+                                  'colorings are not cached.')
         self.options.declare('group_by_pre_opt_post', types=bool,
                              default=False,
                              desc="If True, group subsystems of the top level model into "
@@ -968,6 +978,8 @@ class Problem(object):
             'pathname': None,  # the pathname of this Problem in the current tree of Problems
             'comm': comm,
             'coloring_dir': self.options['coloring_dir'],  # directory for coloring files
+            # directory for cached colorings, keyed by model structure
+            'coloring_cache_dir': self.options['coloring_cache_dir'],
             'recording_iter': _RecIteration(comm.rank),  # manager of recorder iterations
             'local_vector_class': local_vector_class,
             'distributed_vector_class': distributed_vector_class,
@@ -1123,7 +1135,8 @@ class Problem(object):
     def check_partials(self, out_stream=_DEFAULT_OUT_STREAM, includes=None, excludes=None,
                        compact_print=False, abs_err_tol=1e-6, rel_err_tol=1e-6,
                        method='fd', step=None, form='forward', step_calc='abs',
-                       minimum_step=1e-12, force_dense=True, show_only_incorrect=False):
+                       minimum_step=1e-12, force_dense=True, show_only_incorrect=False,
+                       show_progress=False, local_procs=1):
         """
         Check partial derivatives comprehensively for all components in your model.
 
@@ -1168,6 +1181,12 @@ class Problem(object):
             If True, analytic derivatives will be coerced into arrays. Default is True.
         show_only_incorrect : bool, optional
             Set to True if output should print only the subjacs found to be incorrect.
+        show_progress : bool
+            True to print a line to out_stream each time the check of a component is done.
+        local_procs : int
+            Number of local processes used to check the components in parallel. The processes
+            are forked from the current one and each checks a share of the components. Only
+            used when not running under MPI.
 
         Returns
         -------
@@ -1290,6 +1309,81 @@ class Problem(object):
 
         self.set_solver_print(level=0)
 
+        if out_stream == _DEFAULT_OUT_STREAM:
+            out_stream = sys.stdout
+
+        do_steps = not (step is None or isinstance(step, (float, int))) and len(step) > 1
+
+        check_args = (method, step, form, step_calc, minimum_step, force_dense)
+        progress = _progress_reporter('check_partials', len(comps),
+                                      out_stream if show_progress else None)
+
+        if local_procs > 1 and len(comps) > 1 and model.comm.size == 1:
+            partials_data, indep_key, all_fd_options, comps_could_not_cs, print_reverse = \
+                self._check_partials_in_pool(comps, check_args, local_procs, progress)
+        else:
+            partials_data, indep_key, all_fd_options, comps_could_not_cs, print_reverse = \
+                self._compute_check_partials_data(comps, *check_args, progress=progress)
+
+        if len(comps_could_not_cs) > 0:
+            msg = "The following components requested complex step, but force_alloc_complex " + \
+                  "has not been set to True, so finite difference was used: "
+            msg += str(list(comps_could_not_cs))
+            msg += "\nTo enable complex step, specify 'force_alloc_complex=True' when calling " + \
+                   "setup on the problem, e.g. 'problem.setup(force_alloc_complex=True)'"
+            issue_warning(msg, category=DerivativesWarning)
+
+        _assemble_derivative_data(partials_data, rel_err_tol, abs_err_tol, out_stream,
+                                  compact_print, comps, all_fd_options, indep_key=indep_key,
+                                  print_reverse=print_reverse,
+                                  show_only_incorrect=show_only_incorrect)
+
+        if not do_steps:
+            _fix_check_data(partials_data)
+
+        return partials_data
+
+    def _compute_check_partials_data(self, comps, method, step, form, step_calc, minimum_step,
+                                     force_dense, progress=None):
+        """
+        Compute the analytic and approximated partials of the given components.
+
+        Parameters
+        ----------
+        comps : list of Component
+            Components to check.
+        method : str
+            Method, 'fd' for finite difference or 'cs' for complex step.
+        step : None, float, or list/tuple of float
+            Step size(s) for approximation.
+        form : str
+            Form for finite difference.
+        step_calc : str
+            Step type for computing the size of the finite difference step.
+        minimum_step : float
+            Minimum step size allowed when using one of the relative step_calc options.
+        force_dense : bool
+            If True, analytic derivatives will be coerced into arrays.
+        progress : function or None
+            If not None, called with the pathname of each component once it has been checked.
+
+        Returns
+        -------
+        dict
+            Derivative data for each component, keyed by component pathname.
+        dict
+            Keys of the subjacs of each component that were not declared dependent.
+        dict
+            Approximation options for each wrt variable of each component.
+        set
+            Pathnames of components where complex step was requested but couldn't be used.
+        bool
+            True if any of the components is matrix free.
+        """
+        model = self.model
+        abs2meta_in = model._var_allprocs_abs2meta['input']
+        abs2meta_out = model._var_allprocs_abs2meta['output']
+
         # This is a defaultdict of (defaultdict of dicts).
         partials_data = defaultdict(lambda: defaultdict(dict))
 
@@ -1609,34 +1703,84 @@ class Problem(object):
                                 deriv['directional_fd_rev'] = []
                             deriv['directional_fd_rev'].append(dhat.dot(d) - mhat.dot(m))
 
+            if progress is not None:
+                progress(comp.pathname)
+
         # Conversion of defaultdict to dicts
         partials_data = {comp_name: dict(data) for comp_name, data in partials_data.items()}
 
-        if out_stream == _DEFAULT_OUT_STREAM:
-            out_stream = sys.stdout
+        return partials_data, indep_key, all_fd_options, comps_could_not_cs, print_reverse
 
-        if len(comps_could_not_cs) > 0:
-            msg = "The following components requested complex step, but force_alloc_complex " + \
-                  "has not been set to True, so finite difference was used: "
-            msg += str(list(comps_could_not_cs))
-            msg += "\nTo enable complex step, specify 'force_alloc_complex=True' when calling " + \
-                   "setup on the problem, e.g. 'problem.setup(force_alloc_complex=True)'"
-            issue_warning(msg, category=DerivativesWarning)
+    def _check_partials_in_pool(self, comps, check_args, local_procs, progress=None):
+        """
+        Check the partials of the given components in a pool of forked local processes.
 
-        _assemble_derivative_data(partials_data, rel_err_tol, abs_err_tol, out_stream,
-                                  compact_print, comps, all_fd_options, indep_key=indep_key,
-                                  print_reverse=print_reverse,
-                                  show_only_incorrect=show_only_incorrect)
+        Parameters
+        ----------
+        comps : list of Component
+            Components to check.
+        check_args : tuple
+            Arguments of _compute_check_partials_data after the list of components.
+        local_procs : int
+            Number of processes.
+        progress : function or None
+            If not None, called with the pathname of each component once it has been checked.
 
-        if not do_steps:
-            _fix_check_data(partials_data)
+        Returns
+        -------
+        tuple
+            The merged results of _compute_check_partials_data for all of the components.
+        """
+        # a few chunks per process balance the load without repeating the model level setup
+        # of each chunk too often
+        nchunks = min(len(comps), 4 * local_procs)
+        chunks = [list(range(i, len(comps), nchunks)) for i in range(nchunks)]
 
-        return partials_data
+        def check_chunk(idxs):
+            return self._compute_check_partials_data([comps[i] for i in idxs], *check_args)
+
+        def next_case():
+            if chunks:
+                return (chunks.pop(0),), None
+
+        partials_data = {}
+        indep_key = {}
+        all_fd_options = {}
+        comps_could_not_cs = set()
+        print_reverse = False
+        errors = []
+
+        def on_result(case, retval, err):
+            nonlocal print_reverse
+            if err is not None:
+                errors.append(err)
+                return
+            data, indep, fd_options, could_not_cs, rev = retval
+            partials_data.update(data)
+            indep_key.update(indep)
+            all_fd_options.update(fd_options)
+            comps_could_not_cs.update(could_not_cs)
+            print_reverse |= rev
+            if progress is not None:
+                for i in case[0][0]:
+                    progress(comps[i].pathname)
+
+        concurrent_eval_async(check_chunk, next_case, on_result, num_procs=local_procs)
+
+        if errors:
+            raise RuntimeError(f"{self.msginfo}: Checking partials failed:\n" +
+                               '\n'.join(errors))
+
+        # keep the same component order as a serial check
+        partials_data = {c.pathname: partials_data[c.pathname] for c in comps
+                         if c.pathname in partials_data}
+
+        return partials_data, indep_key, all_fd_options, comps_could_not_cs, print_reverse
 
     def check_totals(self, of=None, wrt=None, out_stream=_DEFAULT_OUT_STREAM, compact_print=False,
                      driver_scaling=False, abs_err_tol=1e-6, rel_err_tol=1e-6, method='fd',
                      step=None, form=None, step_calc='abs', show_progress=False,
-                     show_only_incorrect=False, directional=False):
+                     show_only_incorrect=False, directional=False, local_procs=1):
         """
         Check total derivatives for the model vs. finite difference.
 
@@ -1686,6 +1830,10 @@ class Problem(object):
         directional : bool
             If True, compute a single directional derivative for each 'of' in rev mode or each
             'wrt' in fwd mode.
+        local_procs : int
+            Number of local processes used to compute the finite difference totals in parallel.
+            The processes are forked from the current one and each perturbs a share of the 'wrt'
+            variables. Only used when not running under MPI and directional is False.
 
         Returns
         -------
@@ -1837,7 +1985,12 @@ class Problem(object):
                 fd_tot_info.seeds = total_info.seeds
                 Jcalc, Jcalc_slices = total_info._get_as_directional()
 
-            if show_progress:
+            if local_procs > 1 and len(wrt) > 1 and not directional and model.comm.size == 1:
+                Jfd = self._check_totals_fd_in_pool(of, wrt, driver_scaling, local_procs,
+                                                    out_stream if show_progress else None)
+                # keep the same ordering as the analytic totals
+                Jfd = {key: Jfd[key] for key in fd_tot_info.J_dict}
+            elif show_progress:
                 Jfd = fd_tot_info.compute_totals_approx(initialize=True,
                                                         progress_out_stream=out_stream)
             else:
@@ -1922,6 +2075,61 @@ class Problem(object):
 
         return data['']
 
+    def _check_totals_fd_in_pool(self, of, wrt, driver_scaling, local_procs, out_stream=None):
+        """
+        Approximate the totals in a pool of forked local processes, each perturbing a few wrts.
+
+        The approximation scheme must already have been declared on the model.
+
+        Parameters
+        ----------
+        of : list of str
+            Variables whose derivatives will be computed.
+        wrt : list of str
+            Variables with respect to which the derivatives will be computed.
+        driver_scaling : bool
+            If True, scale the derivatives using the driver scaling of the variables.
+        local_procs : int
+            Number of processes.
+        out_stream : file-like object or None
+            Where to print the progress of each wrt variable, if not None.
+
+        Returns
+        -------
+        dict
+            Approximated totals, keyed by (of, wrt).
+        """
+        chunks = [wrt[i::local_procs] for i in range(min(len(wrt), local_procs))]
+
+        def approx_chunk(wrt_chunk):
+            tot_info = _TotalJacInfo(self, of, wrt_chunk, False, return_format='flat_dict',
+                                     approx=True, driver_scaling=driver_scaling)
+            return tot_info.compute_totals_approx(initialize=True)
+
+        def next_case():
+            if chunks:
+                return (chunks.pop(0),), None
+
+        progress = _progress_reporter('check_totals', len(wrt), out_stream)
+        Jfd = {}
+        errors = []
+
+        def on_result(case, retval, err):
+            if err is not None:
+                errors.append(err)
+                return
+            Jfd.update(retval)
+            if progress is not None:
+                for name in case[0][0]:
+                    progress(name)
+
+        concurrent_eval_async(approx_chunk, next_case, on_result, num_procs=local_procs)
+
+        if errors:
+            raise RuntimeError(f"{self.msginfo}: Checking totals failed:\n" + '\n'.join(errors))
+
+        return Jfd
+
     def compute_totals(self, of=None, wrt=None, return_format='flat_dict', debug_print=False,
                        driver_scaling=False, use_abs_names=False, get_remote=True):
         """
@@ -2926,6 +3134,39 @@ def _fix_check_data(data):
                 del dct['steps']
 
 
+def _progress_reporter(title, total, out_stream):
+    """
+    Return a function that prints a progress line each time an item of a check is done.
+
+    Parameters
+    ----------
+    title : str
+        Name of the check.
+    total : int
+        Total number of items.
+    out_stream : file-like object or None
+        Where to print the progress.
+
+    Returns
+    -------
+    function or None
+        Function to call with the name of each item that's done, or None if out_stream is None.
+    """
+    if out_stream is None:
+        return None
+
+    start = time.perf_counter()
+    ndone = 0
+
+    def report(name):
+        nonlocal ndone
+        ndone += 1
+        print(f"{title}: {ndone}/{total} {name} ({time.perf_counter() - start:.2f} sec)",
+              file=out_stream, flush=True)
+
+    return report
+
+
 def _assemble_derivative_data(derivative_data, rel_error_tol, abs_error_tol, out_stream,
                               compact_print, system_list, global_options, totals=False,
                               indep_key=None, print_reverse=False,
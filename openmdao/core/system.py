@@ -369,6 +369,12 @@ class System(object):
         exception.
     _owning_rank : dict
         Dict mapping var name to the lowest rank where that variable is local.
+    _remote_gather_plans : dict
+        Cached receive sizes, displacements and per variable slices used by _abs_get_vals to
+        gather many remote or distributed variables with a single buffer collective.
+    _record_plans : dict
+        Cached index arrays and buffers used by _retrieve_data_of_kind to gather the values of
+        each list of recorded variables with a single vectorized take.
     _filtered_vars_to_record : Dict
         Dict of list of var names to record
     _vector_class : class
@@ -543,6 +549,8 @@ class System(object):
 
         self._filtered_vars_to_record = {}
         self._owning_rank = None
+        self._remote_gather_plans = {}
+        self._record_plans = {}
         self._coloring_info = _DEFAULT_COLORING_META.copy()
         self._first_call_to_linearize = True  # will check in first call to _linearize
         self._tot_jac = None
@@ -1701,6 +1709,20 @@ class System(object):
                     approx_scheme._reset()
             return [coloring]
 
+        cache_fname = self._get_coloring_cache_fname()
+        coloring = coloring_mod._load_cached_coloring(cache_fname)
+        if coloring is not None:
+            print(f"\n{self.msginfo}: loaded coloring from cache file {cache_fname}")
+            info['coloring'] = coloring
+            info.update(coloring._meta)
+            self._save_coloring(coloring)
+            if not info['per_instance']:
+                coloring_mod._CLASS_COLORINGS[coloring_fname] = coloring
+            # force regen of approx groups during next compute_approximations
+            if not use_jax:
+                approx_scheme._reset()
+            return [coloring]
+
         save_first_call = self._first_call_to_linearize
         self._first_call_to_linearize = False
         sparsity_start_time = time.perf_counter()
@@ -1788,6 +1810,9 @@ class System(object):
         if not self._finalize_coloring(coloring, info, sp_info, sparsity_time):
             return [None]
 
+        if cache_fname is not None:
+            self._save_coloring(coloring, cache_fname)
+
         self._first_call_to_linearize = save_first_call
 
         if not use_jax:
@@ -1824,7 +1849,25 @@ class System(object):
 
         return os.path.join(directory, fname)
 
-    def _save_coloring(self, coloring):
+    def _get_coloring_cache_fname(self):
+        """
+        Return the name of the coloring cache file for the current structure of this system.
+
+        Returns
+        -------
+        str or None
+            Name of the cache file, or None if coloring caching is not active.
+        """
+        info = self._coloring_info
+        settings = [(name, info.get(name)) for name in ('wrt_patterns', 'method', 'form', 'step',
+                                                        'num_full_jacs', 'tol', 'orders',
+                                                        'perturb_size')]
+        if info['per_instance']:
+            settings.append(self.pathname)
+
+        return coloring_mod._get_coloring_cache_fname(self, 'partial', settings)
+
+    def _save_coloring(self, coloring, fname=None):
         """
         Save the coloring to a file based on this system's class or pathname.
 
@@ -1832,11 +1875,13 @@ class System(object):
         ----------
         coloring : Coloring
             See Coloring class docstring.
+        fname : str or None
+            Name of the file.  If None, it is based on this system's class or pathname.
         """
         # under MPI, only save on proc 0
         if ((self._full_comm is not None and self._full_comm.rank == 0) or
                 (self._full_comm is None and self.comm.rank == 0)):
-            coloring.save(self.get_coloring_fname())
+            coloring.save(self.get_coloring_fname() if fname is None else fname)
 
     def _get_static_coloring(self):
         """
@@ -2061,6 +2106,8 @@ class System(object):
         self._var_allprocs_discrete = {'input': {}, 'output': {}}
         self._var_allprocs_abs2idx = {}
         self._owning_rank = defaultdict(int)
+        self._remote_gather_plans = {}
+        self._record_plans = {}
         self._var_sizes = {}
         self._owned_sizes = None
 
@@ -2914,6 +2961,17 @@ class System(object):
         """
         return ()
 
+    def _solver_subsystem_batch_iter(self):
+        """
+        Do nothing.
+
+        Returns
+        -------
+        tuple
+            An empty tuple.
+        """
+        return ()
+
     def _create_indexer(self, indices, typename, vname, flat_src=False):
         """
         Return an Indexer instance and it's size if possible.
@@ -3968,6 +4026,7 @@ class System(object):
         if is_design_var is not None:
             des_vars = self.get_design_vars(get_sizes=False, use_prom_ivc=False)
 
+        entries = []
         for iotype in iotypes:
             cont2meta = metadict[iotype]
             disc2meta = disc_metadict[iotype]
@@ -4000,87 +4059,125 @@ class System(object):
                             except KeyError:
                                 ret_meta[key] = 'Unavailable'
 
-                if need_gather:
-                    if distrib or abs_name in self._vars_to_gather:
-                        if rank is None:
-                            allproc_metas = self.comm.allgather(ret_meta)
-                        else:
-                            allproc_metas = self.comm.gather(ret_meta, root=rank)
-
-                        if rank is None or self.comm.rank == rank:
-                            if not ret_meta:
-                                ret_meta = {}
-                            if distrib:
-                                if 'val' in keyset:
-                                    # assemble the full distributed value
-                                    dist_vals = [m['val'] for m in allproc_metas
-                                                 if m is not None and m['val'].size > 0]
-                                    if dist_vals:
-                                        ret_meta['val'] = np.concatenate(dist_vals)
-                                    else:
-                                        ret_meta['val'] = np.zeros(0)
-                                if 'src_indices' in keyset:
-                                    # assemble full src_indices
-                                    dist_src_inds = [m['src_indices'] for m in allproc_metas
-                                                     if m is not None and m['src_indices'].size > 0]
-                                    if dist_src_inds:
-                                        ret_meta['src_indices'] = np.concatenate(dist_src_inds)
-                                    else:
-                                        ret_meta['src_indices'] = np.zeros(0, dtype=INT_DTYPE)
-
-                            elif abs_name in self._vars_to_gather:
-                                for m in allproc_metas:
-                                    if m is not None:
-                                        ret_meta = m
-                                        break
-                        else:
-                            ret_meta = None
+                gather = need_gather and (distrib or abs_name in self._vars_to_gather)
+                entries.append([iotype, abs_name, prom, rel_name, meta, ret_meta, distrib,
+                                gather])
+
+        if need_gather:
+            # gather the metadata of all remote and distributed variables in a single collective
+            # call rather than one call per variable.
+            to_gather = [e for e in entries if e[7]]
+            if to_gather:
+                local_metas = [e[5] for e in to_gather]
+                if rank is None:
+                    allproc_lists = self.comm.allgather(local_metas)
+                else:
+                    allproc_lists = self.comm.gather(local_metas, root=rank)
 
-                if ret_meta is not None:
-                    # handle is_indep_var
-                    if is_indep_var is not None:
-                        if iotype == 'output':
-                            out_meta = meta
-                        else:
-                            src_name = self.get_source(abs_name)
-                            try:
-                                out_meta = metadict['output'][src_name]
-                            except KeyError:
-                                out_meta = disc_metadict['output'][src_name]
+                for i, entry in enumerate(to_gather):
+                    if rank is None or self.comm.rank == rank:
+                        allproc_metas = [metas[i] for metas in allproc_lists]
+                        entry[5] = self._merge_gathered_meta(entry[1], entry[5], entry[6],
+                                                             allproc_metas, keyset)
+                    else:
+                        entry[5] = None
+
+        for iotype, abs_name, prom, rel_name, meta, ret_meta, _, _ in entries:
+            if ret_meta is not None:
+                # handle is_indep_var
+                if is_indep_var is not None:
+                    if iotype == 'output':
+                        out_meta = meta
+                    else:
+                        src_name = self.get_source(abs_name)
+                        try:
+                            out_meta = metadict['output'][src_name]
+                        except KeyError:
+                            out_meta = disc_metadict['output'][src_name]
 
-                        src_tags = out_meta['tags'] if 'tags' in out_meta else {}
-                        if is_indep_var:
-                            if 'openmdao:indep_var' not in src_tags:
-                                continue
-                        elif 'openmdao:indep_var' in src_tags:
+                    src_tags = out_meta['tags'] if 'tags' in out_meta else {}
+                    if is_indep_var:
+                        if 'openmdao:indep_var' not in src_tags:
                             continue
+                    elif 'openmdao:indep_var' in src_tags:
+                        continue
 
-                    # handle is_design_var
-                    if is_design_var is not None:
-                        if iotype == 'output':
-                            out_name = abs_name
-                        else:
-                            out_name = self.get_source(abs_name)
-                        if is_design_var:
-                            if out_name not in des_vars:
-                                continue
-                        elif out_name in des_vars:
+                # handle is_design_var
+                if is_design_var is not None:
+                    if iotype == 'output':
+                        out_name = abs_name
+                    else:
+                        out_name = self.get_source(abs_name)
+                    if is_design_var:
+                        if out_name not in des_vars:
                             continue
-
-                    # handle tags
-                    if tags and not tagset & ret_meta['tags']:
+                    elif out_name in des_vars:
                         continue
 
-                    ret_meta['prom_name'] = prom
-                    ret_meta['discrete'] = abs_name not in all2meta[iotype]
+                # handle tags
+                if tags and not tagset & ret_meta['tags']:
+                    continue
 
-                    if return_rel_names:
-                        result[rel_name] = ret_meta
-                    else:
-                        result[abs_name] = ret_meta
+                ret_meta['prom_name'] = prom
+                ret_meta['discrete'] = abs_name not in all2meta[iotype]
+
+                if return_rel_names:
+                    result[rel_name] = ret_meta
+                else:
+                    result[abs_name] = ret_meta
 
         return result
 
+    def _merge_gathered_meta(self, abs_name, ret_meta, distrib, allproc_metas, keyset):
+        """
+        Combine the metadata of a variable gathered from all procs.
+
+        Parameters
+        ----------
+        abs_name : str
+            Absolute name of the variable.
+        ret_meta : dict or None
+            Metadata of the variable on this proc, or None if the variable isn't local.
+        distrib : bool
+            True if the variable is distributed.
+        allproc_metas : list
+            Metadata of the variable from each proc.
+        keyset : set
+            Set of requested metadata keys.
+
+        Returns
+        -------
+        dict
+            The combined metadata.
+        """
+        if not ret_meta:
+            ret_meta = {}
+        if distrib:
+            if 'val' in keyset:
+                # assemble the full distributed value
+                dist_vals = [m['val'] for m in allproc_metas
+                             if m is not None and m['val'].size > 0]
+                if dist_vals:
+                    ret_meta['val'] = np.concatenate(dist_vals)
+                else:
+                    ret_meta['val'] = np.zeros(0)
+            if 'src_indices' in keyset:
+                # assemble full src_indices
+                dist_src_inds = [m['src_indices'] for m in allproc_metas
+                                 if m is not None and m['src_indices'].size > 0]
+                if dist_src_inds:
+                    ret_meta['src_indices'] = np.concatenate(dist_src_inds)
+                else:
+                    ret_meta['src_indices'] = np.zeros(0, dtype=INT_DTYPE)
+
+        elif abs_name in self._vars_to_gather:
+            for m in allproc_metas:
+                if m is not None:
+                    ret_meta = m
+                    break
+
+        return ret_meta
+
     def list_inputs(self,
                     val=True,
                     prom_name=True,
@@ -4201,9 +4298,11 @@ class System(object):
             print_options = np.get_printoptions()
             np_precision = print_options['precision']
 
+            vals = self._abs_get_vals(inputs, get_remote=True,
+                                      rank=None if all_procs else 0, kind='input')
+
             for n, meta in inputs.items():
-                meta['val'] = self._abs_get_val(n, get_remote=True,
-                                                rank=None if all_procs else 0, kind='input')
+                meta['val'] = vals[n]
                 if isinstance(meta['val'], np.ndarray):
                     if print_min:
                         meta['min'] = np.round(np.min(meta['val']), np_precision)
@@ -4367,11 +4466,18 @@ class System(object):
             print_options = np.get_printoptions()
             np_precision = print_options['precision']
 
+            # gather all remote values (and resids) at once
+            if val:
+                vals = self._abs_get_vals(outputs, get_remote=True,
+                                          rank=None if all_procs else 0, kind='output')
+            if residuals or residuals_tol:
+                resid_vals = self._abs_get_vals(outputs, get_remote=True,
+                                                rank=None if all_procs else 0, kind='residual')
+
             for name, meta in outputs.items():
                 if val:
                     # we want value from the input vector, not from the metadata
-                    meta['val'] = self._abs_get_val(name, get_remote=True,
-                                                    rank=None if all_procs else 0, kind='output')
+                    meta['val'] = vals[name]
 
                     if isinstance(meta['val'], np.ndarray):
                         if print_min:
@@ -4381,9 +4487,7 @@ class System(object):
                             meta['max'] = np.round(np.max(meta['val']), np_precision)
 
                 if residuals or residuals_tol:
-                    resids = self._abs_get_val(name, get_remote=True,
-                                               rank=None if all_procs else 0,
-                                               kind='residual')
+                    resids = resid_vals[name]
                     if residuals_tol and np.linalg.norm(resids) < residuals_tol:
                         to_remove.append(name)
                     elif residuals:
@@ -4393,7 +4497,7 @@ class System(object):
             for name in to_remove:
                 del outputs[name]
 
-        # NOTE: calls to _abs_get_val() above are collective calls and must be done on all procs
+        # NOTE: calls to _abs_get_vals() above are collective calls and must be done on all procs
         if not outputs or (not all_procs and self.comm.rank != 0):
             return []
 
@@ -5087,6 +5191,192 @@ class System(object):
 
         return val
 
+    def _abs_get_vals(self, abs_names, get_remote=False, rank=None, vec_name=None, kind=None,
+                      flat=False):
+        """
+        Return the values of the variables specified by the given absolute names.
+
+        Continuous variables that must be retrieved from other processes are gathered together
+        using a single buffer based Allgatherv (or Gatherv if rank is given) rather than one
+        pickle based collective per variable.  All other variables are retrieved individually
+        using _abs_get_val.
+
+        Parameters
+        ----------
+        abs_names : iter of str
+            The absolute names of the variables.
+        get_remote : bool or None
+            If True, return the values even if the variables are remote. NOTE: This function must
+            be called in all procs in the Problem's MPI communicator with the same abs_names.
+            If False, only retrieve the values that are on the current process.
+            If None and any variable is remote or distributed, a RuntimeError will be raised.
+        rank : int or None
+            If not None, specifies that the values are to be gathered to the given rank only.
+            Otherwise, if get_remote is specified, the values will be broadcast to all procs
+            in the MPI communicator.
+        vec_name : str
+            Name of the vector to use.
+        kind : str or None
+            Kind of variable ('input', 'output', or 'residual').  If None, returned values
+            will be either inputs or outputs.
+        flat : bool
+            If True, return the flattened versions of the values.
+
+        Returns
+        -------
+        dict
+            Mapping of absolute name to the value of the requested output/input/resid variable.
+        """
+        abs_names = list(abs_names)
+        if vec_name is None:
+            vec_name = 'nonlinear'
+
+        plan = None
+        if get_remote and self.comm.size > 1 and self._vectors:
+            if not self._vectors['output'][vec_name]._under_complex_step:
+                plan = self._get_remote_gather_plan(abs_names, vec_name, kind, rank)
+
+        if plan is None:
+            return {n: self._abs_get_val(n, get_remote, rank, vec_name, kind, flat)
+                    for n in abs_names}
+
+        batched = plan['vars']
+        vals = {}
+        # NOTE: calls to _abs_get_val() are collective calls, so every proc has to make them in
+        # the same order.
+        for n in abs_names:
+            if n not in batched:
+                vals[n] = self._abs_get_val(n, get_remote, rank, vec_name, kind, flat)
+
+        myrank = self.comm.rank
+        local = []
+        for n, (vkind, distrib, shape, slc) in batched.items():
+            if plan['send'][n]:
+                local.append(self._vectors[vkind][vec_name]._abs_get_val(n, flat=True))
+
+        sendbuf = np.concatenate(local) if local else np.zeros(0)
+        recvbuf = np.zeros(plan['total'])
+        if rank is None:
+            self.comm.Allgatherv(sendbuf, [recvbuf, plan['recv_sizes'], plan['recv_offsets'],
+                                           MPI.DOUBLE])
+        else:
+            self.comm.Gatherv(sendbuf, [recvbuf, plan['recv_sizes'], plan['recv_offsets'],
+                                        MPI.DOUBLE], root=rank)
+
+        if rank is None or rank == myrank:
+            full = recvbuf[plan['perm']]
+            for n, (vkind, distrib, shape, slc) in batched.items():
+                vals[n] = full[slc] if flat else full[slc].reshape(shape)
+        else:
+            # mimic _abs_get_val on procs that aren't the target of the gather
+            for n, (vkind, distrib, shape, slc) in batched.items():
+                if distrib:
+                    val = np.zeros(slc.stop - slc.start)
+                    vals[n] = val if flat else val.reshape(shape)
+                else:
+                    vec = self._vectors[vkind][vec_name]
+                    vals[n] = vec._abs_get_val(n, flat) if vec._contains_abs(n) else _UNDEFINED
+
+        return {n: vals[n] for n in abs_names}
+
+    def _get_remote_gather_plan(self, abs_names, vec_name, kind, rank):
+        """
+        Return the cached plan used to gather the given variables with one buffer collective.
+
+        Parameters
+        ----------
+        abs_names : list of str
+            The absolute names of the variables.
+        vec_name : str
+            Name of the vector to use.
+        kind : str or None
+            Kind of variable ('input', 'output', or 'residual').
+        rank : int or None
+            Rank that values are gathered to, or None if they're gathered to all procs.
+
+        Returns
+        -------
+        dict or None
+            The gather plan, or None if none of the variables need to be gathered.
+        """
+        key = (kind, vec_name, rank, tuple(abs_names))
+        try:
+            return self._remote_gather_plans[key]
+        except KeyError:
+            pass
+
+        vars_to_gather = self._problem_meta['vars_to_gather']
+        nprocs = self.comm.size
+        myrank = self.comm.rank
+
+        names = []
+        contribs = []
+        batched = {}
+        send = {}
+        for n in abs_names:
+            if n in batched:
+                continue
+            if n in self._var_allprocs_abs2meta['output']:
+                typ = 'output'
+            elif n in self._var_allprocs_abs2meta['input']:
+                typ = 'input'
+            else:  # discrete
+                continue
+            meta = self._var_allprocs_abs2meta[typ][n]
+            distrib = meta['distributed']
+            if not (distrib or n in vars_to_gather):
+                continue
+
+            sizes = self._var_sizes[typ][:, self._var_allprocs_abs2idx[n]]
+            if distrib:
+                contrib = sizes.copy()
+                shape = meta['global_shape']
+            else:
+                contrib = np.zeros(nprocs, dtype=INT_DTYPE)
+                owner = self._owning_rank[n]
+                contrib[owner] = sizes[owner]
+                shape = meta['shape']
+
+            names.append(n)
+            contribs.append(contrib)
+            batched[n] = [typ if kind is None else kind, distrib, shape, None]
+            send[n] = contrib[myrank] > 0
+
+        if not names:
+            self._remote_gather_plans[key] = None
+            return None
+
+        # contribs[i, r] is the size of the piece of variable i contributed by rank r
+        contribs = np.array(contribs, dtype=INT_DTYPE)
+        recv_sizes = np.sum(contribs, axis=0)
+        recv_offsets = np.zeros(nprocs, dtype=INT_DTYPE)
+        recv_offsets[1:] = np.cumsum(recv_sizes[:-1])
+        starts = recv_offsets + np.cumsum(contribs, axis=0) - contribs
+
+        # reorder the received buffer so each variable's pieces are contiguous and in rank order
+        perm = []
+        start = 0
+        for i, n in enumerate(names):
+            for r in range(nprocs):
+                if contribs[i, r]:
+                    perm.append(np.arange(starts[i, r], starts[i, r] + contribs[i, r],
+                                          dtype=INT_DTYPE))
+            end = start + np.sum(contribs[i])
+            batched[n][3] = slice(start, end)
+            start = end
+
+        plan = {
+            'vars': batched,
+            'send': send,
+            'total': start,
+            'recv_sizes': recv_sizes,
+            'recv_offsets': recv_offsets,
+            'perm': np.concatenate(perm) if perm else np.zeros(0, dtype=INT_DTYPE),
+        }
+        self._remote_gather_plans[key] = plan
+
+        return plan
+
     def get_val(self, name, units=None, indices=None, get_remote=False, rank=None,
                 vec_name='nonlinear', kind=None, flat=False, from_src=True):
         """
@@ -5677,30 +5967,22 @@ class System(object):
             offset = len(self.pathname) + 1 if self.pathname else 0
 
             if self.comm.size == 1:
-                get = vec._abs_get_val
-                srcget = self._vectors['output'][vec_name]._abs_get_val
-                vdict = {}
-                if discrete_vec:
-                    for n in variables:
-                        if vec._contains_abs(n):
-                            vdict[n] = get(n, False)
-                        elif n[offset:] in discrete_vec:
-                            vdict[n] = discrete_vec[n[offset:]]['val']
-                        else:
-                            ivc_path = conns[prom2abs_in[n][0]]
-                            if vec._contains_abs(ivc_path):
-                                vdict[ivc_path] = srcget(ivc_path, False)
-                            elif ivc_path[offset:] in discrete_vec:
-                                vdict[ivc_path] = discrete_vec[ivc_path[offset:]]['val']
-                else:
-                    for name in variables:
-                        if name in self._responses and self._responses[name]['alias'] is not None:
-                            name = self._responses[name]['source']
-                        if vec._contains_abs(name):
-                            vdict[name] = get(name, False)
-                        else:
-                            ivc_path = conns[prom2abs_in[name][0]]
-                            vdict[ivc_path] = srcget(ivc_path, False)
+                plan = self._get_record_plan(variables, kind, vec_name)
+                arr = vec.asarray()
+                outarr = self._vectors['output'][vec_name].asarray()
+                nvec = plan['vec_idx'].size
+                buf = plan['buf']
+
+                if arr.dtype == buf.dtype and outarr.dtype == buf.dtype:
+                    np.take(arr, plan['vec_idx'], out=buf[:nvec])
+                    np.take(outarr, plan['out_idx'], out=buf[nvec:])
+                    vdict = plan['vals'].copy()
+                else:  # under complex step
+                    buf = np.concatenate((arr[plan['vec_idx']], outarr[plan['out_idx']]))
+                    vdict = {n: buf[slc].reshape(shape) for n, slc, shape in plan['slices']}
+
+                for name, rel_name in plan['discrete']:
+                    vdict[name] = discrete_vec[rel_name]['val']
             elif parallel:
                 get = self._abs_get_val
                 vdict = {}
@@ -5725,8 +6007,14 @@ class System(object):
             else:
                 io = 'input' if kind == 'input' else 'output'
                 meta = self._var_allprocs_abs2meta[io]
+                # gather all variables not owned by rank 0 in a single collective call
+                remote_vals = self._abs_get_vals([n for n in variables
+                                                  if self._owning_rank[n] != 0 or
+                                                  (n in meta and meta[n]['distributed'])],
+                                                 get_remote=True, rank=0, vec_name=vec_name,
+                                                 kind=kind)
                 for name in variables:
-                    if self._owning_rank[name] == 0 and not meta[name]['distributed']:
+                    if name not in remote_vals:
                         # if using a serial recorder and rank 0 owns the variable,
                         # use local value on rank 0 and do nothing on other ranks.
                         if rank == 0:
@@ -5735,11 +6023,128 @@ class System(object):
                             elif name[offset:] in discrete_vec:
                                 vdict[name] = discrete_vec[name[offset:]]['val']
                     else:
-                        vdict[name] = self.get_val(name, get_remote=True, rank=0,
-                                                   vec_name=vec_name, kind=kind, from_src=False)
+                        vdict[name] = remote_vals[name]
 
         return vdict
 
+    def _get_record_plan(self, variables, kind, vec_name):
+        """
+        Return the cached plan used to gather the recorded values of the given variables.
+
+        The values of all continuous variables are gathered with a single vectorized take into a
+        preallocated buffer, and a dict of views into that buffer is built once, so no work is
+        done per variable when recording. This is only used when running on a single process.
+
+        Parameters
+        ----------
+        variables : list of str
+            The names of the recorded variables.
+        kind : str
+            Either 'input', 'output', or 'residual'.
+        vec_name : str
+            Either 'nonlinear' or 'linear'.
+
+        Returns
+        -------
+        dict
+            The plan, containing the indices of the values in the vector of the given kind
+            ('vec_idx') and in the output vector ('out_idx'), the buffer they are gathered into
+            ('buf'), views into the buffer keyed on recorded name ('vals') along with the slice
+            and shape of each view ('slices'), and the recorded and relative names of discrete
+            variables ('discrete').
+        """
+        key = (kind, vec_name, id(variables))
+        try:
+            cached_vars, plan = self._record_plans[key]
+            if cached_vars is variables:
+                return plan
+        except KeyError:
+            pass
+
+        prom2abs_in = self._var_allprocs_prom2abs_list['input']
+        conns = self._problem_meta['model_ref']()._conn_global_abs_in2out
+        vec = self._vectors[kind][vec_name]
+        discrete_vec = () if kind == 'residual' else self._var_discrete[kind]
+        offset = len(self.pathname) + 1 if self.pathname else 0
+
+        # recorded name mapped to (True if the value is in the output vector, absolute name),
+        # or to the relative name of a discrete variable
+        located = {}
+        for name in variables:
+            if discrete_vec:
+                if vec._contains_abs(name):
+                    located[name] = (False, name)
+                elif name[offset:] in discrete_vec:
+                    located[name] = name[offset:]
+                else:
+                    ivc_path = conns[prom2abs_in[name][0]]
+                    if vec._contains_abs(ivc_path):
+                        located[ivc_path] = (True, ivc_path)
+                    elif ivc_path[offset:] in discrete_vec:
+                        located[ivc_path] = ivc_path[offset:]
+            else:
+                if name in self._responses and self._responses[name]['alias'] is not None:
+                    name = self._responses[name]['source']
+                if vec._contains_abs(name):
+                    located[name] = (False, name)
+                else:
+                    ivc_path = conns[prom2abs_in[name][0]]
+                    located[ivc_path] = (True, ivc_path)
+
+        # start of each variable in the local vectors
+        starts = {}
+        for io in ('input', 'output'):
+            start = 0
+            for abs_name, meta in self._var_abs2meta[io].items():
+                starts[io, abs_name] = start
+                start += meta['size']
+
+        vec_io = 'input' if kind == 'input' else 'output'
+        ranges = {False: [], True: []}
+        for name, loc in located.items():
+            if isinstance(loc, tuple):
+                in_outvec, abs_name = loc
+                io = 'output' if in_outvec else vec_io
+                meta = self._var_abs2meta[io][abs_name]
+                start = starts[io, abs_name]
+                ranges[in_outvec].append((name, start, meta['size'], meta['shape']))
+
+        idxs = {}
+        slices = []
+        end = 0
+        for in_outvec in (False, True):
+            idx = [np.arange(start, start + size, dtype=INT_DTYPE)
+                   for _, start, size, _ in ranges[in_outvec]]
+            idxs[in_outvec] = np.concatenate(idx) if idx else np.zeros(0, dtype=INT_DTYPE)
+            for name, _, size, shape in ranges[in_outvec]:
+                slices.append((name, slice(end, end + size), shape))
+                end += size
+
+        buf = np.zeros(end, dtype=vec.asarray().real.dtype)
+        views = {n: buf[slc].reshape(shape) for n, slc, shape in slices}
+
+        # keep the recorded names in the order they were requested
+        vals = {}
+        discrete = []
+        for name, loc in located.items():
+            if isinstance(loc, tuple):
+                vals[name] = views[name]
+            else:
+                vals[name] = None
+                discrete.append((name, loc))
+
+        plan = {
+            'vec_idx': idxs[False],
+            'out_idx': idxs[True],
+            'buf': buf,
+            'vals': vals,
+            'slices': slices,
+            'discrete': discrete,
+        }
+        self._record_plans[key] = (variables, plan)
+
+        return plan
+
     def convert2units(self, name, val, units):
         """
         Convert the given value to the specified units.
@@ -2869,5 +2869,79 @@ class TestCheckPartialsMultipleSteps(unittest.TestCase):
         self.assertEqual(tables[2][0].count('+'), 8)
 
 
+class TestCheckPartialsLocalProcs(unittest.TestCase):
+    def setup_model(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('good', MyCompGoodPartials())
+        model.add_subsystem('bad', MyCompBadPartials())
+        model.add_subsystem('parab', Paraboloid())
+        model.add_subsystem('tricky', ParaboloidTricky())
+        model.add_subsystem('mat_vec', ParaboloidMatVec())
+        model.connect('good.y', 'bad.y1')
+
+        prob.set_solver_print(level=0)
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        return prob
+
+    def test_same_as_serial(self):
+        for kwargs in ({}, {'method': 'cs'}, {'step': [1e-6, 1e-7]}, {'compact_print': True}):
+            with self.subTest(**kwargs):
+                prob = self.setup_model()
+
+                stream = StringIO()
+                expected = prob.check_partials(out_stream=stream, **kwargs)
+                expected_out = stream.getvalue()
+
+                stream = StringIO()
+                data = prob.check_partials(out_stream=stream, local_procs=3, **kwargs)
+
+                self.assertEqual(stream.getvalue(), expected_out)
+                self.assertEqual(list(data), list(expected))
+                for cname, cdata in expected.items():
+                    self.assertEqual(list(data[cname]), list(cdata))
+                    for key, subjacs in cdata.items():
+                        for jname, val in subjacs.items():
+                            if jname.startswith('J_'):
+                                assert_near_equal(data[cname][key][jname], val, 1e-12)
+
+    def test_show_progress(self):
+        prob = self.setup_model()
+
+        for local_procs in (1, 2):
+            with self.subTest(local_procs=local_procs):
+                stream = StringIO()
+                prob.check_partials(out_stream=stream, compact_print=True, show_progress=True,
+                                    local_procs=local_procs)
+
+                lines = [line for line in stream.getvalue().splitlines()
+                         if line.startswith('check_partials: ')]
+                self.assertEqual(len(lines), 5)
+                self.assertEqual(sorted(line.split()[2] for line in lines),
+                                 ['bad', 'good', 'mat_vec', 'parab', 'tricky'])
+                self.assertEqual([line.split()[1] for line in lines],
+                                 ['1/5', '2/5', '3/5', '4/5', '5/5'])
+
+    def test_error_in_worker(self):
+        class FailingComp(MyCompGoodPartials):
+            def compute_partials(self, inputs, partials):
+                raise RuntimeError("bad linearize")
+
+        prob = om.Problem()
+        prob.model.add_subsystem('good', MyCompGoodPartials())
+        prob.model.add_subsystem('fail', FailingComp())
+        prob.setup()
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.check_partials(out_stream=None, local_procs=2)
+
+        msg = str(cm.exception)
+        self.assertIn("Checking partials failed:", msg)
+        self.assertIn("RuntimeError: bad linearize", msg)
+
+
 if __name__ == "__main__":
     unittest.main()
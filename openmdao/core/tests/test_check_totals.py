@@ -482,6 +482,42 @@ class TestProblemCheckTotals(unittest.TestCase):
 
         prob.check_totals(method='fd', show_progress=True)
 
+    def test_check_totals_local_procs(self):
+        def build():
+            prob = om.Problem()
+            prob.model = SellarDerivatives()
+            prob.model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-15, rtol=1e-15)
+
+            prob.model.add_design_var('x', lower=-100, upper=100)
+            prob.model.add_design_var('z', lower=-100, upper=100)
+            prob.model.add_objective('obj')
+            prob.model.add_constraint('con1', upper=0.0)
+            prob.model.add_constraint('con2', upper=0.0)
+
+            prob.set_solver_print(level=0)
+            prob.setup()
+            prob.run_model()
+            return prob
+
+        stream = StringIO()
+        expected = build().check_totals(method='fd', out_stream=stream)
+        expected_out = stream.getvalue()
+
+        stream = StringIO()
+        totals = build().check_totals(method='fd', out_stream=stream, local_procs=2)
+        self.assertEqual(stream.getvalue(), expected_out)
+
+        self.assertEqual(list(totals), list(expected))
+        for key, val in expected.items():
+            assert_near_equal(totals[key]['J_fd'], val['J_fd'], 1e-12)
+            assert_near_equal(totals[key]['J_fwd'], val['J_fwd'], 1e-12)
+
+        stream = StringIO()
+        build().check_totals(method='fd', out_stream=stream, local_procs=2, show_progress=True)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual([line.split()[1] for line in lines[:2]], ['1/2', '2/2'])
+        self.assertEqual(sorted(line.split()[2] for line in lines[:2]), ['x', 'z'])
+
     def test_desvar_as_obj(self):
         prob = om.Problem()
         prob.model = SellarDerivatives()
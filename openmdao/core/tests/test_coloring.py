@@ -17,12 +17,13 @@ except ImportError:
 
 import openmdao.api as om
 from openmdao.utils.general_utils import set_pyoptsparse_opt
-from openmdao.utils.array_utils import array_viz
+from openmdao.utils.array_utils import array_viz, rand_sparsity
 from openmdao.utils.coloring import _compute_coloring, compute_total_coloring, Coloring
 from openmdao.utils.mpi import MPI, multi_proc_exception_check
-from openmdao.utils.testing_utils import use_tempdirs, set_env_vars
+from openmdao.utils.testing_utils import use_tempdirs, set_env_vars, set_env_vars_context
 from openmdao.test_suite.tot_jac_builder import TotJacBuilder
 from openmdao.utils.general_utils import run_driver
+from openmdao.utils.assert_utils import assert_warning
 
 import openmdao.test_suite
 
@@ -167,9 +168,12 @@ def run_opt(driver_class, mode, assemble_type=None, color_info=None, derivs=True
     if 'min_improve_pct' in options:
         del options['min_improve_pct']
 
+    sparsity_method = options.pop('sparsity_method', 'numeric')
+
     if 'dynamic_total_coloring' in options:
         if options['dynamic_total_coloring']:
-            p.driver.declare_coloring(tol=1e-15, min_improve_pct=min_improve_pct)
+            p.driver.declare_coloring(tol=1e-15, min_improve_pct=min_improve_pct,
+                                      sparsity_method=sparsity_method)
         del options['dynamic_total_coloring']
 
     p.driver.options.update(options)
@@ -1110,6 +1114,192 @@ class SimulColoringRevScipyTestCase(unittest.TestCase):
                          "Derivative support has been turned off but compute_totals was called.")
 
 
+@use_tempdirs
+class SymbolicSparsityTestCase(unittest.TestCase):
+
+    def setUp(self):
+        om.clear_reports()
+
+    def _check_sparsity(self, p, of=None, wrt=None):
+        numeric = compute_total_coloring(p, of=of, wrt=wrt)
+        symbolic = compute_total_coloring(p, of=of, wrt=wrt, sparsity_method='symbolic')
+        self.assertEqual(symbolic._meta['sparsity_method'], 'symbolic')
+        np.testing.assert_array_equal(symbolic.get_dense_sparsity(),
+                                      numeric.get_dense_sparsity())
+        return symbolic
+
+    @parameterized.expand([('default', {}),
+                           ('auto_ivc', {'auto_ivc': True}),
+                           ('no_diag_partials', {'has_diag_partials': False}),
+                           ('con_alias', {'con_alias': True}),
+                           ('partial_coloring', {'partial_coloring': True})])
+    def test_symbolic_matches_numeric(self, name, kwargs):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False, **kwargs)
+        coloring = self._check_sparsity(p)
+        self.assertEqual(coloring.total_solves(), 5)
+
+    def test_symbolic_sellar(self):
+        from openmdao.test_suite.components.sellar import SellarStateConnection
+
+        p = om.Problem(SellarStateConnection())
+        p.model.add_design_var('x')
+        p.model.add_design_var('z')
+        p.model.add_objective('obj')
+        p.model.add_constraint('con1', upper=0.)
+        p.model.add_constraint('con2', upper=0.)
+        p.setup()
+        p.run_model()
+
+        self._check_sparsity(p)
+
+    def test_symbolic_implicit_elementwise(self):
+        # the numeric sparsity of this model picks up spurious nonzeros, but the declared
+        # partials show that the states only depend on the matching design var entries.
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('sq', om.ExecComp('y=x**2', x=np.ones(3), y=np.ones(3),
+                                              has_diag_partials=True))
+        model.add_subsystem('bal', om.BalanceComp('x', val=np.ones(3), lhs_name='y',
+                                                  rhs_name='b'))
+        model.add_subsystem('out', om.ExecComp('f=sum(x)', x=np.ones(3)))
+        model.connect('bal.x', ['sq.x', 'out.x'])
+        model.connect('sq.y', 'bal.y')
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        model.linear_solver = om.DirectSolver()
+        model.add_design_var('bal.b', lower=0.)
+        model.add_objective('out.f')
+        model.add_constraint('bal.x', upper=10.)
+        p.setup()
+        p.set_val('bal.b', [1., 2., 3.])
+        p.run_model()
+
+        coloring = compute_total_coloring(p, sparsity_method='symbolic')
+        J = p.driver._compute_totals(return_format='array')
+        np.testing.assert_array_equal(coloring.get_dense_sparsity(), J != 0.)
+
+    def test_symbolic_fallback(self):
+        # the state of the balance doesn't affect any residual, so the declared partials are
+        # structurally singular and the sparsity has to be computed numerically.
+        p = om.Problem()
+        model = p.model
+        model.add_subsystem('bal', om.BalanceComp('x', val=np.ones(3), lhs_name='y',
+                                                  rhs_name='b'))
+        model.add_design_var('bal.b')
+        model.add_objective('bal.x', index=0)
+        model.add_constraint('bal.y', upper=0.)
+        p.setup()
+        p.final_setup()
+
+        stdout = sys.stdout
+        strout = StringIO()
+        sys.stdout = strout
+        try:
+            coloring = compute_total_coloring(p, sparsity_method='symbolic')
+        finally:
+            sys.stdout = stdout
+
+        self.assertIn("Total jacobian sparsity can't be determined from declared partials",
+                      strout.getvalue())
+        self.assertNotEqual(coloring._meta.get('sparsity_method'), 'symbolic')
+
+    def test_dynamic_total_coloring_symbolic(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False)
+        p_color = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                          dynamic_total_coloring=True, sparsity_method='symbolic')
+
+        assert_almost_equal(p['circle.area'], np.pi, decimal=7)
+        assert_almost_equal(p_color['circle.area'], np.pi, decimal=7)
+
+        self.assertEqual(p_color.driver._coloring_info['coloring']._meta['sparsity_method'],
+                         'symbolic')
+
+        p_color.model._solve_count = 0
+        p_color.driver._compute_totals()
+        self.assertEqual(p_color.model._solve_count, 5)
+
+    def test_bad_sparsity_method(self):
+        p = om.Problem()
+        with self.assertRaises(ValueError) as cm:
+            p.driver.declare_coloring(sparsity_method='exact')
+        self.assertEqual(str(cm.exception),
+                         "Driver: sparsity_method must be 'numeric' or 'symbolic', but 'exact' "
+                         "was given.")
+
+
+@use_tempdirs
+class TotalColoringCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        om.clear_reports()
+
+    def _run(self, **kwargs):
+        stdout = sys.stdout
+        strout = StringIO()
+        sys.stdout = strout
+        try:
+            with set_env_vars_context(OPENMDAO_COLORING_CACHE_DIR=os.path.abspath('cache')):
+                p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                            dynamic_total_coloring=True, **kwargs)
+        finally:
+            sys.stdout = stdout
+
+        return p, strout.getvalue()
+
+    def test_total_coloring_cache(self):
+        p, out = self._run()
+        self.assertNotIn("Loaded total coloring from cache file", out)
+        self.assertEqual(len(os.listdir('cache')), 1)
+        expected = p.driver._coloring_info['coloring']
+
+        # same structure, so the coloring is loaded from the cache
+        p, out = self._run()
+        self.assertIn("Loaded total coloring from cache file", out)
+        self.assertEqual(len(os.listdir('cache')), 1)
+        assert_almost_equal(p['circle.area'], np.pi, decimal=7)
+
+        coloring = p.driver._coloring_info['coloring']
+        self.assertEqual(coloring.get_dense_sparsity().tolist(),
+                         expected.get_dense_sparsity().tolist())
+
+        p.model._solve_count = 0
+        p.driver._compute_totals()
+        self.assertEqual(p.model._solve_count, 5)
+
+        # different declared partials give a new cache entry
+        p, out = self._run(has_diag_partials=False)
+        self.assertNotIn("Loaded total coloring from cache file", out)
+        self.assertEqual(len(os.listdir('cache')), 2)
+
+        # different responses give a new cache entry
+        p, out = self._run(con_alias=True)
+        self.assertNotIn("Loaded total coloring from cache file", out)
+        self.assertEqual(len(os.listdir('cache')), 3)
+
+    def test_total_coloring_cache_bad_file(self):
+        p, out = self._run()
+        fname = os.path.join('cache', os.listdir('cache')[0])
+        with open(fname, 'wb') as f:
+            f.write(b'not a coloring')
+
+        with assert_warning(om.DerivativesWarning,
+                            f"Ignoring coloring cache file '{os.path.abspath(fname)}': File "
+                            f"'{os.path.abspath(fname)}' is not a valid coloring file."):
+            p, out = self._run()
+
+        self.assertNotIn("Loaded total coloring from cache file", out)
+        assert_almost_equal(p['circle.area'], np.pi, decimal=7)
+
+        # the bad file was replaced by a good one
+        p, out = self._run()
+        self.assertIn("Loaded total coloring from cache file", out)
+
+    def test_no_cache_by_default(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True)
+        self.assertIsNone(p.options['coloring_cache_dir'])
+        self.assertFalse(os.path.exists('cache'))
+
+
 def _test_func_name(func, num, param):
     args = []
     for p in param.args:
@@ -1156,10 +1346,11 @@ class BidirectionalTestCase(unittest.TestCase):
     @parameterized.expand(itertools.product(
         [('n4c6-b15', 3), ('can_715', 21), ('lp_finnis', 14), ('ash608', 6), ('ash331', 6),
          ('D_6', 27), ('Harvard500', 26), ('illc1033', 5)],
+        ['adjacency', 'sparse'],
         ), name_func=_test_func_name
     )
     @unittest.skipIf(load_npz is None, "scipy version too old")
-    def test_bidir_coloring(self, tup):
+    def test_bidir_coloring(self, tup, algorithm):
         matname, expected_colors = tup
         matdir = os.path.join(os.path.dirname(openmdao.test_suite.__file__), 'matrices')
 
@@ -1170,7 +1361,7 @@ class BidirectionalTestCase(unittest.TestCase):
 
         mat = load_npz(matfile).tocoo()
         mat.data = np.asarray(mat.data, dtype=bool)
-        coloring = _compute_coloring(mat, 'auto')
+        coloring = _compute_coloring(mat, 'auto', algorithm)
         mat = None
 
         tot_size, tot_colors, fwd_solves, rev_solves, pct = coloring._solves_info()
@@ -1178,6 +1369,71 @@ class BidirectionalTestCase(unittest.TestCase):
         self.assertEqual(tot_colors, expected_colors)
 
 
+class SparseColoringAlgorithmTestCase(unittest.TestCase):
+
+    def _check_valid(self, J, coloring):
+        dense = J.toarray()
+        for direction, mat in (('fwd', dense), ('rev', dense.T)):
+            info = coloring._fwd if direction == 'fwd' else coloring._rev
+            if info is None:
+                continue
+            for group in coloring.color_iter(direction):
+                # columns in the same color group must not share a nonzero row
+                self.assertTrue(np.all(np.count_nonzero(mat[:, group], axis=1) <= 1))
+
+    @parameterized.expand(itertools.product([(10, 10), (30, 80), (80, 30), (150, 150)],
+                                            [.02, .1, .4],
+                                            ['fwd', 'rev', 'auto']),
+                          name_func=_test_func_name)
+    def test_sparse_matches_adjacency(self, shape, density, mode):
+        np.random.seed(11)
+        J = rand_sparsity(shape, density)
+
+        expected = _compute_coloring(J, mode, 'adjacency')
+        coloring = _compute_coloring(J, mode, 'sparse')
+
+        self.assertEqual(coloring._meta['coloring_algorithm'], 'sparse')
+        self.assertEqual(coloring.total_solves(), expected.total_solves())
+        for direction in ('fwd', 'rev'):
+            if getattr(expected, '_' + direction) is None:
+                self.assertIsNone(getattr(coloring, '_' + direction))
+            else:
+                self.assertEqual([list(g) for g in coloring.color_iter(direction)],
+                                 [list(g) for g in expected.color_iter(direction)])
+                for rows, exp_rows in zip(coloring.get_row_col_map(direction),
+                                          expected.get_row_col_map(direction)):
+                    if exp_rows is None:
+                        self.assertIsNone(rows)
+                    else:
+                        np.testing.assert_array_equal(rows, exp_rows)
+
+        self._check_valid(J, coloring)
+
+    def test_auto_algorithm(self):
+        np.random.seed(11)
+        small = rand_sparsity((10, 10), .2)
+        large = rand_sparsity((100, 100), .1)
+        self.assertEqual(_compute_coloring(small, 'fwd')._meta['coloring_algorithm'],
+                         'adjacency')
+        self.assertEqual(_compute_coloring(large, 'auto')._meta['coloring_algorithm'], 'sparse')
+
+    def test_empty_rows_and_cols(self):
+        J = np.zeros((6, 5), dtype=bool)
+        J[1, [0, 3]] = True
+        J[4, 3] = True
+        for mode in ('fwd', 'rev', 'auto'):
+            expected = _compute_coloring(J, mode, 'adjacency')
+            coloring = _compute_coloring(J, mode, 'sparse')
+            self.assertEqual(coloring.total_solves(), expected.total_solves())
+
+    def test_bad_algorithm(self):
+        with self.assertRaises(ValueError) as cm:
+            _compute_coloring(np.eye(3, dtype=bool), 'fwd', 'greedy')
+        self.assertEqual(str(cm.exception),
+                         "Coloring algorithm must be one of ['auto', 'adjacency', 'sparse'], but "
+                         "'greedy' was given.")
+
+
 def _get_random_mat(rows, cols, generator=None):
     gen = generator if generator is not None else np.random.default_rng()
 
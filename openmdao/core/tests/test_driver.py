@@ -877,6 +877,93 @@ class TestDriver(unittest.TestCase):
         with assert_warnings(expected_warnings):
             prob.final_setup()
 
+    def test_voi_plan_matches_per_var(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', val=np.array([[1., 2., 3.], [4., 5., 6.]])),
+                            promotes=['x'])
+        model.add_subsystem('comp', om.ExecComp(['y = 2.*x', 'z = sum(x)'],
+                                                x=np.ones((2, 3)), y=np.ones((2, 3))),
+                            promotes=['*'])
+
+        model.add_design_var('x', indices=[2, 3], flat_indices=True,
+                             ref=np.array([2., 3.]), ref0=np.array([.5, 1.5]))
+        model.add_objective('z', ref=10.)
+        model.add_constraint('y', indices=[5, 0, 3], lower=0., scaler=2., adder=.1)
+        model.add_constraint('y', alias='y_eq', indices=[1], equals=4., ref=.5)
+
+        prob.setup()
+        prob.run_model()
+
+        driver = prob.driver
+        for driver_scaling in (True, False):
+            for vals, vois, remote in ((driver.get_design_var_values(driver_scaling=driver_scaling),
+                                        driver._designvars, driver._remote_dvs),
+                                       (driver.get_objective_values(driver_scaling=driver_scaling),
+                                        driver._objs, driver._remote_objs),
+                                       (driver.get_constraint_values(driver_scaling=driver_scaling),
+                                        driver._cons, driver._remote_cons)):
+                self.assertEqual(list(vals), list(vois))
+                for name, meta in vois.items():
+                    expected = driver._get_voi_val(name, meta, remote,
+                                                   driver_scaling=driver_scaling)
+                    np.testing.assert_array_equal(vals[name], expected)
+
+        assert_near_equal(driver.get_constraint_values()['comp.y'], [24.2, 4.2, 16.2], 1e-15)
+
+        eq = driver.get_constraint_values(ctype='eq')
+        self.assertEqual(list(eq), ['y_eq'])
+        assert_near_equal(eq['y_eq'], [8.], 1e-15)
+
+        # set a scaled value and get it back
+        driver.set_design_var('px.x', np.array([1., 2.]))
+        assert_near_equal(prob.get_val('x'), [[1., 2., 2.], [4.5, 5., 6.]], 1e-15)
+        assert_near_equal(driver.get_design_var_values()['px.x'], [1., 2.], 1e-15)
+
+        # VOIs added after setup are picked up
+        driver._cons['z_con'] = driver._objs['comp.z']
+        self.assertEqual(list(driver.get_constraint_values()), ['comp.y', 'y_eq', 'z_con'])
+
+    def test_voi_plan_not_possible(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', val=np.array([1., 2., 3.])),
+                            promotes=['x'])
+        model.add_subsystem('comp', om.ExecComp('y = 2.*x', x=np.ones(3), y=np.ones(3)),
+                            promotes=['*'])
+
+        model.add_design_var('x')
+        model.add_objective('y', index=0)
+        model.add_constraint('y', alias='y_con', indices=[1, 2], lower=0., scaler=2.)
+
+        prob.setup()
+        prob.run_model()
+
+        driver = prob.driver
+
+        # a remote VOI without an owning rank, e.g. a distributed var under a parallel group,
+        # can't be gathered with a plan
+        driver._remote_cons['y_con'] = (None, 2)
+
+        builds = []
+        build_voi_plan = driver._build_voi_plan
+
+        def build(vois, remote_vois):
+            builds.append(list(vois))
+            return build_voi_plan(vois, remote_vois)
+
+        driver._build_voi_plan = build
+
+        for i in range(3):
+            assert_near_equal(driver.get_constraint_values()['y_con'], [8., 12.], 1e-15)
+
+        # the plan is only attempted once
+        self.assertEqual(builds, [['y_con']])
+        self.assertIs(driver._voi_plans['cons_all_all'], False)
+
+
 @use_tempdirs
 class TestCheckRelevance(unittest.TestCase):
     def setup_problem(self, driver=None):
@@ -1095,5 +1182,106 @@ class TestDriverMPI(unittest.TestCase):
         assert_near_equal(dvs['par_group.g0.dv.x'], 2)
         assert_near_equal(dvs['par_group.g1.dv.x'], 2)
 
+    def test_voi_plan_remote_distrib_alias(self):
+        comm = MPI.COMM_WORLD
+        size = 3 if comm.rank == 0 else 2
+
+        class MiniModel(om.Group):
+            def setup(self):
+                self.add_subsystem('dv', om.IndepVarComp('x', np.array([1., 2., 3.])))
+                self.add_subsystem('comp', om.ExecComp('y = 2.*x', x=np.ones(3), y=np.ones(3)))
+                self.connect('dv.x', 'comp.x')
+
+        class DistribComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', shape=size, distributed=True)
+                self.add_output('z', shape=size, distributed=True)
+                self.add_output('w', shape=size, distributed=True)
+
+            def compute(self, inputs, outputs):
+                outputs['z'] = 3. * inputs['x'] + 1.
+                outputs['w'] = inputs['x'] - 1.
+
+        p = om.Problem()
+        model = p.model
+
+        par = model.add_subsystem('par', om.ParallelGroup())
+        par.add_subsystem('g0', MiniModel())
+        par.add_subsystem('g1', MiniModel())
+
+        d_ivc = model.add_subsystem('d_ivc', om.IndepVarComp(distributed=True))
+        d_ivc.add_output('x', np.arange(size, dtype=float) + comm.rank)
+        model.add_subsystem('dc', DistribComp())
+        model.connect('d_ivc.x', 'dc.x')
+
+        model.add_subsystem('obj', om.ExecComp('f = y0 + y1'))
+        model.connect('par.g0.comp.y', 'obj.y0', src_indices=[0])
+        model.connect('par.g1.comp.y', 'obj.y1', src_indices=[2])
+
+        # remote design vars, with and without indices, and a distributed design var
+        model.add_design_var('par.g0.dv.x', indices=[2, 0], ref=2., ref0=.5)
+        model.add_design_var('par.g1.dv.x', scaler=3.)
+        model.add_design_var('d_ivc.x', adder=1.)
+        model.add_objective('obj.f', ref=10.)
+
+        # remote, aliased and distributed constraints, linear and nonlinear
+        model.add_constraint('par.g0.comp.y', lower=0., scaler=2.)
+        model.add_constraint('par.g1.comp.y', indices=[1], equals=4., ref=.5, linear=True)
+        model.add_constraint('par.g1.comp.y', alias='g1_y_alias', indices=[2, 0], upper=10.,
+                             adder=-1.)
+        model.add_constraint('dc.z', alias='z_eq', equals=0., scaler=.5)
+        model.add_constraint('dc.w', upper=100., linear=True)
+
+        p.driver.supports._read_only = False
+        p.driver.supports['distributed_design_vars'] = True
+
+        p.setup()
+        p.run_model()
+
+        driver = p.driver
+        for driver_scaling in (True, False):
+            for vals, vois, remote in ((driver.get_design_var_values(driver_scaling=driver_scaling),
+                                        driver._designvars, driver._remote_dvs),
+                                       (driver.get_objective_values(driver_scaling=driver_scaling),
+                                        driver._objs, driver._remote_objs),
+                                       (driver.get_constraint_values(driver_scaling=driver_scaling),
+                                        driver._cons, driver._remote_cons)):
+                self.assertEqual(list(vals), list(vois))
+                for name, meta in vois.items():
+                    expected = driver._get_voi_val(name, meta, remote,
+                                                   driver_scaling=driver_scaling)
+                    np.testing.assert_array_equal(vals[name], expected)
+
+        # every value is gathered with the compiled plans
+        for kind in ('desvars', 'objs', 'cons_all_all'):
+            self.assertIsNot(driver._voi_plans[kind], False)
+
+        dist_x = p.get_val('d_ivc.x', get_remote=True)
+        assert_near_equal(dist_x, [0., 1., 2., 1., 2.][:dist_x.size], 1e-15)
+
+        dvs = driver.get_design_var_values()
+        assert_near_equal(dvs['par.g0.dv.x'], [(3. - .5) / 1.5, (1. - .5) / 1.5], 1e-15)
+        assert_near_equal(dvs['par.g1.dv.x'], [3., 6., 9.], 1e-15)
+        assert_near_equal(dvs['d_ivc.x'], dist_x + 1., 1e-15)
+
+        assert_near_equal(driver.get_objective_values()['obj.f'], [.8], 1e-15)
+
+        cons = driver.get_constraint_values()
+        assert_near_equal(cons['par.g0.comp.y'], [4., 8., 12.], 1e-15)
+        assert_near_equal(cons['par.g1.comp.y'], [8.], 1e-15)
+        assert_near_equal(cons['g1_y_alias'], [5., 1.], 1e-15)
+        assert_near_equal(cons['z_eq'], (3. * dist_x + 1.) * .5, 1e-15)
+        assert_near_equal(cons['dc.w'], dist_x - 1., 1e-15)
+
+        # only the constraints that pass the filter are gathered
+        for ctype, lintype, names in (('eq', 'all', ['par.g1.comp.y', 'z_eq']),
+                                      ('ineq', 'nonlinear', ['par.g0.comp.y', 'g1_y_alias']),
+                                      ('all', 'linear', ['par.g1.comp.y', 'dc.w'])):
+            vals = driver.get_constraint_values(ctype=ctype, lintype=lintype)
+            self.assertEqual(list(vals), names)
+            self.assertEqual(driver._voi_plans[f'cons_{ctype}_{lintype}']['names'], names)
+            for name in names:
+                np.testing.assert_array_equal(vals[name], cons[name])
+
 if __name__ == "__main__":
     unittest.main()
@@ -421,6 +421,39 @@ class ParTestCase(unittest.TestCase):
         np.testing.assert_allclose(p.get_val('par.C1.y', get_remote=True), (np.arange(7) + 1.) * 4.)
         np.testing.assert_allclose(p.get_val('par.C2.y', get_remote=True), (np.arange(7,10) + 1.) * 9.)
 
+    def test_par_get_vals_batched(self):
+        p = Problem()
+        p.model.add_subsystem('indep', IndepVarComp('x', val=np.ones(10)))
+        dist = p.model.add_subsystem('dist', IndepVarComp())
+        dist.add_output('d', val=np.arange(2 + p.comm.rank) + 10. * p.comm.rank, distributed=True)
+        par = p.model.add_subsystem('par', ParallelGroup())
+        par.add_subsystem('C1', ExecComp('y=x*2.', x=np.zeros(7), y=np.zeros(7)))
+        par.add_subsystem('C2', ExecComp('y=x*3.', x=np.zeros((3, 1)), y=np.zeros((3, 1))))
+        p.model.connect('indep.x', 'par.C1.x', src_indices=list(range(7)))
+        p.model.connect('indep.x', 'par.C2.x', src_indices=list(range(7, 10)))
+
+        p.setup()
+        p['indep.x'] = np.arange(10) + 1.
+        p.run_model()
+
+        model = p.model
+        names = ['par.C1.y', 'dist.d', 'indep.x', 'par.C2.y', 'par.C1.x']
+        for rank in (None, 0):
+            for flat in (False, True):
+                with self.subTest(rank=rank, flat=flat):
+                    vals = model._abs_get_vals(names, get_remote=True, rank=rank, flat=flat)
+                    self.assertEqual(list(vals), names)
+                    if rank is None or p.comm.rank == rank:
+                        for name in names:
+                            expected = model._abs_get_val(name, get_remote=True, rank=rank,
+                                                          flat=flat)
+                            self.assertEqual(vals[name].shape, expected.shape)
+                            np.testing.assert_allclose(vals[name], expected)
+
+        vals = model._abs_get_vals(names, get_remote=True)
+        np.testing.assert_allclose(vals['dist.d'], [0., 1., 10., 11., 12.])
+        np.testing.assert_allclose(vals['par.C2.y'].ravel(), (np.arange(7, 10) + 1.) * 3.)
+
     @unittest.expectedFailure
     def test_par_multi_src_inds_fail(self):
         p = Problem()
@@ -488,6 +488,57 @@ class TestColoringExplicit(unittest.TestCase):
             self.assertTrue(orig is comp._coloring_info['coloring'],
                             "Instance '{}' is using a different coloring".format(comp.pathname))
 
+    def _build_cached_coloring_prob(self, isplit=7, subdir='run'):
+        method = 'cs'
+        prob = Problem(coloring_dir=os.path.join(self.tempdir, subdir),
+                       coloring_cache_dir=os.path.join(self.tempdir, 'cache'))
+        model = prob.model
+
+        sparsity = setup_sparsity(_BIGMASK)
+        indeps, conns = setup_indeps(isplit, _BIGMASK.shape[1], 'indeps', 'comp')
+        model.add_subsystem('indeps', indeps)
+        comp = model.add_subsystem('comp', SparseCompExplicit(sparsity, method,
+                                                              isplit=isplit, osplit=5))
+        comp.declare_coloring('x*', method=method)
+
+        for conn in conns:
+            model.connect(*conn)
+
+        prob.setup(check=False, mode='fwd')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob, comp, sparsity
+
+    def test_partials_coloring_cache(self):
+        cache_dir = os.path.join(self.tempdir, 'cache')
+
+        prob, comp, sparsity = self._build_cached_coloring_prob(subdir='run1')
+        start_nruns = comp._nruns
+        comp.run_linearize()
+        uncached_nruns = comp._nruns - start_nruns
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        expected = comp._coloring_info['coloring']
+
+        # a new problem with the same structure reuses the cached coloring
+        prob, comp, sparsity = self._build_cached_coloring_prob(subdir='run2')
+        start_nruns = comp._nruns
+        comp.run_linearize()
+        self.assertEqual(comp._nruns - start_nruns, 10)
+        self.assertLess(comp._nruns - start_nruns, uncached_nruns)
+        self.assertEqual(comp._coloring_info['coloring'].get_dense_sparsity().tolist(),
+                         expected.get_dense_sparsity().tolist())
+        _check_partial_matrix(comp, comp._jacobian._subjacs_info, sparsity, 'cs')
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        # changing the variables invalidates the cached coloring
+        prob, comp, sparsity = self._build_cached_coloring_prob(isplit=2, subdir='run3')
+        start_nruns = comp._nruns
+        comp.run_linearize()
+        self.assertGreater(comp._nruns - start_nruns, 10)
+        _check_partial_matrix(comp, comp._jacobian._subjacs_info, sparsity, 'cs')
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
 
 class TestColoringImplicit(unittest.TestCase):
     def setUp(self):
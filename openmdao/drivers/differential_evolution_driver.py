@@ -25,9 +25,10 @@ except ModuleNotFoundError:
 
 from openmdao.core.constants import INF_BOUND
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_async
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
+from openmdao.recorders.recording_manager import _capture_all_cases, _record_captured_cases
 
 
 class DifferentialEvolutionDriver(Driver):
@@ -58,6 +59,8 @@ class DifferentialEvolutionDriver(Driver):
          Number of successful function evaluations.
     _randomstate : int
         Seed-number which controls the random draws.
+    _worker_cases : list or None
+        Cases captured in a local worker process, None outside of them.
     """
 
     def __init__(self, **kwargs):
@@ -90,6 +93,7 @@ class DifferentialEvolutionDriver(Driver):
         self._desvar_idx = {}
         self._ga = None
         self._nfit = 0
+        self._worker_cases = None
 
         # random state can be set for predictability during testing
         if 'DifferentialEvolutionDriver_seed' in os.environ:
@@ -114,6 +118,17 @@ class DifferentialEvolutionDriver(Driver):
                              desc='Set to True to execute the points in a generation in parallel.')
         self.options.declare('procs_per_model', default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('steady_state', types=bool, default=False,
+                             desc='If True, evaluate points asynchronously. As soon as any '
+                             'evaluation finishes, a new trial point is generated from the current '
+                             'population instead of waiting for the whole generation to finish. '
+                             'The total number of evaluations is the same as for max_gen '
+                             'generations.')
+        self.options.declare('local_procs', default=1, lower=1,
+                             desc='Number of local (forked) processes used to evaluate points when '
+                             'steady_state is True and the driver is not running in parallel '
+                             'under MPI. Cases recorded in the worker processes are sent to the '
+                             'parent process and recorded there.')
         self.options.declare('penalty_parameter', default=10., lower=0.,
                              desc='Penalty function parameter.')
         self.options.declare('penalty_exponent', default=1.,
@@ -169,6 +184,9 @@ class DifferentialEvolutionDriver(Driver):
         model_mpi = None
         comm = problem.comm
         if self._concurrent_pop_size > 0:
+            if self.options['steady_state'] and self.options['procs_per_model'] > 1:
+                raise RuntimeError(f"{self.msginfo}: Option 'steady_state' is not supported when "
+                                   "'procs_per_model' is greater than 1.")
             model_mpi = (self._concurrent_pop_size, self._concurrent_color)
         elif not self.options['run_parallel']:
             comm = None
@@ -320,9 +338,18 @@ class DifferentialEvolutionDriver(Driver):
         if pop_size == 0:
             pop_size = 20 * count
 
-        desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound,
-                                                    pop_size, max_gen,
-                                                    self._randomstate, F, Pc)
+        if self.options['steady_state']:
+            desvar_new, obj, self._nfit = \
+                ga.execute_steady_state(x0, lower_bound, upper_bound, pop_size, max_gen,
+                                        self._randomstate, F, Pc,
+                                        num_procs=self.options['local_procs'],
+                                        initializer=self._setup_worker_proc,
+                                        worker_objfun=self._worker_objective,
+                                        record_cases=self._record_worker_cases)
+        else:
+            desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound,
+                                                        pop_size, max_gen,
+                                                        self._randomstate, F, Pc)
 
         # Pull optimal parameters back into framework and re-run, so that
         # framework is left in the right final state
@@ -339,6 +366,48 @@ class DifferentialEvolutionDriver(Driver):
 
         return False
 
+    def _setup_worker_proc(self):
+        """
+        Prepare a forked local worker process for evaluating points.
+
+        The cases recorded in the worker are captured instead, so that they can be sent back
+        with the result of each evaluation.
+        """
+        self._worker_cases = _capture_all_cases(self._problem())
+
+    def _worker_objective(self, x, icase):
+        """
+        Evaluate the objective in a local worker process.
+
+        Parameters
+        ----------
+        x : ndarray
+            Value of design variables.
+        icase : int
+            Case number, used for identification when run in parallel.
+
+        Returns
+        -------
+        tuple
+            Returns of objective_callback.
+        list
+            Cases recorded during the evaluation.
+        """
+        self._worker_cases.clear()
+        return self.objective_callback(x, icase), list(self._worker_cases)
+
+    def _record_worker_cases(self, cases):
+        """
+        Record the cases of an evaluation in a local worker process.
+
+        Parameters
+        ----------
+        cases : list
+            Cases recorded during the evaluation.
+        """
+        _record_captured_cases(self._problem(), cases, (self._get_name(), self.iter_count))
+        self.iter_count += 1
+
     def objective_callback(self, x, icase):
         r"""
         Evaluate problem objective at the requested point.
@@ -681,26 +750,171 @@ class DifferentialEvolution(object):
             fitness = np.ones(self.npop) * np.inf
 
             for ii in range(self.npop):
-                # randomly select 3 different population members other than the current choice
-                a, b, c = ii, ii, ii
-                while a == ii:
-                    a = rng.integers(0, self.npop)
-                while b == ii or b == a:
-                    b = rng.integers(0, self.npop)
-                while c == ii or c == a or c == b:
-                    c = rng.integers(0, self.npop)
-
-                # randomly select chromosome index for forced crossover
-                r = rng.integers(0, self.lchrom)
-
-                # crossover and mutation
-                population[ii] = parentPop[ii]  # start the same as parent
-                # clip mutant so that it cannot be outside the bounds
-                mutant = np.clip(parentPop[a] + F * (parentPop[b] - parentPop[c]), vlb, vub)
-                # sometimes replace parent's feature with mutant's
-                rr = rng.random(self.lchrom)
-                idx = np.where(rr < Pc)
-                population[ii][idx] = mutant[idx]
-                population[ii][r] = mutant[r]  # always replace at least one with mutant's
+                population[ii] = self.trial_vector(parentPop, ii, rng, vlb, vub, F, Pc)
 
         return xopt, fopt, nfit
+
+    def execute_steady_state(self, x0, vlb, vub, pop_size, max_gen, random_state, F=0.5, Pc=0.5,
+                             num_procs=1, initializer=None, worker_objfun=None,
+                             record_cases=None):
+        """
+        Perform the genetic algorithm asynchronously, without synchronizing generations.
+
+        Each population member is the target of a new trial vector as soon as a worker becomes
+        free, and a finished trial replaces its target right away if it is better. The trial
+        vectors are generated from the population as it is at that moment, so no worker ever
+        waits for the slowest evaluation of a generation.
+
+        Parameters
+        ----------
+        x0 : ndarray
+            Initial design values.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        pop_size : int
+            Number of points in the population.
+        max_gen : int
+            Number of generations worth of evaluations to run.
+        random_state : int
+            Seed-number which controls the random draws.
+        F : float
+            Differential rate.
+        Pc : float
+            Crossover rate.
+        num_procs : int
+            Number of local processes used to evaluate points when there is no communicator.
+        initializer : function or None
+            Function called once in each local worker process on startup.
+        worker_objfun : function or None
+            Objective function evaluated in local worker processes instead of objfun. It returns
+            the returns of objfun and the cases recorded during the evaluation.
+        record_cases : function or None
+            Function called in this process with the cases returned by worker_objfun.
+
+        Returns
+        -------
+        ndarray
+            Best design point.
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        self.lchrom = len(x0)
+
+        if np.mod(pop_size, 2) == 1:
+            pop_size += 1
+        self.npop = npop = int(pop_size)
+
+        # Only the master process (rank 0 under MPI) generates the population.
+        rng = np.random.default_rng(random_state)
+
+        # create LHS initial population (scaled to bounds) + user initial condition
+        population = lhs(self.lchrom, npop - 1, criterion='center', random_state=random_state)
+        population = population * (vub - vlb) + vlb  # scale to bounds
+        population = np.vstack((population, x0))
+        fitness = np.ones(npop) * np.inf  # initialize fitness to infinitely bad
+
+        max_evals = npop * (max_gen + 1)
+        nsent = 0
+        nfit = 0
+
+        def next_case():
+            nonlocal nsent
+            if nsent >= max_evals:
+                return None
+
+            ii = nsent % npop
+            if nsent < npop:
+                x = population[ii].copy()
+            else:
+                x = self.trial_vector(population, ii, rng, vlb, vub, F, Pc)
+            nsent += 1
+
+            return (x, ii), None
+
+        def on_result(case, returns, traceback):
+            nonlocal nfit
+            if returns:
+                if objfun is worker_objfun:
+                    returns, cases = returns
+                    record_cases(cases)
+                val, success, ii = returns
+                if success:
+                    nfit += 1
+                    # trial replaces its target, if better
+                    if val < fitness[ii]:
+                        fitness[ii] = val
+                        population[ii] = case[0][0]
+            else:
+                # Print the traceback if it fails
+                print('A case failed:')
+                print(traceback)
+
+        objfun = self.objfun
+        if worker_objfun is not None and num_procs > 1 and (comm is None or comm.size == 1):
+            # cases are evaluated in local worker processes
+            objfun = worker_objfun
+
+        concurrent_eval_async(objfun, next_case, on_result, comm=comm,
+                              num_procs=num_procs, initializer=initializer)
+
+        if comm is not None and comm.size > 1:
+            population, fitness, nfit = comm.bcast((population, fitness, nfit), root=0)
+
+        min_index = np.argmin(fitness)
+
+        return population[min_index], fitness[min_index], nfit
+
+    def trial_vector(self, population, ii, rng, vlb, vub, F, Pc):
+        """
+        Generate a new trial vector for a population member by mutation and crossover.
+
+        Parameters
+        ----------
+        population : ndarray
+            Current population.
+        ii : int
+            Index of the target population member.
+        rng : Generator
+            Random number generator.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        F : float
+            Differential rate.
+        Pc : float
+            Crossover rate.
+
+        Returns
+        -------
+        ndarray
+            The trial vector.
+        """
+        # randomly select 3 different population members other than the current choice
+        a, b, c = ii, ii, ii
+        while a == ii:
+            a = rng.integers(0, self.npop)
+        while b == ii or b == a:
+            b = rng.integers(0, self.npop)
+        while c == ii or c == a or c == b:
+            c = rng.integers(0, self.npop)
+
+        # randomly select chromosome index for forced crossover
+        r = rng.integers(0, self.lchrom)
+
+        # crossover and mutation
+        trial = population[ii].copy()  # start the same as parent
+        # clip mutant so that it cannot be outside the bounds
+        mutant = np.clip(population[a] + F * (population[b] - population[c]), vlb, vub)
+        # sometimes replace parent's feature with mutant's
+        rr = rng.random(self.lchrom)
+        idx = np.where(rr < Pc)
+        trial[idx] = mutant[idx]
+        trial[r] = mutant[r]  # always replace at least one with mutant's
+
+        return trial
@@ -88,6 +88,11 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('hotstart_file', types=str, default=None, allow_none=True,
+                             desc='File location of a case recorder database written by a '
+                             'previous run. Cases that match the recorded ones, in the order '
+                             'they were recorded, and were completed successfully are not run '
+                             'again, their recorded values are recorded instead.')
 
     def _setup_comm(self, comm):
         """
@@ -181,6 +186,8 @@ class DOEDriver(Driver):
         for name, _ in con_meta.items():
             self._quantities.append(name)
 
+        self._load_hotstart_cases(self.options['hotstart_file'])
+
         if MPI and self.options['run_parallel']:
             case_gen = self._parallel_generator
         else:
@@ -216,6 +223,12 @@ class DOEDriver(Driver):
                 if msg:
                     raise ValueError(msg)
 
+        hotstart = self._get_hotstart_case()
+        if hotstart is not None:
+            # the case was completed in the run recorded in the hot start file
+            self._record_hotstart_case(hotstart)
+            return
+
         with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
             try:
                 self._problem().model.run_solve_nonlinear()
@@ -32,9 +32,10 @@ except ModuleNotFoundError:
 
 from openmdao.core.constants import INF_BOUND
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_async
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
+from openmdao.recorders.recording_manager import _capture_all_cases, _record_captured_cases
 
 
 class SimpleGADriver(Driver):
@@ -63,6 +64,8 @@ class SimpleGADriver(Driver):
          Random state (or seed-number) which controls the seed and random draws.
     _nfit : int
          Number of successful function evaluations.
+    _worker_cases : list or None
+        Cases captured in a local worker process, None outside of them.
     """
 
     def __init__(self, **kwargs):
@@ -94,6 +97,7 @@ class SimpleGADriver(Driver):
 
         self._desvar_idx = {}
         self._ga = None
+        self._worker_cases = None
 
         # random state can be set for predictability during testing
         if 'SimpleGADriver_seed' in os.environ:
@@ -134,6 +138,17 @@ class SimpleGADriver(Driver):
                              desc='Set to True to execute the points in a generation in parallel.')
         self.options.declare('procs_per_model', default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('steady_state', types=bool, default=False,
+                             desc='If True, evaluate points asynchronously. As soon as any '
+                             'evaluation finishes, a new child is bred from the current population '
+                             'and replaces its worst member if better, instead of waiting for the '
+                             'whole generation to finish. The total number of evaluations is the '
+                             'same as for max_gen generations.')
+        self.options.declare('local_procs', default=1, lower=1,
+                             desc='Number of local (forked) processes used to evaluate points when '
+                             'steady_state is True and the driver is not running in parallel '
+                             'under MPI. Cases recorded in the worker processes are sent to the '
+                             'parent process and recorded there.')
         self.options.declare('penalty_parameter', default=10., lower=0.,
                              desc='Penalty function parameter.')
         self.options.declare('penalty_exponent', default=1.,
@@ -191,9 +206,16 @@ class SimpleGADriver(Driver):
                        f"equals={equals}, lower={lower}, upper={upper}.")
                 raise ValueError(msg)
 
+        if self.options['steady_state'] and self.options['compute_pareto']:
+            raise RuntimeError(f"{self.msginfo}: Option 'steady_state' is not supported when "
+                               "'compute_pareto' is True.")
+
         model_mpi = None
         comm = problem.comm
         if self._concurrent_pop_size > 0:
+            if self.options['steady_state'] and self.options['procs_per_model'] > 1:
+                raise RuntimeError(f"{self.msginfo}: Option 'steady_state' is not supported when "
+                                   "'procs_per_model' is greater than 1.")
             model_mpi = (self._concurrent_pop_size, self._concurrent_color)
         elif not self.options['run_parallel']:
             comm = None
@@ -394,9 +416,18 @@ class SimpleGADriver(Driver):
         if pop_size == 0:
             pop_size = 4 * np.sum(bits)
 
-        desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound, outer_bound,
-                                                    bits, pop_size, max_gen,
-                                                    self._randomstate, Pm, Pc)
+        if self.options['steady_state']:
+            desvar_new, obj, self._nfit = \
+                ga.execute_steady_state(x0, lower_bound, upper_bound, outer_bound, bits,
+                                        pop_size, max_gen, self._randomstate, Pm, Pc,
+                                        num_procs=self.options['local_procs'],
+                                        initializer=self._setup_worker_proc,
+                                        worker_objfun=self._worker_objective,
+                                        record_cases=self._record_worker_cases)
+        else:
+            desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound,
+                                                        outer_bound, bits, pop_size, max_gen,
+                                                        self._randomstate, Pm, Pc)
 
         if compute_pareto:
             # Just save the non-dominated points.
@@ -419,6 +450,48 @@ class SimpleGADriver(Driver):
 
         return False
 
+    def _setup_worker_proc(self):
+        """
+        Prepare a forked local worker process for evaluating points.
+
+        The cases recorded in the worker are captured instead, so that they can be sent back
+        with the result of each evaluation.
+        """
+        self._worker_cases = _capture_all_cases(self._problem())
+
+    def _worker_objective(self, x, icase):
+        """
+        Evaluate the objective in a local worker process.
+
+        Parameters
+        ----------
+        x : ndarray
+            Value of design variables.
+        icase : int
+            Case number, used for identification when run in parallel.
+
+        Returns
+        -------
+        tuple
+            Returns of objective_callback.
+        list
+            Cases recorded during the evaluation.
+        """
+        self._worker_cases.clear()
+        return self.objective_callback(x, icase), list(self._worker_cases)
+
+    def _record_worker_cases(self, cases):
+        """
+        Record the cases of an evaluation in a local worker process.
+
+        Parameters
+        ----------
+        cases : list
+            Cases recorded during the evaluation.
+        """
+        _record_captured_cases(self._problem(), cases, (self._get_name(), self.iter_count))
+        self.iter_count += 1
+
     def objective_callback(self, x, icase):
         r"""
         Evaluate problem objective at the requested point.
@@ -813,6 +886,162 @@ class GeneticAlgorithm(object):
 
         return xopt, fopt, nfit
 
+    def execute_steady_state(self, x0, vlb, vub, vob, bits, pop_size, max_gen, random_state,
+                             Pm=None, Pc=0.5, num_procs=1, initializer=None,
+                             worker_objfun=None, record_cases=None):
+        """
+        Perform the genetic algorithm asynchronously, without synchronizing generations.
+
+        Whenever a worker becomes free, it gets a new child bred from the population as it is at
+        that moment, and a finished child replaces the worst member of the population if it is
+        better. This replacement is implicitly elitist. Only a single objective is supported.
+
+        Parameters
+        ----------
+        x0 : ndarray
+            Initial design values.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array. This includes over-allocation so that every point falls on an
+            integer value.
+        vob : ndarray
+            Outer bounds array. This is purely for bounds check.
+        bits : ndarray
+            Number of bits to encode the design space for each element of the design vector.
+        pop_size : int
+            Number of points in the population.
+        max_gen : int
+            Number of generations worth of evaluations to run.
+        random_state : np.random.RandomState, int
+            Random state (or seed-number) which controls the seed and random draws.
+        Pm : float or None
+            Mutation rate.
+        Pc : float
+            Crossover rate.
+        num_procs : int
+            Number of local processes used to evaluate points when there is no communicator.
+        initializer : function or None
+            Function called once in each local worker process on startup.
+        worker_objfun : function or None
+            Objective function evaluated in local worker processes instead of objfun. It returns
+            the returns of objfun and the cases recorded during the evaluation.
+        record_cases : function or None
+            Function called in this process with the cases returned by worker_objfun.
+
+        Returns
+        -------
+        ndarray
+            Best design point.
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        self.lchrom = int(np.sum(bits))
+
+        # Needs to be divisible by two because tournament selection pits one half of the
+        # population against the other half.
+        if np.mod(pop_size, 2) == 1:
+            pop_size += 1
+        self.npop = npop = int(pop_size)
+
+        # If mutation rate is not provided as input
+        if Pm is None:
+            Pm = (self.lchrom + 1.0) / (2.0 * pop_size * np.sum(bits))
+
+        # Only the master process (rank 0 under MPI) generates the population.
+        pop = np.round(lhs(self.lchrom, npop, criterion='center', random_state=random_state))
+        pop[0] = self.encode(x0, vlb, vub, bits)
+        x_pop = self.decode(pop, vlb, vub, bits)
+        fitness = np.full((npop, 1), np.inf)
+
+        # case number of the initial member in each slot, -1 once it is replaced by a child
+        owner = np.arange(npop)
+
+        # Children are bred in batches by the usual generational operators, but only as many of
+        # each batch are used as there are workers, so every child comes from a recent population.
+        if comm is not None and comm.size > 1:
+            nbatch = max(2, comm.size - 1)
+        else:
+            nbatch = max(2, num_procs)
+        children = []
+        pending = {}
+
+        max_evals = npop * (max_gen + 1)
+        nsent = 0
+        nfit = 0
+
+        def next_case():
+            nonlocal nsent, children
+            while nsent < max_evals:
+                icase = nsent
+                nsent += 1
+
+                if icase < npop:
+                    gen, x = pop[icase], x_pop[icase]
+                else:
+                    if not children:
+                        new_gen = self.tournament(pop, fitness[:, 0])
+                        new_gen = self.crossover(new_gen, Pc)
+                        new_gen = self.mutate(new_gen, Pm)
+                        children = list(zip(new_gen, self.decode(new_gen, vlb, vub, bits)))
+                        children = children[:nbatch]
+                    gen, x = children.pop()
+
+                # Points that exceed bounds for over-allocated integer variables use up an
+                # evaluation without being run.
+                if np.all(x - vob <= 0):
+                    pending[icase] = gen.copy()
+                    return (x.copy(), icase), None
+
+            return None
+
+        def on_result(case, returns, traceback):
+            nonlocal nfit
+            x, icase = case[0]
+            gen = pending.pop(icase)
+
+            if returns:
+                if objfun is worker_objfun:
+                    returns, cases = returns
+                    record_cases(cases)
+                val, success, _ = returns
+                if success:
+                    nfit += 1
+                    if icase < npop and owner[icase] == icase:
+                        # initial member that still holds its slot
+                        fitness[icase, :] = val
+                    else:
+                        # Replace the worst member, but don't let duplicates take over the
+                        # population.
+                        worst = np.argmax(fitness[:, 0])
+                        if val < fitness[worst, 0] and not np.any(np.all(pop == gen, axis=1)):
+                            pop[worst] = gen
+                            x_pop[worst] = x
+                            fitness[worst, :] = val
+                            owner[worst] = -1
+            else:
+                # Print the traceback if it fails
+                print('A case failed:')
+                print(traceback)
+
+        objfun = self.objfun
+        if worker_objfun is not None and num_procs > 1 and (comm is None or comm.size == 1):
+            # cases are evaluated in local worker processes
+            objfun = worker_objfun
+
+        concurrent_eval_async(objfun, next_case, on_result, comm=comm,
+                              num_procs=num_procs, initializer=initializer)
+
+        if comm is not None and comm.size > 1:
+            x_pop, fitness, nfit = comm.bcast((x_pop, fitness, nfit), root=0)
+
+        min_index = np.argmin(fitness[:, 0])
+
+        return x_pop[min_index], fitness[min_index, 0], nfit
+
     def eval_pareto(self, x, obj, x_nd, obj_nd):
         """
         Produce a set of non dominated designs.
@@ -333,6 +333,9 @@ class pyOptSparseDriver(Driver):
         """
         Return number of objective evaluations made during a driver run.
 
+        Evaluations that were taken from the design point cache are included. Their number is
+        given by get_driver_cache_hits.
+
         Returns
         -------
         int
@@ -369,6 +372,7 @@ class pyOptSparseDriver(Driver):
         self.pyopt_solution = None
         self._total_jac = None
         self.iter_count = 0
+        self._reset_design_cache()
         fwd = problem._mode == 'fwd'
         self._quantities = []
 
@@ -671,6 +675,7 @@ class pyOptSparseDriver(Driver):
         """
         model = self._problem().model
         fail = 0
+        key = None
 
         # Note: we place our handler as late as possible so that codes that run in the
         # workflow can place their own handlers.
@@ -680,18 +685,29 @@ class pyOptSparseDriver(Driver):
             signal.signal(sigusr, self._signal_handler)
 
         try:
+            # Check if we caught a termination signal while SNOPT was running. This comes
+            # before the cache lookup so that a cached design point can't hide the request.
+            if self._user_termination_flag:
+                self._model_design_key = None
+                for name in self._indep_list:
+                    self.set_design_var(name, dv_dict[name])
+
+                func_dict = self.get_objective_values()
+                func_dict.update(self.get_constraint_values(lintype='nonlinear'))
+                return func_dict, 2
+
+            key = self._get_dv_dict_key(dv_dict)
+            func_dict = self._get_cached(key, 'responses')
+            if func_dict is not None:
+                return {name: val.copy() for name, val in func_dict.items()}, fail
+
+            self._model_design_key = None
             for name in self._indep_list:
                 self.set_design_var(name, dv_dict[name])
 
             # print("Setting DV")
             # print(dv_dict)
 
-            # Check if we caught a termination signal while SNOPT was running.
-            if self._user_termination_flag:
-                func_dict = self.get_objective_values()
-                func_dict.update(self.get_constraint_values(lintype='nonlinear'))
-                return func_dict, 2
-
             # Execute the model
             with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
                 self.iter_count += 1
@@ -722,6 +738,11 @@ class pyOptSparseDriver(Driver):
         func_dict = self.get_objective_values()
         func_dict.update(self.get_constraint_values(lintype='nonlinear'))
 
+        if fail == 0 and self._exc_info is None:
+            self._model_design_key = key
+            self._set_cached(key, 'responses',
+                             {name: val.copy() for name, val in func_dict.items()})
+
         if fail > 0 and self._fill_NANs:
             for name in func_dict:
                 func_dict[name].fill(np.NAN)
@@ -769,9 +790,26 @@ class pyOptSparseDriver(Driver):
 
             try:
                 self._in_user_function = True
-                sens_dict = self._compute_totals(of=self._quantities,
-                                                 wrt=self._indep_list,
-                                                 return_format=self._total_jac_format)
+
+                key = self._get_dv_dict_key(dv_dict)
+                sens_dict = self._get_cached(key, 'totals')
+                if sens_dict is None:
+                    if key is not None and key != self._model_design_key:
+                        # the model was last run at another design point, so the totals
+                        # would be wrong
+                        for name in self._indep_list:
+                            self.set_design_var(name, dv_dict[name])
+                        with RecordingDebugging(self._get_name(), self.iter_count, self):
+                            self.iter_count += 1
+                            prob.model.run_solve_nonlinear()
+                        self._model_design_key = key
+
+                    sens_dict = self._compute_totals(of=self._quantities,
+                                                     wrt=self._indep_list,
+                                                     return_format=self._total_jac_format)
+                    self._set_cached(key, 'totals',
+                                     {okey: {ikey: val.copy() for ikey, val in sub.items()}
+                                      for okey, sub in sens_dict.items()})
 
                 # First time through, check for zero row/col.
                 if self._check_jac and self._total_jac is not None:
@@ -835,6 +873,24 @@ class pyOptSparseDriver(Driver):
         self._in_user_function = False
         return sens_dict, fail
 
+    def _get_dv_dict_key(self, dv_dict):
+        """
+        Return the key of the design point given by pyoptsparse in the design point cache.
+
+        Parameters
+        ----------
+        dv_dict : dict
+            Dictionary of design variable values.
+
+        Returns
+        -------
+        bytes or None
+            The key of the design point, or None if the cache is disabled.
+        """
+        if self.options['memoize'] > 0:
+            return self._get_design_key(np.concatenate([np.asarray(dv_dict[name]).ravel()
+                                                        for name in self._indep_list]))
+
     def _get_name(self):
         """
         Get name of current optimizer.
@@ -116,6 +116,9 @@ class ScipyOptimizeDriver(Driver):
         Copy of _designvars.
     _lincongrad_cache : np.ndarray
         Pre-calculated gradients of linear constraints.
+    _hotstart_totals : tuple or None
+        Key and recorded total derivatives of the design point whose responses were last taken
+        from the hot start file.
     """
 
     def __init__(self, **kwargs):
@@ -149,6 +152,7 @@ class ScipyOptimizeDriver(Driver):
         self._obj_and_nlcons = None
         self._dvlist = None
         self._lincongrad_cache = None
+        self._hotstart_totals = None
         self.fail = False
         self.iter_count = 0
         self._check_jac = False
@@ -179,6 +183,11 @@ class ScipyOptimizeDriver(Driver):
                              "ignore - don't perform check.")
         self.options.declare('singular_jac_tol', default=1e-16,
                              desc='Tolerance for zero row/column check.')
+        self.options.declare('hotstart_file', types=str, default=None, allow_none=True,
+                             desc='File location of a case recorder database written by a '
+                             'previous run. While the design points match the recorded ones, in '
+                             'the order they were recorded, the recorded responses and '
+                             'derivatives are used instead of running the model.')
 
     def _get_name(self):
         """
@@ -234,6 +243,9 @@ class ScipyOptimizeDriver(Driver):
         """
         Return number of objective evaluations made during a driver run.
 
+        Evaluations that were taken from the design point cache are included. Their number is
+        given by get_driver_cache_hits.
+
         Returns
         -------
         int
@@ -272,6 +284,8 @@ class ScipyOptimizeDriver(Driver):
         model = problem.model
         self.iter_count = 0
         self._total_jac = None
+        self._reset_design_cache()
+        self._hotstart_totals = None
 
         self._check_for_missing_objective()
         self._check_for_invalid_desvar_values()
@@ -285,6 +299,11 @@ class ScipyOptimizeDriver(Driver):
         desvar_vals = self.get_design_var_values()
         self._dvlist = list(self._designvars)
 
+        # the initial point is always run, so the model starts from a valid state, and the
+        # replay starts after the recorded initial run
+        self._load_hotstart_cases(self.options['hotstart_file'])
+        self._hotstart_index = 1
+
         # maxiter and disp get passed into scipy with all the other options.
         if 'maxiter' not in self.opt_settings:  # lets you override the value in options
             self.opt_settings['maxiter'] = self.options['maxiter']
@@ -328,6 +347,14 @@ class ScipyOptimizeDriver(Driver):
 
                     bounds.append((p_low, p_high))
 
+        # the model has just been run at the initial design point
+        key = self._get_design_key(x_init)
+        if key is not None:
+            self._model_design_key = key
+            for f_init in self.get_objective_values().values():
+                self._set_cached(key, 'responses', (f_init, self._con_cache))
+                break
+
         if use_bounds and (opt in _supports_new_style) and _use_new_style:
             # For 'trust-constr' it is better to use the new type bounds, because it seems to work
             # better (for the current examples in the tests) with the "keep_feasible" option
@@ -554,6 +581,13 @@ class ScipyOptimizeDriver(Driver):
 
         self.result = result
 
+        # leave the model at the final design point if its responses were taken from the cache
+        x_final = getattr(result, 'x', None)
+        if x_final is not None:
+            key = self._get_design_key(x_final)
+            if key is not None and key != self._model_design_key:
+                self._run_design_point(np.asarray(x_final, dtype=float), key, replay=False)
+
         if hasattr(result, 'success'):
             self.fail = False if result.success else True
             if self.fail:
@@ -579,7 +613,8 @@ class ScipyOptimizeDriver(Driver):
         """
         Evaluate and return the objective function.
 
-        Model is executed here.
+        Model is executed here, unless the responses at this design point are cached or were
+        recorded in the hot start file.
 
         Parameters
         ----------
@@ -591,29 +626,17 @@ class ScipyOptimizeDriver(Driver):
         float
             Value of the objective function evaluated at the new design point.
         """
-        model = self._problem().model
+        if MPI:
+            self._problem().model.comm.Bcast(x_new, root=0)
 
-        try:
+        key = self._get_design_key(x_new)
+        responses = self._get_cached(key, 'responses')
+        if responses is not None:
+            f_new, self._con_cache = responses
+            return f_new
 
-            # Pass in new inputs
-            i = 0
-            if MPI:
-                model.comm.Bcast(x_new, root=0)
-            for name, meta in self._designvars.items():
-                size = meta['size']
-                self.set_design_var(name, x_new[i:i + size])
-                i += size
-
-            with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
-                self.iter_count += 1
-                model.run_solve_nonlinear()
-
-            # Get the objective function evaluations
-            for obj in self.get_objective_values().values():
-                f_new = obj
-                break
-
-            self._con_cache = self.get_constraint_values()
+        try:
+            f_new = self._run_design_point(x_new, key)
 
         except Exception as msg:
             if self._exc_info is None:  # only record the first one
@@ -626,6 +649,63 @@ class ScipyOptimizeDriver(Driver):
 
         return f_new
 
+    def _run_design_point(self, x_new, key, replay=True):
+        """
+        Run the model at a design point and cache the objective and constraint values.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at the design point.
+        key : bytes or None
+            Key of the design point in the design point cache.
+        replay : bool
+            If True, take the responses from the hot start file instead of running the model
+            if the design point was recorded there.
+
+        Returns
+        -------
+        float
+            Value of the objective function evaluated at the design point.
+        """
+        model = self._problem().model
+        self._model_design_key = None
+
+        # Pass in new inputs
+        i = 0
+        for name, meta in self._designvars.items():
+            size = meta['size']
+            self.set_design_var(name, x_new[i:i + size])
+            i += size
+
+        hotstart = self._get_hotstart_case() if replay else None
+        if hotstart is not None:
+            # the model is not run, the recorded values are recorded again instead
+            self._record_hotstart_case(hotstart)
+            self.iter_count += 1
+            responses = hotstart['responses']
+            f_new = responses[next(iter(self._objs))]
+            self._con_cache = {name: responses[name] for name in self._cons}
+            self._hotstart_totals = (key, hotstart['totals'])
+            self._set_cached(key, 'responses', (f_new, self._con_cache))
+            return f_new
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+            self.iter_count += 1
+            model.run_solve_nonlinear()
+
+        # Get the objective function evaluations
+        for obj in self.get_objective_values().values():
+            f_new = obj
+            break
+
+        self._con_cache = self.get_constraint_values()
+
+        self._model_design_key = key
+        self._set_cached(key, 'responses', (f_new, self._con_cache))
+
+        return f_new
+
     def _con_val_func(self, x_new, name, dbl, idx):
         """
         Return the value of the constraint function requested in args.
@@ -718,10 +798,28 @@ class ScipyOptimizeDriver(Driver):
         ndarray
             Gradient of objective with respect to input array.
         """
+        if MPI and (self.options['memoize'] > 0 or self._hotstart_cases):
+            self._problem().model.comm.Bcast(x_new, root=0)
+
+        key = self._get_design_key(x_new)
+        grad = self._get_cached(key, 'totals')
+        if grad is not None:
+            self._grad_cache = grad
+            return grad[0, :]
+
         try:
-            grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
-                                        return_format=self._total_jac_format)
+            grad = None
+            if key is not None and key != self._model_design_key:
+                grad = self._get_hotstart_grad(key)
+                if grad is None:
+                    # the model was last run at another design point, so the totals would be wrong
+                    self._run_design_point(x_new, key, replay=False)
+
+            if grad is None:
+                grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
+                                            return_format=self._total_jac_format)
             self._grad_cache = grad
+            self._set_cached(key, 'totals', grad.copy())
 
             # First time through, check for zero row/col.
             if self._check_jac and self._total_jac is not None:
@@ -741,6 +839,34 @@ class ScipyOptimizeDriver(Driver):
 
         return grad[0, :]
 
+    def _get_hotstart_grad(self, key):
+        """
+        Return the recorded total derivatives of a design point replayed from the hot start file.
+
+        Parameters
+        ----------
+        key : bytes
+            Key of the design point in the design point cache.
+
+        Returns
+        -------
+        ndarray or None
+            Total derivatives of the objective and nonlinear constraints, or None if they were
+            not recorded.
+        """
+        if self._hotstart_totals is None or self._hotstart_totals[0] != key:
+            return None
+
+        totals = self._hotstart_totals[1]
+        if totals is None:
+            return None
+
+        try:
+            return np.vstack([np.hstack([np.atleast_2d(totals[of, wrt]) for wrt in self._dvlist])
+                              for of in self._obj_and_nlcons])
+        except KeyError:
+            return None
+
     def _congradfunc(self, x_new, name, dbl, idx):
         """
         Return the cached gradient of the constraint function.
@@ -433,6 +433,100 @@ class TestDifferentialEvolution(unittest.TestCase):
             self.assertLessEqual(1.0 - 1e-6, prob["x"][i])
 
 
+@unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
+@use_tempdirs
+class TestSteadyStateDifferentialEvolution(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['DifferentialEvolutionDriver_seed'] = '11'  # make RNG repeatable
+
+    def tearDown(self):
+        del os.environ['DifferentialEvolutionDriver_seed']  # clean up environment
+
+    def _branin_problem(self, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(steady_state=True, max_gen=50, **options)
+
+        return prob
+
+    def test_steady_state(self):
+        prob = self._branin_problem()
+
+        prob.setup()
+        prob.run_driver()
+
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-3)
+
+        # same number of evaluations as the generational algorithm
+        self.assertEqual(prob.driver.get_driver_objective_calls(), 40 * 51)
+
+    def test_steady_state_local_procs(self):
+        prob = self._branin_problem(local_procs=2)
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        prob.setup()
+        prob.model.comp.add_recorder(om.SqliteRecorder('comp_cases.sql'))
+        prob.run_driver()
+        prob.cleanup()
+
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-3)
+        self.assertEqual(prob.driver.get_driver_objective_calls(), 40 * 51)
+
+        # evaluations in the worker processes are recorded by the parent process, followed by
+        # the final run.
+        cr = om.CaseReader('cases.sql')
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), 40 * 51 + 1)
+        self.assertEqual(cases[-1], 'rank0:DifferentialEvolution|%d' % (40 * 51))
+        assert_near_equal(cr.get_case(cases[-1])['comp.f'], prob['comp.f'])
+
+        branin = om.Problem()
+        branin.model.add_subsystem('comp', Branin())
+        branin.setup()
+        for case in cr.get_cases('driver')[:-1:100]:
+            branin.set_val('comp.x0', case['xI'])
+            branin.set_val('comp.x1', case['xC'])
+            branin.run_model()
+            assert_near_equal(case['comp.f'], branin['comp.f'], 1e-12)
+
+        # so are the cases of the systems in the model
+        cases = om.CaseReader('comp_cases.sql').list_cases('root.comp', recurse=False,
+                                                           out_stream=None)
+        self.assertEqual(len(cases), 40 * 51 + 1)
+
+    def test_steady_state_failed_cases(self):
+        class FailingBranin(Branin):
+            def compute(self, inputs, outputs):
+                if inputs['x0'] > 8.0:
+                    raise om.AnalysisError('fail')
+                super().compute(inputs, outputs)
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', FailingBranin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(steady_state=True, max_gen=20)
+
+        prob.setup()
+        prob.run_driver()
+
+        self.assertLessEqual(prob['xI'], 8.0)
+        self.assertLess(prob.driver.get_driver_objective_calls(), 40 * 21)
+
+
 @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
 class TestDriverOptionsDifferentialEvolution(unittest.TestCase):
 
@@ -1061,6 +1155,44 @@ class MPITestDifferentialEvolution4Procs(unittest.TestCase):
         # No meaningful result from a short run; just make sure we don't hang.
         prob.run_driver()
 
+    def test_steady_state(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(run_parallel=True, steady_state=True,
+                                                     max_gen=50)
+
+        prob.setup()
+        prob.run_driver()
+
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-3)
+        self.assertEqual(prob.driver.get_driver_objective_calls(), 40 * 51)
+
+    def test_steady_state_procs_per_model_error(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        prob.model.add_design_var('xI', lower=-5.0, upper=10.0)
+        prob.model.add_design_var('xC', lower=0.0, upper=15.0)
+        prob.model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(run_parallel=True, steady_state=True,
+                                                     procs_per_model=2)
+
+        with self.assertRaises(RuntimeError) as err:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(err.exception),
+                         "DifferentialEvolutionDriver: Option 'steady_state' is not supported "
+                         "when 'procs_per_model' is greater than 1.")
+
     def test_proc_per_model(self):
         # Test that we can run a GA on a distributed component without lockups.
         prob = om.Problem()
@@ -1565,6 +1565,141 @@ class TestDOEDriver(unittest.TestCase):
             derivs = cr.get_case(case).derivatives
             self.assertIsNone(derivs)
 
+    def test_hotstart(self):
+        def build(cases, recorder, hotstart_file=None):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+            model.set_input_defaults('x', 0.0)
+            model.set_input_defaults('y', 0.0)
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy')
+
+            prob.driver = om.DOEDriver(om.ListGenerator(cases), hotstart_file=hotstart_file)
+            prob.driver.add_recorder(om.SqliteRecorder(recorder))
+
+            prob.setup()
+            return prob
+
+        # an interrupted run that completed the first 4 cases
+        prob = build(self.fullfact3[:4], "cases1.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        prob = build(self.fullfact3, "cases2.sql", hotstart_file="cases1.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        # the completed cases are skipped
+        self.assertEqual(prob.model.comp.iter_count, 5)
+        self.assertEqual(prob.driver.get_driver_hotstart_hits(), 4)
+
+        # the skipped cases are recorded with their recorded values
+        cr = om.CaseReader("cases2.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), 9)
+
+        for i, (case, expected) in enumerate(zip(cases, self.expected_fullfact3)):
+            case = cr.get_case(case)
+            self.assertEqual(case.hotstart, i < 4)
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(case.outputs[name], expected[name])
+
+    def test_hotstart_twice(self):
+        def build(cases, recorder, hotstart_file=None):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+            model.set_input_defaults('x', 0.0)
+            model.set_input_defaults('y', 0.0)
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy')
+
+            prob.driver = om.DOEDriver(om.ListGenerator(cases), hotstart_file=hotstart_file)
+            prob.driver.add_recorder(om.SqliteRecorder(recorder))
+            prob.driver.recording_options['record_derivatives'] = True
+
+            prob.setup()
+            return prob
+
+        # two interrupted runs, each hot started from the file of the previous one
+        prob = build(self.fullfact3[:4], "cases1.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        prob = build(self.fullfact3[:7], "cases2.sql", hotstart_file="cases1.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.get_driver_hotstart_hits(), 4)
+        self.assertEqual(prob.model.comp.iter_count, 3)
+
+        prob = build(self.fullfact3, "cases3.sql", hotstart_file="cases2.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.get_driver_hotstart_hits(), 7)
+        self.assertEqual(prob.model.comp.iter_count, 2)
+
+        cr = om.CaseReader("cases3.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), 9)
+
+        for i, (case, expected) in enumerate(zip(cases, self.expected_fullfact3)):
+            case = cr.get_case(case)
+            self.assertEqual(case.hotstart, i < 7)
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(case.outputs[name], expected[name])
+
+            # the derivatives of the replayed cases are recorded too
+            x, y = expected['x'], expected['y']
+            assert_near_equal(case.derivatives['f_xy', 'x'].ravel(), 2. * x - 6. + y, 1e-12)
+            assert_near_equal(case.derivatives['f_xy', 'y'].ravel(), 2. * y + 8. + x, 1e-12)
+
+    def test_hotstart_repeated_cases(self):
+        def build(cases, recorder, hotstart_file=None):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+            model.add_design_var('x', lower=0.0, upper=1.0, ref=2.)
+            model.add_design_var('y', lower=0.0, upper=1.0, scaler=3., adder=.5)
+            model.add_objective('f_xy')
+
+            prob.driver = om.DOEDriver(om.ListGenerator(cases), hotstart_file=hotstart_file)
+            prob.driver.add_recorder(om.SqliteRecorder(recorder))
+
+            prob.setup()
+            return prob
+
+        # the same point is evaluated more than once
+        cases = [[('x', .1), ('y', .3)], [('x', .7), ('y', .2)], [('x', .1), ('y', .3)],
+                 [('x', .9), ('y', .4)]]
+
+        prob = build(cases[:3], "cases1.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        prob = build(cases, "cases2.sql", hotstart_file="cases1.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        # each recorded case is replayed once, in order
+        self.assertEqual(prob.driver.get_driver_hotstart_hits(), 3)
+        self.assertEqual(prob.model.comp.iter_count, 1)
+
+        # a different order ends the replay at the first mismatch
+        prob = build(cases[1:], "cases3.sql", hotstart_file="cases1.sql")
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.get_driver_hotstart_hits(), 0)
+        self.assertEqual(prob.model.comp.iter_count, 3)
+
 
 @use_tempdirs
 class TestDOEDriverListVars(unittest.TestCase):
@@ -580,6 +580,90 @@ class TestSimpleGA(unittest.TestCase):
             self.assertLessEqual(1.0, prob["x"][i])
 
 
+@unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
+@use_tempdirs
+class TestSteadyStateSimpleGA(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+
+    def _branin_problem(self, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('xC', 7.5)
+        model.set_input_defaults('xI', 0.0)
+
+        model.add_subsystem('comp', Branin(),
+                            promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, steady_state=True, **options)
+        prob.driver.options['bits'] = {'xC': 8}
+
+        prob.driver._randomstate = 11
+
+        return prob
+
+    def test_mixed_integer_branin(self):
+        prob = self._branin_problem()
+
+        prob.setup()
+        prob.run_driver()
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-2)
+        self.assertTrue(int(prob['xI'].item()) in [3, -3])
+
+        # points outside of the over-allocated integer range are not evaluated
+        self.assertLessEqual(prob.driver.get_driver_objective_calls(), 26 * 76)
+
+    def test_local_procs(self):
+        prob = self._branin_problem(local_procs=2)
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        # the order in which cases finish varies, so use a larger population for a robust result
+        prob.driver.options['pop_size'] = 50
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-2)
+        self.assertTrue(int(prob['xI'].item()) in [3, -3])
+
+        # evaluations in the worker processes are recorded by the parent process, followed by
+        # the final run.
+        cr = om.CaseReader('cases.sql')
+        cases = cr.get_cases('driver')
+        self.assertEqual(len(cases), prob.driver.get_driver_objective_calls() + 1)
+        assert_near_equal(cases[-1]['comp.f'], prob['comp.f'])
+        self.assertEqual(len({case.name for case in cases}), len(cases))
+
+    def test_pareto_error(self):
+        prob = om.Problem()
+
+        prob.model.add_subsystem('box', Box(), promotes=['*'])
+
+        prob.model.add_design_var('length', lower=0.0, upper=2.0)
+        prob.model.add_design_var('width', lower=0.0, upper=2.0)
+        prob.model.add_objective('front_area')
+        prob.model.add_objective('top_area')
+
+        prob.driver = om.SimpleGADriver(steady_state=True, compute_pareto=True)
+
+        with self.assertRaises(RuntimeError) as err:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(err.exception),
+                         "SimpleGADriver: Option 'steady_state' is not supported when "
+                         "'compute_pareto' is True.")
+
+
 @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
 class TestDriverOptionsSimpleGA(unittest.TestCase):
 
@@ -1405,6 +1489,27 @@ class MPITestSimpleGA4Procs(unittest.TestCase):
         # No meaningful result from a short run; just make sure we don't hang.
         prob.run_driver()
 
+    def test_steady_state(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=75, pop_size=25, run_parallel=True,
+                                        steady_state=True)
+        prob.driver.options['bits'] = {'xC': 8}
+
+        prob.setup()
+        prob.run_driver()
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.49399549, 1e-2)
+        self.assertTrue(int(prob['xI'].item()) in [3, -3])
+
     def test_proc_per_model(self):
         # Test that we can run a GA on a distributed component without lockups.
         prob = om.Problem()
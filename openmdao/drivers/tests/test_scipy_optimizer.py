@@ -19,7 +19,7 @@ from openmdao.test_suite.components.simple_comps import NonSquareArrayComp
 from openmdao.test_suite.groups.sin_fitter import SineFitter
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.general_utils import run_driver
-from openmdao.utils.testing_utils import set_env_vars_context
+from openmdao.utils.testing_utils import set_env_vars_context, use_tempdirs
 from openmdao.utils.mpi import MPI
 
 try:
@@ -1146,6 +1146,73 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         msg = "'a_disk' <class ReducedActuatorDisc>: Error calling compute_partials(), Error raised from compute_partials!"
         self.assertEqual(context.exception.args[0], msg)
 
+    def _memoize_problem(self, memoize):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('x', val=50.)
+        model.set_input_defaults('y', val=50.)
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('c = - x + y'), promotes=['*'])
+
+        prob.set_solver_print(level=0)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False,
+                                             memoize=memoize)
+
+        model.add_design_var('x', lower=-50.0, upper=50.0)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0)
+
+        prob.setup()
+
+        return prob
+
+    def test_memoize(self):
+        prob = self._memoize_problem(0)
+        prob.run_driver()
+        runs = prob.model.comp.iter_count
+
+        prob = self._memoize_problem(10)
+        failed = prob.run_driver()
+
+        self.assertFalse(failed, "Optimization failed, result =\n" +
+                                 str(prob.driver.result))
+        assert_near_equal(prob['x'], 7.16667, 1e-6)
+        assert_near_equal(prob['y'], -7.833334, 1e-6)
+
+        # SLSQP asks for the initial point again, which was just evaluated
+        hits = prob.driver.get_driver_cache_hits()
+        self.assertGreaterEqual(hits['responses'], 1)
+        self.assertEqual(prob.driver.opt_result['cache_hits'], hits)
+        self.assertEqual(prob.model.comp.iter_count, runs - hits['responses'])
+
+    def test_memoize_model_state(self):
+        prob = self._memoize_problem(1)
+        prob.run_driver()
+        driver = prob.driver
+        hits = driver.get_driver_cache_hits()
+
+        x1 = np.array([1., 2.])
+        x2 = np.array([3., 4.])
+        driver._objfunc(x1)
+        driver._objfunc(x2)
+
+        # the model is run again at x1 so that the totals are computed at the right point
+        grad = driver._gradfunc(x1)
+        assert_near_equal(prob['x'], 1., 1e-12)
+        assert_near_equal(grad, [2. * 1. - 6. + 2., 2. * 2. + 8. + 1.], 1e-8)
+
+        # only the latest design point is kept
+        runs = prob.model.comp.iter_count
+        driver._objfunc(x2)
+        self.assertEqual(prob.model.comp.iter_count, runs + 1)
+        driver._objfunc(x2)
+        self.assertEqual(prob.model.comp.iter_count, runs + 1)
+        self.assertEqual(driver.get_driver_cache_hits()['responses'], hits['responses'] + 1)
+
     def test_simple_paraboloid_upper_COBYLA(self):
 
         prob = om.Problem()
@@ -2223,5 +2290,141 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         assert_near_equal(p.get_val('exec.z')[50], -75)
 
 
+@use_tempdirs
+class TestScipyOptimizeDriverHotStart(unittest.TestCase):
+
+    def _hotstart_problem(self, recorder=None, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('x', val=50.)
+        model.set_input_defaults('y', val=50.)
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('c = - x + y'), promotes=['*'])
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False, **options)
+        if recorder is not None:
+            prob.driver.recording_options['record_derivatives'] = True
+            prob.driver.add_recorder(om.SqliteRecorder(recorder))
+
+        model.add_design_var('x', lower=-50.0, upper=50.0, ref=10.)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy', ref=5.)
+        model.add_constraint('c', upper=-15.0)
+
+        prob.setup()
+
+        return prob
+
+    def test_hotstart(self):
+        prob = self._hotstart_problem('cases.sql')
+        prob.run_driver()
+        prob.cleanup()
+        nfev = prob.driver.get_driver_objective_calls()
+
+        prob = self._hotstart_problem(hotstart_file='cases.sql')
+        failed = prob.run_driver()
+
+        self.assertFalse(failed)
+        assert_near_equal(prob['x'], 7.16667, 1e-6)
+        assert_near_equal(prob['y'], -7.833334, 1e-6)
+        self.assertEqual(prob.driver.get_driver_objective_calls(), nfev)
+        self.assertTrue(prob.driver.get_driver_hotstart_hits() > 0)
+
+        # only the initial point and the optimum are run, the rest is replayed
+        self.assertEqual(prob.model.comp.iter_count, 2)
+
+    def test_hotstart_continue(self):
+        prob = self._hotstart_problem()
+        prob.run_driver()
+        runs = prob.model.comp.iter_count
+
+        # the optimization continues live from where the recorded one stopped
+        prob = self._hotstart_problem('cases.sql', maxiter=2)
+        prob.run_driver()
+        prob.cleanup()
+
+        prob = self._hotstart_problem(hotstart_file='cases.sql')
+        failed = prob.run_driver()
+
+        self.assertFalse(failed)
+        assert_near_equal(prob['x'], 7.16667, 1e-6)
+        assert_near_equal(prob['y'], -7.833334, 1e-6)
+        self.assertTrue(prob.driver.get_driver_hotstart_hits() > 0)
+        self.assertTrue(prob.model.comp.iter_count < runs)
+
+    def test_hotstart_twice(self):
+        # two interrupted runs, each hot started from the file of the previous one
+        prob = self._hotstart_problem('cases1.sql', maxiter=2)
+        prob.run_driver()
+        prob.cleanup()
+        nfev1 = prob.driver.get_driver_objective_calls()
+
+        prob = self._hotstart_problem('cases2.sql', hotstart_file='cases1.sql', maxiter=4)
+        prob.run_driver()
+        prob.cleanup()
+        nfev2 = prob.driver.get_driver_objective_calls()
+
+        # every case of the first run but its initial one is replayed
+        self.assertEqual(prob.driver.get_driver_hotstart_hits(), nfev1)
+        self.assertEqual(prob.model.comp.iter_count, 1 + nfev2 - nfev1)
+
+        # the replayed cases are recorded as well, so the second file holds every case
+        cr = om.CaseReader('cases2.sql')
+        cases = [cr.get_case(case) for case in cr.list_cases('driver', out_stream=None)]
+        self.assertEqual(len(cases), nfev2 + 1)
+        self.assertEqual([case.hotstart for case in cases],
+                         [False] + [True] * nfev1 + [False] * (nfev2 - nfev1))
+
+        prob = self._hotstart_problem('cases3.sql', hotstart_file='cases2.sql')
+        failed = prob.run_driver()
+        prob.cleanup()
+
+        self.assertFalse(failed)
+        assert_near_equal(prob['x'], 7.16667, 1e-6)
+        assert_near_equal(prob['y'], -7.833334, 1e-6)
+        self.assertEqual(prob.driver.get_driver_hotstart_hits(), nfev2)
+
+        # only the initial point and the optimum are run, the rest is replayed
+        self.assertEqual(prob.model.comp.iter_count, 2)
+
+    def test_hotstart_scaled(self):
+        def build(recorder=None, **options):
+            prob = om.Problem(model=SellarDerivatives())
+            model = prob.model
+            model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12, iprint=-1)
+
+            model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]),
+                                 ref=3., ref0=.5)
+            model.add_design_var('x', lower=0.0, upper=10.0, scaler=2.)
+            model.add_objective('obj', ref=5.)
+            model.add_constraint('con1', upper=0.0, ref=2.)
+            model.add_constraint('con2', upper=0.0, adder=1.)
+
+            prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False,
+                                                 **options)
+            if recorder is not None:
+                prob.driver.recording_options['record_derivatives'] = True
+                prob.driver.add_recorder(om.SqliteRecorder(recorder))
+
+            prob.setup()
+            return prob
+
+        prob = build('cases.sql', maxiter=4)
+        prob.run_driver()
+        prob.cleanup()
+        nfev = prob.driver.get_driver_objective_calls()
+
+        prob = build(hotstart_file='cases.sql')
+        failed = prob.run_driver()
+
+        # every recorded point is replayed, although the design vars and responses are scaled
+        self.assertFalse(failed)
+        self.assertEqual(prob.driver.get_driver_hotstart_hits(), nfev)
+        assert_near_equal(prob.get_val('z'), [1.97763888, 0.0], 1e-6)
+        assert_near_equal(prob.get_val('x'), 0.0, 1e-6)
+
+
 if __name__ == "__main__":
     unittest.main()
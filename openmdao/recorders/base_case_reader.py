@@ -91,6 +91,82 @@ class BaseCaseReader(object):
         """
         pass
 
+    def get_val_history(self, var_names, source='driver'):
+        """
+        Get the recorded values of the given variables across all cases from a source.
+
+        Parameters
+        ----------
+        var_names : str or list of str
+            Promoted or absolute names of the variables.
+        source : 'problem', 'driver', component pathname, solver pathname
+            Identifies which cases to use.
+
+        Returns
+        -------
+        ndarray
+            Array with one row per case containing the flattened values of the variables.
+        """
+        pass
+
+    def export(self, filename, source='driver', var_names=None, fmt=None, batch_size=1000):
+        """
+        Export the values of variables in the cases recorded by a source to a columnar file.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the output file.
+        source : 'problem', 'driver', component pathname, solver pathname
+            Identifies which cases to export.
+        var_names : list of str or None
+            Promoted or absolute names of the variables to export.
+        fmt : 'parquet', 'hdf5', 'npz' or None
+            Format of the output file.
+        batch_size : int
+            The maximum number of cases read at once.
+
+        Returns
+        -------
+        str
+            Path of the output file.
+        """
+        pass
+
+    def query(self, source='driver', coord_prefix=None, success=None, start_time=None,
+              end_time=None, where=None, order_by=None, descending=False, limit=None):
+        """
+        Get the cases from a source that satisfy the given conditions.
+
+        Parameters
+        ----------
+        source : 'problem', 'driver', component pathname, solver pathname
+            Identifies which cases to search.
+        coord_prefix : str or None
+            If not None, only cases whose iteration coordinate starts with this string are
+            returned.
+        success : bool or None
+            If not None, only cases whose success flag has this value are returned.
+        start_time : float or None
+            If not None, only cases recorded at or after this time are returned.
+        end_time : float or None
+            If not None, only cases recorded at or before this time are returned.
+        where : dict or None
+            Mapping of variable names to (operator, value) tuples that the cases must satisfy.
+        order_by : str or None
+            Name of a variable, or 'timestamp', used to order the cases.
+        descending : bool
+            If True, cases are ordered from the largest value of order_by to the smallest.
+        limit : int or None
+            If not None, the maximum number of cases returned.
+
+        Returns
+        -------
+        list of Case
+            The matching cases.
+        """
+        pass
+
     def list_sources(self, out_stream=_DEFAULT_OUT_STREAM):
         """
         List of all the different recording sources for which there is recorded data.
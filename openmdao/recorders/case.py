@@ -63,14 +63,8 @@ class Case(object):
         Success flag for the case.
     msg : str
         Message associated with the case.
-    outputs : PromAbsDict
-        Map of outputs to values recorded.
-    inputs : PromAbsDict or None
-        Map of inputs to values recorded, None if not recorded.
-    residuals : PromAbsDict or None
-        Map of outputs to residuals recorded, None if not recorded.
-    derivatives : PromAbsDict or None
-        Map of (output, input) to derivatives recorded, None if not recorded.
+    hotstart : bool
+        True if the case was replayed from a hot start file instead of being run.
     parent : str
         The full unique identifier for the parent this iteration.
     abs_err : float or None
@@ -92,6 +86,11 @@ class Case(object):
         Dictionary with information about variables (scaling, indices, execution order).
     _format_version : int
         A version number specifying the format of array data, if not numpy arrays.
+    _raw_data : dict
+        The recorded data of each section (inputs, outputs, residuals, derivatives) that has not
+        been decoded yet.
+    _decoded : dict
+        The decoded data of each section that has been accessed.
     """
 
     def __init__(self, source, data, prom2abs, abs2prom, abs2meta, conns, auto_ivc_map, var_info,
@@ -120,6 +119,7 @@ class Case(object):
         self.timestamp = data['timestamp']
         self.success = data['success']
         self.msg = data['msg']
+        self.hotstart = bool(data['hotstart']) if 'hotstart' in data.keys() else False
 
         # for a solver or problem case
         self.abs_err = data['abs_err'] if 'abs_err' in data.keys() else None
@@ -133,64 +133,13 @@ class Case(object):
             data['outputs'] = data.pop('solver_output')
             data['residuals'] = data.pop('solver_residuals')
 
-        # default properties to None
-        self.inputs = None
-        self.outputs = None
-        self.residuals = None
-        self.derivatives = None
-
-        if 'inputs' in data.keys():
-            if data_format >= 3:
-                inputs = deserialize(data['inputs'], abs2meta, prom2abs, conns)
-            elif data_format in (1, 2):
-                inputs = blob_to_array(data['inputs'])
-                if type(inputs) is np.ndarray and not inputs.shape:
-                    inputs = None
-            else:
-                inputs = data['inputs']
-            if inputs is not None:
-                self.inputs = PromAbsDict(inputs, prom2abs['input'], abs2prom['input'])
-
-        if 'outputs' in data.keys():
-            if data_format >= 3:
-                outputs = deserialize(data['outputs'], abs2meta, prom2abs, conns)
-            elif self._format_version in (1, 2):
-                outputs = blob_to_array(data['outputs'])
-                if type(outputs) is np.ndarray and not outputs.shape:
-                    outputs = None
-            else:
-                outputs = data['outputs']
-            if outputs is not None:
-                self.outputs = PromAbsDict(outputs, prom2abs['output'], abs2prom['output'],
-                                           in_prom2abs=prom2abs['input'],
-                                           auto_ivc_map=auto_ivc_map)
-
-        if 'residuals' in data.keys():
-            if data_format >= 3:
-                residuals = deserialize(data['residuals'], abs2meta, prom2abs, conns)
-            elif data_format in (1, 2):
-                residuals = blob_to_array(data['residuals'])
-                if type(residuals) is np.ndarray and not residuals.shape:
-                    residuals = None
-            else:
-                residuals = data['residuals']
-            if residuals is not None:
-                self.residuals = PromAbsDict(residuals, prom2abs['output'], abs2prom['output'],
-                                             in_prom2abs=prom2abs['input'],
-                                             auto_ivc_map=auto_ivc_map)
-
-        if 'jacobian' in data.keys():
-            if data_format >= 2:
-                jacobian = blob_to_array(data['jacobian'])
-                if type(jacobian) is np.ndarray and not jacobian.shape:
-                    jacobian = None
-            else:
-                jacobian = data['jacobian']
-            if jacobian is not None:
-                self.derivatives = PromAbsDict(jacobian, prom2abs['output'], abs2prom['output'],
-                                               in_prom2abs=prom2abs['input'],
-                                               auto_ivc_map=auto_ivc_map,
-                                               var_info=var_info)
+        # keep the recorded data for each section, it is only decoded when first accessed
+        self._raw_data = {}
+        self._decoded = {}
+        for section, key in (('inputs', 'inputs'), ('outputs', 'outputs'),
+                             ('residuals', 'residuals'), ('derivatives', 'jacobian')):
+            if key in data.keys():
+                self._raw_data[section] = data[key]
 
         # save var name & meta dict references for use by self._get_variables_of_type()
         self._prom2abs = prom2abs
@@ -202,6 +151,111 @@ class Case(object):
         # save VOI dict reference for use by self._scale()
         self._var_info = var_info
 
+    @property
+    def inputs(self):
+        """
+        Map of inputs to values recorded, None if not recorded.
+        """
+        return self._get_section('inputs')
+
+    @property
+    def outputs(self):
+        """
+        Map of outputs to values recorded, None if not recorded.
+        """
+        return self._get_section('outputs')
+
+    @property
+    def residuals(self):
+        """
+        Map of outputs to residuals recorded, None if not recorded.
+        """
+        return self._get_section('residuals')
+
+    @property
+    def derivatives(self):
+        """
+        Map of (output, input) to derivatives recorded, None if not recorded.
+        """
+        return self._get_section('derivatives')
+
+    def _get_section(self, section):
+        """
+        Return the given section of recorded data, decoding it on first access.
+
+        Parameters
+        ----------
+        section : str
+            One of 'inputs', 'outputs', 'residuals' or 'derivatives'.
+
+        Returns
+        -------
+        PromAbsDict or None
+            Map of variables to the recorded values, None if not recorded.
+        """
+        try:
+            return self._decoded[section]
+        except KeyError:
+            pass
+
+        if section in self._raw_data:
+            val = self._decode_section(section, self._raw_data.pop(section))
+        else:
+            val = None
+
+        self._decoded[section] = val
+        return val
+
+    def _decode_section(self, section, data):
+        """
+        Decode the recorded data for the given section.
+
+        Parameters
+        ----------
+        section : str
+            One of 'inputs', 'outputs', 'residuals' or 'derivatives'.
+        data : str or bytes or object
+            The recorded data for the section.
+
+        Returns
+        -------
+        PromAbsDict or None
+            Map of variables to the recorded values, None if not recorded.
+        """
+        data_format = self._format_version
+        prom2abs = self._prom2abs
+        abs2prom = self._abs2prom
+
+        if section == 'derivatives':
+            if data_format >= 2:
+                jacobian = blob_to_array(data)
+                if type(jacobian) is np.ndarray and not jacobian.shape:
+                    jacobian = None
+            else:
+                jacobian = data
+            if jacobian is not None:
+                return PromAbsDict(jacobian, prom2abs['output'], abs2prom['output'],
+                                   in_prom2abs=prom2abs['input'],
+                                   auto_ivc_map=self._auto_ivc_map,
+                                   var_info=self._var_info)
+            return None
+
+        if data_format >= 3:
+            values = deserialize(data, self._abs2meta, prom2abs, self._conns)
+        elif data_format in (1, 2):
+            values = blob_to_array(data)
+            if type(values) is np.ndarray and not values.shape:
+                values = None
+        else:
+            values = data
+
+        if values is None:
+            return None
+        if section == 'inputs':
+            return PromAbsDict(values, prom2abs['input'], abs2prom['input'])
+        return PromAbsDict(values, prom2abs['output'], abs2prom['output'],
+                           in_prom2abs=prom2abs['input'], auto_ivc_map=self._auto_ivc_map)
+
     def __str__(self):
         """
         Get string representation of the case.
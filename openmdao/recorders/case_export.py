@@ -0,0 +1,446 @@
+"""
+Functions for exporting recorded cases to columnar files.
+
+Cases are read from the case database in batches and appended to the output file, so the full set
+of cases is never held in memory. Each flattened entry of each variable is stored in its own
+column, next to columns containing the case name, counter, timestamp and success flag.
+"""
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from importlib.util import find_spec
+
+import numpy as np
+
+
+# output formats, keyed by file extension
+_formats = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.h5': 'hdf5',
+    '.hdf5': 'hdf5',
+    '.npz': 'npz',
+}
+
+_extensions = {
+    'parquet': '.parquet',
+    'hdf5': '.h5',
+    'npz': '.npz',
+}
+
+# the columns describing each case, with their types
+_case_columns = [
+    ('case', str),
+    ('counter', np.int64),
+    ('timestamp', np.float64),
+    ('success', np.bool_),
+]
+
+
+def export_cases(cr, filename, source='driver', var_names=None, fmt=None, batch_size=1000):
+    """
+    Export the values of variables in the cases recorded by a source to a columnar file.
+
+    Parameters
+    ----------
+    cr : SqliteCaseReader
+        The case reader for the recorded cases.
+    filename : str
+        Path of the output file. Unless fmt is given, the format is determined from its
+        extension ('.parquet', '.pq', '.h5', '.hdf5' or '.npz'), or is the best available format
+        if it has none of these. Missing extensions are appended.
+    source : 'problem', 'driver', component pathname, solver pathname
+        Identifies which cases to export.
+    var_names : list of str or None
+        Promoted or absolute names of the variables to export. By default, all numerical
+        variables recorded in the first case of the source are exported.
+    fmt : 'parquet', 'hdf5', 'npz' or None
+        Format of the output file. Parquet files require pyarrow and HDF5 files require h5py.
+    batch_size : int
+        The maximum number of cases read from the database at once.
+
+    Returns
+    -------
+    str
+        Path of the output file.
+    """
+    ext_fmt = _formats.get(os.path.splitext(filename)[1].lower())
+
+    # pyarrow and h5py are only imported by the writers, so they are only checked for here
+    has_pyarrow = find_spec('pyarrow') is not None
+    has_h5py = find_spec('h5py') is not None
+
+    if fmt is None:
+        fmt = ext_fmt
+        if fmt is None:
+            if has_pyarrow:
+                fmt = 'parquet'
+            elif has_h5py:
+                fmt = 'hdf5'
+            else:
+                fmt = 'npz'
+
+    if fmt == 'parquet':
+        if not has_pyarrow:
+            raise RuntimeError("pyarrow must be installed to export cases to a Parquet file.")
+        writer_class = _ParquetWriter
+    elif fmt == 'hdf5':
+        if not has_h5py:
+            raise RuntimeError("h5py must be installed to export cases to an HDF5 file.")
+        writer_class = _HDF5Writer
+    elif fmt == 'npz':
+        writer_class = _NpzWriter
+    else:
+        raise ValueError(f"Invalid format '{fmt}' for exporting cases. Must be one of "
+                         f"{list(_extensions)}.")
+
+    if ext_fmt is None:
+        filename += _extensions[fmt]
+
+    table = cr._get_case_table(source)
+
+    if cr._format_version >= 5:
+        first = table.query(source, limit=1)
+        first = first[0] if first else None
+    else:
+        first = table._get_first(source)
+
+    if first is None:
+        raise RuntimeError(f"No cases were recorded by source '{source}'.")
+
+    if var_names is None:
+        var_names = []
+        for vals in (first.outputs, first.inputs):
+            if vals is not None:
+                for name in vals:
+                    if name not in var_names:
+                        val = vals[name]
+                        if isinstance(val, np.ndarray) and np.issubdtype(val.dtype, np.number):
+                            var_names.append(name)
+    elif isinstance(var_names, str):
+        var_names = [var_names]
+
+    variables = {}
+    columns = []
+    for name in var_names:
+        shape = np.shape(first[name])
+        size = int(np.prod(shape))
+        units = table.get_var_meta(name).get('units')
+
+        if size == 1:
+            names = [name]
+        else:
+            names = [f'{name}[{i}]' for i in range(size)]
+
+        variables[name] = {'units': units, 'shape': shape, 'columns': names}
+        columns.extend((col, name, units) for col in names)
+
+    metadata = {'source': source, 'variables': variables}
+
+    writer = writer_class(filename, columns, metadata)
+    try:
+        for records, vals in table.iter_val_batches(var_names, source, batch_size):
+            writer.write(records, vals)
+    finally:
+        writer.close()
+
+    return filename
+
+
+class _ParquetWriter(object):
+    """
+    Write cases to a Parquet file.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the output file.
+    columns : list of (str, str, str or None)
+        Name of the column, variable name and units of each variable column.
+    metadata : dict
+        Metadata describing the exported variables.
+
+    Attributes
+    ----------
+    _schema : pyarrow.Schema
+        The schema of the output file.
+    _writer : pyarrow.parquet.ParquetWriter
+        The writer of the output file.
+    """
+
+    def __init__(self, filename, columns, metadata):
+        """
+        Initialize attributes.
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        types = {str: pyarrow.string(), np.int64: pyarrow.int64(),
+                 np.float64: pyarrow.float64(), np.bool_: pyarrow.bool_()}
+
+        fields = [pyarrow.field(name, types[dtype]) for name, dtype in _case_columns]
+        fields.extend(pyarrow.field(col, pyarrow.float64(),
+                                    metadata={'variable': name, 'units': units or ''})
+                      for col, name, units in columns)
+
+        self._schema = pyarrow.schema(fields, metadata={'openmdao': json.dumps(metadata)})
+        self._writer = pyarrow.parquet.ParquetWriter(filename, self._schema)
+
+    def write(self, records, vals):
+        """
+        Append a batch of cases to the file.
+
+        Parameters
+        ----------
+        records : list of tuple
+            The name, counter, timestamp and success flag of each case.
+        vals : ndarray
+            Array with one row per case containing the flattened values of the variables.
+        """
+        import pyarrow
+
+        arrays = [pyarrow.array(list(col)) if dtype is str else
+                  pyarrow.array(np.asarray(col, dtype=dtype))
+                  for (_, dtype), col in zip(_case_columns, zip(*records))]
+        arrays.extend(pyarrow.array(col) for col in vals.T.astype(np.float64))
+
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        """
+        Finish writing the file.
+        """
+        self._writer.close()
+
+
+class _HDF5Writer(object):
+    """
+    Write cases to an HDF5 file, with one dataset per column.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the output file.
+    columns : list of (str, str, str or None)
+        Name of the column, variable name and units of each variable column.
+    metadata : dict
+        Metadata describing the exported variables.
+
+    Attributes
+    ----------
+    _file : h5py.File
+        The output file.
+    _datasets : list of h5py.Dataset
+        The dataset of each column.
+    _nrows : int
+        The number of cases written so far.
+    """
+
+    def __init__(self, filename, columns, metadata):
+        """
+        Initialize attributes.
+        """
+        import h5py
+
+        self._file = h5py.File(filename, 'w')
+        self._file.attrs['openmdao'] = json.dumps(metadata)
+        self._nrows = 0
+
+        self._datasets = []
+        for name, dtype in _case_columns:
+            if dtype is str:
+                dtype = h5py.string_dtype()
+            self._datasets.append(self._file.create_dataset(name, shape=(0,), maxshape=(None,),
+                                                            dtype=dtype, chunks=True))
+
+        for col, name, units in columns:
+            dset = self._file.create_dataset(col, shape=(0,), maxshape=(None,),
+                                             dtype=np.float64, chunks=True)
+            dset.attrs['variable'] = name
+            dset.attrs['units'] = units or ''
+            self._datasets.append(dset)
+
+    def write(self, records, vals):
+        """
+        Append a batch of cases to the file.
+
+        Parameters
+        ----------
+        records : list of tuple
+            The name, counter, timestamp and success flag of each case.
+        vals : ndarray
+            Array with one row per case containing the flattened values of the variables.
+        """
+        start = self._nrows
+        self._nrows += len(records)
+
+        for dset, col in zip(self._datasets, list(zip(*records)) + list(vals.T)):
+            dset.resize((self._nrows,))
+            dset[start:] = col
+
+    def close(self):
+        """
+        Finish writing the file.
+        """
+        self._file.close()
+
+
+class _NpzWriter(object):
+    """
+    Write cases to a numpy .npz file, with one array per column.
+
+    Since an .npz file can't be appended to, each column is written to a temporary file that is
+    copied into the archive once all cases have been written.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the output file.
+    columns : list of (str, str, str or None)
+        Name of the column, variable name and units of each variable column.
+    metadata : dict
+        Metadata describing the exported variables.
+
+    Attributes
+    ----------
+    _filename : str
+        Path of the output file.
+    _metadata : dict
+        Metadata describing the exported variables.
+    _names : list of str
+        The name of each column.
+    _dtypes : list
+        The data type of each column.
+    _tmpdir : str
+        Directory containing the temporary file of each column.
+    _files : list of file
+        The temporary file of each column.
+    _nrows : int
+        The number of cases written so far.
+    _maxlen : int
+        The length of the longest case name.
+    """
+
+    def __init__(self, filename, columns, metadata):
+        """
+        Initialize attributes.
+        """
+        self._filename = filename
+        self._metadata = metadata
+        self._names = [name for name, _ in _case_columns] + [col for col, _, _ in columns]
+        self._dtypes = [dtype for _, dtype in _case_columns] + [np.float64] * len(columns)
+        self._nrows = 0
+        self._maxlen = 1
+
+        self._tmpdir = tempfile.mkdtemp()
+        self._files = [open(os.path.join(self._tmpdir, str(i)), 'wb')
+                       for i in range(len(self._names))]
+
+    def write(self, records, vals):
+        """
+        Append a batch of cases to the file.
+
+        Parameters
+        ----------
+        records : list of tuple
+            The name, counter, timestamp and success flag of each case.
+        vals : ndarray
+            Array with one row per case containing the flattened values of the variables.
+        """
+        self._nrows += len(records)
+
+        cols = list(zip(*records))
+        case_names = cols[0]
+        self._maxlen = max(self._maxlen, max(len(name) for name in case_names))
+        # case names are stored one per line until their length is known
+        self._files[0].write(''.join(f'{name}\n' for name in case_names).encode('utf-8'))
+
+        for f, dtype, col in zip(self._files[1:], self._dtypes[1:], cols[1:] + list(vals.T)):
+            f.write(np.asarray(col, dtype=dtype).tobytes())
+
+    def close(self):
+        """
+        Copy the columns into the .npz file and remove the temporary files.
+        """
+        try:
+            for f in self._files:
+                f.close()
+
+            with zipfile.ZipFile(self._filename, 'w', allowZip64=True) as zf:
+                for i, (name, dtype) in enumerate(zip(self._names, self._dtypes)):
+                    if dtype is str:
+                        dtype = np.dtype(f'U{self._maxlen}')
+                    else:
+                        dtype = np.dtype(dtype)
+
+                    header = {'descr': np.lib.format.dtype_to_descr(dtype),
+                              'fortran_order': False, 'shape': (self._nrows,)}
+
+                    with zf.open(f'{name}.npy', 'w', force_zip64=True) as out, \
+                            open(os.path.join(self._tmpdir, str(i)), 'rb') as f:
+                        np.lib.format.write_array_header_1_0(out, header)
+                        if i == 0:
+                            for lines in iter(lambda: f.readlines(1 << 20), []):
+                                out.write(np.array([line.decode('utf-8').rstrip('\n')
+                                                    for line in lines], dtype=dtype).tobytes())
+                        else:
+                            shutil.copyfileobj(f, out)
+
+                with zf.open('__metadata__.npy', 'w') as out:
+                    np.lib.format.write_array(out, np.array(json.dumps(self._metadata)))
+        finally:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+
+def _export_cases_setup_parser(parser):
+    """
+    Set up the openmdao subparser for the 'openmdao export_cases' command.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument('file', nargs=1, help='Case recording file.')
+    parser.add_argument('-o', default=None, action='store', dest='outfile',
+                        help='Name of the output file. Its extension (.parquet, .pq, .h5, .hdf5 '
+                        'or .npz) determines the format unless --format is given. By default, '
+                        'it is the name of the case recording file with the extension of the '
+                        'best available format.')
+    parser.add_argument('-s', '--source', default='driver', action='store', dest='source',
+                        help="Source of the exported cases: 'problem', 'driver' (the default), "
+                        "or the pathname of a system or solver.")
+    parser.add_argument('-v', '--var', default=[], action='append', dest='vars',
+                        help='Name of a variable to export. This option may be given multiple '
+                        'times. By default, all numerical variables are exported.')
+    parser.add_argument('-f', '--format', default=None, action='store', dest='format',
+                        choices=list(_extensions), help='Format of the output file.')
+    parser.add_argument('--batch_size', default=1000, type=int, action='store',
+                        dest='batch_size', help='Number of cases read from the case recording '
+                        'file at once.')
+
+
+def _export_cases_cmd(options, user_args):
+    """
+    Implement the 'openmdao export_cases' command.
+
+    Parameters
+    ----------
+    options : argparse Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script.
+    """
+    from openmdao.recorders.sqlite_reader import SqliteCaseReader
+
+    filename = options.file[0]
+    outfile = options.outfile
+    if outfile is None:
+        outfile = os.path.splitext(filename)[0]
+
+    cr = SqliteCaseReader(filename)
+    outfile = cr.export(outfile, source=options.source, var_names=options.vars or None,
+                        fmt=options.format, batch_size=options.batch_size)
+    print(f"Cases exported to '{outfile}'.")
@@ -337,6 +337,19 @@ class CaseRecorder(object):
         """
         raise NotImplementedError("record_derivatives_driver has not been overridden")
 
+    def record_failure(self, recording_requester, err):
+        """
+        Handle an AnalysisError raised through an object that this recorder is attached to.
+
+        Parameters
+        ----------
+        recording_requester : object
+            System, Solver or Driver that the error was raised through.
+        err : AnalysisError
+            The error that was raised.
+        """
+        pass
+
     def record_viewer_data(self, model_viewer_data):
         """
         Record model viewer data.
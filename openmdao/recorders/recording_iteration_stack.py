@@ -1,6 +1,7 @@
 """Management of iteration stack for recording."""
 import weakref
 
+from openmdao.core.analysis_error import AnalysisError
 from openmdao.utils.mpi import MPI
 
 _norec_funcs = frozenset(['_run_apply', '_compute_totals'])
@@ -177,6 +178,9 @@ class Recording(object):
             else:
                 requester.record_iteration()
 
+            if args and isinstance(args[1], AnalysisError):
+                requester._rec_mgr.record_failure(requester, args[1])
+
         # Enable the following line for stack debugging.
         # print_recording_iteration_stack()
 
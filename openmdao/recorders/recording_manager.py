@@ -126,6 +126,20 @@ class RecordingManager(object):
         for recorder in self._recorders:
             recorder.record_derivatives(recording_requester, data, metadata)
 
+    def record_failure(self, recording_requester, err):
+        """
+        Call record_failure on all recorders.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that the error was raised through.
+        err : AnalysisError
+            The error that was raised.
+        """
+        for recorder in self._recorders:
+            recorder.record_failure(recording_requester, err)
+
     def has_recorders(self):
         """
         Are there any recorders managed by this RecordingManager.
@@ -160,6 +174,121 @@ def _get_all_requesters(problem):
                 yield nl.linesearch
 
 
+class _CaseCapture(RecordingManager):
+    """
+    Recording manager that keeps the cases of its requester instead of recording them.
+
+    It replaces the recording managers in forked worker processes, which send the captured
+    cases back to the parent process to be recorded there.
+
+    Parameters
+    ----------
+    rec_mgr : RecordingManager
+        The recording manager that is replaced.
+    index : int
+        Index of the requester in the requesters of the problem.
+    cases : list
+        List that the captured cases are appended to.
+
+    Attributes
+    ----------
+    _index : int
+        Index of the requester in the requesters of the problem.
+    _cases : list
+        List that the captured cases are appended to.
+    """
+
+    def __init__(self, rec_mgr, index, cases):
+        """
+        Initialize.
+        """
+        super().__init__()
+        # keep the recorders so that requesters still gather the data to record
+        self._recorders = rec_mgr._recorders
+        self._index = index
+        self._cases = cases
+
+    def shutdown(self):
+        """
+        Remove all recorders without shutting them down, they belong to the parent process.
+        """
+        self._recorders = []
+
+    def record_iteration(self, recording_requester, data, metadata):
+        """
+        Capture an iteration.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that needs an iteration of itself recorded.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Metadata for iteration coordinate.
+        """
+        self._cases.append((self._index, 'iteration',
+                            list(recording_requester._recording_iter.stack), data, metadata))
+
+    def record_derivatives(self, recording_requester, data, metadata):
+        """
+        Capture derivatives.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that needs an iteration of itself recorded.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Metadata for iteration coordinate.
+        """
+        self._cases.append((self._index, 'derivatives',
+                            list(recording_requester._recording_iter.stack), data, metadata))
+
+    def record_failure(self, recording_requester, err):
+        """
+        Ignore a failure, the parent process handles the errors of its workers.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that the error was raised through.
+        err : AnalysisError
+            The error that was raised.
+        """
+        pass
+
+
+def _capture_all_cases(problem):
+    # Capture the cases of every requester instead of recording them.  This is used in forked
+    # worker processes, so that only the parent process writes to the recorders it shares with
+    # them.  The returned list collects the captured cases.
+    cases = []
+    for i, req in enumerate(_get_all_requesters(problem)):
+        if req._rec_mgr._recorders:
+            req._rec_mgr = _CaseCapture(req._rec_mgr, i, cases)
+    return cases
+
+
+def _record_captured_cases(problem, cases, root):
+    # Record cases captured by _capture_all_cases in a worker process.  The first entry of their
+    # iteration coordinates is replaced by root, so they are numbered by the parent process.
+    requesters = list(_get_all_requesters(problem))
+    rec_iter = problem._recording_iter
+    stack = rec_iter.stack
+    try:
+        for index, kind, case_stack, data, metadata in cases:
+            req = requesters[index]
+            rec_iter.stack = [root] + case_stack[1:]
+            if kind == 'iteration':
+                req._rec_mgr.record_iteration(req, data, metadata)
+            else:
+                req._rec_mgr.record_derivatives(req, data, metadata)
+    finally:
+        rec_iter.stack = stack
+
+
 def _get_all_viewer_data_recorders(problem):
     for req in _get_all_requesters(problem):
         for r in req._rec_mgr._recorders:
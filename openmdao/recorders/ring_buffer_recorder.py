@@ -0,0 +1,535 @@
+"""
+Class definition for RingBufferRecorder, which keeps the latest cases in memory.
+"""
+from copy import deepcopy
+
+import numpy as np
+
+from openmdao.recorders.case_recorder import PICKLE_VER
+from openmdao.recorders.sqlite_recorder import SqliteRecorder
+
+# sections of the data dict whose variable values are packed into the ring
+_VAR_SECTIONS = ('input', 'output', 'residual')
+
+
+class _CaseRing(object):
+    """
+    Fixed size buffer holding the latest cases recorded from a single source.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of record, one of 'driver', 'system', 'solver' or 'derivatives'.
+    requester : Driver, System or Solver
+        The object that requested the recording.
+    size : int
+        The maximum number of cases held.
+
+    Attributes
+    ----------
+    kind : str
+        The kind of record, one of 'driver', 'system', 'solver' or 'derivatives'.
+    requester : Driver, System or Solver
+        The object that requested the recording.
+    size : int
+        The maximum number of cases held.
+    seen : int
+        The number of cases offered to the ring since it was created.
+    count : int
+        The number of cases currently held.
+    _next : int
+        The slot that the next case will be written to.
+    _layout : list or None
+        For each section of the data, a tuple of (section, entries), where entries is a list of
+        (name, start, end, shape) for packed values or (name, None, None, None) for values held
+        as objects. None for sections that were not recorded.
+    _values : ndarray or None
+        Array with one row per slot holding the packed values of a case.
+    _slots : list
+        For each slot, a tuple of (counter, iteration_coordinate, metadata, extras), where
+        extras holds the values that could not be packed.
+    """
+
+    def __init__(self, kind, requester, size):
+        """
+        Initialize.
+        """
+        self.kind = kind
+        self.requester = requester
+        self.size = size
+        self.seen = 0
+        self.count = 0
+        self._next = 0
+        self._layout = None
+        self._values = None
+        self._slots = [None] * size
+
+    def _sections(self, data):
+        """
+        Return the (section, dict) pairs of the data that are packed.
+
+        Parameters
+        ----------
+        data : dict
+            The recorded data.
+
+        Returns
+        -------
+        list
+            List of (section, dict) tuples.
+        """
+        if self.kind == 'derivatives':
+            return [(None, data)]
+        return [(sect, data[sect]) for sect in _VAR_SECTIONS]
+
+    def _build_layout(self, data):
+        """
+        Compute where the values of each variable are stored in a row of the ring.
+
+        Parameters
+        ----------
+        data : dict
+            The recorded data.
+        """
+        layout = []
+        start = 0
+        for sect, vals in self._sections(data):
+            if vals is None:
+                layout.append((sect, None))
+                continue
+            entries = []
+            for name, val in vals.items():
+                if isinstance(val, np.ndarray) and val.dtype.kind == 'f':
+                    entries.append((name, start, start + val.size, val.shape))
+                    start += val.size
+                else:
+                    entries.append((name, None, None, None))
+            layout.append((sect, entries))
+
+        self._layout = layout
+        self._values = np.empty((self.size, start))
+
+    def _matches(self, data):
+        """
+        Return True if the data can be stored using the current layout.
+
+        Parameters
+        ----------
+        data : dict
+            The recorded data.
+
+        Returns
+        -------
+        bool
+            True if the data matches the current layout.
+        """
+        for (sect, vals), (_, entries) in zip(self._sections(data), self._layout):
+            if vals is None or entries is None:
+                if vals is not entries:
+                    return False
+            elif len(vals) != len(entries):
+                return False
+            else:
+                for (name, val), (ename, start, end, shape) in zip(vals.items(), entries):
+                    if name != ename:
+                        return False
+                    if start is None:
+                        if isinstance(val, np.ndarray) and val.dtype.kind == 'f':
+                            return False
+                    elif not (isinstance(val, np.ndarray) and val.dtype.kind == 'f' and
+                              val.size == end - start):
+                        return False
+        return True
+
+    def push(self, counter, coord, data, metadata):
+        """
+        Store a case, overwriting the oldest one if the ring is full.
+
+        Parameters
+        ----------
+        counter : int
+            The global counter of the case.
+        coord : str
+            The iteration coordinate of the case.
+        data : dict
+            The recorded data.
+        metadata : dict
+            Dictionary containing execution metadata.
+
+        Returns
+        -------
+        bool
+            False if the data doesn't match the layout of the cases already held, in which case
+            nothing is stored.
+        """
+        if self._layout is None:
+            self._build_layout(data)
+        elif not self._matches(data):
+            return False
+
+        slot = self._next
+        row = self._values[slot]
+        extras = {}
+        for (sect, vals), (_, entries) in zip(self._sections(data), self._layout):
+            if entries is None:
+                continue
+            for (name, val), (_, start, end, _) in zip(vals.items(), entries):
+                if start is None:
+                    extras[sect, name] = deepcopy(val)
+                else:
+                    row[start:end] = val.ravel()
+
+        if self.kind == 'solver':
+            extras['abs'] = data['abs']
+            extras['rel'] = data['rel']
+
+        meta = {'timestamp': metadata['timestamp'], 'success': metadata['success'],
+                'msg': metadata['msg'], 'hotstart': metadata.get('hotstart', False)}
+        self._slots[slot] = (counter, coord, meta, extras)
+        self._next = (slot + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        return True
+
+    def cases(self):
+        """
+        Yield the cases held, oldest first.
+
+        Yields
+        ------
+        int
+            The global counter of the case.
+        str
+            The iteration coordinate of the case.
+        dict
+            The recorded data.
+        dict
+            Dictionary containing execution metadata.
+        """
+        first = (self._next - self.count) % self.size
+        for i in range(self.count):
+            slot = (first + i) % self.size
+            counter, coord, metadata, extras = self._slots[slot]
+            row = self._values[slot]
+
+            data = {}
+            for sect, entries in self._layout:
+                if entries is None:
+                    data[sect] = None
+                    continue
+                vals = {}
+                for name, start, end, shape in entries:
+                    if start is None:
+                        vals[name] = extras[sect, name]
+                    else:
+                        vals[name] = row[start:end].reshape(shape)
+                if sect is None:
+                    data = vals
+                else:
+                    data[sect] = vals
+
+            if self.kind == 'solver':
+                data['abs'] = extras['abs']
+                data['rel'] = extras['rel']
+
+            yield counter, coord, data, metadata.copy()
+
+    def clear(self):
+        """
+        Remove all cases from the ring.
+        """
+        self.count = 0
+        self._next = 0
+        self._slots = [None] * self.size
+
+
+class RingBufferRecorder(SqliteRecorder):
+    """
+    Recorder that keeps the latest cases of each source in memory and writes them on demand.
+
+    Iteration cases from each Driver, System and Solver are held in a preallocated buffer with
+    room for the latest `size` cases, whose variable values are packed into a single array.
+    The cases are only written to the sqlite file when `flush` is called, when an AnalysisError
+    is raised through a recorded object, or when the recorder is shut down, so the file can be
+    read with a CaseReader like any file written by a SqliteRecorder. Metadata, and cases
+    recorded from a Problem, are written as soon as they are recorded.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the recorder file.
+    size : int, optional
+        The number of cases held in memory for each source.
+    sample_every : int, optional
+        Only keep every `sample_every`-th case from each source, starting with the first.
+    flush_on_error : bool, optional
+        If True, write the cases held in memory when an AnalysisError is raised through an
+        object that this recorder is attached to.
+    flush_on_shutdown : bool, optional
+        If True, write the cases held in memory when the recorder is shut down.
+    pickle_version : int, optional
+        The pickle protocol version to use when pickling metadata.
+    record_viewer_data : bool, optional
+        If True, record data needed for visualization.
+
+    Attributes
+    ----------
+    _size : int
+        The number of cases held in memory for each source.
+    _sample_every : int
+        Only keep every `sample_every`-th case from each source.
+    _flush_on_error : bool
+        If True, write the cases held in memory when an AnalysisError is raised.
+    _flush_on_shutdown : bool
+        If True, write the cases held in memory when the recorder is shut down.
+    _rings : dict
+        Mapping of (kind, recording requester) to the _CaseRing holding its cases.
+    _num_written : int
+        The number of cases written to the database.
+    """
+
+    def __init__(self, filepath, size=100, sample_every=1, flush_on_error=True,
+                 flush_on_shutdown=True, pickle_version=PICKLE_VER, record_viewer_data=True):
+        """
+        Initialize the RingBufferRecorder.
+        """
+        if size < 1:
+            raise ValueError(f"RingBufferRecorder: size must be a positive integer, but got "
+                             f"{size}.")
+        if sample_every < 1:
+            raise ValueError(f"RingBufferRecorder: sample_every must be a positive integer, but "
+                             f"got {sample_every}.")
+
+        self._size = size
+        self._sample_every = sample_every
+        self._flush_on_error = flush_on_error
+        self._flush_on_shutdown = flush_on_shutdown
+        self._rings = {}
+        self._num_written = 0
+
+        super().__init__(filepath, pickle_version=pickle_version,
+                         record_viewer_data=record_viewer_data)
+
+    def _buffer(self, kind, requester, data, metadata):
+        """
+        Store a case in the ring of its source.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of record, one of 'driver', 'system', 'solver' or 'derivatives'.
+        requester : Driver, System or Solver
+            The object that requested the recording.
+        data : dict
+            The recorded data.
+        metadata : dict
+            Dictionary containing execution metadata.
+
+        Returns
+        -------
+        bool
+            True if the case was handled, False if it should be written directly.
+        """
+        if not self.connection:
+            # not initialized or not recording on this proc, let the SqliteRecorder deal with it
+            return False
+
+        key = (kind, requester)
+        try:
+            ring = self._rings[key]
+        except KeyError:
+            ring = self._rings[key] = _CaseRing(kind, requester, self._size)
+
+        ring.seen += 1
+        if (ring.seen - 1) % self._sample_every:
+            return True
+
+        if not ring.push(self._counter, self._iteration_coordinate, data, metadata):
+            # the recorded variables changed, so write what we have and start over
+            self._flush_rings([ring])
+            ring = self._rings[key] = _CaseRing(kind, requester, self._size)
+            ring.seen = 1
+            ring.push(self._counter, self._iteration_coordinate, data, metadata)
+
+        return True
+
+    def record_iteration_driver(self, driver, data, metadata):
+        """
+        Record data and metadata from a Driver.
+
+        Parameters
+        ----------
+        driver : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if not self._buffer('driver', driver, data, metadata):
+            super().record_iteration_driver(driver, data, metadata)
+
+    def record_iteration_system(self, system, data, metadata):
+        """
+        Record data and metadata from a System.
+
+        Parameters
+        ----------
+        system : System
+            System in need of recording.
+        data : dict
+            Dictionary containing inputs, outputs, and residuals.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if not self._buffer('system', system, data, metadata):
+            super().record_iteration_system(system, data, metadata)
+
+    def record_iteration_solver(self, solver, data, metadata):
+        """
+        Record data and metadata from a Solver.
+
+        Parameters
+        ----------
+        solver : Solver
+            Solver in need of recording.
+        data : dict
+            Dictionary containing outputs, residuals, and errors.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if not self._buffer('solver', solver, data, metadata):
+            super().record_iteration_solver(solver, data, metadata)
+
+    def record_iteration_problem(self, problem, data, metadata):
+        """
+        Record data and metadata from a Problem.
+
+        Parameters
+        ----------
+        problem : Problem
+            Problem in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, and constraints.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if self.connection:
+            self._write('problem', problem, data, metadata)
+        else:
+            super().record_iteration_problem(problem, data, metadata)
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """
+        Record derivatives data from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if not self._buffer('derivatives', recording_requester, data, metadata):
+            super().record_derivatives_driver(recording_requester, data, metadata)
+
+    def _flush_rings(self, rings):
+        """
+        Write the cases held in the given rings to the database, in the order they were recorded.
+
+        Parameters
+        ----------
+        rings : list of _CaseRing
+            The rings to write.
+        """
+        cases = []
+        for ring in rings:
+            for counter, coord, data, metadata in ring.cases():
+                cases.append((counter, ring.kind != 'derivatives', ring, coord, data, metadata))
+            ring.clear()
+
+        if not cases:
+            return
+
+        # derivatives share the counter of their iteration and are written after it
+        cases.sort(key=lambda case: (case[0], not case[1]))
+
+        counter = self._counter
+        coord = self._iteration_coordinate
+        try:
+            for _, _, ring, case_coord, data, metadata in cases:
+                self._iteration_coordinate = case_coord
+                self._write(ring.kind, ring.requester, data, metadata)
+        finally:
+            self._counter = counter
+            self._iteration_coordinate = coord
+
+    def _write(self, kind, requester, data, metadata):
+        """
+        Write a case to the database.
+
+        The CaseReader expects the counters of the cases in a file to be consecutive, so cases
+        are numbered in the order they are written rather than in the order they were recorded.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of record, one of 'driver', 'system', 'solver', 'problem' or 'derivatives'.
+        requester : object
+            The object that requested the recording.
+        data : dict
+            The recorded data.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        counter = self._counter
+        if kind == 'derivatives':
+            # derivatives share the counter of the last iteration
+            self._counter = self._num_written
+        else:
+            self._num_written += 1
+            self._counter = self._num_written
+
+        try:
+            if kind == 'driver':
+                super().record_iteration_driver(requester, data, metadata)
+            elif kind == 'system':
+                super().record_iteration_system(requester, data, metadata)
+            elif kind == 'solver':
+                super().record_iteration_solver(requester, data, metadata)
+            elif kind == 'problem':
+                super().record_iteration_problem(requester, data, metadata)
+            else:
+                super().record_derivatives_driver(requester, data, metadata)
+        finally:
+            self._counter = counter
+
+    def flush(self):
+        """
+        Write all cases held in memory to the database and remove them from memory.
+        """
+        self._flush_rings(list(self._rings.values()))
+
+    def record_failure(self, recording_requester, err):
+        """
+        Write the cases held in memory after an AnalysisError, if requested.
+
+        Parameters
+        ----------
+        recording_requester : object
+            System, Solver or Driver that the error was raised through.
+        err : AnalysisError
+            The error that was raised.
+        """
+        if self._flush_on_error:
+            self.flush()
+
+    def shutdown(self):
+        """
+        Write the cases held in memory, if requested, and shut down the recorder.
+        """
+        if self._flush_on_shutdown:
+            self.flush()
+        self._rings = {}
+        super().shutdown()
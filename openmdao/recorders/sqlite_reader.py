@@ -1,30 +1,45 @@
 """
 Definition of the SqliteCaseReader.
 """
+import os
+import shutil
 import sqlite3
+import tempfile
+import weakref
 from collections import OrderedDict
 
 import sys
 import numpy as np
 
 from openmdao.recorders.base_case_reader import BaseCaseReader
-from openmdao.recorders.case import Case
+from openmdao.recorders.case import Case, PromAbsDict
 from openmdao.core.constants import _DEFAULT_OUT_STREAM
 from openmdao.utils.variable_table import write_source_table
 from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system
 from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 
-from openmdao.recorders.sqlite_recorder import format_version, META_KEY_SEP
-
+from openmdao.recorders.sqlite_recorder import format_version, META_KEY_SEP, blob_to_array
+from openmdao.recorders.sqlite_shards import find_shards, merge_shards
 from openmdao.utils.notebook_utils import notebook, display, HTML
 from openmdao.visualization.tables.table_builder import generate_table
 
 import pickle
 import zlib
 import re
+import operator
 from json import loads as json_loads
 from io import TextIOBase
 
+# comparison operators allowed in the 'where' argument of SqliteCaseReader.query
+_query_ops = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
 
 class SqliteCaseReader(BaseCaseReader):
     """
@@ -33,7 +48,9 @@ class SqliteCaseReader(BaseCaseReader):
     Parameters
     ----------
     filename : str
-        The path to the filename containing the recorded data.
+        The path to the filename containing the recorded data. If the cases were recorded on
+        multiple ranks, this may also be the path given to the SqliteRecorder, in which case the
+        case files from all ranks are read as a single database.
     pre_load : bool
         If True, load all the data into memory during initialization.
     metadata_filename : str
@@ -72,12 +89,24 @@ class SqliteCaseReader(BaseCaseReader):
         Helper object for accessing cases from the problem_cases table.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _merged_filename : str or None
+        Path to the temporary database holding the merged cases recorded on multiple ranks.
     """
 
     def __init__(self, filename, pre_load=False, metadata_filename=None):
         """Initialize."""
         super().__init__(filename, pre_load)
 
+        self._merged_filename = None
+        if not os.path.isfile(filename) and find_shards(filename)[1]:
+            # cases were recorded separately on each rank, so read them as one database
+            tmpdir = tempfile.mkdtemp()
+            weakref.finalize(self, shutil.rmtree, tmpdir, True)
+            self._merged_filename = os.path.join(tmpdir, os.path.basename(filename))
+            merge_shards(filename, self._merged_filename)
+            filename = self._merged_filename
+            metadata_filename = None
+
         check_valid_sqlite3_db(filename)
 
         if metadata_filename:
@@ -873,6 +902,130 @@ class SqliteCaseReader(BaseCaseReader):
         else:
             return self._get_cases_nested(case_ids, OrderedDict())
 
+    def get_val_history(self, var_names, source='driver'):
+        """
+        Get the recorded values of the given variables across all cases from a source.
+
+        Only the requested values are extracted from the recorded data, without constructing a
+        Case for each case, so this is much faster than iterating over get_cases().
+
+        Parameters
+        ----------
+        var_names : str or list of str
+            Promoted or absolute names of the variables.
+        source : 'problem', 'driver', component pathname, solver pathname
+            Identifies which cases to use.
+
+        Returns
+        -------
+        ndarray
+            Array with one row per case, in the order the cases were recorded, containing the
+            flattened values of the variables concatenated in the order given.
+        """
+        if isinstance(var_names, str):
+            var_names = [var_names]
+
+        return self._get_case_table(source).get_val_history(var_names, source)
+
+    def export(self, filename, source='driver', var_names=None, fmt=None, batch_size=1000):
+        """
+        Export the values of variables in the cases recorded by a source to a columnar file.
+
+        Cases are read and written in batches, so the memory required doesn't depend on the
+        number of cases. Each flattened entry of each variable is stored in its own column, along
+        with the units of the variable.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the output file. Unless fmt is given, the format is determined from its
+            extension ('.parquet', '.pq', '.h5', '.hdf5' or '.npz'), or is the best available format
+            if it has none of these. Missing extensions are appended.
+        source : 'problem', 'driver', component pathname, solver pathname
+            Identifies which cases to export.
+        var_names : list of str or None
+            Promoted or absolute names of the variables to export. By default, all numerical
+            variables recorded in the first case of the source are exported.
+        fmt : 'parquet', 'hdf5', 'npz' or None
+            Format of the output file. Parquet files require pyarrow and HDF5 files require h5py.
+        batch_size : int
+            The maximum number of cases read from the database at once.
+
+        Returns
+        -------
+        str
+            Path of the output file.
+        """
+        from openmdao.recorders.case_export import export_cases
+
+        return export_cases(self, filename, source, var_names, fmt, batch_size)
+
+    def query(self, source='driver', coord_prefix=None, success=None, start_time=None,
+              end_time=None, where=None, order_by=None, descending=False, limit=None):
+        """
+        Get the cases from a source that satisfy the given conditions.
+
+        The conditions are evaluated by the database wherever possible, so only the matching
+        cases are read from the file.
+
+        Parameters
+        ----------
+        source : 'problem', 'driver', component pathname, solver pathname
+            Identifies which cases to search.
+        coord_prefix : str or None
+            If not None, only cases whose iteration coordinate (or case name, for problem cases)
+            starts with this string are returned.
+        success : bool or None
+            If not None, only cases whose success flag has this value are returned.
+        start_time : float or None
+            If not None, only cases recorded at or after this time are returned.
+        end_time : float or None
+            If not None, only cases recorded at or before this time are returned.
+        where : dict or None
+            Mapping of promoted or absolute variable names to (operator, value) tuples, where the
+            operator is one of '<', '<=', '>', '>=', '==' or '!='. Only cases for which every
+            comparison holds are returned. Each variable must have a size of 1.
+        order_by : str or None
+            Name of a variable with a size of 1, or 'timestamp', used to order the cases. By
+            default, cases are returned in the order they were recorded.
+        descending : bool
+            If True, cases are ordered from the largest value of order_by to the smallest.
+        limit : int or None
+            If not None, the maximum number of cases returned.
+
+        Returns
+        -------
+        list of Case
+            The matching cases.
+        """
+        return self._get_case_table(source).query(source, coord_prefix, success, start_time,
+                                                  end_time, where, order_by, descending, limit)
+
+    def _get_case_table(self, source):
+        """
+        Get the table containing the cases recorded by the given source.
+
+        Parameters
+        ----------
+        source : 'problem', 'driver', component pathname, solver pathname
+            Identifies which cases to use.
+
+        Returns
+        -------
+        CaseTable
+            The table containing the cases of the source.
+        """
+        if source == 'driver':
+            return self._driver_cases
+        elif source == 'problem' and self._format_version >= 2:
+            return self._problem_cases
+        elif source in self._system_cases.list_sources():
+            return self._system_cases
+        elif source in self._solver_cases.list_sources():
+            return self._solver_cases
+
+        raise RuntimeError('Source not found: %s' % source)
+
     def _get_cases_nested(self, case_ids, cases):
         """
         Populate a nested dictionary of cases matching the provided dictionary of case IDs.
@@ -1013,6 +1166,9 @@ class CaseTable(object):
         List of iteration cases and the table and row in which they are found.
     """
 
+    # names of the columns holding the recorded inputs and outputs
+    _val_columns = ('inputs', 'outputs')
+
     def __init__(self, fname, ver, table, index, giter, prom2abs, abs2prom, abs2meta, conns,
                  auto_ivc_map, var_info):
         """
@@ -1090,6 +1246,449 @@ class CaseTable(object):
             # source is a system or solver
             return [key for key in self._keys if self._get_source(key) == source]
 
+    def get_val_history(self, var_names, source=None):
+        """
+        Get the recorded values of the given variables across the cases in the table.
+
+        Parameters
+        ----------
+        var_names : list of str
+            Promoted or absolute names of the variables.
+        source : str, optional
+            If not None, only cases that have the specified source will be used.
+
+        Returns
+        -------
+        ndarray
+            Array with one row per case containing the flattened values of the variables.
+        """
+        batches = [vals for _, vals in self.iter_val_batches(var_names, source)]
+        return np.concatenate(batches) if batches else np.zeros((0, 0))
+
+    def iter_val_batches(self, var_names, source=None, batch_size=1000):
+        """
+        Iterate over the recorded values of the given variables in batches of cases.
+
+        Parameters
+        ----------
+        var_names : list of str
+            Promoted or absolute names of the variables.
+        source : str, optional
+            If not None, only cases that have the specified source will be used.
+        batch_size : int
+            The maximum number of cases in each batch.
+
+        Yields
+        ------
+        list of tuple
+            The index, counter, timestamp and success flag of each case in the batch.
+        ndarray
+            Array with one row per case in the batch containing the flattened values of the
+            variables.
+        """
+        # driver and problem tables only contain cases from a single source
+        filtered = source not in (None, 'driver', 'problem')
+
+        if self._format_version < 3:
+            # values aren't recorded as JSON, so let the cases decode them
+            records = []
+            rows = []
+            for case in self.cases():
+                if filtered and self._get_source(case.name) != source:
+                    continue
+                records.append((case.name, case.counter, case.timestamp, case.success))
+                rows.append(np.concatenate([np.ravel(case[name]) for name in var_names]))
+                if len(rows) == batch_size:
+                    yield records, np.array(rows)
+                    records = []
+                    rows = []
+            if rows:
+                yield records, np.array(rows)
+            return
+
+        lookups = [self._get_val_history_keys(name) for name in var_names]
+        columns = sorted({col for keys in lookups for col, _ in keys})
+
+        if filtered and self._format_version >= 5:
+            cond, params = self._get_source_cond(source)
+            cond = f" WHERE {cond}"
+            filtered = False
+        else:
+            cond, params = '', ()
+
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute(f"SELECT t.{self._index_name}, t.counter, t.timestamp, t.success, "
+                        f"{', '.join('t.' + col for col in columns)} "
+                        f"FROM {self._table_name} t{cond} ORDER BY t.id ASC",  # nosec: trusted
+                        params)
+
+            while True:
+                records = cur.fetchmany(batch_size)
+                if not records:
+                    break
+
+                if filtered:
+                    records = [r for r in records if self._get_source(r[0]) == source]
+                    if not records:
+                        continue
+
+                rows = []
+                for record in records:
+                    data = {col: json_loads(text) if text else None
+                            for col, text in zip(columns, record[4:])}
+
+                    vals = []
+                    for name, keys in zip(var_names, lookups):
+                        for col, key in keys:
+                            if data[col] and key in data[col]:
+                                vals.append(np.ravel(data[col][key]))
+                                break
+                        else:
+                            raise KeyError(f'Variable name "{name}" not found in case '
+                                           f'"{record[0]}".')
+                    rows.append(np.concatenate(vals))
+
+                yield [record[:4] for record in records], np.array(rows)
+
+        con.close()
+
+    def query(self, source=None, coord_prefix=None, success=None, start_time=None,
+              end_time=None, where=None, order_by=None, descending=False, limit=None):
+        """
+        Get the cases in the table that satisfy the given conditions.
+
+        Parameters
+        ----------
+        source : str or None
+            If not None, only cases that have the specified source will be returned.
+        coord_prefix : str or None
+            If not None, only cases whose index starts with this string are returned.
+        success : bool or None
+            If not None, only cases whose success flag has this value are returned.
+        start_time : float or None
+            If not None, only cases recorded at or after this time are returned.
+        end_time : float or None
+            If not None, only cases recorded at or before this time are returned.
+        where : dict or None
+            Mapping of variable names to (operator, value) tuples that the cases must satisfy.
+        order_by : str or None
+            Name of a variable, or 'timestamp', used to order the cases.
+        descending : bool
+            If True, cases are ordered from the largest value of order_by to the smallest.
+        limit : int or None
+            If not None, the maximum number of cases returned.
+
+        Returns
+        -------
+        list of Case
+            The matching cases.
+        """
+        if self._format_version < 5:
+            raise RuntimeError(f"Querying cases is not supported for case recording files of "
+                               f"format version {self._format_version}.")
+
+        where = where or {}
+        for name, (op, _) in where.items():
+            if op not in _query_ops:
+                raise ValueError(f"Invalid operator '{op}' for variable '{name}' in query. "
+                                 f"Must be one of {list(_query_ops)}.")
+
+        conds = []
+        params = []
+
+        if source not in (None, 'driver', 'problem'):
+            cond, cond_params = self._get_source_cond(source)
+            conds.append(cond)
+            params.extend(cond_params)
+
+        if coord_prefix:
+            # compare against a range rather than using LIKE so that the index can be used
+            conds.append(f"t.{self._index_name} >= ? AND t.{self._index_name} < ?")
+            params.extend((coord_prefix, coord_prefix + '\U0010ffff'))
+
+        if success is not None:
+            conds.append("t.success = ?")
+            params.append(int(bool(success)))
+
+        if start_time is not None:
+            conds.append("t.timestamp >= ?")
+            params.append(start_time)
+
+        if end_time is not None:
+            conds.append("t.timestamp <= ?")
+            params.append(end_time)
+
+        lookups = {name: self._get_query_keys(name) for name in where}
+        if order_by not in (None, 'timestamp') and order_by not in lookups:
+            lookups[order_by] = self._get_query_keys(order_by)
+
+        # the conditions on variable values, which are extracted from the recorded JSON data
+        val_conds = []
+        val_params = []
+        for name, (op, val) in where.items():
+            expr, expr_params = self._get_query_expr(lookups[name])
+            val_conds.append(f"{expr} {op} ?")
+            val_params.extend(expr_params)
+            val_params.append(val)
+
+        order_params = []
+        if order_by is None:
+            order = "t.id"
+        elif order_by == 'timestamp':
+            order = "t.timestamp"
+        else:
+            order, order_params = self._get_query_expr(lookups[order_by])
+        if descending:
+            order += " DESC"
+
+        select = self._get_query_select()
+
+        with sqlite3.connect(self._filename) as con:
+            con.row_factory = sqlite3.Row
+            cur = con.cursor()
+
+            sql = select
+            all_conds = conds + val_conds
+            if all_conds:
+                sql += " WHERE " + " AND ".join(all_conds)
+            sql += f" ORDER BY {order}, t.id"
+            all_params = params + val_params + order_params
+            if limit is not None:
+                sql += " LIMIT ?"
+                all_params.append(limit)
+
+            try:
+                rows = cur.execute(sql, all_params).fetchall()  # nosec: trusted input
+            except sqlite3.OperationalError:
+                # the JSON functions are not available in this version of sqlite or the data
+                # contains values they can't parse (e.g. NaN), so compare the values here instead
+                sql = select
+                if conds:
+                    sql += " WHERE " + " AND ".join(conds)
+                rows = cur.execute(sql + " ORDER BY t.id", params).fetchall()  # nosec: trusted
+                rows = self._filter_rows(rows, lookups, where, order_by, descending, limit)
+
+        con.close()
+
+        cases = []
+        for row in rows:
+            case_id = row[self._index_name]
+            if case_id in self._cases:
+                cases.append(self._cases[case_id])
+                continue
+
+            if 'jacobian' in row.keys() and row['jacobian'] is None:
+                row = dict(zip(row.keys(), row))
+                del row['jacobian']
+
+            cases.append(Case(self._get_source(case_id), row, self._prom2abs, self._abs2prom,
+                              self._abs2meta, self._conns, self._auto_ivc_map, self._var_info,
+                              self._format_version))
+
+        return cases
+
+    def _get_source_cond(self, source):
+        """
+        Get the SQL condition selecting the cases of the given source.
+
+        Parameters
+        ----------
+        source : str
+            The pathname of the system or solver that recorded the cases.
+
+        Returns
+        -------
+        str
+            The SQL condition, with the table aliased as 't'.
+        list
+            The parameters of the SQL condition.
+        """
+        # systems other than the model are recorded in global_iterations without 'root.'
+        sources = [source]
+        if source.startswith('root.'):
+            sources.append(source[5:])
+
+        cond = ("t.id IN (SELECT rowid FROM global_iterations WHERE record_type=? "
+                f"AND source IN ({', '.join('?' * len(sources))}))")
+
+        return cond, [self._table_name.split('_')[0]] + sources
+
+    def _get_query_select(self):
+        """
+        Get the SELECT statement used to query the cases in the table.
+
+        Returns
+        -------
+        str
+            The SELECT statement, with the table aliased as 't'.
+        """
+        return f"SELECT t.* FROM {self._table_name} t"
+
+    def _get_query_keys(self, name):
+        """
+        Get where the value of the given variable may be found in the recorded data for a query.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+
+        Returns
+        -------
+        list of (str, str)
+            Column and key in the recorded JSON data for each possible location.
+        int
+            Number of dimensions of the variable value.
+        """
+        keys = self._get_val_history_keys(name)
+        meta = self.get_var_meta(name)
+
+        if meta.get('size', 1) != 1:
+            raise ValueError(f"Variable '{name}' has a size of {meta['size']}, but only "
+                             "variables with a size of 1 can be used in a query.")
+
+        return keys, len(meta.get('shape') or ())
+
+    def get_var_meta(self, name):
+        """
+        Get the metadata of the given variable.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+
+        Returns
+        -------
+        dict
+            The metadata of the variable.
+        """
+        for _, key in self._get_val_history_keys(name):
+            if key in self._abs2meta:
+                return self._abs2meta[key]
+
+        raise KeyError(f'Variable name "{name}" not found.')
+
+    def _get_query_expr(self, lookup):
+        """
+        Get the SQL expression that extracts the value of a variable from the recorded data.
+
+        Parameters
+        ----------
+        lookup : tuple
+            The keys and number of dimensions of the variable, as returned by _get_query_keys.
+
+        Returns
+        -------
+        str
+            The SQL expression.
+        list
+            The parameters of the SQL expression.
+        """
+        keys, ndim = lookup
+        exprs = []
+        params = []
+        for col, key in keys:
+            exprs.append(f"json_extract(t.{col}, ?)")
+            params.append(f'$."{key}"' + '[0]' * ndim)
+
+        return f"COALESCE({', '.join(exprs)})", params
+
+    def _filter_rows(self, rows, lookups, where, order_by, descending, limit):
+        """
+        Apply the conditions on variable values of a query to the given rows.
+
+        Parameters
+        ----------
+        rows : list of sqlite3.Row
+            The rows satisfying all other conditions of the query, in the order they were recorded.
+        lookups : dict
+            The keys and number of dimensions of each variable used in the query.
+        where : dict
+            Mapping of variable names to (operator, value) tuples that the rows must satisfy.
+        order_by : str or None
+            Name of a variable, or 'timestamp', used to order the rows.
+        descending : bool
+            If True, rows are ordered from the largest value of order_by to the smallest.
+        limit : int or None
+            If not None, the maximum number of rows returned.
+
+        Returns
+        -------
+        list of sqlite3.Row
+            The rows satisfying the conditions.
+        """
+        def get_val(row, data, name):
+            for col, key in lookups[name][0]:
+                if col not in data:
+                    data[col] = json_loads(row[col]) if row[col] else None
+                if data[col] and key in data[col]:
+                    return np.ravel(data[col][key])[0]
+            return None
+
+        vals = []
+        for row in rows:
+            data = {}
+            for name, (op, val) in where.items():
+                rowval = get_val(row, data, name)
+                if rowval is None or not _query_ops[op](rowval, val):
+                    break
+            else:
+                if order_by is None:
+                    key = None
+                elif order_by == 'timestamp':
+                    key = row['timestamp']
+                else:
+                    key = get_val(row, data, order_by)
+                vals.append((key, row))
+
+        if order_by is not None:
+            # missing values are ordered first, as in SQL, and since the sort is stable, rows with
+            # equal values stay in the order they were recorded
+            vals.sort(key=lambda v: (False, 0) if v[0] is None else (True, v[0]),
+                      reverse=descending)
+
+        rows = [row for _, row in vals]
+        return rows if limit is None else rows[:limit]
+
+    def _get_val_history_keys(self, name):
+        """
+        Get where the value of the given variable may be found in the recorded data.
+
+        The locations are ordered the same way that a Case looks up the variable.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+
+        Returns
+        -------
+        list of (str, str)
+            Column and key in the recorded JSON data for each possible location.
+        """
+        inputs, outputs = self._val_columns
+        prom2abs = self._prom2abs
+
+        keys = [(outputs, name)]
+        if name in prom2abs['output']:
+            keys.append((outputs, prom2abs['output'][name][0]))
+
+        if name in prom2abs['input']:
+            abs_in = prom2abs['input'][name][0]
+        elif name in self._abs2prom['input']:
+            abs_in = name
+        else:
+            abs_in = None
+
+        if abs_in is not None:
+            keys.append((inputs, abs_in))
+            if abs_in in self._conns:
+                keys.append((outputs, self._conns[abs_in]))
+
+        return keys
+
     def get_cases(self, source=None, recurse=False, flat=False):
         """
         Get list of case names for cases in the table.
@@ -1427,6 +2026,54 @@ class DriverCases(CaseTable):
 
         con.close()
 
+    def get_derivatives_by_counter(self):
+        """
+        Get all recorded derivatives, keyed by the counter they were recorded with.
+
+        Derivatives carry the counter of the last case recorded before them, which is the case
+        they were computed at. Derivatives recorded separately with the same counter are merged.
+
+        Returns
+        -------
+        dict
+            Map of counter to a PromAbsDict of derivatives keyed by (of, wrt).
+        """
+        if self._format_version < 2:
+            return {}
+
+        jacs = {}
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute("SELECT counter, derivatives FROM driver_derivatives ORDER BY id ASC")
+            rows = cur.fetchall()
+        con.close()
+
+        for counter, data in rows:
+            jac = blob_to_array(data)
+            if type(jac) is np.ndarray and not jac.shape:
+                continue
+            jacs.setdefault(counter, {}).update((name, jac[name][0]) for name in jac.dtype.names)
+
+        return {counter: PromAbsDict(jac, self._prom2abs['output'], self._abs2prom['output'],
+                                     data_format=self._format_version,
+                                     in_prom2abs=self._prom2abs['input'],
+                                     auto_ivc_map=self._auto_ivc_map, var_info=self._var_info)
+                for counter, jac in jacs.items()}
+
+    def _get_query_select(self):
+        """
+        Get the SELECT statement used to query the cases in the table.
+
+        Override base class to add derivatives from the derivatives table.
+
+        Returns
+        -------
+        str
+            The SELECT statement, with the table aliased as 't'.
+        """
+        return ("SELECT t.*, d.derivatives AS jacobian FROM driver_iterations t "
+                "LEFT JOIN driver_derivatives d ON d.iteration_coordinate = t.iteration_coordinate")
+
     def get_case(self, case_id, cache=False):
         """
         Get a case from the database.
@@ -1596,6 +2243,8 @@ class SolverCases(CaseTable):
         Dictionary with information about variables (scaling, indices, execution order).
     """
 
+    _val_columns = ('solver_inputs', 'solver_output')
+
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
                  auto_ivc_map, var_info):
         """
@@ -32,6 +32,8 @@ from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 """
 SQL case database version history.
 ----------------------------------
+15-- OpenMDAO 3.29.1
+     Added hotstart column to driver_iterations table.
 14-- OpenMDAO 3.8.1
      Metadata pickle and JSON blobs are compressed.
      Save metadata separately for parallel runs.
@@ -64,7 +66,7 @@ SQL case database version history.
 1 -- Through OpenMDAO 2.3
      Original implementation.
 """
-format_version = 14
+format_version = 15
 
 # separator, cannot be a legal char for names
 META_KEY_SEP = '!'
@@ -130,11 +132,19 @@ class SqliteRecorder(CaseRecorder):
         The pickle protocol version to use when pickling metadata.
     record_viewer_data : bool, optional
         If True, record data needed for visualization.
+    sharded : bool, optional
+        If True and running under MPI, record on every rank that hasn't explicitly disabled
+        recording. Each rank writes its cases to its own file, '<filepath>_<rank>', and the
+        metadata common to all of them is written once to '<filepath>_meta'. Passing filepath to
+        a CaseReader reads all of them as a single database, and 'openmdao merge_cases' combines
+        them into one file.
 
     Attributes
     ----------
     _record_viewer_data : bool
         Flag indicating whether to record data needed to generate N2 diagram.
+    _sharded : bool
+        If True, record on all ranks by default when running under MPI.
     connection : sqlite connection object
         Connection to the sqlite3 database.
     metadata_connection : sqlite connection object
@@ -158,13 +168,16 @@ class SqliteRecorder(CaseRecorder):
         set of recording requesters for which this recorder has been started.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True,
+                 sharded=False):
         """
         Initialize the SqliteRecorder.
         """
         if append:
             raise NotImplementedError("Append feature not implemented for SqliteRecorder")
 
+        self._sharded = sharded
+
         self.connection = None
         self.metadata_connection = None
         self._record_metadata = True
@@ -202,7 +215,8 @@ class SqliteRecorder(CaseRecorder):
                     rank = comm.rank
                     filepath = f"{self._filepath}_{rank}"
                     print("Note: SqliteRecorder is running on multiple processors. "
-                          f"Cases from rank {rank} are being written to {filepath}.")
+                          f"Cases from rank {rank} are being written to {filepath}. Use "
+                          f"'openmdao merge_cases {self._filepath}' to combine them.")
                     if rank == min(self._recording_ranks):
                         metadata_filepath = f'{self._filepath}_meta'
                         print("Note: Metadata is being recorded separately as "
@@ -237,31 +251,39 @@ class SqliteRecorder(CaseRecorder):
                 # used to keep track of the order of the case records across all case tables
                 c.execute("CREATE TABLE global_iterations(id INTEGER PRIMARY KEY, "
                           "record_type TEXT, rowid INT, source TEXT)")
+                c.execute("CREATE INDEX glob_src_ind on global_iterations(record_type, source)")
 
                 c.execute("CREATE TABLE driver_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
+                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT, "
+                          "hotstart INT)")
                 c.execute("CREATE TABLE driver_derivatives(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, derivatives BLOB)")
                 c.execute("CREATE INDEX driv_iter_ind on driver_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX driv_time_ind on driver_iterations(timestamp)")
+                c.execute("CREATE INDEX driv_deriv_ind on "
+                          "driver_derivatives(iteration_coordinate)")
 
                 c.execute("CREATE TABLE problem_cases(id INTEGER PRIMARY KEY, "
                           "counter INT, case_name TEXT, timestamp REAL, "
                           "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT, "
                           "jacobian BLOB, abs_err REAL, rel_err REAL)")
                 c.execute("CREATE INDEX prob_name_ind on problem_cases(case_name)")
+                c.execute("CREATE INDEX prob_time_ind on problem_cases(timestamp)")
 
                 c.execute("CREATE TABLE system_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
                 c.execute("CREATE INDEX sys_iter_ind on system_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX sys_time_ind on system_iterations(timestamp)")
 
                 c.execute("CREATE TABLE solver_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, abs_err REAL, rel_err REAL, "
                           "solver_inputs TEXT, solver_output TEXT, solver_residuals TEXT)")
                 c.execute("CREATE INDEX solv_iter_ind on solver_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX solv_time_ind on solver_iterations(timestamp)")
 
             if self._record_metadata:
                 with self.metadata_connection as m:
@@ -326,6 +348,9 @@ class SqliteRecorder(CaseRecorder):
         if recording_requester in self._started:
             return
 
+        if self._sharded and self._record_on_proc is None:
+            self._record_on_proc = True
+
         super().startup(recording_requester, comm)
 
         if not self._database_initialized:
@@ -505,11 +530,12 @@ class SqliteRecorder(CaseRecorder):
                 c = c.cursor()  # need a real cursor for lastrowid
 
                 c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs, residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
+                          "timestamp, success, msg, inputs, outputs, residuals, hotstart) "
+                          "VALUES(?,?,?,?,?,?,?,?,?)",
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
+                           inputs_text, outputs_text, residuals_text,
+                           int(metadata.get('hotstart', False))))
 
                 c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
                           ('driver', c.lastrowid, driver._get_name()))
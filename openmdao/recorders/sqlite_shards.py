@@ -0,0 +1,216 @@
+"""
+Functions for combining the per-rank case files (shards) written by a SqliteRecorder under MPI.
+
+When recording on multiple ranks, each recording rank writes its cases to '<filepath>_<rank>'
+and the metadata shared by all of them is written once to '<filepath>_meta'.
+"""
+import os
+import re
+import sqlite3
+from glob import glob, escape
+
+from openmdao.utils.record_util import check_valid_sqlite3_db
+from openmdao.utils.om_warnings import issue_warning
+
+
+# tables containing recorded cases, keyed by the record_type used for them in global_iterations
+_case_tables = {
+    'driver': 'driver_iterations',
+    'problem': 'problem_cases',
+    'system': 'system_iterations',
+    'solver': 'solver_iterations',
+}
+
+# all tables found in a case file that aren't found in the metadata file
+_shard_tables = ('global_iterations', 'driver_derivatives') + tuple(_case_tables.values())
+
+
+def find_shards(filepath):
+    """
+    Return the metadata file and the per-rank case files recorded for the given path.
+
+    Parameters
+    ----------
+    filepath : str
+        The path given to the SqliteRecorder.
+
+    Returns
+    -------
+    str or None
+        Path to the metadata file, or None if no sharded recording exists for filepath.
+    list of str
+        Paths to the case files, ordered by rank.
+    """
+    meta_filepath = f'{filepath}_meta'
+    if not os.path.isfile(meta_filepath):
+        return None, []
+
+    pattern = re.compile(re.escape(filepath) + r'_(\d+)$')
+    shards = []
+    for fname in glob(escape(filepath) + '_*'):
+        match = pattern.match(fname)
+        if match:
+            shards.append((int(match.group(1)), fname))
+
+    return meta_filepath, [fname for _, fname in sorted(shards)]
+
+
+def merge_shards(filepath, out_filepath=None):
+    """
+    Combine the case files recorded on each rank into a single case database.
+
+    Cases are stored in rank order, so all of the cases recorded on the lowest rank come first.
+    Their iteration coordinates are unchanged, since these already identify the recording rank.
+
+    Parameters
+    ----------
+    filepath : str
+        The path given to the SqliteRecorder.
+    out_filepath : str or None
+        The path of the merged database. Defaults to filepath.
+
+    Returns
+    -------
+    str
+        The path of the merged database.
+    """
+    meta_filepath, shards = find_shards(filepath)
+    if meta_filepath is None or not shards:
+        raise IOError(f"No case files recorded on multiple ranks were found for '{filepath}'.")
+
+    check_valid_sqlite3_db(meta_filepath)
+    for shard in shards:
+        check_valid_sqlite3_db(shard)
+
+    if out_filepath is None:
+        out_filepath = filepath
+
+    try:
+        os.remove(out_filepath)
+        issue_warning(f'The existing case recorder file, {out_filepath}, is being overwritten.',
+                      category=UserWarning)
+    except OSError:
+        pass
+
+    con = sqlite3.connect(out_filepath)
+    try:
+        # the metadata shared by all of the shards
+        _attach(con, meta_filepath)
+        for name, sql in con.execute("SELECT name, sql FROM shard.sqlite_master WHERE "
+                                     "type='table' AND name NOT IN (%s)" %  # nosec: trusted input
+                                     ', '.join('?' * len(_shard_tables)),
+                                     _shard_tables).fetchall():
+            con.execute(sql)
+            con.execute(f"INSERT INTO main.{name} SELECT * FROM shard.{name}")  # nosec: trusted
+        _detach(con)
+
+        # the case tables and their indices, created the same way as in the shards
+        _attach(con, shards[0])
+        for sql, in con.execute("SELECT sql FROM shard.sqlite_master WHERE sql IS NOT NULL AND "
+                                "tbl_name IN (%s) ORDER BY type DESC" %  # nosec: trusted input
+                                ', '.join('?' * len(_shard_tables)), _shard_tables).fetchall():
+            con.execute(sql)
+        _detach(con)
+
+        for shard in shards:
+            offsets = {table: con.execute(f"SELECT COALESCE(MAX(id), 0) "  # nosec: trusted
+                                          f"FROM main.{table}").fetchone()[0]
+                       for table in _shard_tables}
+
+            _attach(con, shard)
+            # the counter of each case is its position in global_iterations, so shift it as well
+            for table in _shard_tables:
+                if table != 'global_iterations':
+                    _copy_rows(con, table, offsets[table], offsets['global_iterations'])
+
+            # global_iterations refers to rows in the case tables, so those ids are shifted too
+            shift = ' '.join(f"WHEN '{rtype}' THEN {offsets[table]}"
+                             for rtype, table in _case_tables.items())
+            con.execute("INSERT INTO main.global_iterations(id, record_type, rowid, source) "
+                        f"SELECT id + ?, record_type, rowid + CASE record_type {shift} ELSE 0 END, "
+                        "source FROM shard.global_iterations ORDER BY id",  # nosec: trusted input
+                        (offsets['global_iterations'],))
+            _detach(con)
+    finally:
+        con.close()
+
+    return out_filepath
+
+
+def _attach(con, filepath):
+    """
+    Attach the given database to the connection under the name 'shard'.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Connection to the merged database.
+    filepath : str
+        Path to the database to attach.
+    """
+    con.execute("ATTACH DATABASE ? AS shard", (filepath,))
+
+
+def _detach(con):
+    """
+    Commit pending changes and detach the database attached as 'shard'.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Connection to the merged database.
+    """
+    con.commit()
+    con.execute("DETACH DATABASE shard")
+
+
+def _copy_rows(con, table, offset, counter_offset):
+    """
+    Append all rows of the given table in the attached shard, shifting their ids and counters.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Connection to the merged database.
+    table : str
+        Name of the table.
+    offset : int
+        Amount added to the id of each copied row.
+    counter_offset : int
+        Amount added to the counter of each copied row.
+    """
+    cols = [row[1] for row in con.execute(f"PRAGMA shard.table_info({table})")]
+    shifted = {'id': f'id + {int(offset)}', 'counter': f'counter + {int(counter_offset)}'}
+    select = ', '.join(shifted.get(col, col) for col in cols)
+    con.execute(f"INSERT INTO main.{table}({', '.join(cols)}) "  # nosec: trusted input
+                f"SELECT {select} FROM shard.{table} ORDER BY id")
+
+
+def _merge_cases_setup_parser(parser):
+    """
+    Set up the openmdao subparser for the 'openmdao merge_cases' command.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument('file', nargs=1, help='The path given to the SqliteRecorder. The case '
+                        'files <file>_<rank> and the metadata file <file>_meta are merged.')
+    parser.add_argument('-o', default=None, action='store', dest='outfile',
+                        help='Name of the merged case file. By default it is the given path.')
+
+
+def _merge_cases_cmd(options, user_args):
+    """
+    Implement the 'openmdao merge_cases' command.
+
+    Parameters
+    ----------
+    options : argparse Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script.
+    """
+    outfile = merge_shards(options.file[0], options.outfile)
+    print(f"Cases merged into '{outfile}'.")
@@ -141,7 +141,7 @@ def assertDriverIterDataRecorded(test, expected, tolerance, prefix=None):
                             'iteration coordinate: "{}"'.format(iter_coord))
 
             counter, global_counter, iteration_coordinate, timestamp, success, msg,\
-                inputs_text, outputs_text, residuals_text = row_actual
+                inputs_text, outputs_text, residuals_text, hotstart = row_actual
 
             if f_version >= 3:
                 inputs_actual = deserialize(inputs_text, abs2meta, prom2abs, conns)
@@ -156,6 +156,7 @@ def assertDriverIterDataRecorded(test, expected, tolerance, prefix=None):
 
             test.assertEqual(success, 1)
             test.assertEqual(msg, '')
+            test.assertEqual(hotstart, 0)
 
             for vartype, actual, expected in (
                 ('outputs', outputs_actual, outputs_expected),
@@ -364,6 +364,37 @@ class DistributedRecorderTest(unittest.TestCase):
 
         prob.cleanup()
 
+    def test_sharded_recording(self):
+        prob = om.Problem()
+
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        prob.model.add_design_var('x', lower=0.0, upper=1.0)
+        prob.model.add_design_var('y', lower=0.0, upper=1.0)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.ListGenerator([[('x', 0.), ('y', 0.)],
+                                                     [('x', 1.), ('y', 1.)]]))
+        prob.driver.add_recorder(om.SqliteRecorder(self.filename, sharded=True))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        prob.comm.barrier()
+
+        # every rank recorded its own cases
+        for rank in range(prob.comm.size):
+            cr = om.CaseReader(f'{self.filename}_{rank}')
+            self.assertEqual(cr.list_cases('driver', out_stream=None),
+                             [f'rank{rank}:DOEDriver_List|0', f'rank{rank}:DOEDriver_List|1'])
+
+        # and the shards can be read as one database
+        cr = om.CaseReader(self.filename)
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(cases, [f'rank{rank}:DOEDriver_List|{i}'
+                                 for rank in range(prob.comm.size) for i in range(2)])
+        self.assertEqual([cr.get_case(c)['f_xy'][0] for c in cases], [22., 27.] * prob.comm.size)
+
     @unittest.skipUnless(pyDOE3, "This test uses full factorial from pyDOE3.")
     def test_record_on_one_proc(self):
         # This test verifies that cases can be recorded on a single process in an MPI environment
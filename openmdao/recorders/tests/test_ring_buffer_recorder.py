@@ -0,0 +1,181 @@
+""" Unit tests for the RingBufferRecorder. """
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+
+from openmdao.test_suite.components.sellar import SellarProblem, SellarDis1, SellarDis2
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+class FailingSellarDis1(SellarDis1):
+    """
+    SellarDis1 that raises an AnalysisError on a given call to compute.
+    """
+
+    def __init__(self, fail_on):
+        super().__init__()
+        self.fail_on = fail_on
+        self.calls = 0
+
+    def compute(self, inputs, outputs):
+        self.calls += 1
+        if self.calls == self.fail_on:
+            raise om.AnalysisError('Try again.')
+        super().compute(inputs, outputs)
+
+
+def _sellar_problem(recorder):
+    prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS, linear_solver=om.ScipyKrylov)
+    prob.setup()
+    prob.set_solver_print(0)
+
+    nl = prob.model.nonlinear_solver
+    nl.recording_options['record_solver_residuals'] = True
+    nl.add_recorder(recorder)
+
+    return prob
+
+
+@use_tempdirs
+class TestRingBufferRecorder(unittest.TestCase):
+
+    def test_latest_cases(self):
+        # record all iterations for comparison
+        prob = _sellar_problem(om.SqliteRecorder('full.sql'))
+        prob.run_model()
+        prob.cleanup()
+        expected = om.CaseReader('full.sql').get_cases('root.nonlinear_solver')
+
+        prob = _sellar_problem(om.RingBufferRecorder('ring.sql', size=3))
+        prob.run_model()
+        prob.cleanup()
+        cases = om.CaseReader('ring.sql').get_cases('root.nonlinear_solver')
+
+        self.assertEqual([case.name for case in cases], [case.name for case in expected[-3:]])
+        for case, expected_case in zip(cases, expected[-3:]):
+            assert_near_equal(case.abs_err, expected_case.abs_err, 1e-12)
+            for name in ('x', 'z', 'y1', 'y2'):
+                assert_near_equal(case[name], expected_case[name], 1e-12)
+            assert_near_equal(case.residuals['y1'], expected_case.residuals['y1'], 1e-12)
+
+    def test_sample_every(self):
+        prob = _sellar_problem(om.RingBufferRecorder('ring.sql', size=10, sample_every=3))
+        prob.run_model()
+        prob.cleanup()
+
+        cases = om.CaseReader('ring.sql').get_cases('root.nonlinear_solver')
+        self.assertEqual([case.name.split('|')[-1] for case in cases], ['1', '4', '7'])
+
+    def test_flush(self):
+        recorder = om.RingBufferRecorder('ring.sql', size=2, flush_on_shutdown=False)
+        prob = _sellar_problem(recorder)
+
+        prob.run_model()
+        recorder.flush()
+        prob.run_model()
+        prob.cleanup()
+
+        # only the cases held when flush was called were written
+        cases = om.CaseReader('ring.sql').get_cases('root.nonlinear_solver')
+        self.assertEqual([case.name for case in cases],
+                         ['rank0:root._solve_nonlinear|0|NonlinearBlockGS|6',
+                          'rank0:root._solve_nonlinear|0|NonlinearBlockGS|7'])
+
+    def test_flush_on_error(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('d1', FailingSellarDis1(fail_on=5), promotes=['*'])
+        model.add_subsystem('d2', SellarDis2(), promotes=['*'])
+        model.nonlinear_solver = om.NonlinearBlockGS(iprint=-1,
+                                                     reraise_child_analysiserror=True)
+        model.nonlinear_solver.add_recorder(om.RingBufferRecorder('ring.sql', size=2,
+                                                                  flush_on_shutdown=False))
+        prob.setup()
+        prob.set_val('x', 1.)
+        prob.set_val('z', np.array([5., 2.]))
+
+        with self.assertRaises(om.AnalysisError):
+            prob.run_model()
+        prob.cleanup()
+
+        # the failed iteration and the one before it were written
+        cases = om.CaseReader('ring.sql').get_cases('root.nonlinear_solver')
+        self.assertEqual([case.name for case in cases],
+                         ['rank0:root._solve_nonlinear|0|NonlinearBlockGS|3',
+                          'rank0:root._solve_nonlinear|0|NonlinearBlockGS|4'])
+
+    def test_driver_derivatives(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p1', om.IndepVarComp('x', 50.0), promotes=['*'])
+        model.add_subsystem('p2', om.IndepVarComp('y', 50.0), promotes=['*'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('c = - x + y'), promotes=['*'])
+        model.add_design_var('x', lower=-50.0, upper=50.0)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.driver.recording_options['record_derivatives'] = True
+        prob.driver.add_recorder(om.RingBufferRecorder('ring.sql', size=2))
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader('ring.sql')
+        cases = cr.get_cases('driver')
+        self.assertEqual(len(cases), 2)
+        assert_near_equal(cases[-1]['x'], prob['x'], 1e-12)
+        assert_near_equal(cases[-1]['f_xy'], prob['f_xy'], 1e-12)
+
+        deriv_cases = [case for case in cases if case.derivatives is not None]
+        self.assertTrue(deriv_cases)
+        for case in deriv_cases:
+            assert_near_equal(case.derivatives['c', 'x'], [[-1.]], 1e-12)
+
+    def test_discrete(self):
+        class DiscComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', val=0.0)
+                self.add_discrete_output('label', val='')
+                self.add_output('y', val=np.zeros(2))
+
+            def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+                discrete_outputs['label'] = 'x=%g' % inputs['x'][0]
+                outputs['y'] = inputs['x'] * np.arange(2)
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', DiscComp(), promotes=['*'])
+        prob.model.add_design_var('x')
+        prob.model.add_objective('y', index=1)
+
+        prob.driver = om.DOEDriver(om.ListGenerator([[('x', x)] for x in (1., 2., 3.)]))
+        prob.driver.recording_options['includes'] = ['*']
+        prob.driver.add_recorder(om.RingBufferRecorder('ring.sql', size=2))
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cases = om.CaseReader('ring.sql').get_cases('driver')
+        self.assertEqual([case['label'] for case in cases], ['x=2', 'x=3'])
+        assert_near_equal(cases[-1]['y'], [0., 3.], 1e-12)
+
+    def test_bad_args(self):
+        with self.assertRaises(ValueError) as cm:
+            om.RingBufferRecorder('ring.sql', size=0)
+        self.assertEqual(str(cm.exception),
+                         "RingBufferRecorder: size must be a positive integer, but got 0.")
+
+        with self.assertRaises(ValueError) as cm:
+            om.RingBufferRecorder('ring.sql', sample_every=0)
+        self.assertEqual(str(cm.exception),
+                         "RingBufferRecorder: sample_every must be a positive integer, but got 0.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 import sys
 import os
 import sys
+import json
 import unittest
 
 from io import StringIO
@@ -38,6 +39,16 @@ OPT, OPTIMIZER = set_pyoptsparse_opt('SLSQP')
 if OPTIMIZER:
     from openmdao.drivers.pyoptsparse_driver import pyOptSparseDriver
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
 
 def count_keys(d):
     """
@@ -3614,6 +3625,375 @@ class TestFeatureSqliteReader(unittest.TestCase):
         assert_near_equal(c2.derivatives[('f_xy', 'y')][0], 0.0, 1e-4)
 
 
+@use_tempdirs
+class TestLazyCases(unittest.TestCase):
+
+    def setUp(self):
+        prob = SellarProblem(SellarDerivativesGrouped, nonlinear_solver=om.NonlinearRunOnce,
+                             linear_solver=om.ScipyKrylov,
+                             mda_nonlinear_solver=om.NonlinearBlockGS)
+
+        driver = prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+        driver.recording_options['record_inputs'] = True
+        driver.recording_options['record_derivatives'] = True
+
+        recorder = om.SqliteRecorder('cases.sql')
+        driver.add_recorder(recorder)
+        prob.model.add_recorder(recorder)
+
+        prob.setup()
+        prob.model.mda.nonlinear_solver.add_recorder(recorder)
+        prob.run_driver()
+        prob.cleanup()
+
+    def test_lazy_sections(self):
+        cr = om.CaseReader('cases.sql')
+        case = cr.get_case(cr.list_cases('driver', out_stream=None)[-1])
+
+        self.assertEqual(case._decoded, {})
+
+        assert_near_equal(case['obj'], 3.18339395, 1e-6)
+        self.assertEqual(list(case._decoded), ['outputs'])
+
+        self.assertIsNotNone(case.derivatives)
+        self.assertEqual(sorted(case._decoded), ['derivatives', 'outputs'])
+
+        # sections that weren't recorded are None
+        self.assertIsNone(case.inputs)
+        self.assertIsNone(case.residuals)
+        self.assertEqual(sorted(case._decoded), ['derivatives', 'inputs', 'outputs', 'residuals'])
+        self.assertEqual(case._raw_data, {})
+
+    def test_val_history(self):
+        cr = om.CaseReader('cases.sql')
+
+        for source, names in (('driver', ['z', 'x', 'obj', 'con1', 'con2']),
+                              ('root', ['obj_cmp.obj', 'y2', 'obj_cmp.x']),
+                              ('root.mda.nonlinear_solver', ['y1', 'mda.d2.y2', 'mda.d1.z'])):
+            with self.subTest(source=source):
+                cases = cr.get_cases(source, recurse=False)
+                expected = np.array([np.concatenate([np.ravel(case[name]) for name in names])
+                                     for case in cases])
+
+                hist = cr.get_val_history(names, source=source)
+
+                self.assertEqual(hist.shape, expected.shape)
+                self.assertEqual(hist.shape[0], len(cases))
+                assert_near_equal(hist, expected, 1e-12)
+
+        assert_near_equal(cr.get_val_history('obj')[-1], [3.18339395], 1e-6)
+
+    def test_val_history_errors(self):
+        cr = om.CaseReader('cases.sql')
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_val_history(['obj', 'foo'])
+        self.assertEqual(cm.exception.args[0],
+                         'Variable name "foo" not found in case "rank0:ScipyOptimize_SLSQP|0".')
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history(['obj'], source='foo')
+        self.assertEqual(str(cm.exception), 'Source not found: foo')
+
+
+@use_tempdirs
+class TestQueryCases(unittest.TestCase):
+
+    def setUp(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-10, upper=10)
+        prob.model.add_design_var('y', lower=-10, upper=10)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=5))
+
+        recorder = om.SqliteRecorder('cases.sql')
+        prob.driver.add_recorder(recorder)
+        prob.model.add_recorder(recorder)
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+    def check_query(self, cr, expected, **kwargs):
+        cases = cr.query(**kwargs)
+        self.assertEqual([case.name for case in cases], [case.name for case in expected])
+
+    def test_query(self):
+        cr = om.CaseReader('cases.sql')
+        cases = cr.get_cases('driver', recurse=False)
+        self.assertEqual(len(cases), 25)
+
+        by_obj = sorted(cases, key=lambda case: case['f_xy'][0])
+
+        self.check_query(cr, cases)
+        self.check_query(cr, [c for c in cases if c['f_xy'] < 100.], where={'f_xy': ('<', 100.)})
+        self.check_query(cr, [c for c in cases if c['x'] == 0. and c['y'] >= 0.],
+                         where={'x': ('==', 0.), 'comp.y': ('>=', 0.)})
+        self.check_query(cr, by_obj[:3], order_by='f_xy', limit=3)
+        self.check_query(cr, by_obj[::-1][:4], order_by='f_xy', descending=True, limit=4)
+        self.check_query(cr, [c for c in by_obj if c['x'] > 0.], where={'x': ('>', 0.)},
+                         order_by='f_xy')
+
+        prefix = 'rank0:DOEDriver_FullFactorial|1'
+        self.check_query(cr, [c for c in cases if c.name.startswith(prefix)], coord_prefix=prefix)
+        self.check_query(cr, cases, success=True)
+        self.check_query(cr, [], success=False)
+        self.check_query(cr, cases[10:], start_time=cases[10].timestamp)
+        self.check_query(cr, cases[:5], end_time=cases[4].timestamp)
+
+        # the cases of other sources are in other tables
+        model_cases = cr.get_cases('root', recurse=False)
+        self.assertEqual(len(model_cases), 25)
+        self.check_query(cr, [c for c in model_cases if c['f_xy'] < 100.], source='root',
+                         where={'f_xy': ('<', 100.)})
+
+    def test_query_fallback(self):
+        # the values are compared outside of the database if it can't extract them
+        from unittest import mock
+        from openmdao.recorders.sqlite_reader import CaseTable
+
+        cr = om.CaseReader('cases.sql')
+
+        kwargs = [
+            {'where': {'f_xy': ('<', 100.)}},
+            {'where': {'x': ('!=', 0.), 'comp.y': ('<=', 0.)}, 'order_by': 'f_xy'},
+            {'where': {'x': ('>', 0.)}, 'order_by': 'y', 'descending': True, 'limit': 6},
+            {'coord_prefix': 'rank0:DOEDriver_FullFactorial|1', 'order_by': 'timestamp',
+             'descending': True},
+        ]
+        expected = [[case.name for case in cr.query(**kw)] for kw in kwargs]
+
+        with mock.patch.object(CaseTable, '_get_query_expr',
+                               return_value=('no_such_function(t.outputs)', [])):
+            for kw, names in zip(kwargs, expected):
+                with self.subTest(**kw):
+                    self.assertTrue(names)
+                    self.assertEqual([case.name for case in cr.query(**kw)], names)
+
+    def test_query_errors(self):
+        cr = om.CaseReader('cases.sql')
+
+        with self.assertRaises(ValueError) as cm:
+            cr.query(where={'f_xy': ('=<', 1.)})
+        self.assertEqual(str(cm.exception),
+                         "Invalid operator '=<' for variable 'f_xy' in query. "
+                         "Must be one of ['<', '<=', '>', '>=', '==', '!='].")
+
+        with self.assertRaises(KeyError) as cm:
+            cr.query(order_by='foo')
+        self.assertEqual(cm.exception.args[0], 'Variable name "foo" not found.')
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.query(source='foo')
+        self.assertEqual(str(cm.exception), 'Source not found: foo')
+
+
+@use_tempdirs
+class TestShardedCases(unittest.TestCase):
+
+    def record_shards(self):
+        # record the case files that two ranks would write, by running serially into each file
+        import shutil
+
+        samples = [
+            [[('x', 0.), ('y', 0.)], [('x', 1.), ('y', 0.)]],
+            [[('x', 0.), ('y', 1.)], [('x', 1.), ('y', 1.)], [('x', 2.), ('y', 2.)]],
+        ]
+        for rank, cases in enumerate(samples):
+            prob = om.Problem()
+            prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+            prob.model.add_design_var('x')
+            prob.model.add_design_var('y')
+            prob.model.add_objective('f_xy')
+
+            prob.driver = om.DOEDriver(om.ListGenerator(cases))
+            recorder = om.SqliteRecorder(f'cases.sql_{rank}')
+            prob.driver.add_recorder(recorder)
+            prob.model.add_recorder(recorder)
+
+            prob.setup()
+            prob.run_driver(case_prefix=f'shard{rank}')
+            prob.cleanup()
+
+        shutil.copyfile('cases.sql_0', 'cases.sql_meta')
+
+        return [c for cases in samples for c in cases]
+
+    def check_cases(self, cr, samples):
+        driver_cases = cr.list_cases('driver', recurse=False, out_stream=None)
+        self.assertEqual(driver_cases, [f'shard{rank}_rank0:DOEDriver_List|{i}'
+                                        for rank, n in enumerate((2, 3)) for i in range(n)])
+
+        for case_id, sample in zip(driver_cases, samples):
+            case = cr.get_case(case_id)
+            x, y = sample[0][1], sample[1][1]
+            assert_near_equal(case['x'], x)
+            assert_near_equal(case['y'], y)
+            assert_near_equal(case['f_xy'], (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0)
+
+        # each driver case has a child system case from the same shard
+        self.assertEqual(len(cr.list_cases('root', out_stream=None)), 5)
+        for case_id in driver_cases:
+            children = cr.list_cases(case_id, recurse=True, flat=True, out_stream=None)
+            self.assertEqual(len(children), 2)
+            self.assertTrue(children[0].startswith(case_id.split('_rank')[0]))
+
+        self.assertEqual(len(cr.list_cases(out_stream=None)), 10)
+
+    def test_reader(self):
+        samples = self.record_shards()
+
+        cr = om.CaseReader('cases.sql')
+        self.check_cases(cr, samples)
+        self.assertFalse(os.path.exists('cases.sql'))
+
+    def test_merge(self):
+        from openmdao.recorders.sqlite_shards import find_shards, merge_shards
+
+        samples = self.record_shards()
+
+        self.assertEqual(find_shards('cases.sql'), ('cases.sql_meta',
+                                                    ['cases.sql_0', 'cases.sql_1']))
+
+        self.assertEqual(merge_shards('cases.sql', 'merged.sql'), 'merged.sql')
+        self.check_cases(om.CaseReader('merged.sql'), samples)
+
+        self.assertEqual(merge_shards('cases.sql'), 'cases.sql')
+        self.check_cases(om.CaseReader('cases.sql'), samples)
+
+    def test_no_shards(self):
+        from openmdao.recorders.sqlite_shards import merge_shards
+
+        with self.assertRaises(IOError) as cm:
+            merge_shards('cases.sql')
+
+        self.assertEqual(str(cm.exception),
+                         "No case files recorded on multiple ranks were found for 'cases.sql'.")
+
+
+@use_tempdirs
+class TestExportCases(unittest.TestCase):
+
+    def setUp(self):
+        prob = SellarProblem(SellarDerivativesGrouped)
+        prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+
+        recorder = om.SqliteRecorder('cases.sql')
+        prob.driver.add_recorder(recorder)
+        prob.model.add_recorder(recorder)
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.cr = om.CaseReader('cases.sql')
+
+    def check_columns(self, cols, source, var_names, columns):
+        case_names = self.cr.list_cases(source, recurse=False, out_stream=None)
+        self.assertEqual(list(cols['case']), case_names)
+
+        cases = self.cr.get_cases(source, recurse=False)
+        assert_near_equal(np.asarray(cols['timestamp'], dtype=float),
+                          [case.timestamp for case in cases], 1e-12)
+        self.assertTrue(all(cols['success']))
+
+        hist = self.cr.get_val_history(var_names, source=source)
+        for i, col in enumerate(columns):
+            assert_near_equal(np.asarray(cols[col], dtype=float), hist[:, i], 1e-12)
+
+    def test_export_npz(self):
+        outfile = self.cr.export('cases.npz', batch_size=3)
+        self.assertEqual(outfile, 'cases.npz')
+
+        with np.load(outfile) as data:
+            self.assertEqual(sorted(data.files),
+                             sorted(['__metadata__', 'case', 'counter', 'timestamp', 'success',
+                                     'z[0]', 'z[1]', 'x', 'con1', 'con2', 'obj']))
+            self.check_columns(data, 'driver', ['z', 'x', 'obj'], ['z[0]', 'z[1]', 'x', 'obj'])
+
+            meta = json.loads(data['__metadata__'][()])
+
+        self.assertEqual(meta['source'], 'driver')
+        self.assertEqual(meta['variables']['z'], {'units': None, 'shape': [2],
+                                                  'columns': ['z[0]', 'z[1]']})
+
+    def test_export_system_npz(self):
+        outfile = self.cr.export('root_cases', source='root', var_names=['y1', 'mda.d2.y2'],
+                                 fmt='npz')
+        self.assertEqual(outfile, 'root_cases.npz')
+
+        with np.load(outfile) as data:
+            self.assertEqual(sorted(data.files),
+                             sorted(['__metadata__', 'case', 'counter', 'timestamp', 'success',
+                                     'y1', 'mda.d2.y2']))
+            self.check_columns(data, 'root', ['y1', 'mda.d2.y2'], ['y1', 'mda.d2.y2'])
+
+    @unittest.skipUnless(pyarrow, "pyarrow is required.")
+    def test_export_parquet(self):
+        import pyarrow.parquet
+
+        outfile = self.cr.export('cases.parquet', var_names=['z', 'obj'], batch_size=3)
+
+        table = pyarrow.parquet.read_table(outfile)
+        self.assertEqual(table.column_names,
+                         ['case', 'counter', 'timestamp', 'success', 'z[0]', 'z[1]', 'obj'])
+        self.check_columns(table.to_pydict(), 'driver', ['z', 'obj'], ['z[0]', 'z[1]', 'obj'])
+
+        self.assertEqual(table.schema.field('z[1]').metadata[b'variable'], b'z')
+
+    @unittest.skipUnless(h5py, "h5py is required.")
+    def test_export_hdf5(self):
+        outfile = self.cr.export('cases.h5', var_names=['z', 'obj'], batch_size=3)
+
+        with h5py.File(outfile, 'r') as f:
+            cols = {name: f[name][:] for name in f}
+            cols['case'] = [name.decode('utf-8') for name in cols['case']]
+            self.check_columns(cols, 'driver', ['z', 'obj'], ['z[0]', 'z[1]', 'obj'])
+
+            self.assertEqual(f['z[1]'].attrs['variable'], 'z')
+
+    def test_export_cmd(self):
+        import argparse
+        from openmdao.recorders.case_export import _export_cases_setup_parser, \
+            _export_cases_cmd
+
+        parser = argparse.ArgumentParser()
+        _export_cases_setup_parser(parser)
+        options = parser.parse_args(['cases.sql', '-f', 'npz', '-v', 'x', '-v', 'obj'])
+
+        stdout = sys.stdout
+        strout = StringIO()
+        sys.stdout = strout
+        try:
+            _export_cases_cmd(options, [])
+        finally:
+            sys.stdout = stdout
+
+        self.assertEqual(strout.getvalue().strip(), "Cases exported to 'cases.npz'.")
+
+        with np.load('cases.npz') as data:
+            self.check_columns(data, 'driver', ['x', 'obj'], ['x', 'obj'])
+
+    def test_export_errors(self):
+        with self.assertRaises(ValueError) as cm:
+            self.cr.export('cases.csv', fmt='csv')
+        self.assertEqual(str(cm.exception),
+                         "Invalid format 'csv' for exporting cases. "
+                         "Must be one of ['parquet', 'hdf5', 'npz'].")
+
+        if pyarrow is None:
+            with self.assertRaises(RuntimeError) as cm:
+                self.cr.export('cases.parquet')
+            self.assertEqual(str(cm.exception),
+                             "pyarrow must be installed to export cases to a Parquet file.")
+
+        with self.assertRaises(RuntimeError) as cm:
+            self.cr.export('cases.npz', source='foo')
+        self.assertEqual(str(cm.exception), 'Source not found: foo')
+
+
 @use_tempdirs
 class TestPromAbsDict(unittest.TestCase):
 
@@ -443,6 +443,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : root",
             "        assembled_jac_type: csc",
             "        auto_order: False",
+            "        concurrent_external_codes: False",
             "    Subsystem : p1",
             "        distributed: False",
             "        run_root_only: False",
@@ -505,6 +506,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : root",
             "        assembled_jac_type: dense",
             "        auto_order: False",
+            "        concurrent_external_codes: False",
             ""
         ]
 
@@ -545,6 +547,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : root",
             "        assembled_jac_type: csc",
             "        auto_order: False",
+            "        concurrent_external_codes: False",
             "    Subsystem : p1",
             "        distributed: False",
             "        run_root_only: False",
@@ -607,6 +610,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : root",
             "        assembled_jac_type: dense",
             "        auto_order: False",
+            "        concurrent_external_codes: False",
             ""
         ]
 
@@ -1232,6 +1236,42 @@ class TestSqliteRecorder(unittest.TestCase):
                           expected_solver_output, expected_solver_residuals),)
         assertSolverIterDataRecorded(self, expected_data, self.eps, prefix='run_again')
 
+    def test_record_solver_plans(self):
+        prob = SellarProblem(nonlinear_solver=om.NonlinearBlockGS,
+                             linear_solver=om.ScipyKrylov)
+        prob.setup()
+
+        nl = prob.model.nonlinear_solver
+        nl.recording_options['record_solver_residuals'] = True
+        nl.add_recorder(self.recorder)
+
+        prob.run_model()
+
+        # the values of each kind of recorded variable are gathered into their own buffer
+        plans = {key[:2]: plan for key, (_, plan) in prob.model._record_plans.items()}
+        self.assertEqual(sorted(plans), [('input', 'nonlinear'), ('output', 'nonlinear'),
+                                         ('residual', 'nonlinear')])
+        bufs = {key: plan['buf'] for key, plan in plans.items()}
+        self.assertFalse(np.shares_memory(bufs['output', 'nonlinear'],
+                                          bufs['residual', 'nonlinear']))
+
+        # the plans are reused when running again
+        prob.run_model()
+        for key, (_, plan) in prob.model._record_plans.items():
+            self.assertIs(plan['buf'], bufs[key[:2]])
+        prob.cleanup()
+
+        cr = om.CaseReader(self.filename)
+        cases = cr.get_cases('root.nonlinear_solver')
+        self.assertGreater(len(cases), 2)
+
+        # each case holds the values of its own iteration
+        assert_near_equal(cases[0]['y1'], 25.58830237, 1e-2)
+        self.assertNotEqual(cases[0]['y1'][0], cases[1]['y1'][0])
+        assert_near_equal(cases[-1]['y1'], prob['y1'], 1e-12)
+        assert_near_equal(cases[-1]['x'], prob['x'], 1e-12)
+        self.assertNotEqual(cases[-1].residuals['y1'][0], cases[-2].residuals['y1'][0])
+
     def test_record_solver_includes_excludes(self):
         prob = om.Problem()
 
@@ -2941,8 +2981,9 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['name'], 'DOEDriver')
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
-                                               'invalid_desvar_behavior': 'warn',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'invalid_desvar_behavior': 'warn', 'memoize': 0,
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'hotstart_file': None})
 
         # Optimization
         driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-3)
@@ -2961,8 +3002,9 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['type'], 'optimization')
         self.assertEqual(metadata['options'], {"debug_print": [], "optimizer": "SLSQP",
                                                "tol": 1e-03, "maxiter": 200, "disp": True,
-                                               "invalid_desvar_behavior": "warn",
-                                                'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16})
+                                               "invalid_desvar_behavior": "warn", "memoize": 0,
+                                                'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16,
+                                               'hotstart_file': None})
         self.assertEqual(metadata['opt_settings'], {"maxiter": 1000})
 
     def test_feature_solver_options(self):
@@ -218,6 +218,8 @@ class PETScKrylov(LinearSolver):
         # changing the default maxiter from the base class
         self.options['maxiter'] = 100
 
+        self.supports['matrix_free'] = True
+
     def _assembled_jac_solver_iter(self):
         """
         Return a generator of linear solvers using assembled jacs.
@@ -299,9 +301,12 @@ class PETScKrylov(LinearSolver):
         x_vec.set_val(_get_petsc_vec_array(in_vec))
 
         # apply linear
-        scope_out, scope_in = system._get_matvec_scope()
-        system._apply_linear(self._assembled_jac, self._rel_systems, self._mode,
-                             scope_out, scope_in)
+        if self._jacvec is not None and self._mode == 'fwd':
+            self._jacvec()
+        else:
+            scope_out, scope_in = system._get_matvec_scope()
+            system._apply_linear(self._assembled_jac, self._rel_systems, self._mode,
+                                 scope_out, scope_in)
 
         # stuff resulting value of b vector into result for KSP
         result.array[:] = b_vec.asarray()
@@ -20,6 +20,10 @@ class ScipyKrylov(LinearSolver):
     """
     The Krylov iterative solvers in scipy.sparse.linalg.
 
+    With the recycle option, previous solutions are only used to deflate the initial guess of
+    each solve. Scipy's solvers can't be augmented with a recycled subspace, so the Krylov
+    iterations themselves are unchanged.
+
     Parameters
     ----------
     **kwargs : {}
@@ -29,6 +33,22 @@ class ScipyKrylov(LinearSolver):
     ----------
     precon : Solver
         Preconditioner for linear solve. Default is None for no preconditioner.
+    _lin_count : int
+        Number of times this solver has been linearized. Used to detect when the recycled
+        subspace was built with a different linear operator.
+    _op_lin_count : int or None
+        Linearization count of the linear operator used by the latest solve.
+    _op_solves : list of int
+        Number of solves done with the previous and with the current linear operator.
+    _recycle_space : dict
+        Recycled subspace for each mode, stored as a list of previous solutions, a list of the
+        corresponding products with the linear operator, and the linearization count at which
+        those products were computed.
+    _total_iter_count : int
+        Total number of iterations over all solves since setup.
+    _total_matvec_count : int
+        Total number of products with the linear operator since setup, including those used to
+        compute the recycled initial guesses.
     """
 
     SOLVER = 'LN: SCIPY'
@@ -42,6 +62,13 @@ class ScipyKrylov(LinearSolver):
         # initialize preconditioner to None
         self.precon = None
 
+        self._lin_count = 0
+        self._op_lin_count = None
+        self._op_solves = [0, 0]
+        self._recycle_space = {}
+        self._total_iter_count = 0
+        self._total_matvec_count = 0
+
     def _assembled_jac_solver_iter(self):
         """
         Return a generator of linear solvers using assembled jacs.
@@ -66,10 +93,25 @@ class ScipyKrylov(LinearSolver):
                                   'iteration cost, but may be necessary for convergence. This '
                                   'option applies only to gmres.')
 
+        self.options.declare('recycle', types=bool, default=False,
+                             desc='When True, solutions of previous solves are kept and used to '
+                                  'compute an initial guess for each new right-hand side by '
+                                  'minimizing the residual over their span. This warm starts all '
+                                  'solves whose initial guess would otherwise be zero. Only the '
+                                  'initial guess is deflated; the Krylov iterations are '
+                                  'unchanged.')
+
+        self.options.declare('recycle_size', default=10, types=int, lower=1,
+                             desc='Maximum number of previous solutions kept per mode when '
+                                  'recycle is True. Memory use is twice this number of vectors '
+                                  'per mode.')
+
         # changing the default maxiter from the base class
         self.options['maxiter'] = 1000
         self.options['atol'] = 1.0e-12
 
+        self.supports['matrix_free'] = True
+
     def _setup_solvers(self, system, depth):
         """
         Assign system instance, set depth, and optionally perform setup.
@@ -83,6 +125,12 @@ class ScipyKrylov(LinearSolver):
         """
         super()._setup_solvers(system, depth)
 
+        self._op_lin_count = None
+        self._op_solves = [0, 0]
+        self._recycle_space = {}
+        self._total_iter_count = 0
+        self._total_matvec_count = 0
+
         if self.precon is not None:
             self.precon._setup_solvers(self._system(), self._depth + 1)
 
@@ -120,6 +168,8 @@ class ScipyKrylov(LinearSolver):
         """
         Perform any required linearization operations such as matrix factorization.
         """
+        self._lin_count += 1
+
         if self.precon is not None:
             self.precon._linearize()
 
@@ -138,6 +188,7 @@ class ScipyKrylov(LinearSolver):
             the outgoing array after the product.
         """
         system = self._system()
+        self._total_matvec_count += 1
 
         if self._mode == 'fwd':
             x_vec = system._doutputs
@@ -147,9 +198,12 @@ class ScipyKrylov(LinearSolver):
             b_vec = system._doutputs
 
         x_vec.set_val(in_arr)
-        scope_out, scope_in = system._get_matvec_scope()
-        system._apply_linear(self._assembled_jac, self._rel_systems, self._mode,
-                             scope_out, scope_in)
+        if self._jacvec is not None and self._mode == 'fwd':
+            self._jacvec()
+        else:
+            scope_out, scope_in = system._get_matvec_scope()
+            system._apply_linear(self._assembled_jac, self._rel_systems, self._mode,
+                                 scope_out, scope_in)
 
         # DO NOT REMOVE: frequently used for debugging
         # print('in', in_arr)
@@ -209,6 +263,8 @@ class ScipyKrylov(LinearSolver):
 
         x_vec_combined = x_vec.asarray()
         size = x_vec_combined.size
+        b_combined = b_vec.asarray(True)
+        recycle = self.options['recycle'] and not system.under_complex_step
         linop = LinearOperator((size, size), dtype=float, matvec=self._mat_vec)
 
         # Support a preconditioner
@@ -217,23 +273,103 @@ class ScipyKrylov(LinearSolver):
         else:
             M = None
 
+        if recycle:
+            # in matrix-free mode the operator can change without a linearization
+            if self._jacvec is not None or self._op_lin_count != self._lin_count:
+                self._op_lin_count = self._lin_count
+                self._op_solves = [self._op_solves[1], 0]
+            self._op_solves[1] += 1
+
+            if not np.any(x_vec_combined):
+                x_vec_combined = self._recycled_guess(b_combined)
+
         self._iter_count = 0
         if solver is gmres:
             if Version(scipy.__version__) < Version("1.1"):
-                x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
+                x, info = solver(linop, b_combined, M=M, restart=restart,
                                  x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
                                  callback=self._monitor, callback_type='legacy')
             else:
-                x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
+                x, info = solver(linop, b_combined, M=M, restart=restart,
                                  x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
                                  callback=self._monitor, callback_type='legacy')
         else:
-            x, info = solver(linop, b_vec.asarray(True), M=M,
+            x, info = solver(linop, b_combined, M=M,
                              x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
                              callback=self._monitor, callback_type='legacy')
 
         fail |= (info != 0)
         x_vec.set_val(x)
+        self._total_iter_count += self._iter_count
+
+        if recycle and not fail and np.any(b_combined):
+            self._recycle_solution(x, b_combined)
+
+    def _recycled_guess(self, b):
+        """
+        Compute the initial guess that minimizes the residual over the recycled subspace.
+
+        If the linear operator has changed since the subspace was stored, its products with the
+        operator are recomputed first. Each of them costs an operator application, which only
+        pays off if the operator is used for several solves. If the previous operator was used for
+        a single solve, as under Newton or in matrix-free mode, only the latest solution is kept.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right-hand side of the current solve.
+
+        Returns
+        -------
+        ndarray
+            The initial guess.
+        """
+        size = b.size
+        if self._mode not in self._recycle_space:
+            return np.zeros(size)
+
+        xs, bs, lin_count = self._recycle_space[self._mode]
+
+        # in matrix-free mode the operator can change without a linearization
+        if lin_count != self._lin_count or self._jacvec is not None:
+            nkeep = len(xs) if self._op_solves[0] > 1 else min(len(xs), self._op_solves[0])
+            if nkeep == 0:
+                del self._recycle_space[self._mode]
+                return np.zeros(size)
+
+            xs = xs[-nkeep:]
+            bs = [self._mat_vec(x).copy() for x in xs]
+            self._recycle_space[self._mode] = (xs, bs, self._lin_count)
+
+        coefs = np.linalg.lstsq(np.array(bs).T, b, rcond=None)[0]
+        return np.array(xs).T.dot(coefs)
+
+    def _recycle_solution(self, x, b):
+        """
+        Add a converged solution to the recycled subspace, dropping the oldest if it is full.
+
+        Parameters
+        ----------
+        x : ndarray
+            The solution.
+        b : ndarray
+            The right-hand side it solves for.
+        """
+        if self._mode in self._recycle_space:
+            xs, bs, lin_count = self._recycle_space[self._mode]
+        else:
+            xs, bs, lin_count = [], [], self._lin_count
+
+        # if the stored products are stale they will all be recomputed before the next guess
+        xs.append(x.copy())
+        bs.append(b.copy())
+
+        nmax = self.options['recycle_size']
+        if len(xs) > nmax:
+            del xs[:-nmax]
+            del bs[:-nmax]
+
+        self._recycle_space[self._mode] = (xs, bs, lin_count)
 
     def _apply_precon(self, in_vec):
         """
@@ -188,6 +188,131 @@ class TestScipyKrylov(LinearSolverTests.LinearSolverTestCase):
         self.assertTrue(icount2 < icount1)
 
 
+class TestScipyKrylovRecycle(unittest.TestCase):
+
+    def _build(self, recycle, recycle_size=10, size=20):
+        rng = np.random.default_rng(11)
+        A = np.eye(size) * 4. + rng.random((size, size))
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('lin', om.LinearSystemComp(size=size))
+        model.linear_solver = om.ScipyKrylov(recycle=recycle, recycle_size=recycle_size)
+
+        prob.setup(mode='fwd')
+        prob.set_solver_print(level=0)
+
+        prob.set_val('lin.A', A)
+        prob.set_val('lin.b', np.arange(size, dtype=float))
+        prob.run_model()
+
+        return prob, A
+
+    def test_recycle_warm_start(self):
+        size = 20
+        prob, A = self._build(recycle=True, recycle_size=size, size=size)
+        ln = prob.model.linear_solver
+
+        J = prob.compute_totals(of=['lin.x'], wrt=['lin.b'])
+        assert_near_equal(J['lin.x', 'lin.b'], np.linalg.inv(A), 1e-9)
+        count1 = ln._total_iter_count
+
+        J = prob.compute_totals(of=['lin.x'], wrt=['lin.b'])
+        assert_near_equal(J['lin.x', 'lin.b'], np.linalg.inv(A), 1e-9)
+        count2 = ln._total_iter_count - count1
+
+        # every right-hand side is found in the recycled subspace
+        self.assertEqual(count2, 0)
+
+        prob, _ = self._build(recycle=False, size=size)
+        ln = prob.model.linear_solver
+        prob.compute_totals(of=['lin.x'], wrt=['lin.b'])
+        count1_no_recycle = ln._total_iter_count
+        prob.compute_totals(of=['lin.x'], wrt=['lin.b'])
+        self.assertEqual(ln._total_iter_count - count1_no_recycle, count1_no_recycle)
+
+    def test_recycle_size(self):
+        prob, A = self._build(recycle=True, recycle_size=5)
+        ln = prob.model.linear_solver
+
+        J = prob.compute_totals(of=['lin.x'], wrt=['lin.b'])
+        assert_near_equal(J['lin.x', 'lin.b'], np.linalg.inv(A), 1e-9)
+
+        # the memory used by the recycled subspace is bounded
+        xs, bs, _ = ln._recycle_space['fwd']
+        self.assertEqual(len(xs), 5)
+        self.assertEqual(len(bs), 5)
+
+    def test_recycle_operator_change(self):
+        size = 20
+        prob, A = self._build(recycle=True, size=size)
+
+        J = prob.compute_totals(of=['lin.x'], wrt=['lin.b'])
+        assert_near_equal(J['lin.x', 'lin.b'], np.linalg.inv(A), 1e-9)
+
+        # changing the operator invalidates the stored products, which are recomputed
+        A2 = A + np.diag(np.linspace(0., 1., size))
+        prob.set_val('lin.A', A2)
+        prob.run_model()
+
+        J = prob.compute_totals(of=['lin.x'], wrt=['lin.b'])
+        assert_near_equal(J['lin.x', 'lin.b'], np.linalg.inv(A2), 1e-9)
+
+        ln = prob.model.linear_solver
+        _, _, lin_count = ln._recycle_space['fwd']
+        self.assertEqual(lin_count, ln._lin_count)
+
+    def test_recycle_single_solve(self):
+        size = 20
+        rng = np.random.default_rng(11)
+        A = np.eye(size) * 4. + rng.random((size, size))
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('lin', om.LinearSystemComp(size=size))
+        model.add_design_var('lin.b', indices=[3])
+        model.add_objective('lin.x', index=0)
+        ln = model.linear_solver = om.ScipyKrylov(recycle=True)
+
+        prob.setup(mode='fwd')
+        prob.set_solver_print(level=0)
+        prob.set_val('lin.b', np.arange(size, dtype=float))
+
+        for i in range(12):
+            A2 = A + np.eye(size) * 0.01 * i
+            prob.set_val('lin.A', A2)
+            prob.run_model()
+
+            matvecs = ln._total_matvec_count
+            iters = ln._total_iter_count
+            J = prob.compute_totals()
+            assert_near_equal(J['lin.x', 'lin.b'], [[np.linalg.inv(A2)[0, 3]]], 1e-9)
+
+            # each linearization has a single solve, so only the latest solution is kept and only
+            # its product is recomputed
+            xs, bs, _ = ln._recycle_space['fwd']
+            self.assertLessEqual(len(xs), 2)
+            refresh = 1 if i > 0 else 0
+            self.assertLessEqual(ln._total_matvec_count - matvecs,
+                                 ln._total_iter_count - iters + 2 + refresh)
+
+    def test_recycle_rev(self):
+        size = 20
+        prob, A = self._build(recycle=True, size=size)
+        prob.setup(mode='rev')
+        prob.set_val('lin.A', A)
+        prob.set_val('lin.b', np.arange(size, dtype=float))
+        prob.run_model()
+
+        for i in range(2):
+            J = prob.compute_totals(of=['lin.x'], wrt=['lin.b'])
+            assert_near_equal(J['lin.x', 'lin.b'], np.linalg.inv(A), 1e-9)
+
+        self.assertIn('rev', prob.model.linear_solver._recycle_space)
+
+
 class TestScipyKrylovFeature(unittest.TestCase):
 
     def test_feature_simple(self):
@@ -267,6 +267,17 @@ class BroydenSolver(NonlinearSolver):
         if self.linesearch is not None:
             self.linesearch._set_solver_print(level=level, type_=type_)
 
+    def _solves_subsystem_batches(self):
+        """
+        Return True if this solver runs the subsystems of its group in concurrent batches.
+
+        Returns
+        -------
+        bool
+            True if the subsystems are run in the batches of _solver_subsystem_batch_iter.
+        """
+        return True
+
     def _linearize(self):
         """
         Perform any required linearization operations such as matrix factorization.
@@ -27,6 +27,12 @@ class NewtonSolver(NonlinearSolver):
         is the parent system's linear solver.
     linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _jacvec_point : tuple of ndarray or None
+        Inputs, outputs and residuals at the point where matrix-free Jacobian-vector products are
+        currently being computed.
+    _precon_age : int or None
+        Number of matrix-free Newton iterations since the model was last linearized for the
+        preconditioner, or None if it hasn't been linearized yet.
     """
 
     SOLVER = 'NL: Newton'
@@ -43,6 +49,9 @@ class NewtonSolver(NonlinearSolver):
         # Slot for linesearch
         self.linesearch = BoundsEnforceLS()
 
+        self._jacvec_point = None
+        self._precon_age = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -60,6 +69,23 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('matrix_free', types=bool, default=False,
+                             desc='When True, the products of the Jacobian with the search '
+                             'direction are approximated by a directional difference of the '
+                             'residuals, so the model is only linearized if the linear solver has '
+                             'a preconditioner. Requires a linear solver that supports matrix-free '
+                             'products, such as ScipyKrylov or PETScKrylov.')
+        self.options.declare('jacvec_method', default='fd', values=('fd', 'cs'),
+                             desc="Method used to approximate the matrix-free Jacobian-vector "
+                             "products, either 'fd' or 'cs'.")
+        self.options.declare('jacvec_step', default=None, allow_none=True,
+                             desc='Step size for the matrix-free Jacobian-vector products. For fd '
+                             'it is relative to the norms of the outputs and the direction and '
+                             'defaults to 1e-7. For cs it defaults to 1e-40.')
+        self.options.declare('precon_lag', types=int, default=1, lower=1,
+                             desc='When matrix_free is True, number of Newton iterations for which '
+                             'a linearization of the model is reused by the preconditioner of the '
+                             'linear solver.')
 
         self.supports['gradients'] = True
         self.supports['implicit_components'] = True
@@ -89,6 +115,14 @@ class NewtonSolver(NonlinearSolver):
         else:
             self.linear_solver = system.linear_solver
 
+        self._precon_age = None
+        if self.options['matrix_free']:
+            if self.linear_solver is None or not self.linear_solver.supports['matrix_free']:
+                raise RuntimeError(f"{self.msginfo}: Option 'matrix_free' requires a linear "
+                                   "solver that supports matrix-free products, such as "
+                                   "ScipyKrylov or PETScKrylov, but the linear solver is "
+                                   f"{type(self.linear_solver).__name__}.")
+
         if self.linesearch is not None:
             self.linesearch._setup_solvers(system, self._depth + 1)
 
@@ -121,6 +155,18 @@ class NewtonSolver(NonlinearSolver):
         if self.linesearch is not None:
             self.linesearch._set_solver_print(level=level, type_=type_)
 
+    def _solves_subsystem_batches(self):
+        """
+        Return True if this solver runs the subsystems of its group in concurrent batches.
+
+        Returns
+        -------
+        bool
+            True if the subsystems are solved, which is done in the batches of
+            _solver_subsystem_batch_iter.
+        """
+        return self.options['solve_subsystems'] is True
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
@@ -224,13 +270,16 @@ class NewtonSolver(NonlinearSolver):
         system._dresiduals *= -1.0
         my_asm_jac = self.linear_solver._assembled_jac
 
-        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-        if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
-            my_asm_jac._update(system)
+        if self.options['matrix_free']:
+            self._matrix_free_solve(do_sub_ln)
+        else:
+            system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+            if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
+                my_asm_jac._update(system)
 
-        self._linearize()
+            self._linearize()
 
-        self.linear_solver.solve('fwd')
+            self.linear_solver.solve('fwd')
 
         if self.linesearch and not system.under_complex_step:
             self.linesearch._do_subsolve = do_subsolve
@@ -250,6 +299,94 @@ class NewtonSolver(NonlinearSolver):
         # Enable local fd
         system._owns_approx_jac = approx_status
 
+    def _matrix_free_solve(self, do_sub_ln):
+        """
+        Solve for the Newton step using matrix-free Jacobian-vector products.
+
+        The model is only linearized if the linear solver has a preconditioner, and that
+        linearization is reused for 'precon_lag' iterations.
+
+        Parameters
+        ----------
+        do_sub_ln : bool
+            Flag indicating if the children should call linearize on their linear solvers.
+        """
+        system = self._system()
+        linear_solver = self.linear_solver
+
+        if linear_solver.precon is not None:
+            if self._precon_age is None or self._precon_age >= self.options['precon_lag']:
+                my_asm_jac = linear_solver._assembled_jac
+                system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+                if (my_asm_jac is not None and
+                        system.linear_solver._assembled_jac is not my_asm_jac):
+                    my_asm_jac._update(system)
+
+                self._linearize()
+                self._precon_age = 0
+
+            self._precon_age += 1
+
+        self._jacvec_point = (system._inputs.asarray(copy=True),
+                              system._outputs.asarray(copy=True),
+                              system._residuals.asarray(copy=True))
+        linear_solver._jacvec = self._apply_jacvec
+        try:
+            linear_solver.solve('fwd')
+        finally:
+            linear_solver._jacvec = None
+            self._jacvec_point = None
+
+    def _apply_jacvec(self):
+        """
+        Approximate the product of the Jacobian with d_outputs by a directional difference.
+
+        The result is placed in d_residuals.
+        """
+        system = self._system()
+        inputs, outputs, residuals = system._inputs, system._outputs, system._residuals
+        inputs0, outputs0, residuals0 = self._jacvec_point
+
+        vnorm = system._doutputs.get_norm()
+        if vnorm == 0.:
+            system._dresiduals.set_val(0.)
+            return
+
+        direction = system._doutputs.asarray(copy=True)
+        step = self.options['jacvec_step']
+
+        self._recording_iter.push(('_apply_jacvec', 0))
+        try:
+            if self.options['jacvec_method'] == 'cs' and not system.under_complex_step:
+                if not outputs._alloc_complex:
+                    raise RuntimeError(f"{self.msginfo}: To use complex step for matrix-free "
+                                       "Jacobian-vector products, specify "
+                                       "'force_alloc_complex=True' when calling setup on the "
+                                       "problem, e.g. 'problem.setup(force_alloc_complex=True)'")
+                delta = (1e-40 if step is None else step) / vnorm
+
+                system._set_complex_step_mode(True)
+                try:
+                    outputs.set_val(outputs0 + 1j * delta * direction)
+                    system._apply_nonlinear()
+                    jacvec = residuals.asarray().imag / delta
+                finally:
+                    system._set_complex_step_mode(False)
+            else:
+                delta = (1e-7 if step is None else step) * (1. + outputs.get_norm()) / vnorm
+
+                outputs.set_val(outputs0 + delta * direction)
+                system._apply_nonlinear()
+                jacvec = (residuals.asarray() - residuals0) / delta
+        finally:
+            self._recording_iter.pop()
+
+        system._dresiduals.set_val(jacvec)
+
+        inputs.set_val(inputs0)
+        outputs.set_val(outputs0)
+        residuals.set_val(residuals0)
+
     def _set_complex_step_mode(self, active):
         """
         Turn on or off complex stepping mode.
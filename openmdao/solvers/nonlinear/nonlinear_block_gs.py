@@ -53,6 +53,21 @@ class NonlinearBlockGS(NonlinearSolver):
             raise RuntimeError('{}: Nonlinear Gauss-Seidel cannot be used on a '
                                'parallel group.'.format(self.msginfo))
 
+        if self.options['use_aitken'] and self.options['use_anderson']:
+            raise RuntimeError(f"{self.msginfo}: Options 'use_aitken' and 'use_anderson' "
+                               "cannot both be True.")
+
+    def _solves_subsystem_batches(self):
+        """
+        Return True if this solver runs the subsystems of its group in concurrent batches.
+
+        Returns
+        -------
+        bool
+            True if the subsystems are run in the batches of _solver_subsystem_batch_iter.
+        """
+        return True
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -67,6 +82,13 @@ class NonlinearBlockGS(NonlinearSolver):
                              desc='upper limit for Aitken relaxation factor')
         self.options.declare('aitken_initial_factor', default=1.0,
                              desc='initial value for Aitken relaxation factor')
+        self.options.declare('use_anderson', types=bool, default=False,
+                             desc='set to True to use Anderson acceleration')
+        self.options.declare('anderson_depth', types=int, default=5, lower=1,
+                             desc='number of previous iterations used by Anderson acceleration')
+        self.options.declare('anderson_beta', default=1.0, lower=0.0, upper=1.0,
+                             desc='mixing parameter for Anderson acceleration; 1.0 takes the '
+                             'full fixed-point update and smaller values damp it')
         self.options.declare('cs_reconverge', types=bool, default=True,
                              desc='When True, when this driver solves under a complex step, nudge '
                              'the Solution vector by a small amount so that it reconverges.')
@@ -95,6 +117,9 @@ class NonlinearBlockGS(NonlinearSolver):
             self._delta_outputs_n_1 = system._outputs.asarray(copy=True)
             self._theta_n_1 = 1.
 
+        if self.options['use_anderson']:
+            self._anderson_initialize()
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration.
@@ -116,6 +141,11 @@ class NonlinearBlockGS(NonlinearSolver):
         outputs = system._outputs
         residuals = system._residuals
         use_aitken = self.options['use_aitken']
+        use_anderson = self.options['use_anderson']
+
+        if use_anderson:
+            # store a copy of the outputs, used as the previous point of the fixed-point iteration
+            anderson_outputs_n = outputs.asarray(copy=True)
 
         if use_aitken:
 
@@ -142,6 +172,9 @@ class NonlinearBlockGS(NonlinearSolver):
         self._gs_iter()
         self._solver_info.pop()
 
+        if use_anderson:
+            self._anderson_update(anderson_outputs_n)
+
         if use_aitken:
             # compute the change in the outputs after the NLBGS iteration
             delta_outputs_n -= outputs.asarray()
@@ -235,10 +268,8 @@ class NonlinearBlockGS(NonlinearSolver):
                 outputs_n = outputs.asarray(copy=True)
 
             self._solver_info.append_subsolver()
-            for subsys in system._solver_subsystem_iter(local_only=False):
-                system._transfer('nonlinear', 'fwd', subsys.name)
-                if subsys._is_local:
-                    subsys._solve_nonlinear()
+            for batch in system._solver_subsystem_batch_iter():
+                system._solve_subsystem_batch(batch)
 
             self._solver_info.pop()
             with system._unscaled_context(residuals=[residuals]):
@@ -16,11 +16,58 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('use_anderson', types=bool, default=False,
+                             desc='set to True to use Anderson acceleration')
+        self.options.declare('anderson_depth', types=int, default=5, lower=1,
+                             desc='number of previous iterations used by Anderson acceleration')
+        self.options.declare('anderson_beta', default=1.0, lower=0.0, upper=1.0,
+                             desc='mixing parameter for Anderson acceleration; 1.0 takes the '
+                             'full fixed-point update and smaller values damp it')
+
+    def _solves_subsystem_batches(self):
+        """
+        Return True if this solver runs the subsystems of its group in concurrent batches.
+
+        Returns
+        -------
+        bool
+            True if the subsystems are run in the batches of _solver_subsystem_batch_iter.
+        """
+        return True
+
+    def _iter_initialize(self):
+        """
+        Perform any necessary pre-processing operations.
+
+        Returns
+        -------
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        if self.options['use_anderson']:
+            self._anderson_initialize()
+
+        return super()._iter_initialize()
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
         """
         system = self._system()
+        use_anderson = self.options['use_anderson']
+
+        if use_anderson:
+            # store a copy of the outputs, used as the previous point of the fixed-point iteration
+            outputs_n = system._outputs.asarray(copy=True)
+
         self._solver_info.append_subsolver()
         system._transfer('nonlinear', 'fwd')
 
@@ -32,14 +79,20 @@ class NonlinearBlockJac(NonlinearSolver):
                     for subsys in system._subsystems_myproc:
                         subsys._solve_nonlinear()
             else:
-                for subsys in system._solver_subsystem_iter(local_only=True):
-                    subsys._solve_nonlinear()
+                for batch in system._solver_subsystem_jacobi_batch_iter():
+                    if len(batch) > 1:
+                        system._solve_subsystems_concurrently(batch)
+                    else:
+                        batch[0]._solve_nonlinear()
 
             rec.abs = 0.0
             rec.rel = 0.0
 
         self._solver_info.pop()
 
+        if use_anderson:
+            self._anderson_update(outputs_n)
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
@@ -47,6 +47,17 @@ class NonlinearRunOnce(NonlinearSolver):
             rec.abs = 0.0
             rec.rel = 0.0
 
+    def _solves_subsystem_batches(self):
+        """
+        Return True if this solver runs the subsystems of its group in concurrent batches.
+
+        Returns
+        -------
+        bool
+            True if the subsystems are run in the batches of _solver_subsystem_batch_iter.
+        """
+        return True
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -827,6 +827,157 @@ class TestNewton(unittest.TestCase):
         self.assertEqual(str(context.exception), msg)
 
 
+class TestNewtonMatrixFree(unittest.TestCase):
+
+    def _run_sellar(self, force_alloc_complex=False, **options):
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+
+        newton = model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                          matrix_free=True, **options)
+        newton.options['atol'] = 1e-10
+        newton.options['rtol'] = 1e-10
+        newton.linear_solver = om.ScipyKrylov()
+
+        prob.setup(force_alloc_complex=force_alloc_complex)
+        prob.run_model()
+
+        return prob
+
+    def test_sellar_fd(self):
+        prob = self._run_sellar()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+    def test_sellar_cs(self):
+        prob = self._run_sellar(force_alloc_complex=True, jacvec_method='cs')
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        # outputs are left real after the complex steps
+        self.assertFalse(prob.model._outputs._under_complex_step)
+
+    def test_sellar_precon_lag(self):
+        counts = {}
+        for lag in (1, 3):
+            prob = om.Problem(model=SellarDerivatives())
+            model = prob.model
+
+            newton = model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                              matrix_free=True, precon_lag=lag)
+            newton.options['atol'] = 1e-10
+            newton.options['rtol'] = 1e-10
+            newton.linear_solver = om.ScipyKrylov()
+            newton.linear_solver.precon = om.LinearBlockGS()
+
+            prob.setup()
+
+            ncalls = [0]
+            orig_linearize = model._linearize
+
+            def _linearize(*args, **kwargs):
+                ncalls[0] += 1
+                return orig_linearize(*args, **kwargs)
+
+            model._linearize = _linearize
+
+            prob.run_model()
+
+            assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+            assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+            counts[lag] = (ncalls[0], newton._iter_count)
+
+        ncalls1, niter1 = counts[1]
+        ncalls3, niter3 = counts[3]
+        self.assertEqual(ncalls1, niter1)
+        self.assertEqual(ncalls3, (niter3 + 2) // 3)
+        self.assertLess(ncalls3, ncalls1)
+
+    def test_sellar_no_precon_no_linearize(self):
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+
+        newton = model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                          matrix_free=True)
+        newton.linear_solver = om.ScipyKrylov()
+
+        prob.setup()
+
+        ncalls = [0]
+        orig_linearize = model._linearize
+
+        def _linearize(*args, **kwargs):
+            ncalls[0] += 1
+            return orig_linearize(*args, **kwargs)
+
+        model._linearize = _linearize
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+        self.assertEqual(ncalls[0], 0)
+
+    def test_compute_totals_after_matrix_free(self):
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+
+        newton = model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                          matrix_free=True)
+        newton.linear_solver = om.ScipyKrylov()
+        model.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        prob.run_model()
+
+        J = prob.compute_totals(of=['obj'], wrt=['x'])
+        assert_near_equal(J['obj', 'x'][0][0], 2.98061391, 1e-6)
+
+    def test_err_unsupported_linear_solver(self):
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+
+        newton = model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                          matrix_free=True)
+        newton.linear_solver = om.DirectSolver()
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NewtonSolver in <model> <class SellarDerivatives>: Option 'matrix_free' "
+                         "requires a linear solver that supports matrix-free products, such as "
+                         "ScipyKrylov or PETScKrylov, but the linear solver is DirectSolver.")
+
+    def test_err_cs_no_complex(self):
+        prob = om.Problem()
+        model = prob.model
+
+        # no ExecComps, so complex vectors are not allocated
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+
+        newton = model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                          matrix_free=True, jacvec_method='cs')
+        newton.linear_solver = om.ScipyKrylov()
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "NewtonSolver in <model> <class Group>: To use complex step "
+                         "for matrix-free Jacobian-vector products, specify "
+                         "'force_alloc_complex=True' when calling setup on the problem, e.g. "
+                         "'problem.setup(force_alloc_complex=True)'")
+
+
 class TestNewtonFeatures(unittest.TestCase):
 
     def test_feature_maxiter(self):
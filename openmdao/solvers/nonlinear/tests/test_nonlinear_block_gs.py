@@ -1,6 +1,8 @@
 """Test the Nonlinear Block Gauss Seidel solver. """
 
+import sys
 import unittest
+from io import StringIO
 
 import numpy as np
 
@@ -409,6 +411,106 @@ class TestNLBGaussSeidel(unittest.TestCase):
         J = prob.compute_totals(of=['y1'], wrt=['x'])
         assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
 
+    def test_NLBGS_Anderson(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        # plain Gauss-Seidel
+        self.assertEqual(model.nonlinear_solver._iter_count, 9)
+
+        model.nonlinear_solver.options['use_anderson'] = True
+        prob.set_val('y1', 1.0)
+        prob.set_val('y2', 1.0)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+        self.assertEqual(model.nonlinear_solver._iter_count, 5)
+
+    def test_NLBGS_Anderson_depth(self):
+
+        prob = om.Problem(model=DoubleSellar())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-10, rtol=1e-10, maxiter=100,
+                                                     use_anderson=True, anderson_depth=2)
+        model.g1.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True, anderson_beta=0.8)
+        model.g2.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True, anderson_beta=0.8)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('g1.y1'), 0.64, .00001)
+        assert_near_equal(prob.get_val('g1.y2'), 0.80, .00001)
+        assert_near_equal(prob.get_val('g2.y1'), 0.64, .00001)
+        assert_near_equal(prob.get_val('g2.y2'), 0.80, .00001)
+
+        # the history buffer is bounded by the depth
+        self.assertEqual(model.nonlinear_solver._anderson_hist.shape[1], 2)
+
+    def test_NLBGS_Anderson_print(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True)
+
+        prob.setup()
+        prob.set_solver_print(level=1)
+
+        stdout = sys.stdout
+        strout = StringIO()
+        sys.stdout = strout
+        try:
+            prob.run_model()
+        finally:
+            sys.stdout = stdout
+
+        lines = strout.getvalue().strip().split('\n')
+        self.assertEqual(lines[0], 'NL: NLBGS Converged in 5 iterations')
+        self.assertTrue(lines[1].startswith('NL: NLBGS Anderson acceleration: 3 of 5 iterations '
+                                            'accelerated, mean mixed/plain residual ratio '))
+
+    def test_NLBGS_Anderson_cs(self):
+
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=om.NonlinearBlockGS))
+
+        model = prob.model
+        model.approx_totals(method='cs', step=1e-10)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        model.nonlinear_solver.options['use_anderson'] = True
+        model.nonlinear_solver.options['atol'] = 1e-15
+        model.nonlinear_solver.options['rtol'] = 1e-15
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        J = prob.compute_totals(of=['y1'], wrt=['x'])
+        assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
+
+    def test_NLBGS_Aitken_and_Anderson_error(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        prob.model.nonlinear_solver = om.NonlinearBlockGS(use_aitken=True, use_anderson=True)
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockGS in <model> <class SellarDerivatives>: Options "
+                         "'use_aitken' and 'use_anderson' cannot both be True.")
+
     def test_NLBGS_cs(self):
 
         prob = om.Problem(model=SellarDerivatives(nonlinear_solver=om.NonlinearBlockGS))
@@ -544,6 +646,42 @@ class ProcTestCase1(unittest.TestCase):
         # Test that Aitken accelerated the convergence, normally takes 7.
         self.assertTrue(model.nonlinear_solver._iter_count == 6)
 
+    def test_anderson(self):
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        p1 = model.add_subsystem('p1', om.ParallelGroup(), promotes=['*'])
+        p1.add_subsystem('d1a', SellarDis1withDerivatives(), promotes=['x', 'z'])
+        p1.add_subsystem('d1b', SellarDis1withDerivatives(), promotes=['x', 'z'])
+
+        p2 = model.add_subsystem('p2', om.ParallelGroup(), promotes=['*'])
+        p2.add_subsystem('d2a', SellarDis2withDerivatives(), promotes=['z'])
+        p2.add_subsystem('d2b', SellarDis2withDerivatives(), promotes=['z'])
+
+        model.connect('d1a.y1', 'd2a.y1')
+        model.connect('d1b.y1', 'd2b.y1')
+        model.connect('d2a.y2', 'd1a.y2')
+        model.connect('d2b.y2', 'd1b.y2')
+
+        model.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True)
+
+        prob.setup()
+        prob.set_solver_print(level=2)
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('d1a.y1', get_remote=True), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('d1b.y1', get_remote=True), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('d2a.y2', get_remote=True), 12.05848819, .00001)
+        assert_near_equal(prob.get_val('d2b.y2', get_remote=True), 12.05848819, .00001)
+
+        # all procs take the same accelerated steps
+        iters = prob.comm.allgather(model.nonlinear_solver._iter_count)
+        self.assertEqual(iters[0], iters[1])
+
     def test_nonlinear_analysis_error(self):
 
         prob = om.Problem()
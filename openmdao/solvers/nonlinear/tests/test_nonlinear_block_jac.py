@@ -136,6 +136,40 @@ class TestNLBlockJacobi(unittest.TestCase):
         assert_near_equal(prob['y1'], 25.5886171567, .00001)
         assert_near_equal(prob['y2'], 12.05848819, .00001)
 
+    def test_anderson(self):
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.nonlinear_solver = om.NonlinearBlockJac(atol=1e-12, rtol=1e-12)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        prob.set_val('x', 1.)
+        prob.set_val('z', np.array([5.0, 2.0]))
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['y2'], 12.05848819, .00001)
+        iters = model.nonlinear_solver._iter_count
+
+        model.nonlinear_solver.options['use_anderson'] = True
+        prob.set_val('y1', 1.0)
+        prob.set_val('y2', 1.0)
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['y2'], 12.05848819, .00001)
+        self.assertLess(model.nonlinear_solver._iter_count, iters)
+        self.assertEqual(model.nonlinear_solver._anderson_steps,
+                         model.nonlinear_solver._iter_count - 1)
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestNonlinearBlockJacobiMPI(unittest.TestCase):
@@ -518,6 +518,19 @@ class NonlinearSolver(Solver):
 
     Attributes
     ----------
+    _anderson_count : int
+        Number of Anderson updates since the start of the current solve.
+    _anderson_hist : ndarray or None
+        Preallocated history of the changes in the fixed-point map outputs and residuals between
+        iterations. Only used if the Anderson acceleration option is turned on.
+    _anderson_prev : ndarray or None
+        Fixed-point map outputs and residuals from the previous iteration. Only used if the
+        Anderson acceleration option is turned on.
+    _anderson_reduction : float
+        Sum over the accelerated iterations of the ratio between the norms of the mixed and the
+        plain fixed-point residuals.
+    _anderson_steps : int
+        Number of accelerated iterations in the current solve.
     _err_cache : dict
         Dictionary holding input and output vectors at start of iteration, if requested.
     _output_cache : ndarray or None
@@ -537,6 +550,11 @@ class NonlinearSolver(Solver):
         self._output_cache = None
         self._prev_fail = False
         self._restarted = False
+        self._anderson_hist = None
+        self._anderson_prev = None
+        self._anderson_count = 0
+        self._anderson_steps = 0
+        self._anderson_reduction = 0.
 
     def _declare_options(self):
         """
@@ -580,6 +598,26 @@ class NonlinearSolver(Solver):
                 # reset to False so we won't waste memory allocating a cache array
                 self.options['restart_from_successful'] = False
 
+        if system._nonlinear_solver is self and 'concurrent_external_codes' in system.options \
+                and system.options['concurrent_external_codes'] \
+                and not self._solves_subsystem_batches():
+            issue_warning(f"{self.msginfo}: Option 'concurrent_external_codes' of {system.msginfo} "
+                          "does nothing, because this solver doesn't run the subsystems of the "
+                          "group.", category=SolverWarning)
+
+    def _solves_subsystem_batches(self):
+        """
+        Return True if this solver runs the subsystems of its group in concurrent batches.
+
+        Such solvers support the 'concurrent_external_codes' option of the group.
+
+        Returns
+        -------
+        bool
+            True if the subsystems are run in the batches of _solver_subsystem_batch_iter.
+        """
+        return False
+
     def solve(self):
         """
         Run the solver.
@@ -629,6 +667,8 @@ class NonlinearSolver(Solver):
         self._mpi_print_header()
 
         self._iter_count = 0
+        self._anderson_steps = 0
+        self._anderson_reduction = 0.
         norm0, norm = self._iter_initialize()
 
         self._norm0 = norm0
@@ -740,6 +780,11 @@ class NonlinearSolver(Solver):
             elif iprint == 2:
                 print(prefix + ' Converged')
 
+        if print_flag and iprint > 0 and self._anderson_steps > 0:
+            ratio = self._anderson_reduction / self._anderson_steps
+            print(prefix + f' Anderson acceleration: {self._anderson_steps} of {self._iter_count} '
+                  f'iterations accelerated, mean mixed/plain residual ratio {ratio:.3g}')
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
@@ -790,21 +835,105 @@ class NonlinearSolver(Solver):
             print(f"Inputs and outputs at start of iteration have been saved to '{filename}'.")
             sys.stdout.flush()
 
+    def _anderson_initialize(self):
+        """
+        Allocate or reset the history used for Anderson acceleration.
+        """
+        vals = self._system()._outputs.asarray()
+        shape = (2, self.options['anderson_depth'], vals.size)
+
+        hist = self._anderson_hist
+        if hist is None or hist.shape != shape or hist.dtype != vals.dtype:
+            self._anderson_hist = np.zeros(shape, dtype=vals.dtype)
+            self._anderson_prev = np.zeros((2, vals.size), dtype=vals.dtype)
+
+        self._anderson_count = 0
+
+    def _anderson_update(self, outputs_n):
+        """
+        Replace the outputs of the last fixed-point iteration with their Anderson mixture.
+
+        The mixture minimizes the norm of the linearized fixed-point residual over the span of
+        the last 'anderson_depth' iterations (Walker and Ni, "Anderson Acceleration for
+        Fixed-Point Iterations", SIAM J. Numer. Anal., 2011).
+
+        Parameters
+        ----------
+        outputs_n : ndarray
+            Output values before the last fixed-point iteration.
+        """
+        system = self._system()
+        outputs = system._outputs
+        depth = self.options['anderson_depth']
+        dg, df = self._anderson_hist
+        g_prev, f_prev = self._anderson_prev
+
+        g = outputs.asarray(copy=True)
+        f = g - outputs_n
+
+        count = self._anderson_count
+        if count > 0:
+            slot = (count - 1) % depth
+            np.subtract(g, g_prev, out=dg[slot])
+            np.subtract(f, f_prev, out=df[slot])
+        g_prev[:] = g
+        f_prev[:] = f
+        self._anderson_count += 1
+
+        nhist = min(count, depth)
+        if nhist == 0:
+            return
+
+        dg = dg[:nhist]
+        df = df[:nhist]
+
+        # Normal equations of the least squares problem min ||f - df.T gamma||, assembled from
+        # local products so that they can be summed across procs in a single reduction.
+        prods = np.empty(nhist * nhist + nhist + 1, dtype=f.dtype)
+        prods[:nhist * nhist] = df.dot(df.T).ravel()
+        prods[nhist * nhist:-1] = df.dot(f)
+        prods[-1] = f.dot(f)
+        if system.comm.size > 1:
+            prods = system.comm.allreduce(prods)
+
+        gram = prods[:nhist * nhist].reshape((nhist, nhist))
+        rhs = prods[nhist * nhist:-1]
+        f2 = prods[-1].real
+
+        # small regularization for nearly colinear history
+        reg = gram + np.eye(nhist) * (1e-12 * np.abs(np.trace(gram)) + 1e-300)
+        try:
+            gamma = np.linalg.solve(reg, rhs)
+        except np.linalg.LinAlgError:
+            # discard the history and keep the plain fixed-point update
+            self._anderson_count = 1
+            return
+
+        if f2 > 0.:
+            r2 = (f2 - 2. * gamma.dot(rhs) + gamma.dot(gram.dot(gamma))).real
+            self._anderson_reduction += np.sqrt(max(r2, 0.) / f2)
+            self._anderson_steps += 1
+
+        mixed = g - gamma.dot(dg)
+
+        beta = self.options['anderson_beta']
+        if beta != 1.:
+            mixed -= (1. - beta) * (f - gamma.dot(df))
+
+        outputs.set_val(mixed)
+
     def _gs_iter(self):
         """
         Perform a Gauss-Seidel iteration over this Solver's subsystems.
         """
         system = self._system()
-        for subsys in system._solver_subsystem_iter(local_only=False):
-            system._transfer('nonlinear', 'fwd', subsys.name)
-
-            if subsys._is_local:
-                try:
-                    subsys._solve_nonlinear()
-                except AnalysisError as err:
-                    if 'reraise_child_analysiserror' not in self.options or \
-                            self.options['reraise_child_analysiserror']:
-                        raise err
+        for batch in system._solver_subsystem_batch_iter():
+            try:
+                system._solve_subsystem_batch(batch)
+            except AnalysisError as err:
+                if 'reraise_child_analysiserror' not in self.options or \
+                        self.options['reraise_child_analysiserror']:
+                    raise err
 
     def _solve_with_cache_check(self):
         """
@@ -860,6 +989,10 @@ class LinearSolver(Solver):
         Names of systems relevant to the current solve.
     _assembled_jac : AssembledJacobian or None
         If not None, the AssembledJacobian instance used by this solver.
+    _jacvec : function or None
+        If not None, function called instead of the system's apply_linear to compute the
+        product of the Jacobian with the d_outputs vector into the d_residuals vector. Only used
+        in 'fwd' mode by solvers that support matrix-free products.
     _scope_in : set or None or _UNDEFINED
         Relevant input variables for the current matrix vector product.
     _scope_out : set or None or _UNDEFINED
@@ -872,6 +1005,7 @@ class LinearSolver(Solver):
         """
         self._rel_systems = None
         self._assembled_jac = None
+        self._jacvec = None
         self._scope_out = _UNDEFINED
         self._scope_in = _UNDEFINED
 
@@ -919,6 +1053,7 @@ class LinearSolver(Solver):
                              desc='Activates use of assembled jacobian by this solver.')
 
         self.supports.declare('assembled_jac', types=bool, default=True)
+        self.supports.declare('matrix_free', types=bool, default=False)
 
     def _setup_solvers(self, system, depth):
         """
@@ -2,6 +2,7 @@
 Routines to compute coloring for use with simultaneous derivatives.
 """
 import datetime
+import hashlib
 import io
 import itertools
 import os
@@ -20,6 +21,7 @@ from packaging.version import Version
 
 import numpy as np
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components, maximum_bipartite_matching
 
 from openmdao.core.constants import INT_DTYPE, _DEFAULT_OUT_STREAM
 from openmdao.utils.general_utils import _src_or_alias_dict, \
@@ -102,6 +104,10 @@ _DEF_COMP_SPARSITY_ARGS = {
 }
 
 
+# Sparsity matrices with at least this many nonzeros are colored with the sparse coloring
+# algorithms, which never build a column adjacency matrix.  See benchmark/benchmark_coloring.py.
+_SPARSE_COLORING_MIN_NNZ = 200
+
 # A dict containing colorings that have been generated during the current execution.
 # When a dynamic coloring is specified for a particular class and per_instance is False,
 # this dict can be checked for an existing class version of the coloring that can be used
@@ -1820,6 +1826,337 @@ def MNCO_bidir(J):
     return coloring
 
 
+def _sparse_nz_lists(J):
+    """
+    Return the CSR row lists and CSC column lists of a sparsity matrix.
+
+    Parameters
+    ----------
+    J : coo_matrix
+        Sparsity matrix without duplicate entries.
+
+    Returns
+    -------
+    tuple
+        (row pointers, column indices) of the CSR form of J.
+    tuple
+        (column pointers, row indices) of the CSC form of J.
+    """
+    data = np.ones(J.row.size, dtype=bool)
+    csr = csr_matrix((data, (J.row, J.col)), shape=J.shape)
+    csc = csc_matrix((data, (J.row, J.col)), shape=J.shape)
+    return (csr.indptr, csr.indices), (csc.indptr, csc.indices)
+
+
+class _BlockArgmax(object):
+    """
+    Track the first index of the largest value of an array that changes in place.
+
+    The array is split into blocks of about sqrt(n) entries and the max of each block is kept,
+    so finding the argmax and updating the values of a set of entries never requires a pass
+    over the whole array.
+
+    Parameters
+    ----------
+    vals : ndarray
+        Integer array of values.  It's modified in place through the update methods.
+
+    Attributes
+    ----------
+    vals : ndarray
+        Integer array of values.
+    _block_size : int
+        Number of entries in each block.
+    _block_max : ndarray
+        Max value of each block.
+    """
+
+    def __init__(self, vals):
+        """
+        Initialize the block maxima.
+        """
+        self.vals = vals
+        self._block_size = max(int(np.sqrt(vals.size)), 1)
+        if vals.size > 0:
+            self._block_max = np.maximum.reduceat(vals, np.arange(0, vals.size,
+                                                                  self._block_size))
+        else:
+            self._block_max = np.zeros(1, dtype=vals.dtype)
+
+    def argmax(self):
+        """
+        Return the first index of the largest value.
+
+        Returns
+        -------
+        int
+            Index of the largest value.
+        """
+        start = int(self._block_max.argmax()) * self._block_size
+        return start + int(self.vals[start:start + self._block_size].argmax())
+
+    def increase(self, inds, amount):
+        """
+        Increase the values at the given unique indices.
+
+        Parameters
+        ----------
+        inds : ndarray
+            Unique indices of the values to increase.
+        amount : int
+            Amount to add to each value.
+        """
+        self.vals[inds] += amount
+        np.maximum.at(self._block_max, inds // self._block_size, self.vals[inds])
+
+    def set(self, i, val):
+        """
+        Set the value at the given index, which may decrease the max of its block.
+
+        Parameters
+        ----------
+        i : int
+            Index of the value.
+        val : int
+            New value.
+        """
+        self.vals[i] = val
+        block = i // self._block_size
+        start = block * self._block_size
+        self._block_max[block] = self.vals[start:start + self._block_size].max()
+
+
+def _sparse_color_cols(J):
+    """
+    Compute a distance-2 coloring of the columns of J without building a column adjacency matrix.
+
+    Columns are colored greedily in incidence degree order, giving the same coloring as
+    _get_full_disjoint_cols, but the neighbors of each column are found from the row lists of
+    its nonzero rows and the column with the largest degree is found with a blocked argmax.
+    The cost is O(nnz * D), where D is the max number of nonzeros in a row, plus O(n**1.5) for
+    the ordering, instead of growing with the square of the density.
+
+    Parameters
+    ----------
+    J : coo_matrix
+        Sparsity matrix without duplicate entries.
+
+    Returns
+    -------
+    list
+        List of lists of disjoint columns.
+    """
+    ncols = J.shape[1]
+    (rptr, rinds), (cptr, cinds) = _sparse_nz_lists(J)
+
+    # colored columns and columns without nonzeros get a degree that's never the largest
+    done = -ncols - 1
+    degrees = np.where(np.diff(cptr) > 0, 0, done).astype(INT_DTYPE)
+    order = _BlockArgmax(degrees)
+
+    colors = np.full(ncols, -1, dtype=INT_DTYPE)
+
+    # marks[color] == col when a neighbor of col already has that color
+    marks = np.full(ncols + 1, -1, dtype=INT_DTYPE)
+    color_groups = []
+
+    for _ in range(np.count_nonzero(degrees == 0)):
+        col = order.argmax()
+
+        rows = cinds[cptr[col]:cptr[col + 1]]
+        if rows.size == 1:
+            nbrs = rinds[rptr[rows[0]]:rptr[rows[0] + 1]]
+        else:
+            # gather the row lists of all nonzero rows of col in one shot
+            starts = rptr[rows]
+            lens = rptr[rows + 1] - starts
+            ends = np.cumsum(lens)
+            idxs = np.arange(ends[-1]) + np.repeat(starts - ends + lens, lens)
+            nbrs = np.unique(rinds[idxs])
+
+        nbr_colors = colors[nbrs]
+        marks[nbr_colors[nbr_colors >= 0]] = col
+        color = int(np.argmax(marks[:len(color_groups) + 1] != col))
+
+        colors[col] = color
+        if color == len(color_groups):
+            color_groups.append([col])
+        else:
+            color_groups[color].append(col)
+
+        order.set(col, done)
+        uncolored = nbrs[nbr_colors < 0]
+        order.increase(uncolored[uncolored != col], 1)
+
+    return color_groups
+
+
+def _sparse_col2rows(Jprows, Jpcols, shape, aslist=False):
+    """
+    Return the nonzero rows of each column of a sparsity matrix.
+
+    Parameters
+    ----------
+    Jprows : ndarray
+        Nonzero rows of the matrix.
+    Jpcols : ndarray
+        Nonzero columns of the matrix.
+    shape : tuple
+        Shape of the matrix.
+    aslist : bool
+        If True, the rows of each column are returned as a list instead of an array.
+
+    Returns
+    -------
+    list
+        Sorted nonzero rows of each column, or None for columns without nonzeros.
+    """
+    csc = csc_matrix((np.ones(Jprows.size, dtype=bool), (Jprows, Jpcols)), shape=shape)
+    col2rows = [None] * shape[1]
+    cptr, cinds = csc.indptr, csc.indices
+    for col in np.nonzero(np.diff(cptr))[0].tolist():
+        rows = cinds[cptr[col]:cptr[col + 1]]
+        col2rows[col] = rows.tolist() if aslist else rows
+
+    return col2rows
+
+
+def _sparse_color_partition(Jprows, Jpcols, shape):
+    """
+    Compute a single directional fwd coloring of a partition, using sparse row and column lists.
+
+    This is the sparse counterpart of _color_partition.
+
+    Parameters
+    ----------
+    Jprows : ndarray
+        Nonzero rows of a partition of the matrix being colored.
+    Jpcols : ndarray
+        Nonzero columns of a partition of the matrix being colored.
+    shape : tuple
+        Shape of a partition of the matrix being colored.
+
+    Returns
+    -------
+    list
+        List of color groups.
+    list
+        List of nonzero rows for each column.
+    """
+    Jpart = coo_matrix((np.ones(Jprows.size, dtype=bool), (Jprows, Jpcols)), shape=shape)
+    col_groups = [sorted(group) for group in _sparse_color_cols(Jpart)]
+
+    return [col_groups, _sparse_col2rows(Jprows, Jpcols, shape)]
+
+
+def _sparse_MNCO_bidir(J):
+    """
+    Compute bidirectional coloring using MNCO, with sparse row and column lists.
+
+    This gives the same coloring as MNCO_bidir, but the rows and columns with the fewest
+    nonzeros are found with a blocked argmin and the remaining nonzeros are tracked with CSR/CSC
+    lists instead of being filtered from the full list of nonzeros at every step.
+
+    Parameters
+    ----------
+    J : coo_matrix
+        Jacobian sparsity matrix (boolean) without duplicate entries.
+
+    Returns
+    -------
+    Coloring
+        See docstring for Coloring class.
+    """
+    nrows, ncols = J.shape
+
+    coloring = Coloring(sparsity=J)
+
+    (rptr, rinds), (cptr, cinds) = _sparse_nz_lists(J)
+
+    M_row_nonzeros = np.diff(rptr).astype(INT_DTYPE)
+    M_col_nonzeros = np.diff(cptr).astype(INT_DTYPE)
+    row_removed = np.zeros(nrows, dtype=bool)
+    col_removed = np.zeros(ncols, dtype=bool)
+
+    # the rows and cols with the fewest nonzeros are the ones with the largest negated counts
+    row_order = _BlockArgmax(-M_row_nonzeros)
+    col_order = _BlockArgmax(-M_col_nonzeros)
+
+    Jf_rows = {}
+    Jr_cols = {}
+
+    remaining = J.row.size
+
+    r = row_order.argmax()
+    c = col_order.argmax()
+    nnz_r = M_row_nonzeros[r]
+    nnz_c = M_col_nonzeros[c]
+
+    Jf_nz_max = 0   # max row nonzeros in Jf
+    Jr_nz_max = 0   # max col nonzeros in Jr
+
+    # see MNCO_bidir for a description of the partitioning
+    while remaining > 0:
+        if ncols + Jr_nz_max + max(Jf_nz_max, nnz_r) < (nrows + Jf_nz_max + max(Jr_nz_max, nnz_c)):
+            cols = rinds[rptr[r]:rptr[r + 1]]
+            cols = cols[~col_removed[cols]]
+            Jf_rows[r] = cols
+            Jf_nz_max = max(nnz_r, Jf_nz_max)
+
+            row_removed[r] = True
+            M_row_nonzeros[r] = ncols + 1  # make sure we don't pick this one again
+            row_order.set(r, -ncols - 1)
+            M_col_nonzeros[cols] -= 1
+            col_order.increase(cols, 1)
+            remaining -= cols.size
+
+            r = row_order.argmax()
+            c = col_order.argmax()
+            nnz_r = M_row_nonzeros[r]
+        else:
+            rows = cinds[cptr[c]:cptr[c + 1]]
+            rows = rows[~row_removed[rows]]
+            Jr_cols[c] = rows
+            Jr_nz_max = max(nnz_c, Jr_nz_max)
+
+            col_removed[c] = True
+            M_col_nonzeros[c] = nrows + 1  # make sure we don't pick this one again
+            col_order.set(c, -nrows - 1)
+            M_row_nonzeros[rows] -= 1
+            row_order.increase(rows, 1)
+            remaining -= rows.size
+
+            r = row_order.argmax()
+            c = col_order.argmax()
+            nnz_c = M_col_nonzeros[c]
+
+    row_order = col_order = None
+
+    nnz_Jf = nnz_Jr = 0
+
+    if Jf_rows:
+        Jfr = np.hstack([np.full(cols.size, i, dtype=INT_DTYPE) for i, cols in Jf_rows.items()])
+        Jfc = np.hstack(list(Jf_rows.values()))
+        nnz_Jf = Jfc.size
+        Jf_rows = None
+        coloring._fwd = _sparse_color_partition(Jfr, Jfc, J.shape)
+        Jfr = Jfc = None
+
+    if Jr_cols:
+        Jrc = np.hstack([np.full(rows.size, i, dtype=INT_DTYPE) for i, rows in Jr_cols.items()])
+        Jrr = np.hstack(list(Jr_cols.values()))
+        nnz_Jr = Jrr.size
+        Jr_cols = None
+        coloring._rev = _sparse_color_partition(Jrc, Jrr, J.T.shape)
+
+    if J.row.size != nnz_Jf + nnz_Jr:
+        raise RuntimeError("Nonzero mismatch for J vs. Jf and Jr")
+
+    coloring._meta['bidirectional'] = True
+
+    return coloring
+
+
 def _tol_sweep(arr, tol=_DEF_COMP_SPARSITY_ARGS['tol'], orders=_DEF_COMP_SPARSITY_ARGS['orders']):
     """
     Find best tolerance 'around' tol to choose nonzero values of arr.
@@ -2014,6 +2351,257 @@ def _get_bool_total_jac(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_ja
     return coo_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=shape), info
 
 
+def _get_voi_entries(model, metadict, names, sizes):
+    """
+    Return the flat output indices of the entries of the given design vars or responses.
+
+    Parameters
+    ----------
+    model : <Group>
+        The top level model.
+    metadict : dict
+        Design var or response metadata from the driver.
+    names : list of str
+        Names of the variables, in row or column order of the total jacobian.
+    sizes : list of int
+        Size of each variable.
+
+    Returns
+    -------
+    list of (str, ndarray)
+        Absolute source name and flat indices into it for each variable.
+    """
+    lookup = {}
+    for meta in metadict.values():
+        lookup[meta['source']] = meta
+        lookup[meta['name']] = meta
+    # keys take precedence, since aliases of the same source differ only in their keys
+    lookup.update(metadict)
+
+    entries = []
+    for name, size in zip(names, sizes):
+        if name in lookup:
+            meta = lookup[name]
+            src = meta['source']
+            inds = meta['indices']
+            inds = np.arange(size) if inds is None else inds.as_array()
+        else:
+            src = model.get_source(name)
+            inds = np.arange(size)
+        entries.append((src, inds))
+
+    return entries
+
+
+def _get_symbolic_total_jac(prob, of, wrt):
+    """
+    Return the sparsity of the total jacobian, determined from the declared partials.
+
+    Boolean sparsity patterns of the declared partials are propagated through connections and
+    src_indices, without any linear solves. Residual entries are first matched to output entries
+    with a maximum bipartite matching, so that implicit components whose residuals don't depend
+    on their own outputs are handled correctly. A total derivative entry is then nonzero if its
+    response entry can be reached from its design var entry in the resulting dependency graph,
+    where coupled (strongly connected) blocks are collapsed before propagating.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    of : list of str
+        Names of response variables.
+    wrt : list of str
+        Names of design variables.
+
+    Returns
+    -------
+    coo_matrix or None
+        Boolean sparsity of the total jacobian, or None if it can't be determined
+        symbolically for this model.
+    dict
+        Metadata about the sparsity computation.
+    """
+    from openmdao.core.component import Component
+    from openmdao.core.explicitcomponent import ExplicitComponent
+    from openmdao.core.group import Group
+
+    model = prob.model
+    driver = prob.driver
+
+    start_time = time.perf_counter()
+    info = {'type': 'total', 'sparsity_method': 'symbolic'}
+
+    if model.comm.size > 1 or model._has_distrib_vars:
+        return None, info
+
+    abs2meta_out = model._var_allprocs_abs2meta['output']
+    abs2meta_in = model._var_abs2meta['input']
+    conns = model._conn_global_abs_in2out
+
+    out_offsets = {}
+    nout = 0
+    for name, meta in abs2meta_out.items():
+        out_offsets[name] = nout
+        nout += meta['size']
+
+    # for each input, the flat output indices of its source entries
+    in_srcs = {}
+    for name, meta in abs2meta_in.items():
+        src = conns[name]
+        src_inds = meta['src_indices']
+        if src_inds is None:
+            in_srcs[name] = out_offsets[src] + np.arange(meta['size'])
+        else:
+            in_srcs[name] = out_offsets[src] + src_inds.as_array()
+
+    def _col_entries(wrt_name):
+        if wrt_name in in_srcs:
+            return in_srcs[wrt_name]
+        return out_offsets[wrt_name] + np.arange(abs2meta_out[wrt_name]['size'])
+
+    rows = []
+    cols = []
+
+    def _add_dense(of_names, wrt_names):
+        r = np.concatenate([out_offsets[n] + np.arange(abs2meta_out[n]['size'])
+                            for n in of_names])
+        c = np.concatenate([_col_entries(n) for n in wrt_names])
+        rows.append(np.repeat(r, c.size))
+        cols.append(np.tile(c, r.size))
+
+    # groups that approximate their partials may contain components that declare none, so
+    # treat them as dense blocks
+    dense_groups = [s for s in model.system_iter(recurse=True, typ=Group)
+                    if s._owns_approx_jac]
+    dense_prefixes = tuple(s.pathname + '.' for s in dense_groups)
+    for group in dense_groups:
+        outs = list(group._var_abs2meta['output'])
+        ins = list(group._var_abs2meta['input'])
+        _add_dense(outs, outs + ins)
+
+    for comp in model.system_iter(recurse=True, typ=Component):
+        if comp.pathname.startswith(dense_prefixes):
+            continue
+        if comp.matrix_free:
+            outs = list(comp._var_abs2meta['output'])
+            ins = list(comp._var_abs2meta['input'])
+            if isinstance(comp, ExplicitComponent):
+                for n in outs:
+                    r = out_offsets[n] + np.arange(abs2meta_out[n]['size'])
+                    rows.append(r)
+                    cols.append(r)
+                if ins:
+                    _add_dense(outs, ins)
+            else:
+                _add_dense(outs, outs + ins)
+
+    for (of_name, wrt_name), meta in model._subjacs_info.items():
+        if of_name.startswith(dense_prefixes):
+            continue
+
+        row_offset = out_offsets[of_name]
+        col_entries = _col_entries(wrt_name)
+
+        if meta['rows'] is not None:
+            r, c = meta['rows'], meta['cols']
+        elif meta.get('sparsity') is not None:
+            r, c = meta['sparsity'][:2]
+        else:
+            nrows, ncols = meta['shape']
+            r = np.repeat(np.arange(nrows), ncols)
+            c = np.tile(np.arange(ncols), nrows)
+
+        rows.append(row_offset + np.asarray(r))
+        cols.append(col_entries[np.asarray(c)])
+
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=INT_DTYPE)
+    cols = np.concatenate(cols) if cols else np.zeros(0, dtype=INT_DTYPE)
+
+    # structure of d(residuals)/d(outputs)
+    A = csr_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(nout, nout))
+
+    # match each residual entry to the output entry it determines
+    match = maximum_bipartite_matching(A, perm_type='column')
+    if np.any(match < 0):
+        # structurally singular, so sparsity can't be determined symbolically
+        return None, info
+
+    # output entry match[i] depends on every output entry in row i of A
+    A = A.tocoo()
+    graph = csr_matrix((np.ones(A.nnz, dtype=bool), (A.col, match[A.row])), shape=(nout, nout))
+
+    nscc, labels = connected_components(graph, directed=True, connection='strong')
+
+    graph = graph.tocoo()
+    src_scc = labels[graph.row]
+    tgt_scc = labels[graph.col]
+    mask = src_scc != tgt_scc
+    dag = csr_matrix((np.ones(np.count_nonzero(mask), dtype=bool),
+                      (src_scc[mask], tgt_scc[mask])), shape=(nscc, nscc))
+    dag.sum_duplicates()
+    indptr, succs = dag.indptr, dag.indices
+
+    wrt_entries = _get_voi_entries(model, driver._designvars, wrt,
+                                   _get_desvar_info(driver, wrt)[1])
+    of_entries = _get_voi_entries(model, driver._responses, of,
+                                  _get_response_info(driver, of)[1])
+
+    # set of design var columns that can reach each coupled block, as bits of an int
+    bits = [0] * nscc
+    col = 0
+    for src, inds in wrt_entries:
+        for scc in labels[out_offsets[src] + inds]:
+            bits[scc] |= 1 << col
+            col += 1
+    ncols = col
+
+    row_sccs = [labels[out_offsets[src] + inds] for src, inds in of_entries]
+    keep = np.zeros(nscc, dtype=bool)
+    for sccs in row_sccs:
+        keep[sccs] = True
+
+    # propagate in topological order, dropping bits that are no longer needed
+    indegree = np.bincount(succs, minlength=nscc)
+    stack = list(np.nonzero(indegree == 0)[0])
+    while stack:
+        scc = stack.pop()
+        b = bits[scc]
+        for succ in succs[indptr[scc]:indptr[scc + 1]]:
+            if b:
+                bits[succ] |= b
+            indegree[succ] -= 1
+            if indegree[succ] == 0:
+                stack.append(succ)
+        if not keep[scc]:
+            bits[scc] = 0
+
+    nbytes = (ncols + 7) // 8
+    nzrows = []
+    nzcols = []
+    row = 0
+    for sccs in row_sccs:
+        for scc in sccs:
+            if bits[scc]:
+                c = np.nonzero(np.unpackbits(np.frombuffer(bits[scc].to_bytes(nbytes, 'little'),
+                                                           dtype=np.uint8),
+                                             bitorder='little')[:ncols])[0]
+                nzrows.append(np.full(c.size, row))
+                nzcols.append(c)
+            row += 1
+
+    shape = (row, ncols)
+    nzrows = np.concatenate(nzrows) if nzrows else np.zeros(0, dtype=INT_DTYPE)
+    nzcols = np.concatenate(nzcols) if nzcols else np.zeros(0, dtype=INT_DTYPE)
+
+    info['sparsity_time'] = time.perf_counter() - start_time
+
+    print(f"Total jacobian sparsity was determined from declared partials, taking "
+          f"{info['sparsity_time']:f} seconds.")
+    print("Total jacobian shape:", shape, "\n")
+
+    return coo_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=shape), info
+
+
 def _get_desvar_info(driver, names=None):
     if names is None:
         vnames = []
@@ -2071,7 +2659,32 @@ def _get_response_info(driver, names=None):
     return names, list(namesdict.values())
 
 
-def _compute_coloring(J, mode):
+def _get_coloring_algorithm(nnz, algorithm='auto'):
+    """
+    Return the coloring algorithm to use for a sparsity matrix with the given number of nonzeros.
+
+    Parameters
+    ----------
+    nnz : int
+        Number of nonzeros in the sparsity matrix.
+    algorithm : str
+        One of 'auto', 'adjacency' or 'sparse'.  If 'auto', 'sparse' is chosen when nnz is at
+        least _SPARSE_COLORING_MIN_NNZ.
+
+    Returns
+    -------
+    str
+        Either 'adjacency' or 'sparse'.
+    """
+    if algorithm == 'auto':
+        return 'sparse' if nnz >= _SPARSE_COLORING_MIN_NNZ else 'adjacency'
+    if algorithm not in ('adjacency', 'sparse'):
+        raise ValueError(f"Coloring algorithm must be one of ['auto', 'adjacency', 'sparse'], "
+                         f"but '{algorithm}' was given.")
+    return algorithm
+
+
+def _compute_coloring(J, mode, algorithm='auto'):
     """
     Compute a good coloring in a specified dominant direction.
 
@@ -2082,6 +2695,10 @@ def _compute_coloring(J, mode):
     mode : str
         The direction for solving for total derivatives.  Must be 'fwd', 'rev' or 'auto'.
         If 'auto', use bidirectional coloring.
+    algorithm : str
+        Coloring algorithm.  'adjacency' builds a column adjacency matrix, 'sparse' only uses
+        CSR/CSC row and column lists, which scales much better for large matrices, and 'auto'
+        picks one of them based on the number of nonzeros.
 
     Returns
     -------
@@ -2094,17 +2711,22 @@ def _compute_coloring(J, mode):
     except RuntimeError:
         start_mem = None
 
-    if mode == 'auto':  # use bidirectional coloring
-        if isinstance(J, np.ndarray):
-            nzrows, nzcols = np.nonzero(J)
-            J = coo_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
+    if isinstance(J, np.ndarray):
+        nzrows, nzcols = np.nonzero(J)
+        J = coo_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
+
+    algorithm = _get_coloring_algorithm(J.row.size, algorithm)
 
-        coloring = MNCO_bidir(J)
-        fallback = _compute_coloring(J, 'fwd')
+    if mode == 'auto':  # use bidirectional coloring
+        if algorithm == 'sparse':
+            coloring = _sparse_MNCO_bidir(J)
+        else:
+            coloring = MNCO_bidir(J)
+        fallback = _compute_coloring(J, 'fwd', algorithm)
         if coloring.total_solves() >= fallback.total_solves():
             coloring = fallback
             coloring._meta['fallback'] = True
-        fallback = _compute_coloring(J, 'rev')
+        fallback = _compute_coloring(J, 'rev', algorithm)
         if coloring.total_solves() > fallback.total_solves():
             coloring = fallback
             coloring._meta['fallback'] = True
@@ -2114,6 +2736,7 @@ def _compute_coloring(J, mode):
         coloring._meta['coloring_time'] = time.perf_counter() - start_time
         if start_mem is not None:
             coloring._meta['coloring_memory'] = mem_usage() - start_mem
+        coloring._meta['coloring_algorithm'] = algorithm
 
         return coloring
 
@@ -2126,24 +2749,25 @@ def _compute_coloring(J, mode):
 
     nrows, ncols = J.shape
 
-    if isinstance(J, np.ndarray):
-        nzrows, nzcols = np.nonzero(J)
-        J = coo_matrix((np.ones(nzrows.size), (nzrows, nzcols)), shape=J.shape)
-
     nzrows, nzcols = J.row, J.col
-    col_groups = _get_full_disjoint_cols(J)
 
-    col2rows = [None] * ncols  # will contain list of nonzero rows for each column
+    if algorithm == 'sparse':
+        col_groups = _sparse_color_cols(J)
+        col2rows = _sparse_col2rows(nzrows, nzcols, J.shape, aslist=True)
+    else:
+        col_groups = _get_full_disjoint_cols(J)
 
-    for r, c in zip(nzrows, nzcols):
-        if col2rows[c] is None:
-            col2rows[c] = [r]
-        else:
-            col2rows[c].append(r)
+        col2rows = [None] * ncols  # will contain list of nonzero rows for each column
+
+        for r, c in zip(nzrows, nzcols):
+            if col2rows[c] is None:
+                col2rows[c] = [r]
+            else:
+                col2rows[c].append(r)
 
-    for c, rows in enumerate(col2rows):
-        if rows is not None:
-            col2rows[c] = sorted(rows)
+        for c, rows in enumerate(col2rows):
+            if rows is not None:
+                col2rows[c] = sorted(rows)
 
     if rev:
         coloring._rev = (col_groups, col2rows)
@@ -2153,6 +2777,7 @@ def _compute_coloring(J, mode):
     coloring._meta['coloring_time'] = time.perf_counter() - start_time
     if start_mem is not None:
         coloring._meta['coloring_memory'] = mem_usage() - start_mem
+    coloring._meta['coloring_algorithm'] = algorithm
 
     return coloring
 
@@ -2161,7 +2786,7 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
                            num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'],
                            tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                            orders=_DEF_COMP_SPARSITY_ARGS['orders'],
-                           setup=False, run_model=False, fname=None):
+                           setup=False, run_model=False, fname=None, sparsity_method='numeric'):
     """
     Compute simultaneous derivative colorings for the total jacobian of the given problem.
 
@@ -2187,12 +2812,20 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         If True, run run_model before calling compute_totals.
     fname : filename or None
         File where output coloring info will be written. If None, no info will be written.
+    sparsity_method : str
+        How to determine the sparsity of the total jacobian. 'numeric' computes 'num_full_jacs'
+        total jacobians. 'symbolic' propagates the sparsity of the declared partials through the
+        model without any linear solves, and falls back to 'numeric' if that isn't possible.
 
     Returns
     -------
     Coloring
         See docstring for Coloring class.
     """
+    if sparsity_method not in ('numeric', 'symbolic'):
+        raise ValueError(f"sparsity_method must be 'numeric' or 'symbolic', but "
+                         f"'{sparsity_method}' was given.")
+
     driver = problem.driver
 
     # if of and wrt are None, which is True in the case of dynamic coloring, ofs will be the
@@ -2228,10 +2861,22 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         coloring = model._compute_coloring(wrt_patterns='*', method=list(model._approx_schemes)[0],
                                            num_full_jacs=num_full_jacs, tol=tol, orders=orders)[0]
     else:
-        J, sparsity_info = _get_bool_total_jac(problem, num_full_jacs=num_full_jacs, tol=tol,
-                                               orders=orders, setup=setup,
-                                               run_model=run_model, of=ofs, wrt=wrts,
-                                               use_abs_names=True)
+        J = None
+        if sparsity_method == 'symbolic':
+            if setup:
+                problem.setup(mode=problem._mode)
+                problem.final_setup()
+            J, sparsity_info = _get_symbolic_total_jac(problem, ofs, wrts)
+            if J is None:
+                print("Total jacobian sparsity can't be determined from declared partials for "
+                      "this model. Computing it numerically instead.")
+                setup = False
+
+        if J is None:
+            J, sparsity_info = _get_bool_total_jac(problem, num_full_jacs=num_full_jacs,
+                                                   tol=tol, orders=orders, setup=setup,
+                                                   run_model=run_model, of=ofs, wrt=wrts,
+                                                   use_abs_names=True)
         coloring = _compute_coloring(J, mode)
         if coloring is not None:
             coloring._row_vars = ofs
@@ -2265,6 +2910,170 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
     return coloring
 
 
+def _update_structure_hash(hasher, item):
+    """
+    Add an item describing part of the structure of a model to a hash.
+
+    Parameters
+    ----------
+    hasher : hash object
+        The hash being computed.
+    item : object
+        An ndarray, or any object with a repr that doesn't depend on its identity.
+    """
+    if isinstance(item, np.ndarray):
+        hasher.update(str((item.dtype, item.shape)).encode())
+        hasher.update(np.ascontiguousarray(item).tobytes())
+    else:
+        hasher.update(repr(item).encode())
+
+
+def _get_structure_hash(system, settings):
+    """
+    Return a hash of the parts of the structure of a system that its colorings depend on.
+
+    This covers the class of each subsystem, the names, shapes and connections of the variables
+    and the declared sparsity of the partials, with names relative to the given system so that
+    all instances of a class get the same hash.
+
+    Parameters
+    ----------
+    system : <System>
+        System whose structure is hashed.
+    settings : list
+        Other items included in the hash, for example the coloring settings and the of/wrt
+        variables.
+
+    Returns
+    -------
+    str
+        Hex digest of the hash.
+    """
+    from openmdao import __version__
+
+    hasher = hashlib.sha1()
+
+    nprefix = len(system.pathname) + 1 if system.pathname else 0
+
+    _update_structure_hash(hasher, __version__)
+
+    for s in system.system_iter(include_self=True, recurse=True):
+        _update_structure_hash(hasher, (s.pathname[nprefix:], type(s).__module__,
+                                        type(s).__qualname__))
+
+    for io in ('input', 'output'):
+        for name, meta in system._var_allprocs_abs2meta[io].items():
+            _update_structure_hash(hasher, (name[nprefix:], meta['shape'], meta['distributed']))
+
+    for tgt, src in system._conn_global_abs_in2out.items():
+        _update_structure_hash(hasher, (tgt[nprefix:], src[nprefix:]))
+        src_indices = system._var_abs2meta['input'].get(tgt, {}).get('src_indices')
+        if src_indices is not None:
+            try:
+                _update_structure_hash(hasher, src_indices.as_array())
+            except Exception:
+                _update_structure_hash(hasher, str(src_indices))
+
+    for (of, wrt), meta in system._subjacs_info.items():
+        _update_structure_hash(hasher, (of[nprefix:], wrt[nprefix:], meta['shape'],
+                                        meta.get('dependent'), meta.get('method')))
+        for key in ('rows', 'cols'):
+            if meta.get(key) is not None:
+                _update_structure_hash(hasher, np.asarray(meta[key]))
+
+    for item in settings:
+        _update_structure_hash(hasher, item)
+
+    return hasher.hexdigest()
+
+
+def _get_coloring_cache_fname(system, kind, settings):
+    """
+    Return the name of the cache file for the coloring of the given system.
+
+    Parameters
+    ----------
+    system : <System>
+        System being colored.  For a total coloring this is the model.
+    kind : str
+        Either 'total' or 'partial'.
+    settings : list
+        Coloring settings and other items that the coloring depends on.
+
+    Returns
+    -------
+    str or None
+        Name of the cache file, or None if coloring caching is not active.
+    """
+    cache_dir = system._problem_meta.get('coloring_cache_dir')
+    if cache_dir is None:
+        return None
+
+    return os.path.join(cache_dir, f"{kind}_coloring_{_get_structure_hash(system, settings)}.pkl")
+
+
+def _load_cached_coloring(fname):
+    """
+    Load a coloring from the coloring cache.
+
+    Parameters
+    ----------
+    fname : str or None
+        Name of the cache file.
+
+    Returns
+    -------
+    Coloring or None
+        The cached coloring, or None if there is no valid coloring in the cache file.
+    """
+    if fname is None or not os.path.isfile(fname):
+        return None
+
+    try:
+        return Coloring.load(fname)
+    except Exception as err:
+        issue_warning(f"Ignoring coloring cache file '{fname}': {err}",
+                      category=DerivativesWarning)
+
+
+def _get_total_coloring_cache_fname(driver):
+    """
+    Return the name of the cache file for the total coloring of the given driver.
+
+    Parameters
+    ----------
+    driver : <Driver>
+        Driver whose total jacobian is being colored.
+
+    Returns
+    -------
+    str or None
+        Name of the cache file, or None if coloring caching is not active.
+    """
+    problem = driver._problem()
+    model = problem.model
+    info = driver._coloring_info
+
+    if model._problem_meta.get('coloring_cache_dir') is None or model._approx_schemes:
+        # colorings of approximated totals are partial colorings of the model
+        return None
+
+    ofs, of_sizes = _get_response_info(driver)
+    wrts, wrt_sizes = _get_desvar_info(driver)
+
+    settings = [problem._mode]
+    for name in ('num_full_jacs', 'tol', 'orders', 'sparsity_method'):
+        settings.append((name, info.get(name)))
+    for names, sizes, metadict in ((ofs, of_sizes, driver._responses),
+                                   (wrts, wrt_sizes, driver._designvars)):
+        settings.append(names)
+        for src, inds in _get_voi_entries(model, metadict, names, sizes):
+            settings.append(src)
+            settings.append(inds)
+
+    return _get_coloring_cache_fname(model, 'total', settings)
+
+
 def dynamic_total_coloring(driver, run_model=True, fname=None):
     """
     Compute simultaneous deriv coloring during runtime.
@@ -2297,9 +3106,27 @@ def dynamic_total_coloring(driver, run_model=True, fname=None):
                                               _DEF_COMP_SPARSITY_ARGS['num_full_jacs'])
     tol = driver._coloring_info.get('tol', _DEF_COMP_SPARSITY_ARGS['tol'])
     orders = driver._coloring_info.get('orders', _DEF_COMP_SPARSITY_ARGS['orders'])
+    sparsity_method = driver._coloring_info.get('sparsity_method', 'numeric')
+
+    cache_fname = _get_total_coloring_cache_fname(driver)
+    coloring = _load_cached_coloring(cache_fname)
 
-    coloring = compute_total_coloring(problem, num_full_jacs=num_full_jacs, tol=tol, orders=orders,
-                                      setup=False, run_model=run_model, fname=fname)
+    if coloring is not None:
+        try:
+            coloring._check_config_total(driver)
+        except RuntimeError:
+            coloring = None
+
+    if coloring is not None:
+        print(f"Loaded total coloring from cache file {cache_fname}")
+        if fname is not None and problem.comm.rank == 0:
+            coloring.save(fname)
+    else:
+        coloring = compute_total_coloring(problem, num_full_jacs=num_full_jacs, tol=tol,
+                                          orders=orders, setup=False, run_model=run_model,
+                                          fname=fname, sparsity_method=sparsity_method)
+        if coloring is not None and cache_fname is not None and problem.comm.rank == 0:
+            coloring.save(cache_fname)
 
     if coloring is not None:
         if not problem.model._approx_schemes:  # avoid double display
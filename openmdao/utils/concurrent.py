@@ -3,12 +3,18 @@ Utilities for submitting function evaluations under MPI.
 """
 import os
 import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from itertools import chain, islice
 
 from openmdao.utils.mpi import debug
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
+# function evaluated by the workers of a local process pool.  It is inherited by the forked
+# workers, so it never has to be pickled.
+_pool_func = None
+
 
 def concurrent_eval_lb(func, cases, comm, broadcast=False):
     """
@@ -252,3 +258,148 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
                 results = None
 
     return results
+
+
+def concurrent_eval_async(func, next_case, on_result, comm=None, num_procs=1, initializer=None):
+    """
+    Evaluate cases asynchronously, generating each new case as soon as a worker becomes free.
+
+    Unlike concurrent_eval_lb, the cases are not known up front.  Whenever a worker finishes a
+    case, on_result is called with its result and next_case is called to get the next case for
+    that worker, so later cases can depend on the results of earlier ones.
+
+    Under MPI, rank 0 is the master and only calls next_case and on_result, while the other
+    ranks evaluate cases.  Without a communicator, cases are evaluated in a local pool of
+    num_procs forked processes, or serially if num_procs is 1.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers.
+    next_case : function
+        Function with no arguments that returns the next case, of the form (args, kwargs),
+        or None if there are no more cases to evaluate.
+    on_result : function
+        Function called as on_result(case, retval, err) when a case has been evaluated.
+    comm : MPI communicator or None
+        The MPI communicator that is shared between the master and workers.
+    num_procs : int
+        Number of local worker processes to use when comm is None.
+    initializer : function or None
+        Function with no arguments called once in each local worker process on startup.
+    """
+    if comm is not None and comm.size > 1:
+        if comm.rank == 0:
+            _concurrent_eval_async_master(next_case, on_result, comm)
+        else:
+            _concurrent_eval_lb_worker(func, comm)
+
+    elif num_procs > 1:
+        _concurrent_eval_async_pool(func, next_case, on_result, num_procs, initializer)
+
+    else:  # serial execution
+        case = next_case()
+        while case is not None:
+            on_result(case, *_eval_case(func, *case))
+            case = next_case()
+
+
+def _eval_case(func, args, kwargs):
+    try:
+        if kwargs:
+            retval = func(*args, **kwargs)
+        else:
+            retval = func(*args)
+    except Exception:
+        return None, traceback.format_exc()
+
+    return retval, None
+
+
+def _pool_eval_case(args, kwargs):
+    return _eval_case(_pool_func, args, kwargs)
+
+
+def _concurrent_eval_async_master(next_case, on_result, comm):
+    """
+    Send cases to workers as they become free and pass their results back.
+
+    This runs only on rank 0.
+
+    Parameters
+    ----------
+    next_case : function
+        Function with no arguments that returns the next case or None.
+    on_result : function
+        Function called as on_result(case, retval, err) when a case has been evaluated.
+    comm : MPI communicator
+        The MPI communicator that is shared between the master and workers.
+    """
+    pending = {}
+
+    # seed the workers
+    for rank in range(1, comm.size):
+        case = next_case()
+        if case is None:
+            break
+        comm.send(case, rank, tag=1)
+        pending[rank] = case
+
+    while pending:
+        worker, retval, err = comm.recv(tag=2)
+        on_result(pending.pop(worker), retval, err)
+
+        case = next_case()
+        if case is not None:
+            comm.send(case, worker, tag=1)
+            pending[worker] = case
+
+    # tell all workers to stop
+    for rank in range(1, comm.size):
+        comm.send((None, None), rank, tag=1)
+
+
+def _concurrent_eval_async_pool(func, next_case, on_result, num_procs, initializer):
+    """
+    Evaluate cases in a pool of forked local processes.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers.
+    next_case : function
+        Function with no arguments that returns the next case or None.
+    on_result : function
+        Function called as on_result(case, retval, err) when a case has been evaluated.
+    num_procs : int
+        Number of worker processes.
+    initializer : function or None
+        Function with no arguments called once in each worker process on startup.
+    """
+    global _pool_func
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        raise RuntimeError("Evaluating cases in a local process pool requires the 'fork' "
+                           "process start method, which is not available on this platform.")
+
+    _pool_func = func
+    try:
+        with ProcessPoolExecutor(max_workers=num_procs, initializer=initializer,
+                                 mp_context=multiprocessing.get_context('fork')) as pool:
+            pending = {}
+            for i in range(num_procs):
+                case = next_case()
+                if case is None:
+                    break
+                pending[pool.submit(_pool_eval_case, *case)] = case
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    on_result(pending.pop(future), *future.result())
+
+                    case = next_case()
+                    if case is not None:
+                        pending[pool.submit(_pool_eval_case, *case)] = case
+    finally:
+        _pool_func = None
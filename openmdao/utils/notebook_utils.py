@@ -3,12 +3,17 @@ import sys
 import importlib
 import inspect
 
-try:
-    from IPython.display import display, HTML, IFrame, Code
-    from IPython import get_ipython
-    ipy = get_ipython() is not None
-except ImportError:
-    ipy = display = HTML = IFrame = None
+# IPython is slow to import, and we can only be running in it if it has already been imported.
+if 'IPython' in sys.modules:
+    try:
+        from IPython.display import display, HTML, IFrame, Code
+        from IPython import get_ipython
+        ipy = get_ipython() is not None
+    except ImportError:
+        ipy = display = HTML = IFrame = Code = None
+else:
+    ipy = False
+    display = HTML = IFrame = Code = None
 
 from openmdao.utils.om_warnings import issue_warning
 from openmdao.utils.om_warnings import warn_deprecation
@@ -69,6 +74,7 @@ def get_code(reference, hide_doc_string=False):
         obj = ''.join(obj)
 
     if ipy:
+        from IPython.display import Code
         return Code(obj, language='python')
     else:
         issue_warning("IPython is not installed. Run `pip install openmdao[notebooks]` or "
@@ -87,6 +93,7 @@ def display_source(reference, hide_doc_string=False):
         Option to hide the docstring.
     """
     if ipy:
+        from IPython.display import display
         display(get_code(reference, hide_doc_string))
 
 
@@ -117,6 +124,8 @@ def show_options_table(reference, recording_options=False, options_dict='options
         obj = reference
 
     if ipy:
+        from IPython.display import display, HTML
+
         if recording_options:
             warn_deprecation('Argument `recording_options` is deprecated. Use '
                              '`options_dict="recording_options" to remove this '
@@ -5,6 +5,7 @@ A console script wrapper for multiple openmdao functions.
 import sys
 import os
 import argparse
+import importlib
 if sys.version_info.minor > 7:
     import importlib.metadata as ilmd
 else:
@@ -27,42 +28,7 @@ else:
 
 
 import openmdao.utils.hooks as hooks
-from openmdao.visualization.n2_viewer.n2_viewer import _n2_setup_parser, _n2_cmd
-from openmdao.visualization.connection_viewer.viewconns import view_connections
-from openmdao.visualization.scaling_viewer.scaling_report import _scaling_setup_parser, \
-    _scaling_cmd
-from openmdao.visualization.timing_viewer.timing_viewer import _timing_setup_parser, _timing_cmd
-from openmdao.visualization.dyn_shape_plot import _view_dyn_shapes_setup_parser, \
-    _view_dyn_shapes_cmd
-try:
-    import bokeh
-    from openmdao.visualization.meta_model_viewer.meta_model_visualization import view_metamodel
-except ImportError:
-    bokeh = None
-from openmdao.components.meta_model_semi_structured_comp import MetaModelSemiStructuredComp
-from openmdao.components.meta_model_structured_comp import MetaModelStructuredComp
-from openmdao.components.meta_model_unstructured_comp import MetaModelUnStructuredComp
-from openmdao.core.component import Component
-from openmdao.devtools.debug import config_summary, tree, comm_info
-from openmdao.devtools.itrace import _itrace_exec, _itrace_setup_parser
-from openmdao.devtools.iprofile_app.iprofile_app import _iprof_exec, _iprof_setup_parser
-from openmdao.devtools.iprofile import _iprof_totals_exec, _iprof_totals_setup_parser
-from openmdao.devtools.iprof_mem import _mem_prof_exec, _mem_prof_setup_parser, \
-    _mempost_exec, _mempost_setup_parser
-from openmdao.error_checking.check_config import _check_config_cmd, _check_config_setup_parser
-from openmdao.utils.mpi import MPI
-from openmdao.utils.find_cite import print_citations
-from openmdao.utils.code_utils import _calltree_setup_parser, _calltree_exec
-from openmdao.utils.coloring import _total_coloring_setup_parser, _total_coloring_cmd, \
-    _partial_coloring_setup_parser, _partial_coloring_cmd, \
-    _view_coloring_setup_parser, _view_coloring_exec
-from openmdao.utils.scaffold import _scaffold_setup_parser, _scaffold_exec
 from openmdao.utils.file_utils import _load_and_exec, _iter_entry_points
-from openmdao.utils.entry_points import _list_installed_setup_parser, _list_installed_cmd, \
-    split_ep, _compute_entry_points_setup_parser, _compute_entry_points_exec, \
-        _find_plugins_setup_parser, _find_plugins_exec
-from openmdao.utils.reports_system import _list_reports_setup_parser, _list_reports_cmd, \
-    _view_reports_setup_parser, _view_reports_cmd
 
 
 def _view_connections_setup_parser(parser):
@@ -97,6 +63,8 @@ def _view_connections_cmd(options, user_args):
     user_args : list of str
         Args to be passed to the user script.
     """
+    from openmdao.visualization.connection_viewer.viewconns import view_connections
+
     def _viewconns(prob):
         if options.title:
             title = options.title
@@ -157,6 +125,17 @@ def _meta_model_cmd(options, user_args):
     user_args : list of str
         Args to be passed to the user script.
     """
+    from openmdao.components.meta_model_semi_structured_comp import MetaModelSemiStructuredComp
+    from openmdao.components.meta_model_structured_comp import MetaModelStructuredComp
+    from openmdao.components.meta_model_unstructured_comp import MetaModelUnStructuredComp
+
+    try:
+        import bokeh
+        from openmdao.visualization.meta_model_viewer.meta_model_visualization import \
+            view_metamodel
+    except ImportError:
+        bokeh = None
+
     def _view_metamodel(prob):
         if bokeh is None:
             print("bokeh must be installed to view a MetaModel.  Use the command:\n",
@@ -246,6 +225,8 @@ def _config_summary_cmd(options, user_args):
     user_args : list of str
         Args to be passed to the user script.
     """
+    from openmdao.devtools.debug import config_summary
+
     hooks._register_hook('final_setup', 'Problem', post=config_summary, exit=True)
     _load_and_exec(options.file[0], user_args)
 
@@ -298,6 +279,8 @@ def _get_tree_filter(attrs, vecvars):
     function
         A function that takes a System and returns a list of name value pairs.
     """
+    from openmdao.core.component import Component
+
     def _finder(system):
         found = []
         for attr in attrs:
@@ -334,6 +317,8 @@ def _tree_cmd(options, user_args):
     user_args : list of str
         Args to be passed to the user script.
     """
+    from openmdao.devtools.debug import tree
+
     if options.outfile is None:
         out = sys.stdout
     else:
@@ -391,6 +376,9 @@ def _cite_cmd(options, user_args):
     else:
         out = open(options.outfile, 'w')
 
+    from openmdao.utils.mpi import MPI
+    from openmdao.utils.find_cite import print_citations
+
     if not options.classes:
         options.classes = None
 
@@ -497,6 +485,8 @@ def _comm_info_cmd(options, user_args):
     user_args : list of str
         Args to be passed to the user script.
     """
+    from openmdao.devtools.debug import comm_info
+
     def _comm_info(model):
         if options.problem:
             if model._problem_meta['name'] != options.problem and \
@@ -525,56 +515,108 @@ def _comm_info_cmd(options, user_args):
 
 # this dict should contain names mapped to tuples of the form:
 #   (setup_parser_func, executor, description)
+# Functions defined in other modules are given as 'module:function' strings, so that a module is
+# only imported when its command is run.
 _command_map = {
-    'call_tree': (_calltree_setup_parser, _calltree_exec,
+    'call_tree': ('openmdao.utils.code_utils:_calltree_setup_parser',
+                  'openmdao.utils.code_utils:_calltree_exec',
                   "Display the call tree for the specified class method and all 'self' class "
                   "methods it calls."),
-    'check': (_check_config_setup_parser, _check_config_cmd,
+    'check': ('openmdao.error_checking.check_config:_check_config_setup_parser',
+              'openmdao.error_checking.check_config:_check_config_cmd',
               'Perform a number of configuration checks on the problem.'),
     'cite': (_cite_setup_parser, _cite_cmd, 'Print citations referenced by the problem.'),
     'comm_info': (_comm_info_setup_parser, _comm_info_cmd,
                   'Print MPI communicator info for systems.'),
-    'compute_entry_points': (_compute_entry_points_setup_parser, _compute_entry_points_exec,
+    'compute_entry_points': ('openmdao.utils.entry_points:_compute_entry_points_setup_parser',
+                             'openmdao.utils.entry_points:_compute_entry_points_exec',
                              'Compute entry point declarations to add to the setup.py file.'),
-    'find_plugins': (_find_plugins_setup_parser, _find_plugins_exec,
+    'export_cases': ('openmdao.recorders.case_export:_export_cases_setup_parser',
+                     'openmdao.recorders.case_export:_export_cases_cmd',
+                     'Export recorded cases to a Parquet, HDF5 or npz file.'),
+    'find_plugins': ('openmdao.utils.entry_points:_find_plugins_setup_parser',
+                     'openmdao.utils.entry_points:_find_plugins_exec',
                      'Find openmdao plugins on github.'),
-    'iprof': (_iprof_setup_parser, _iprof_exec,
+    'iprof': ('openmdao.devtools.iprofile_app.iprofile_app:_iprof_setup_parser',
+              'openmdao.devtools.iprofile_app.iprofile_app:_iprof_exec',
               'Profile calls to particular object instances.'),
-    'iprof_totals': (_iprof_totals_setup_parser, _iprof_totals_exec,
+    'iprof_totals': ('openmdao.devtools.iprofile:_iprof_totals_setup_parser',
+                     'openmdao.devtools.iprofile:_iprof_totals_exec',
                      'Generate total timings of calls to particular object instances.'),
-    'list_installed': (_list_installed_setup_parser, _list_installed_cmd,
+    'list_installed': ('openmdao.utils.entry_points:_list_installed_setup_parser',
+                       'openmdao.utils.entry_points:_list_installed_cmd',
                        'List installed types recognized by OpenMDAO.'),
-    'list_reports': (_list_reports_setup_parser, _list_reports_cmd,
+    'list_reports': ('openmdao.utils.reports_system:_list_reports_setup_parser',
+                     'openmdao.utils.reports_system:_list_reports_cmd',
                      'List available reports.'),
-    'mem': (_mem_prof_setup_parser, _mem_prof_exec,
+    'merge_cases': ('openmdao.recorders.sqlite_shards:_merge_cases_setup_parser',
+                    'openmdao.recorders.sqlite_shards:_merge_cases_cmd',
+                    'Merge the case files recorded on multiple ranks into a single file.'),
+    'mem': ('openmdao.devtools.iprof_mem:_mem_prof_setup_parser',
+            'openmdao.devtools.iprof_mem:_mem_prof_exec',
             'Profile memory used by OpenMDAO related functions.'),
-    'mempost': (_mempost_setup_parser, _mempost_exec, 'Post-process memory profile output.'),
-    'n2': (_n2_setup_parser, _n2_cmd, 'Display an interactive N2 diagram of the problem.'),
-    'partial_coloring': (_partial_coloring_setup_parser, _partial_coloring_cmd,
+    'mempost': ('openmdao.devtools.iprof_mem:_mempost_setup_parser',
+                'openmdao.devtools.iprof_mem:_mempost_exec',
+                'Post-process memory profile output.'),
+    'n2': ('openmdao.visualization.n2_viewer.n2_viewer:_n2_setup_parser',
+           'openmdao.visualization.n2_viewer.n2_viewer:_n2_cmd',
+           'Display an interactive N2 diagram of the problem.'),
+    'partial_coloring': ('openmdao.utils.coloring:_partial_coloring_setup_parser',
+                         'openmdao.utils.coloring:_partial_coloring_cmd',
                          'Compute coloring(s) for specified partial jacobians.'),
-    'scaffold': (_scaffold_setup_parser, _scaffold_exec,
+    'scaffold': ('openmdao.utils.scaffold:_scaffold_setup_parser',
+                 'openmdao.utils.scaffold:_scaffold_exec',
                  'Generate a simple scaffold for a component.'),
-    'scaling': (_scaling_setup_parser, _scaling_cmd, 'View driver scaling report.'),
+    'scaling': ('openmdao.visualization.scaling_viewer.scaling_report:_scaling_setup_parser',
+                'openmdao.visualization.scaling_viewer.scaling_report:_scaling_cmd',
+                'View driver scaling report.'),
     'list_pre_post': (_list_pre_post_setup_parser, _list_pre_post_cmd,
                       'Show pre and post setup systems.'),
     'summary': (_config_summary_setup_parser, _config_summary_cmd,
                 'Print a short top-level summary of the problem.'),
-    'timing': (_timing_setup_parser, _timing_cmd, 'Collect timing information for all systems.'),
-    'total_coloring': (_total_coloring_setup_parser, _total_coloring_cmd,
+    'timing': ('openmdao.visualization.timing_viewer.timing_viewer:_timing_setup_parser',
+               'openmdao.visualization.timing_viewer.timing_viewer:_timing_cmd',
+               'Collect timing information for all systems.'),
+    'total_coloring': ('openmdao.utils.coloring:_total_coloring_setup_parser',
+                       'openmdao.utils.coloring:_total_coloring_cmd',
                        'Compute a coloring for the total jacobian.'),
-    'trace': (_itrace_setup_parser, _itrace_exec, 'Dump trace output.'),
+    'trace': ('openmdao.devtools.itrace:_itrace_setup_parser',
+              'openmdao.devtools.itrace:_itrace_exec', 'Dump trace output.'),
     'tree': (_tree_setup_parser, _tree_cmd, 'Print the system tree.'),
-    'view_coloring': (_view_coloring_setup_parser, _view_coloring_exec, 'View a colored jacobian.'),
+    'view_coloring': ('openmdao.utils.coloring:_view_coloring_setup_parser',
+                      'openmdao.utils.coloring:_view_coloring_exec', 'View a colored jacobian.'),
     'view_connections': (_view_connections_setup_parser, _view_connections_cmd,
                          'View connections showing values and source/target units.'),
-    'view_dyn_shapes': (_view_dyn_shapes_setup_parser, _view_dyn_shapes_cmd,
+    'view_dyn_shapes': ('openmdao.visualization.dyn_shape_plot:_view_dyn_shapes_setup_parser',
+                        'openmdao.visualization.dyn_shape_plot:_view_dyn_shapes_cmd',
                         'View the dynamic shape dependency graph.'),
     'view_mm': (_meta_model_parser, _meta_model_cmd, "View a metamodel."),
-    'view_reports': (_view_reports_setup_parser, _view_reports_cmd,
+    'view_reports': ('openmdao.utils.reports_system:_view_reports_setup_parser',
+                     'openmdao.utils.reports_system:_view_reports_cmd',
                      'View existing reports.'),
 }
 
 
+def _load_command_func(func):
+    """
+    Return the given command function, importing it first if it is given as a string.
+
+    Parameters
+    ----------
+    func : function or str
+        The function, or its 'module:function' name.
+
+    Returns
+    -------
+    function
+        The function.
+    """
+    if isinstance(func, str):
+        modname, funcname = func.split(':')
+        func = getattr(importlib.import_module(modname), funcname)
+    return func
+
+
 def openmdao_cmd():
     """
     Run an 'openmdao' sub-command or list help info for 'openmdao' command or sub-commands.
@@ -603,14 +645,20 @@ def openmdao_cmd():
 
     # setting 'dest' here will populate the Namespace with the active subparser name
     subs = parser.add_subparsers(title='Tools', metavar='', dest="subparser_name")
+    # only the sub-command being run needs its arguments, so the modules of the others aren't
+    # imported
+    args = [a for a in sys.argv[1:] if not a.startswith('-')]
     for p, (parser_setup_func, executor, help_str) in sorted(_command_map.items()):
         subp = subs.add_parser(p, help=help_str)
-        parser_setup_func(subp)
-        subp.set_defaults(executor=executor)
+        if args and args[0] == p:
+            _load_command_func(parser_setup_func)(subp)
+            subp.set_defaults(executor=_load_command_func(executor))
 
     # now add any plugin openmdao commands
     epdict = {}
     for ep in _iter_entry_points('openmdao_command'):
+        from openmdao.utils.entry_points import split_ep
+
         cmd, module, target = split_ep(ep)
         # don't let plugins override the builtin commands
         if cmd in _command_map:
@@ -632,7 +680,6 @@ def openmdao_cmd():
         parser_setup_func(subp)
         subp.set_defaults(executor=executor)
 
-    args = [a for a in sys.argv[1:] if not a.startswith('-')]
     cmdargs = [a for a in sys.argv[1:] if a not in ('-h', '--version', '--dependency_versions')]
 
     # handle case where someone just runs `openmdao <script> [dashed-args]`
@@ -4,7 +4,13 @@ Utility functions related to the reporting system which generates reports by def
 
 from collections import namedtuple
 import os
+import sys
+import time
+import atexit
 import inspect
+import threading
+import traceback
+import multiprocessing
 from itertools import chain
 
 from numpy import isin
@@ -23,6 +29,13 @@ _active_reports = set()  # these reports will actually run (assuming their hook
 _reports_dir = os.environ.get('OPENMDAO_REPORTS_DIR', './reports')  # top dir for the reports
 _plugins_loaded = False  # use this to ensure plugins only loaded once
 
+# if True, reports that support it are rendered in the background after their data is collected
+_reports_deferred = env_truthy('OPENMDAO_REPORTS_DEFERRED')
+# max number of seconds each deferred report may take, or None for no limit
+_report_time_budget = float(os.environ.get('OPENMDAO_REPORTS_TIME_BUDGET', 0)) or None
+_pending_reports = []  # (name, worker, start time) for each deferred report that was started
+_wait_registered = False  # True once wait_for_reports has been registered to run at exit
+
 
 class Report(object):
     r"""
@@ -466,6 +479,166 @@ set_default_reports_dir = set_reports_dir
 # -----------------------------------------
 
 
+def set_reports_deferred(deferred=True, time_budget=None):
+    """
+    Set whether reports that support it are rendered in the background.
+
+    When deferred, the report hooks only collect the data needed by the report and the slow
+    part of the report, e.g. writing its html file, runs in a forked process (or in a thread
+    if forking is not possible) concurrently with the rest of the run. All deferred reports are
+    waited for when the process exits, or when wait_for_reports is called.
+
+    This can also be activated by setting the OPENMDAO_REPORTS_DEFERRED environment variable,
+    with OPENMDAO_REPORTS_TIME_BUDGET giving the time budget.
+
+    Parameters
+    ----------
+    deferred : bool
+        If True, render reports in the background.
+    time_budget : float or None
+        Max number of seconds each deferred report may take. Reports running in a process are
+        stopped when they exceed it, and reports running in a thread are no longer waited for.
+        If None, there is no limit.
+    """
+    global _reports_deferred, _report_time_budget
+    _reports_deferred = deferred
+    _report_time_budget = time_budget
+
+
+def reports_deferred():
+    """
+    Return True if reports that support it are rendered in the background.
+
+    Returns
+    -------
+    bool
+        True if reports are deferred.
+    """
+    return _reports_deferred
+
+
+def _deferred_reports_fork():
+    """
+    Return True if deferred reports are rendered in a forked process.
+
+    A forked process works on a snapshot of the memory of the parent taken when it is started,
+    so a report rendered in it can also collect its data from objects that keep changing.
+
+    Returns
+    -------
+    bool
+        True if reports are deferred and rendered in a forked process.
+    """
+    # forking a process that uses MPI isn't safe, so a thread is used in that case
+    from openmdao.utils.mpi import MPI
+    return _reports_deferred and MPI is None and \
+        'fork' in multiprocessing.get_all_start_methods()
+
+
+def _run_deferred_report(name, func, args, kwargs):
+    """
+    Run the rendering function of a report, turning any error into a warning.
+
+    Parameters
+    ----------
+    name : str
+        Name of the report.
+    func : function
+        Function that renders the report.
+    args : tuple
+        Positional args passed to func.
+    kwargs : dict
+        Keyword args passed to func.
+    """
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        issue_warning(f"Deferred report '{name}' failed:\n{traceback.format_exc()}")
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def run_report(name, func, *args, **kwargs):
+    """
+    Run the rendering part of a report, in the background if reports are deferred.
+
+    The arguments must be a snapshot of the data needed by the report, because the model may
+    keep changing while the report is rendered.
+
+    Parameters
+    ----------
+    name : str
+        Name of the report.
+    func : function
+        Function that renders the report.
+    *args : list
+        Positional args passed to func.
+    **kwargs : dict
+        Keyword args passed to func.
+    """
+    global _wait_registered
+
+    if not _reports_deferred:
+        func(*args, **kwargs)
+        return
+
+    if _deferred_reports_fork():
+        worker = multiprocessing.get_context('fork').Process(target=_run_deferred_report,
+                                                             args=(name, func, args, kwargs),
+                                                             daemon=True)
+    else:
+        worker = threading.Thread(target=_run_deferred_report, args=(name, func, args, kwargs),
+                                  daemon=True)
+
+    worker.start()
+    _pending_reports.append((name, worker, time.perf_counter()))
+
+    if not _wait_registered:
+        _wait_registered = True
+        atexit.register(wait_for_reports)
+
+
+def wait_for_reports(time_budget=_UNDEFINED):
+    """
+    Wait for all deferred reports to finish.
+
+    Parameters
+    ----------
+    time_budget : float, None or _UNDEFINED
+        Max number of seconds each deferred report may take, counting from when it started.
+        If _UNDEFINED, the time budget set with set_reports_deferred is used.
+
+    Returns
+    -------
+    list of str
+        Names of the reports that did not finish within their time budget.
+    """
+    if time_budget is _UNDEFINED:
+        time_budget = _report_time_budget
+
+    late = []
+    while _pending_reports:
+        name, worker, start = _pending_reports.pop(0)
+        if time_budget is None:
+            worker.join()
+        else:
+            worker.join(max(0., start + time_budget - time.perf_counter()))
+
+        if worker.is_alive():
+            late.append(name)
+            if isinstance(worker, threading.Thread):
+                issue_warning(f"Deferred report '{name}' did not finish within its time budget "
+                              f"of {time_budget} sec and will not be waited for.")
+            else:
+                worker.terminate()
+                worker.join()
+                issue_warning(f"Deferred report '{name}' did not finish within its time budget "
+                              f"of {time_budget} sec and was stopped.")
+
+    return late
+
+
 def _reset_reports_dir():
     """
     Reset the path to the top level reports directory from the environment or to './reports'.
@@ -181,5 +181,52 @@ class CmdlineTestErrTestCase(unittest.TestCase):
                       f"Return code: {proc.returncode}.\nstderr: {proc.stderr}\nstdout: {proc.stdout}")
 
 
+# modules that must not be imported just to import the api or to list the command line tools
+_slow_imports = ['openmdao.core.problem', 'openmdao.drivers.doe_driver',
+                 'openmdao.visualization.n2_viewer.n2_viewer', 'IPython', 'pyDOE3']
+
+
+class LazyImportTestCase(unittest.TestCase):
+    def _check_imports(self, code, slow_imports=_slow_imports):
+        code += "\nimport sys\nprint(' '.join(sys.modules))"
+        output = subprocess.check_output(['python', '-c', code],  # nosec: trusted input
+                                         encoding='UTF-8')
+        imported = set(output.split())
+        for modname in slow_imports:
+            self.assertNotIn(modname, imported, f"'{code}' imported {modname}.")
+
+    def test_api_import(self):
+        self._check_imports('import openmdao.api as om')
+
+    def test_cmd_help(self):
+        self._check_imports('import sys\n'
+                            'sys.argv = ["openmdao", "-h"]\n'
+                            'from openmdao.utils.om import openmdao_cmd\n'
+                            'try:\n'
+                            '    openmdao_cmd()\n'
+                            'except SystemExit:\n'
+                            '    pass')
+
+    def test_case_reader_import(self):
+        # the optional libraries used to export cases are only imported when exporting
+        self._check_imports('from openmdao.recorders.sqlite_reader import SqliteCaseReader',
+                            ['openmdao.recorders.case_export', 'pyarrow', 'h5py'])
+
+    def test_api_access(self):
+        import openmdao.api as om
+        from openmdao.core.problem import Problem
+        from openmdao.drivers.doe_generators import LatinHypercubeGenerator
+
+        self.assertIs(om.Problem, Problem)
+        self.assertIs(om.LatinHypercubeGenerator, LatinHypercubeGenerator)
+        self.assertIn('SqliteRecorder', dir(om))
+
+        with self.assertRaises(AttributeError) as cm:
+            om.NotAnOpenMDAOClass
+
+        self.assertEqual(str(cm.exception),
+                         "module 'openmdao.api' has no attribute 'NotAnOpenMDAOClass'")
+
+
 if __name__ == '__main__':
     unittest.main()
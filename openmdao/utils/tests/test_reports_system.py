@@ -3,6 +3,7 @@ import unittest
 import pathlib
 import sys
 import os
+import multiprocessing
 from io import StringIO
 
 import openmdao.api as om
@@ -13,7 +14,8 @@ import openmdao.core.problem as probmod
 from openmdao.core.constants import _UNDEFINED
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 from openmdao.utils.reports_system import set_reports_dir, _reports_dir, register_report, \
-    list_reports, clear_reports, _reset_reports_dir, activate_report, _reports_registry
+    list_reports, clear_reports, _reset_reports_dir, activate_report, _reports_registry, \
+    set_reports_deferred, run_report, wait_for_reports
 from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.utils.assert_utils import assert_no_warning
 from openmdao.utils.mpi import MPI
@@ -160,6 +162,83 @@ class TestReportsSystem(unittest.TestCase):
         path = pathlib.Path(problem_reports_dir).joinpath(self.optimizer_filename)
         self.assertTrue(path.is_file(), f'The optimizer report file, {str(path)}, was not found')
 
+    @hooks_active
+    def test_report_generation_deferred(self):
+        set_reports_deferred()
+        try:
+            prob = self.setup_and_run_simple_problem()
+            self.assertEqual(wait_for_reports(), [])
+        finally:
+            set_reports_deferred(False)
+
+        problem_reports_dir = pathlib.Path(_reports_dir).joinpath(prob._name)
+
+        path = pathlib.Path(problem_reports_dir).joinpath(self.n2_filename)
+        self.assertTrue(path.is_file(), f'The N2 report file, {str(path)} was not found')
+        with open(path) as f:
+            self.assertIn('OpenMDAO Model Hierarchy and N2 diagram', f.read())
+        path = pathlib.Path(problem_reports_dir).joinpath(self.scaling_filename)
+        self.assertTrue(path.is_file(), f'The scaling report file, {str(path)}, was not found')
+
+    @unittest.skipUnless(MPI is None and 'fork' in multiprocessing.get_all_start_methods(),
+                         "requires the fork start method")
+    @hooks_active
+    def test_report_generation_deferred_n2_data(self):
+        from unittest import mock
+        import openmdao.visualization.n2_viewer.n2_viewer as n2mod
+
+        get_viewer_data = n2mod._get_viewer_data
+        pids = []
+
+        def _get_viewer_data(*args, **kwargs):
+            pids.append(os.getpid())
+            return get_viewer_data(*args, **kwargs)
+
+        set_reports_deferred()
+        try:
+            with mock.patch.object(n2mod, '_get_viewer_data', _get_viewer_data):
+                prob = self.setup_and_run_simple_problem()
+                self.assertEqual(wait_for_reports(), [])
+        finally:
+            set_reports_deferred(False)
+
+        # the viewer data is collected by the forked worker, not by the hook
+        self.assertEqual(pids, [])
+
+        path = pathlib.Path(_reports_dir).joinpath(prob._name, self.n2_filename)
+        self.assertTrue(path.is_file(), f'The N2 report file, {str(path)} was not found')
+        with open(path) as f:
+            self.assertIn('OpenMDAO Model Hierarchy and N2 diagram', f.read())
+
+    def test_deferred_report_time_budget(self):
+        import time
+
+        def slow_report(fname):
+            time.sleep(30)
+            with open(fname, 'w') as f:
+                f.write('done')
+
+        def fast_report(fname):
+            with open(fname, 'w') as f:
+                f.write('done')
+
+        set_reports_deferred(time_budget=1.0)
+        try:
+            run_report('slow', slow_report, 'slow.txt')
+            run_report('fast', fast_report, 'fast.txt')
+            start = time.perf_counter()
+            with self.assertWarns(om.OpenMDAOWarning) as cm:
+                late = wait_for_reports()
+        finally:
+            set_reports_deferred(False)
+
+        self.assertLess(time.perf_counter() - start, 10.)
+        self.assertEqual(late, ['slow'])
+        self.assertEqual(str(cm.warning), "Deferred report 'slow' did not finish within its "
+                                          "time budget of 1.0 sec and was stopped.")
+        self.assertTrue(os.path.isfile('fast.txt'))
+        self.assertFalse(os.path.isfile('slow.txt'))
+
     @hooks_active
     def test_report_generation_on_error(self):
         prob_name = 'error_problem'
@@ -1,7 +1,10 @@
 """Code for generating N2 diagram."""
+import base64
 import inspect
+import json
 import os
 import sys
+import zlib
 import pathlib
 from operator import itemgetter
 
@@ -27,7 +30,8 @@ from openmdao.utils.general_utils import default_noraise
 from openmdao.utils.mpi import MPI
 from openmdao.utils.notebook_utils import notebook, display, HTML, IFrame, colab
 from openmdao.utils.om_warnings import issue_warning
-from openmdao.utils.reports_system import register_report_hook
+from openmdao.utils.reports_system import register_report_hook, run_report, \
+    _deferred_reports_fork
 from openmdao.utils.file_utils import _load_and_exec, _to_filename
 from openmdao.visualization.htmlpp import HtmlPreprocessor
 from openmdao import __version__ as openmdao_version
@@ -36,6 +40,7 @@ _MAX_ARRAY_SIZE_FOR_REPR_VAL = 1000  # If var has more elements than this do not
 _MAX_OPTION_SIZE = int(1e4)          # If option value is bigger than this do not pass to N2
 
 _default_n2_filename = 'n2.html'
+_DEFAULT_SHARD_SIZE = 2000  # max number of variables in an n2 data shard
 
 
 def _convert_nans_in_nested_list(val_as_list):
@@ -216,7 +221,7 @@ def _serialize_single_option(option):
     return default_noraise(val)
 
 
-def _get_tree_dict(system, values=True, is_parallel=False):
+def _get_tree_dict(system, values=True, is_parallel=False, shard_writer=None):
     """
     Get a dictionary representation of the system hierarchy.
 
@@ -228,7 +233,22 @@ def _get_tree_dict(system, values=True, is_parallel=False):
         If True, include variable values. If False, all values will be None.
     is_parallel : bool
         If True, values can be remote and are not available.
+    shard_writer : _N2ShardWriter or None
+        If not None, subtrees that are small enough are written to a shard as soon as they
+        are built and only their skeleton is kept in the returned dictionary.
+
+    Returns
+    -------
+    dict
+        Dictionary representation of the system hierarchy.
     """
+    if shard_writer is not None and system.pathname:
+        nvars = sum(len(system._var_allprocs_abs2meta[io]) +
+                    len(system._var_allprocs_discrete[io]) for io in ('input', 'output'))
+        if shard_writer.is_shard_root(nvars, isinstance(system, Group)):
+            return shard_writer.add_shard(system.pathname,
+                                          _get_tree_dict(system, values, is_parallel))
+
     tree_dict = {
         'name': system.name if system.name else 'root',
         'type': 'subsystem' if system.name else 'root',
@@ -248,7 +268,7 @@ def _get_tree_dict(system, values=True, is_parallel=False):
         tree_dict['subsystem_type'] = 'group'
         tree_dict['is_parallel'] = is_parallel
 
-        children = [_get_tree_dict(s, values, is_parallel)
+        children = [_get_tree_dict(s, values, is_parallel, shard_writer)
                     for s in system._subsystems_myproc]
 
         if system.comm.size > 1:
@@ -347,6 +367,213 @@ def _get_tree_dict(system, values=True, is_parallel=False):
     return tree_dict
 
 
+def _iter_tree_var_paths(children, path):
+    """
+    Yield the absolute path of each variable in a subtree of the model tree.
+
+    Parameters
+    ----------
+    children : list of dict
+        The children of the root node of the subtree.
+    path : str
+        Pathname of the root node of the subtree.
+
+    Yields
+    ------
+    str
+        Absolute path of a variable.
+    """
+    for child in children:
+        cpath = f"{path}.{child['name']}" if path else child['name']
+        if child['type'] == 'subsystem':
+            yield from _iter_tree_var_paths(child['children'], cpath)
+        else:
+            yield cpath
+
+
+class _N2ShardWriter(object):
+    """
+    Write the subtrees of the n2 model tree to separate shard files.
+
+    Each shard holds the children of one subsystem of at most shard_size variables, along with
+    the connections into, the promoted names of and the declared partials of its variables. In
+    the model tree, the subsystem is replaced by a skeleton node with the index of its shard, so
+    the viewer only has to load a shard when the subsystem is expanded.
+
+    Parameters
+    ----------
+    data_dir : str
+        Directory where the shards are written.
+    shard_size : int
+        Max number of variables in a shard, unless a single component has more.
+
+    Attributes
+    ----------
+    data_dir : str
+        Directory where the shards are written.
+    shard_size : int
+        Max number of variables in a shard, unless a single component has more.
+    nshards : int
+        Number of shards written so far.
+    _conns : dict
+        Connections that are not in a shard yet, keyed by target.
+    _abs2prom : dict
+        Promoted name of each variable, keyed by 'input' or 'output' and absolute name.
+    _partials : dict
+        Declared partials that are not in a shard yet, keyed by component pathname.
+    _active : bool
+        True if this process writes the shard files.
+    """
+
+    def __init__(self, data_dir, shard_size=_DEFAULT_SHARD_SIZE):
+        """
+        Initialize attributes.
+        """
+        self.data_dir = data_dir
+        self.shard_size = shard_size
+        self.nshards = 0
+        self._conns = {}
+        self._abs2prom = {'input': {}, 'output': {}}
+        self._partials = {}
+        self._active = MPI is None or MPI.COMM_WORLD.rank == 0
+
+        if self._active:
+            os.makedirs(data_dir, exist_ok=True)
+            for fname in os.listdir(data_dir):
+                if fname.startswith('shard_') and fname.endswith('.js'):
+                    os.remove(os.path.join(data_dir, fname))
+
+    def set_model_data(self, connections_list, abs2prom, declare_partials_list):
+        """
+        Set the model level data that is split between the shards.
+
+        Parameters
+        ----------
+        connections_list : list of dict
+            The connections of the model.
+        abs2prom : dict
+            Promoted name of each variable, keyed by 'input' or 'output' and absolute name.
+        declare_partials_list : list of str
+            The declared partials, in the form "of > wrt".
+        """
+        self._conns = {}
+        for conn in connections_list:
+            self._conns.setdefault(conn['tgt'], []).append(conn)
+
+        self._abs2prom = abs2prom
+
+        self._partials = {}
+        for partial in declare_partials_list:
+            comp = partial.split(' > ', 1)[0].rpartition('.')[0]
+            self._partials.setdefault(comp, []).append(partial)
+
+    def is_shard_root(self, nvars, is_group):
+        """
+        Return True if a subsystem should be written to its own shard.
+
+        Parameters
+        ----------
+        nvars : int
+            Number of variables in the subsystem.
+        is_group : bool
+            True if the subsystem is a Group.
+
+        Returns
+        -------
+        bool
+            True if the subsystem should be written to its own shard.
+        """
+        return not is_group or nvars <= self.shard_size
+
+    def add_shard(self, path, tree_dict):
+        """
+        Write the children of a subsystem to a new shard.
+
+        Parameters
+        ----------
+        path : str
+            Pathname of the subsystem.
+        tree_dict : dict
+            Tree dictionary of the subsystem.
+
+        Returns
+        -------
+        dict
+            Skeleton of the tree dictionary of the subsystem, without its children.
+        """
+        children = tree_dict['children']
+        var_paths = list(_iter_tree_var_paths(children, path))
+
+        comps = set()
+        connections_list = []
+        abs2prom = {'input': {}, 'output': {}}
+        for vpath in var_paths:
+            comps.add(vpath.rpartition('.')[0])
+            connections_list.extend(self._conns.pop(vpath, ()))
+            for io in ('input', 'output'):
+                if vpath in self._abs2prom[io]:
+                    abs2prom[io][vpath] = self._abs2prom[io][vpath]
+
+        declare_partials_list = []
+        for comp in sorted(comps):
+            declare_partials_list.extend(self._partials.pop(comp, ()))
+
+        shard_id = self.nshards
+        self.nshards += 1
+
+        if self._active:
+            shard = {
+                'path': path,
+                'children': children,
+                'connections_list': connections_list,
+                'abs2prom': abs2prom,
+                'declare_partials_list': declare_partials_list,
+            }
+            data = zlib.compress(json.dumps(shard, default=default_noraise).encode('UTF-8'))
+            with open(os.path.join(self.data_dir, f'shard_{shard_id}.js'), 'w') as f:
+                f.write(f'n2AddShard({shard_id}, "{base64.b64encode(data).decode("UTF-8")}");\n')
+
+        skeleton = {k: [] if k == 'children' else v for k, v in tree_dict.items()}
+        skeleton['shard'] = shard_id
+        skeleton['num_vars'] = len(var_paths)
+
+        return skeleton
+
+    def split_tree(self, tree_dict, path=''):
+        """
+        Write the subtrees of an already built tree dictionary to shards.
+
+        Parameters
+        ----------
+        tree_dict : dict
+            Tree dictionary whose children are replaced by skeletons as they are written.
+        path : str
+            Pathname of the system of the tree dictionary.
+        """
+        children = tree_dict['children']
+        for i, child in enumerate(children):
+            if child['type'] != 'subsystem':
+                continue
+
+            cpath = f"{path}.{child['name']}" if path else child['name']
+            nvars = sum(1 for _ in _iter_tree_var_paths(child['children'], cpath))
+            if self.is_shard_root(nvars, child['subsystem_type'] == 'group'):
+                children[i] = self.add_shard(cpath, child)
+            else:
+                self.split_tree(child, cpath)
+
+    def remaining_connections(self):
+        """
+        Return the connections whose target is not in any shard.
+
+        Returns
+        -------
+        list of dict
+            The remaining connections.
+        """
+        return [conn for conns in self._conns.values() for conn in conns]
+
+
 def _get_declare_partials(system):
     """
     Get a list of the declared partials.
@@ -371,7 +598,7 @@ def _get_declare_partials(system):
     return declare_partials_list
 
 
-def _get_viewer_data(data_source, values=_UNDEFINED, case_id=None):
+def _get_viewer_data(data_source, values=_UNDEFINED, case_id=None, shard_writer=None):
     """
     Get the data needed by the N2 viewer as a dictionary.
 
@@ -387,6 +614,10 @@ def _get_viewer_data(data_source, values=_UNDEFINED, case_id=None):
         model for which setup is not complete, in which case it behaves as if set to False.
     case_id : int or str or None
         Case name or index of case in SQL file.
+    shard_writer : _N2ShardWriter or None
+        If not None, the variables, connections and declared partials of the subtrees of the
+        model are written to separate shards and the returned data only contains the skeleton
+        of the tree.
 
     Returns
     -------
@@ -500,16 +731,80 @@ def _get_viewer_data(data_source, values=_UNDEFINED, case_id=None):
         if 'md5_hash' not in data_dict:
             data_dict['md5_hash'] = None
 
+        if shard_writer is not None:
+            shard_writer.set_model_data(data_dict['connections_list'], data_dict['abs2prom'],
+                                        data_dict.get('declare_partials_list', []))
+            shard_writer.split_tree(data_dict['tree'])
+            data_dict['connections_list'] = shard_writer.remaining_connections()
+            data_dict['abs2prom'] = {'input': {}, 'output': {}}
+            data_dict['declare_partials_list'] = []
+            data_dict['shard_dir'] = os.path.basename(shard_writer.data_dir)
+
         return data_dict
 
     else:
         raise TypeError(f"Viewer data is not available for '{data_source}'."
                         "The source must be a Problem, model or the filename of a recording.")
 
+    connections_list, sys_idx = _get_connections_data(root_group)
+
+    if shard_writer is not None:
+        shard_writer.set_model_data(connections_list, root_group._var_abs2prom,
+                                    _get_declare_partials(root_group))
+
     data_dict = {}
-    data_dict['tree'] = _get_tree_dict(root_group, values=values)
+    if shard_writer is not None and root_group.comm.size == 1:
+        # subtrees are written to their shards as soon as they are built
+        data_dict['tree'] = _get_tree_dict(root_group, values=values, shard_writer=shard_writer)
+    else:
+        data_dict['tree'] = _get_tree_dict(root_group, values=values)
+        if shard_writer is not None:
+            shard_writer.split_tree(data_dict['tree'])
     data_dict['md5_hash'] = root_group._generate_md5_hash()
 
+    if shard_writer is not None:
+        connections_list = shard_writer.remaining_connections()
+        abs2prom = {'input': {}, 'output': {}}
+        declare_partials_list = []
+        data_dict['shard_dir'] = os.path.basename(shard_writer.data_dir)
+    else:
+        abs2prom = root_group._var_abs2prom
+        declare_partials_list = _get_declare_partials(root_group)
+
+    data_dict['sys_pathnames_list'] = list(sys_idx)
+    data_dict['connections_list'] = connections_list
+    data_dict['abs2prom'] = abs2prom
+
+    data_dict['driver'] = {
+        'name': driver_name,
+        'type': driver_type,
+        'options': driver_options,
+        'opt_settings': driver_opt_settings
+    }
+    data_dict['design_vars'] = root_group.get_design_vars(use_prom_ivc=False)
+    data_dict['responses'] = root_group.get_responses(use_prom_ivc=False)
+
+    data_dict['declare_partials_list'] = declare_partials_list
+
+    return data_dict
+
+
+def _get_connections_data(root_group):
+    """
+    Get the connections of the model, with the cycles they are part of.
+
+    Parameters
+    ----------
+    root_group : <Group>
+        The top level Group of the model.
+
+    Returns
+    -------
+    list of dict
+        The connections, sorted by source and target.
+    dict
+        Index of each system that is part of a cycle, keyed by pathname.
+    """
     connections_list = []
 
     G = root_group.compute_sys_graph(comps_only=True)
@@ -580,26 +875,91 @@ def _get_viewer_data(data_source, values=_UNDEFINED, case_id=None):
 
     connections_list = sorted(connections_list, key=itemgetter('src', 'tgt'))
 
-    data_dict['sys_pathnames_list'] = list(sys_idx)
-    data_dict['connections_list'] = connections_list
-    data_dict['abs2prom'] = root_group._var_abs2prom
+    return connections_list, sys_idx
 
-    data_dict['driver'] = {
-        'name': driver_name,
-        'type': driver_type,
-        'options': driver_options,
-        'opt_settings': driver_opt_settings
-    }
-    data_dict['design_vars'] = root_group.get_design_vars(use_prom_ivc=False)
-    data_dict['responses'] = root_group.get_responses(use_prom_ivc=False)
 
-    data_dict['declare_partials_list'] = _get_declare_partials(root_group)
+def _get_n2_data(data_source, values=_UNDEFINED, case_id=None, shard_writer=None):
+    """
+    Collect the data shown in the n2 diagram.
 
-    return data_dict
+    Parameters
+    ----------
+    data_source : <Problem> or str
+        The Problem or case recorder database containing the model or model data.
+    values : bool or _UNDEFINED
+        If True, include variable values. If False, all values will be None.
+    case_id : int, str, or None
+        Case name or index of case in SQL file if data_source is a database.
+    shard_writer : _N2ShardWriter or None
+        If not None, the subtrees of the model are written to separate shards.
+
+    Returns
+    -------
+    dict
+        The model data.
+    str
+        Error message if the data could not be collected, else an empty string.
+    """
+    try:
+        return _get_viewer_data(data_source, values=values, case_id=case_id,
+                                shard_writer=shard_writer), ''
+    except TypeError as err:
+        issue_warning(str(err))
+        return {}, str(err)
+
+
+def _write_n2_html(model_data, outfile, path=None, embeddable=False, title=None, err_msg=''):
+    """
+    Write the html file of an n2 diagram from the collected model data.
+
+    Parameters
+    ----------
+    model_data : dict
+        The model data returned by _get_n2_data.
+    outfile : str
+        The name of the output file.
+    path : str, optional
+        If specified, the n2 viewer will begin in a state that is zoomed in on the selected path.
+    embeddable : bool, optional
+        If True, gives a single HTML file that doesn't have the <html>, <DOCTYPE>, <body>
+        and <head> tags.
+    title : str, optional
+        The title for the diagram.
+    err_msg : str
+        If not empty, this message is written instead of the diagram.
+    """
+    if err_msg:
+        with open(outfile, 'w') as f:
+            f.write(err_msg)
+        return
+
+    model_data['options'] = {}
+
+    import openmdao
+    openmdao_dir = os.path.dirname(inspect.getfile(openmdao))
+    vis_dir = os.path.join(openmdao_dir, "visualization/n2_viewer")
+
+    if title:
+        title = f"OpenMDAO Model Hierarchy and N2 diagram: {title}"
+    else:
+        title = "OpenMDAO Model Hierarchy and N2 diagram"
+
+    html_vars = {
+        'title': title,
+        'embeddable': "embedded-diagram" if embeddable else "non-embedded-diagram",
+        'openmdao_version': openmdao_version,
+        'model_data': model_data,
+        'initial_path': path
+    }
+
+    HtmlPreprocessor(os.path.join(vis_dir, "index.html"),
+                     outfile, allow_overwrite=True, var_dict=html_vars,
+                     json_dumps_default=default_noraise, verbose=False).run()
 
 
 def n2(data_source, outfile=_default_n2_filename, path=None, values=_UNDEFINED, case_id=None,
-       show_browser=True, embeddable=False, title=None, display_in_notebook=True):
+       show_browser=True, embeddable=False, title=None, display_in_notebook=True,
+       chunked=False, shard_size=_DEFAULT_SHARD_SIZE):
     """
     Generate an HTML file containing a tree viewer.
 
@@ -631,47 +991,27 @@ def n2(data_source, outfile=_default_n2_filename, path=None, values=_UNDEFINED,
     display_in_notebook : bool, optional
         If True, display the N2 diagram in the notebook, if this is called from a notebook.
         Defaults to True.
+    chunked : bool, optional
+        If True, the html file only contains the skeleton of the model tree. The variables,
+        values and connections of its subtrees are written to shard files in a directory next
+        to the html file, named after it with a '_data' suffix, and are loaded by the viewer
+        when a subtree is expanded. The html file must be kept with that directory.
+    shard_size : int, optional
+        Max number of variables in a shard when chunked is True.
     """
-    # grab the model viewer data
-    try:
-        model_data = _get_viewer_data(data_source, values=values, case_id=case_id)
-        err_msg = ''
-    except TypeError as err:
-        model_data = {}
-        err_msg = str(err)
-        issue_warning(err_msg)
+    shard_writer = None
+    if chunked:
+        shard_writer = _N2ShardWriter(os.path.splitext(outfile)[0] + '_data', shard_size)
+
+    model_data, err_msg = _get_n2_data(data_source, values=values, case_id=case_id,
+                                       shard_writer=shard_writer)
 
     # if MPI is active only display one copy of the viewer
     if MPI and MPI.COMM_WORLD.rank != 0:
         return
 
-    options = {}
-    model_data['options'] = options
-
-    import openmdao
-    openmdao_dir = os.path.dirname(inspect.getfile(openmdao))
-    vis_dir = os.path.join(openmdao_dir, "visualization/n2_viewer")
-
-    if title:
-        title = f"OpenMDAO Model Hierarchy and N2 diagram: {title}"
-    else:
-        title = "OpenMDAO Model Hierarchy and N2 diagram"
-
-    html_vars = {
-        'title': title,
-        'embeddable': "embedded-diagram" if embeddable else "non-embedded-diagram",
-        'openmdao_version': openmdao_version,
-        'model_data': model_data,
-        'initial_path': path
-    }
-
-    if err_msg:
-        with open(outfile, 'w') as f:
-            f.write(err_msg)
-    else:
-        HtmlPreprocessor(os.path.join(vis_dir, "index.html"),
-                         outfile, allow_overwrite=True, var_dict=html_vars,
-                         json_dumps_default=default_noraise, verbose=False).run()
+    _write_n2_html(model_data, outfile, path=path, embeddable=embeddable, title=title,
+                   err_msg=err_msg)
 
     if notebook:
         if display_in_notebook:
@@ -688,11 +1028,23 @@ def n2(data_source, outfile=_default_n2_filename, path=None, values=_UNDEFINED,
 
 
 # N2 report definition
-def _run_n2_report(prob, report_filename=_default_n2_filename):
+def _get_n2_report_data(prob):
+    """
+    Collect the data of the n2 report of a problem.
 
-    n2_filepath = str(pathlib.Path(prob.get_reports_dir()).joinpath(report_filename))
+    Parameters
+    ----------
+    prob : <Problem>
+        The problem.
+
+    Returns
+    -------
+    tuple or None
+        The model data and error message returned by _get_n2_data, or None if the report is
+        skipped.
+    """
     try:
-        n2(prob, show_browser=False, outfile=n2_filepath, display_in_notebook=False)
+        return _get_n2_data(prob)
     except RuntimeError as err:
         # We ignore this error
         if str(err) != "Can't compute total derivatives unless " \
@@ -700,6 +1052,42 @@ def _run_n2_report(prob, report_filename=_default_n2_filename):
             raise err
 
 
+def _write_n2_report(prob, n2_filepath):
+    """
+    Collect the data of the n2 report of a problem and write its html file.
+
+    Parameters
+    ----------
+    prob : <Problem>
+        The problem.
+    n2_filepath : str
+        The name of the output file.
+    """
+    data = _get_n2_report_data(prob)
+    if data is not None:
+        model_data, err_msg = data
+        _write_n2_html(model_data, n2_filepath, err_msg=err_msg)
+
+
+def _run_n2_report(prob, report_filename=_default_n2_filename):
+
+    n2_filepath = str(pathlib.Path(prob.get_reports_dir()).joinpath(report_filename))
+
+    if _deferred_reports_fork():
+        # the forked worker has a snapshot of the problem, so it collects the data too
+        run_report('n2', _write_n2_report, prob, n2_filepath)
+        return
+
+    data = _get_n2_report_data(prob)
+    if data is None:
+        return
+
+    if MPI is None or MPI.COMM_WORLD.rank == 0:
+        # only the data collection is done here, the html may be written in the background
+        model_data, err_msg = data
+        run_report('n2', _write_n2_html, model_data, n2_filepath, err_msg=err_msg)
+
+
 def _run_n2_report_w_errors(prob, report_filename=_default_n2_filename):
     if prob._any_rank_has_saved_errors():
         n2_filepath = str(pathlib.Path(prob.get_reports_dir()).joinpath(report_filename))
@@ -749,6 +1137,12 @@ def _n2_setup_parser(parser):
                         help='initial system path to zoom into.')
     parser.add_argument('--problem', default=None, action='store', dest='problem_name',
                         help='name of sub-problem, if target is a sub-problem')
+    parser.add_argument('--chunked', action='store_true', dest='chunked',
+                        help="write the variables of the model in shards that are loaded when "
+                             "their subtree is expanded. Use this for very large models.")
+    parser.add_argument('--shard_size', default=_DEFAULT_SHARD_SIZE, action='store', type=int,
+                        dest='shard_size', help='max number of variables in a shard when '
+                        f'--chunked is used. Default is {_DEFAULT_SHARD_SIZE}.')
 
 
 def _n2_cmd(options, user_args):
@@ -779,14 +1173,16 @@ def _n2_cmd(options, user_args):
                     # after final_setup in order to have correct values for all of the variables.
                     n2(prob, outfile=options.outfile, show_browser=not options.no_browser,
                        values=not options.no_values, title=options.title, path=options.path,
-                       embeddable=options.embeddable)
+                       embeddable=options.embeddable, chunked=options.chunked,
+                       shard_size=options.shard_size)
                     # errors will result in exit at the end of the _check_collected_errors method
                 else:
                     # no errors, generate n2 after final_setup
                     def _view_model_no_errors(prob):
                         n2(prob, outfile=options.outfile, show_browser=not options.no_browser,
                            values=not options.no_values, title=options.title, path=options.path,
-                           embeddable=options.embeddable)
+                           embeddable=options.embeddable, chunked=options.chunked,
+                           shard_size=options.shard_size)
                     hooks._register_hook('final_setup', 'Problem',
                                          post=_view_model_no_errors, exit=True)
                     hooks._setup_hooks(prob)
@@ -799,4 +1195,4 @@ def _n2_cmd(options, user_args):
         n2(filename, outfile=options.outfile, title=options.title, path=options.path,
            values=False if options.no_values else _UNDEFINED,
            show_browser=not options.no_browser,
-           embeddable=options.embeddable)
+           embeddable=options.embeddable, chunked=options.chunked, shard_size=options.shard_size)
@@ -0,0 +1,118 @@
+/**
+ * Load the subtrees of chunked model data when they are first expanded.
+ *
+ * With chunked model data, n2_viewer.py replaces subtrees of the model with skeleton
+ * nodes that have a "shard" index, and writes their variables, connections, promoted
+ * names and declared partials to shard scripts in the data directory. Each script calls
+ * n2AddShard() with its compressed data when loaded. The list of loaded shards is kept
+ * in the URL hash, so loading a new shard just reloads the page, which rebuilds the
+ * diagram from the skeleton and all of the requested shards.
+ * @typedef OmShardLoader
+ * @property {String} dataDir The directory containing the shard scripts.
+ * @property {Number[]} loadedIds The indices of the shards to load.
+ * @property {String} zoomPath The path of the node to zoom into after loading, if any.
+ * @property {Object} shards The uncompressed data of each loaded shard, keyed by index.
+ */
+class OmShardLoader {
+    constructor(dataDir) {
+        this.dataDir = dataDir;
+        this.shards = {};
+
+        const params = new URLSearchParams(window.location.hash.substring(1));
+        this.loadedIds = params.has('shards') ?
+            params.get('shards').split(',').filter(s => s.length > 0).map(Number) : [];
+        this.zoomPath = params.get('path');
+    }
+
+    /**
+     * Determine whether the node is a skeleton whose shard hasn't been loaded.
+     * @param {Object} node The node to check.
+     * @returns {Boolean} True if the shard of the node still needs to be loaded.
+     */
+    isUnloaded(node) {
+        return node.shard !== undefined && !this.loadedIds.includes(node.shard);
+    }
+
+    /**
+     * Load the shard script with the given index.
+     * @param {Number} id The index of the shard.
+     * @returns {Promise} Resolves to the shard data once the script has run.
+     */
+    _loadScript(id) {
+        return new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = `${this.dataDir}/shard_${id}.js`;
+            script.onload = () => resolve(this.shards[id]);
+            script.onerror = () => reject(new Error(`Unable to load model data from ${script.src}.`));
+            document.head.appendChild(script);
+        });
+    }
+
+    /**
+     * Map the path of each subsystem in the raw model tree to its node.
+     * @param {Object} node The raw node to start from.
+     * @param {String} path The path of the node.
+     * @param {Object} nodes The map to add the subsystems to.
+     * @returns {Object} The map of nodes.
+     */
+    _mapSubsystems(node, path, nodes = {}) {
+        nodes[path] = node;
+        for (const child of node.children) {
+            if (child.type == 'subsystem') {
+                this._mapSubsystems(child, path ? `${path}.${child.name}` : child.name, nodes);
+            }
+        }
+        return nodes;
+    }
+
+    /**
+     * Load all of the requested shards and merge them into the raw model data.
+     * Connections are only kept when both of their ends have been loaded.
+     * @param {Object} modelData The raw model data with the skeleton tree.
+     */
+    async loadRequested(modelData) {
+        const shards = await Promise.all(this.loadedIds.map(id => this._loadScript(id)));
+        const nodes = this._mapSubsystems(modelData.tree, '');
+        const loadedVars = new Set();
+        const conns = [];
+
+        for (const shard of shards) {
+            nodes[shard.path].children = shard.children;
+            conns.push(...shard.connections_list);
+            modelData.declare_partials_list.push(...shard.declare_partials_list);
+
+            for (const io of ['input', 'output']) {
+                for (const absName in shard.abs2prom[io]) {
+                    modelData.abs2prom[io][absName] = shard.abs2prom[io][absName];
+                    loadedVars.add(absName);
+                }
+            }
+        }
+
+        for (const conn of conns) {
+            if (loadedVars.has(conn.src) && loadedVars.has(conn.tgt)) {
+                modelData.connections_list.push(conn);
+            }
+        }
+    }
+
+    /**
+     * Add the shard of the node to the loaded shards and rebuild the diagram,
+     * zoomed into the node.
+     * @param {TreeNode} node The skeleton node that was expanded.
+     */
+    reloadWith(node) {
+        this.loadedIds.push(node.shard);
+        window.location.hash = `shards=${this.loadedIds.join(',')}&path=${node.path}`;
+        window.location.reload();
+    }
+}
+
+/**
+ * Called by each shard script with its data.
+ * @param {Number} id The index of the shard.
+ * @param {String} b64str The compressed shard data.
+ */
+function n2AddShard(id, b64str) {
+    n2ShardLoader.shards[id] = OmModelData.uncompressModel(b64str);
+}
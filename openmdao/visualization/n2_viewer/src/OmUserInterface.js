@@ -28,6 +28,22 @@ class OmUserInterface extends UserInterface {
         this.toolbar = new OmToolbar(this);
     }
 
+    /**
+     * React to a left-clicked node by zooming in on it. If the node is the skeleton of a
+     * subtree that hasn't been loaded yet, load it first.
+     * @param {TreeNode} node The targetted node.
+     */
+    leftClick(e, node) {
+        if (n2ShardLoader && n2ShardLoader.isUnloaded(node)) {
+            e.preventDefault();
+            e.stopPropagation();
+            n2ShardLoader.reloadWith(node);
+            return;
+        }
+
+        super.leftClick(e, node);
+    }
+
     /**
      * Create a regular node info window if the hovered object is not a solver,
      * or a solver node info window if it is.
@@ -2,6 +2,7 @@
 // <<hpp_insert gen/defaults.js>>
 // <<hpp_insert src/OmModelData.js>>
 // <<hpp_insert src/OmDiagram.js>>
+// <<hpp_insert src/OmShardLoader.js>>
 
 var sharedTransition = null;
 
@@ -12,6 +13,9 @@ var exitIndex = 0;
 let modelData = OmModelData.uncompressModel(compressedModel);
 delete compressedModel;
 
+// With chunked model data, subtrees are only loaded when they are expanded
+const n2ShardLoader = modelData.shard_dir ? new OmShardLoader(modelData.shard_dir) : null;
+
 var n2MouseFuncs = null;
 
 function zoomToInitial(n2Diag) {
@@ -32,4 +36,10 @@ function n2main() {
 }
 
 // wintest();
-n2main();
+if (n2ShardLoader) {
+    if (n2ShardLoader.zoomPath) initialPath = n2ShardLoader.zoomPath;
+    n2ShardLoader.loadRequested(modelData).then(n2main);
+}
+else {
+    n2main();
+}
@@ -52,6 +52,41 @@ def extract_compressed_model(filename):
     return model_data
 
 
+def merge_shards(model_data, data_dir):
+    """
+    Load all of the shards of chunked model data and merge them into the model data.
+    """
+    nodes = {}
+
+    def map_subsystems(node, path):
+        nodes[path] = node
+        for child in node['children']:
+            if child['type'] == 'subsystem':
+                map_subsystems(child, f"{path}.{child['name']}" if path else child['name'])
+
+    map_subsystems(model_data['tree'], '')
+
+    for fname in os.listdir(data_dir):
+        with open(os.path.join(data_dir, fname), 'r', encoding='utf-8') as f:
+            shard_id, b64_data = re.match(r'n2AddShard\((\d+), "(.*)"\);', f.read()).groups()
+
+        shard = json.loads(zlib.decompress(base64.b64decode(b64_data)).decode("utf-8"))
+
+        node = nodes[shard['path']]
+        assert node.pop('shard') == int(shard_id)
+        node.pop('num_vars')
+        node['children'] = shard['children']
+        model_data['connections_list'].extend(shard['connections_list'])
+        model_data['declare_partials_list'].extend(shard['declare_partials_list'])
+        for io in ('input', 'output'):
+            model_data['abs2prom'][io].update(shard['abs2prom'][io])
+
+    model_data['connections_list'].sort(key=lambda c: (c['src'], c['tgt']))
+    model_data['declare_partials_list'].sort()
+
+    return model_data
+
+
 @use_tempdirs
 def save_viewer_data(viewer_data, filename):
     """
@@ -532,6 +567,44 @@ class TestN2(unittest.TestCase):
 
                 self.assertDictEqual(model_data_from_prob, model_data_from_cmd)
 
+    def test_n2_chunked(self):
+        """
+        Test that the shards of chunked n2 data add up to the full model data.
+        """
+        sql_filename = "sellarstate.sql"
+
+        p = om.Problem(model=SellarStateConnection(), reports=False)
+        p.driver.add_recorder(SqliteRecorder(sql_filename))
+        p.setup()
+        p.final_setup()
+        p.cleanup()
+
+        n2(p, outfile='full_n2.html', show_browser=False)
+        expected = extract_compressed_model('full_n2.html')
+        expected['declare_partials_list'].sort()
+
+        for source in (p, sql_filename):
+            for shard_size in (1, 5, 1000):
+                with self.subTest(source=source, shard_size=shard_size):
+                    n2(source, outfile='chunked_n2.html', show_browser=False, chunked=True,
+                       shard_size=shard_size)
+
+                    model_data = extract_compressed_model('chunked_n2.html')
+                    self.assertEqual(model_data.pop('shard_dir'), 'chunked_n2_data')
+                    self.assertEqual(model_data['connections_list'], [])
+                    self.assertEqual(model_data['abs2prom'], {'input': {}, 'output': {}})
+
+                    nshards = len(os.listdir('chunked_n2_data'))
+                    if shard_size == 1:
+                        # one shard for each component
+                        self.assertEqual(nshards, 7)
+                    elif shard_size == 1000:
+                        # one shard for each subsystem of the model
+                        self.assertEqual(nshards, len(expected['tree']['children']))
+
+                    merge_shards(model_data, 'chunked_n2_data')
+                    self.assertDictEqual(model_data, expected)
+
     def test_n2_command(self):
         """
         Check that there are no errors when running from the command line with a script.
@@ -13,7 +13,7 @@ from openmdao.utils.mpi import MPI
 from openmdao.utils.webview import webview
 from openmdao.utils.general_utils import default_noraise
 from openmdao.utils.file_utils import _load_and_exec
-from openmdao.utils.reports_system import register_report
+from openmdao.utils.reports_system import register_report, run_report
 
 _default_scaling_filename = 'driver_scaling_report.html'
 
@@ -167,22 +167,14 @@ def _compute_jac_view_info(totals, data, dv_vals, response_vals, coloring):
     data['var_mat_list'] = varmatlist
 
 
-def view_driver_scaling(driver, outfile=_default_scaling_filename, show_browser=True,
-                        title=None, jac=True):
+def _get_scaling_data(driver, title=None, jac=True):
     """
-    Generate a self-contained html file containing a table of scaling data.
-
-    Optionally pops up a web browser to view the file.
+    Collect the data shown in the scaling report.
 
     Parameters
     ----------
     driver : Driver
         The driver used for the scaling report.
-    outfile : str, optional
-        The name of the output html file.  Defaults to 'connections.html'.
-    show_browser : bool, optional
-        If True, pop up a browser to view the generated html file.
-        Defaults to True.
     title : str, optional
         Sets the title of the web page.
     jac : bool
@@ -191,7 +183,7 @@ def view_driver_scaling(driver, outfile=_default_scaling_filename, show_browser=
     Returns
     -------
     dict
-        Data to used to generate html file.
+        Data used to generate the html file.
     """
     dv_table = []
     con_table = []
@@ -436,34 +428,78 @@ def view_driver_scaling(driver, outfile=_default_scaling_filename, show_browser=
 
             _compute_jac_view_info(lintotals, lindata, dv_vals, lin_response_vals, None)
 
-    if driver._problem().comm.rank == 0:
+    return data
+
+
+def _write_scaling_html(data, outfile):
+    """
+    Write the html file of a scaling report from its data.
+
+    Parameters
+    ----------
+    data : dict
+        The scaling data returned by _get_scaling_data.
+    outfile : str
+        The name of the output html file.
+    """
+    viewer = 'scaling_table.html'
+
+    code_dir = os.path.dirname(os.path.abspath(__file__))
+    libs_dir = os.path.join(os.path.dirname(code_dir), 'common', 'libs')
+    style_dir = os.path.join(os.path.dirname(code_dir), 'common', 'style')
+
+    with open(os.path.join(code_dir, viewer), "r", encoding='utf-8') as f:
+        template = f.read()
+
+    with open(os.path.join(libs_dir, 'tabulator.5.4.4.min.js'), "r", encoding='utf-8') as f:
+        tabulator_src = f.read()
+
+    with open(os.path.join(style_dir, 'tabulator.5.4.4.min.css'), "r", encoding='utf-8') as f:
+        tabulator_style = f.read()
+
+    with open(os.path.join(libs_dir, 'd3.v6.min.js'), "r", encoding='utf-8') as f:
+        d3_src = f.read()
 
-        viewer = 'scaling_table.html'
+    jsontxt = json.dumps(data, default=default_noraise)
 
-        code_dir = os.path.dirname(os.path.abspath(__file__))
-        libs_dir = os.path.join(os.path.dirname(code_dir), 'common', 'libs')
-        style_dir = os.path.join(os.path.dirname(code_dir), 'common', 'style')
+    with open(outfile, 'w', encoding='utf-8') as f:
+        s = template.replace("<tabulator_src>", tabulator_src)
+        s = s.replace("<tabulator_style>", tabulator_style)
+        s = s.replace("<d3_src>", d3_src)
+        s = s.replace("<scaling_data>", jsontxt)
+        f.write(s)
 
-        with open(os.path.join(code_dir, viewer), "r", encoding='utf-8') as f:
-            template = f.read()
 
-        with open(os.path.join(libs_dir, 'tabulator.5.4.4.min.js'), "r", encoding='utf-8') as f:
-            tabulator_src = f.read()
+def view_driver_scaling(driver, outfile=_default_scaling_filename, show_browser=True,
+                        title=None, jac=True):
+    """
+    Generate a self-contained html file containing a table of scaling data.
 
-        with open(os.path.join(style_dir, 'tabulator.5.4.4.min.css'), "r", encoding='utf-8') as f:
-            tabulator_style = f.read()
+    Optionally pops up a web browser to view the file.
 
-        with open(os.path.join(libs_dir, 'd3.v6.min.js'), "r", encoding='utf-8') as f:
-            d3_src = f.read()
+    Parameters
+    ----------
+    driver : Driver
+        The driver used for the scaling report.
+    outfile : str, optional
+        The name of the output html file.  Defaults to 'connections.html'.
+    show_browser : bool, optional
+        If True, pop up a browser to view the generated html file.
+        Defaults to True.
+    title : str, optional
+        Sets the title of the web page.
+    jac : bool
+        If True, show jacobian information.
 
-        jsontxt = json.dumps(data, default=default_noraise)
+    Returns
+    -------
+    dict
+        Data to used to generate html file.
+    """
+    data = _get_scaling_data(driver, title=title, jac=jac)
 
-        with open(outfile, 'w', encoding='utf-8') as f:
-            s = template.replace("<tabulator_src>", tabulator_src)
-            s = s.replace("<tabulator_style>", tabulator_style)
-            s = s.replace("<d3_src>", d3_src)
-            s = s.replace("<scaling_data>", jsontxt)
-            f.write(s)
+    if driver._problem().comm.rank == 0:
+        _write_scaling_html(data, outfile)
 
         if show_browser:
             webview(outfile)
@@ -578,7 +614,7 @@ def _run_scaling_report(driver, report_filename=_default_scaling_filename):
     scaling_filepath = str(pathlib.Path(prob.get_reports_dir()).joinpath(report_filename))
 
     try:
-        prob.driver.scaling_report(outfile=scaling_filepath, show_browser=False)
+        data = _get_scaling_data(driver)
 
     # Need to handle the coloring and scaling reports which can fail in this way
     # because total Jacobian can't be computed
@@ -586,6 +622,11 @@ def _run_scaling_report(driver, report_filename=_default_scaling_filename):
         if str(err) != "Can't compute total derivatives unless " \
                        "both 'of' or 'wrt' variables have been specified.":
             raise err
+        return
+
+    if prob.comm.rank == 0:
+        # only the data collection is done here, the html may be written in the background
+        run_report('scaling', _write_scaling_html, data, scaling_filepath)
 
 
 def _scaling_report_register():
@@ -46,12 +46,29 @@ def _timing_iter(all_timing_managers):
                             t.name, t.ncalls, t.avg(), t.min, t.max, t.tot, tot_time
 
 
+def _cache_stats_iter(all_timing_managers):
+    # iterates over all of the timing managers and yields all cache hit/miss info
+    for rank, (timing_managers, _) in enumerate(all_timing_managers):
+        for probname, tmanager in timing_managers.items():
+            for sysname, (classname, stats) in getattr(tmanager, '_cache_stats', {}).items():
+                for method, counts in stats.items():
+                    if counts['hits'] + counts['misses'] > 0:
+                        yield rank, probname, classname, sysname, method, counts['hits'], \
+                            counts['misses']
+
+
 def _timing_file_iter(timing_file):
     # iterates over the given timing file
     with open(timing_file, 'rb') as f:
         yield from _timing_iter(_restricted_load(f))
 
 
+def _cache_stats_file_iter(timing_file):
+    # iterates over the cache hit/miss info in the given timing file
+    with open(timing_file, 'rb') as f:
+        yield from _cache_stats_iter(_restricted_load(f))
+
+
 def _get_par_child_info(timing_iter, method):
     # puts timing info for direct children of parallel groups into a dict.
     parents = {}
@@ -189,6 +206,9 @@ class TimingManager(object):
         Set of pathnames of ParallelGroups.
     _par_only : bool
         If True, only instrument direct children of ParallelGroups.
+    _cache_stats : dict
+        Mapping of instance name to (class name, cache hit/miss counts) for instances that
+        keep track of cache hits and misses in a _cache_stats attribute.
     """
 
     def __init__(self, options=None):
@@ -198,6 +218,7 @@ class TimingManager(object):
         self._timers = {}
         self._par_groups = set()
         self._par_only = options is None or options.view.lower() == 'text'
+        self._cache_stats = {}
 
     def add_timings(self, name_obj_proc_iter, method_names):
         """
@@ -211,6 +232,10 @@ class TimingManager(object):
             List of names of methods to wrap.
         """
         for name, obj, nprocs in name_obj_proc_iter:
+            # the counts are updated in place, so they're current when the timing data is saved
+            stats = getattr(obj, '_cache_stats', None)
+            if stats is not None:
+                self._cache_stats[name] = (type(obj).__name__, stats)
             for method_name in method_names:
                 self.add_timing(name, obj, nprocs, method_name)
 
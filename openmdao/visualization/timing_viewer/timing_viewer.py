@@ -14,7 +14,7 @@ from openmdao.utils.mpi import MPI
 from openmdao.utils.file_utils import _load_and_exec, _to_filename
 import openmdao.visualization.timing_viewer.timer as timer_mod
 from openmdao.visualization.timing_viewer.timer import timing_context, _set_timer_setup_hook, \
-    _timing_file_iter, _get_par_child_info
+    _timing_file_iter, _get_par_child_info, _cache_stats_file_iter
 from openmdao.utils.om_warnings import issue_warning
 from openmdao.core.constants import _DEFAULT_OUT_STREAM
 
@@ -47,6 +47,47 @@ def view_timing_dump(timing_file, out_stream=_DEFAULT_OUT_STREAM):
               f"(tot) {pct:6.2f} % {parallel} {probname} {sysname}:{method}", file=out_stream)
 
 
+def view_cache_stats(timing_file, out_stream=_DEFAULT_OUT_STREAM):
+    """
+    Print the cache hit rates of systems that cache their results, e.g. SubmodelComp.
+
+    Parameters
+    ----------
+    timing_file : str
+        The name of the pickle file contining the timing data.
+    out_stream : file-like or None
+        Where the output will be printed. If None, generate no output.
+
+    Returns
+    -------
+    list or None
+        List of (rank, probname, classname, sysname, method, hits, misses) tuples or None.
+    """
+    if out_stream is None:
+        return
+    elif out_stream is _DEFAULT_OUT_STREAM:
+        out_stream = sys.stdout
+
+    stats = list(_cache_stats_file_iter(timing_file))
+
+    if not stats:
+        return
+
+    cols = ['System', 'Rank', 'Method', 'Hits', 'Misses', 'Hit Rate']
+    colspc = ['-' * len(s) for s in cols]
+
+    print("\n\nCache hit rates\n", file=out_stream)
+    for c in (cols, colspc):
+        print(f"  {c[0]:30}  {c[1]:>5}  {c[2]:20} {c[3]:>8} {c[4]:>8} {c[5]:>9}",
+              file=out_stream)
+    for rank, probname, classname, sysname, method, hits, misses in stats:
+        pct = hits / (hits + misses) * 100.
+        print(f"  {probname + ':' + sysname:30}  {rank:>5}  {method:20} {hits:8} {misses:8} "
+              f"{pct:8.2f}%", file=out_stream)
+
+    return stats
+
+
 def view_MPI_timing(timing_file, method='_solve_nonlinear', out_stream=_DEFAULT_OUT_STREAM):
     """
     Print timings of direct children of ParallelGroups to a file or to stdout.
@@ -219,10 +260,12 @@ def _show_view(timing_file, options):
             ret = view_MPI_timing(timing_file, method=f, out_stream=sys.stdout)
             if ret is None:
                 issue_warning(f"Could find no children of a ParallelGroup running method '{f}'.")
+        view_cache_stats(timing_file, out_stream=sys.stdout)
     elif view == 'browser' or view == 'no_browser':
         view_timing(timing_file, outfile='timing_report.html', show_browser=view == 'browser')
     elif view == 'dump':
         view_timing_dump(timing_file, out_stream=sys.stdout)
+        view_cache_stats(timing_file, out_stream=sys.stdout)
     elif view == 'none':
         pass
     else:
@@ -210,6 +210,7 @@ setup(
         'openmdao_component': [
             'addsubtractcomp=openmdao.components.add_subtract_comp:AddSubtractComp',
             'balancecomp=openmdao.components.balance_comp:BalanceComp',
+            'constraintaggregationcomp=openmdao.components.constraint_aggregation_comp:ConstraintAggregationComp',
             'crossproductcomp=openmdao.components.cross_product_comp:CrossProductComp',
             'dotproductcomp=openmdao.components.dot_product_comp:DotProductComp',
             'eqconstraintcomp=openmdao.components.eq_constraint_comp:EQConstraintComp',